@@ -1,10 +1,20 @@
 from motor.motor_asyncio import AsyncIOMotorClient
 from pydantic_settings import BaseSettings
 from typing import Optional
+from app.services.index_manager import ensure_indexes, format_index_report
 
 class Settings(BaseSettings):
     mongodb_url: str = "mongodb://127.0.0.1:27017/"
     database_name: str = "kitchen_db"
+    unit_cache_size: int = 1024  # عدد نتائج حساب الوحدات في الكاش (0 لتعطيله)
+    job_workers: int = 2  # عدد العمليات في process pool مهام الخلفية
+    job_queue_limit: int = 100  # الحد الأقصى للمهام غير المنتهية في السيرفر
+    index_check_timeout_ms: int = 5000  # مهلة الوصول لـ MongoDB عند إنشاء الفهارس في الخلفية
+    job_lease_s: float = 60.0  # مدة حجز المهمة قبل أن تستأنفها عملية أخرى (تتجدد كل ثلث المدة)
+    export_cache_dir: str = ""  # مجلد كاش ملفات التصدير (الافتراضي داخل مجلد temp)
+    export_cache_max_mb: int = 256  # الحد الأقصى لحجم كاش التصدير
+    config_refresh_s: float = 1.0  # كل كم ثانية يتم التحقق من رقم نسخة الإعدادات
+    enabled_routers: str = ""  # أسماء الـ routers مفصولة بفاصلة لهذا السيرفر (فارغ = الكل)
     
     class Config:
         env_file = ".env"
@@ -23,6 +33,23 @@ async def connect_to_mongo():
     database = client[settings.database_name]
     print("Connected to MongoDB")
 
+async def ensure_database_indexes():
+    """
+    Create missing indexes and print the report
+
+    Runs as a background task from startup (and from `python -m app.services.index_manager`)
+    with its own client and a short serverSelectionTimeoutMS, so an unreachable MongoDB
+    only produces a warning instead of delaying startup.
+    """
+    index_client = AsyncIOMotorClient(settings.mongodb_url, serverSelectionTimeoutMS=settings.index_check_timeout_ms)
+    try:
+        for line in format_index_report(await ensure_indexes(index_client[settings.database_name])):
+            print(line)
+    except Exception as e:
+        print(f"WARNING: Could not ensure MongoDB indexes: {e}")
+    finally:
+        index_client.close()
+
 async def close_mongo_connection():
     """Close MongoDB connection"""
     global client
@@ -1,10 +1,25 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from app.database import connect_to_mongo, close_mongo_connection
-from app.routers import settings, units, summaries, projects, auth, dashboard, marketplace, cart, ads
+from app.database import connect_to_mongo, close_mongo_connection, ensure_database_indexes, settings as app_settings
+from app.services.job_service import shutdown_job_executor, watch_unfinished_jobs
+import asyncio
+import importlib
 import os
 
+# (اسم الموديول في app.routers، المسار، الـ tag)
+ROUTERS = [
+    ("auth", "/auth", "Auth"),
+    ("settings", "/settings", "Settings"),
+    ("projects", "/projects", "Projects"),
+    ("units", "/units", "Units"),
+    ("marketplace", "/marketplace", "Marketplace"),
+    ("dashboard", "/dashboard", "Dashboard"),
+    ("cart", "/cart", "Cart"),
+    ("ads", "/ads", "Ads"),
+    ("jobs", "/jobs", "Jobs"),
+]
+
 app = FastAPI(
     title="Kitchen Cabinet Calculator API",
     description="API for calculating kitchen cabinet dimensions and costs",
@@ -26,22 +41,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Include routers
-app.include_router(auth.router, prefix="/auth", tags=["Auth"])
-app.include_router(settings.router, prefix="/settings", tags=["Settings"])
-app.include_router(projects.router, prefix="/projects", tags=["Projects"])
-app.include_router(units.router, prefix="/units", tags=["Units"])
-app.include_router(marketplace.router, prefix="/marketplace", tags=["Marketplace"])
-app.include_router(dashboard.router, prefix="/dashboard", tags=["Dashboard"])
-app.include_router(cart.router, prefix="/cart", tags=["Cart"])
-app.include_router(ads.router, prefix="/ads", tags=["Ads"])
+# Include routers (ENABLED_ROUTERS يحدد routers هذا السيرفر، والباقي لا يتم استيراده)
+enabled_routers = {name.strip() for name in app_settings.enabled_routers.split(",") if name.strip()}
+for router_name, prefix, tag in ROUTERS:
+    if enabled_routers and router_name not in enabled_routers:
+        continue
+    router_module = importlib.import_module(f"app.routers.{router_name}")
+    app.include_router(router_module.router, prefix=prefix, tags=[tag])
 
 @app.on_event("startup")
 async def startup_event():
     await connect_to_mongo()
+    # Create missing indexes in the background (startup does not wait for MongoDB)
+    app.state.index_builder = asyncio.create_task(ensure_database_indexes())
+    # Resume background jobs without blocking startup (kept so it can be cancelled)
+    app.state.jobs_watcher = asyncio.create_task(watch_unfinished_jobs())
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    for task_name in ("index_builder", "jobs_watcher"):
+        task = getattr(app.state, task_name, None)
+        if task is not None:
+            task.cancel()
+    shutdown_job_executor()
     await close_mongo_connection()
 
 @app.get("/")
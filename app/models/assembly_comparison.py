@@ -0,0 +1,24 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional, Dict
+from app.models.settings import AssemblyMethod, HandleType
+
+class AssemblyVariantResult(BaseModel):
+    """نتيجة الوحدة أو المشروع بطريقة تجميع ونوع مقبض واحد"""
+    assembly_method: AssemblyMethod = Field(description="طريقة التجميع")
+    handle_type: HandleType = Field(description="نوع المقبض")
+    total_area_m2: float = Field(default=0.0, description="إجمالي المساحة (م²)")
+    total_edge_band_m: float = Field(default=0.0, description="إجمالي متر الشريط")
+    part_count: int = Field(default=0, description="عدد القطع")
+    sheet_count: float = Field(default=0.0, description="عدد الألواح (تقدير المساحة للوحدة، الرص الفعلي للمشروع)")
+    cost_breakdown: Dict[str, float] = Field(default_factory=dict, description="تفاصيل التكلفة لكل مادة")
+    total_cost: float = Field(default=0.0, description="التكلفة الإجمالية")
+    error: Optional[str] = Field(default=None, description="رسالة الخطأ إذا فشل الحساب بهذه الإعدادات")
+
+class AssemblyComparisonResponse(BaseModel):
+    """مقارنة كل طرق التجميع وأنواع المقابض جنباً إلى جنب"""
+    current_assembly_method: AssemblyMethod = Field(description="طريقة التجميع في الإعدادات الحالية")
+    current_handle_type: HandleType = Field(description="نوع المقبض في الإعدادات الحالية")
+    unit_count: int = Field(description="عدد الوحدات المحسوبة")
+    skipped_units: int = Field(default=0, description="وحدات محفوظة بدون مدخلات الطلب (لا يمكن إعادة حسابها)")
+    variants: List[AssemblyVariantResult] = Field(description="نتيجة كل تركيبة طريقة تجميع × نوع مقبض")
+    cheapest: Optional[AssemblyVariantResult] = Field(default=None, description="التركيبة الأقل تكلفة")
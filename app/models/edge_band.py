@@ -23,6 +23,17 @@ class EdgeBandPart(BaseModel):
     total_edge_m: float = Field(description="إجمالي متر الشريط للقطعة (مع الكمية)")
     edge_type: EdgeType = Field(default=EdgeType.PVC, description="نوع الشريط المستخدم")
 
+class EdgeRollPlan(BaseModel):
+    """خطة شراء لفات الشريط لنوع شريط واحد"""
+    edge_type: EdgeType = Field(description="نوع الشريط")
+    roll_length_m: float = Field(description="طول اللفة بالمتر")
+    roll_count: int = Field(description="عدد اللفات المطلوبة")
+    strip_count: int = Field(description="عدد قطع الشريط (حافة × الكمية)")
+    strips_m: float = Field(description="إجمالي طول القطع بالمتر (مع هدر المكنة)")
+    waste_m: float = Field(description="الهدر المتبقي في اللفات بالمتر")
+    utilization_percent: float = Field(description="نسبة استغلال اللفات")
+    cost: Optional[float] = Field(default=None, description="تكلفة اللفات")
+
 class EdgeBreakdownResponse(BaseModel):
     """نتيجة توزيع الشريط"""
     unit_id: str = Field(description="معرف الوحدة")
@@ -33,4 +44,16 @@ class EdgeBreakdownResponse(BaseModel):
         default=None,
         description="تفاصيل التكلفة حسب نوع الشريط"
     )
+    roll_plan: List[EdgeRollPlan] = Field(
+        default_factory=list,
+        description="عدد لفات الشريط والهدر لكل نوع شريط"
+    )
+
+
 
+class EdgeRollsResponse(BaseModel):
+    """خطة لفات الشريط لمشروع كامل"""
+    project_id: str = Field(description="معرف المشروع")
+    total_edge_m: float = Field(description="إجمالي متر الشريط للمشروع")
+    roll_plan: List[EdgeRollPlan] = Field(description="عدد لفات الشريط والهدر لكل نوع شريط")
+    total_cost: Optional[float] = Field(default=None, description="تكلفة كل اللفات")
@@ -0,0 +1,33 @@
+from pydantic import BaseModel, Field
+from typing import Optional, Dict, Any
+from datetime import datetime
+from enum import Enum
+
+class JobStatus(str, Enum):
+    """حالة المهمة"""
+    PENDING = "pending"  # في الانتظار
+    RUNNING = "running"  # قيد التنفيذ
+    COMPLETED = "completed"  # انتهت بنجاح
+    FAILED = "failed"  # فشلت
+
+class JobKind(str, Enum):
+    """نوع المهمة"""
+    PROJECT_OPTIMIZE = "project_optimize"  # رص ألواح وشريط المشروع وحساب التكلفة
+    UNITS_RECALCULATE = "units_recalculate"  # إعادة حساب الوحدات المحفوظة بعد تغيير الإعدادات
+    USER_STATS_REBUILD = "user_stats_rebuild"  # إعادة حساب إحصائيات لوحة التحكم لكل المستخدمين
+    UNIT_QUOTA_RECONCILE = "unit_quota_reconcile"  # إعادة بناء خانات حد الوحدات اليومية من الوحدات
+
+class JobResponse(BaseModel):
+    """حالة مهمة في الخلفية"""
+    job_id: str = Field(description="معرف المهمة")
+    kind: JobKind = Field(description="نوع المهمة")
+    status: JobStatus = Field(description="حالة المهمة")
+    progress: int = Field(default=0, ge=0, le=100, description="نسبة التقدم")
+    stage: Optional[str] = Field(default=None, description="المرحلة الحالية")
+    project_id: Optional[str] = Field(default=None, description="معرف المشروع")
+    result: Optional[Dict[str, Any]] = Field(default=None, description="النتيجة (عند الانتهاء)")
+    error: Optional[str] = Field(default=None, description="سبب الفشل")
+    created_by: Optional[str] = Field(default=None, description="المستخدم صاحب المهمة")
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
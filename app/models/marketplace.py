@@ -60,6 +60,11 @@ class MarketplaceItemResponse(BaseModel):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
+class MarketplaceItemPageResponse(BaseModel):
+    """صفحة من منتجات السوق"""
+    items: List[MarketplaceItemResponse] = Field(default_factory=list)
+    next_cursor: Optional[str] = Field(default=None, description="مؤشر الصفحة التالية (None في آخر صفحة)")
+
 class MarketplaceItemDocument(BaseModel):
     """نموذج المنتج في قاعدة البيانات"""
     id: str = Field(alias="_id")
@@ -0,0 +1,65 @@
+from pydantic import BaseModel, Field, computed_field, model_validator
+from typing import List
+from app.models.units import Part
+
+# الحد الأقصى لعدد القطع في طلب الرص، ولعددها بعد فك الكميات
+MAX_NESTING_PARTS = 500
+MAX_NESTING_PIECES = 2000
+
+class NestingRequest(BaseModel):
+    """طلب رص قائمة قطع على الألواح"""
+    parts: List[Part] = Field(
+        min_length=1,
+        max_length=MAX_NESTING_PARTS,
+        description="القطع المطلوب رصها (مع الكميات)"
+    )
+
+    @model_validator(mode="after")
+    def check_piece_count(self) -> "NestingRequest":
+        """رفض الكميات السالبة والطلبات التي يزيد عدد قطعها عن MAX_NESTING_PIECES"""
+        if any(part.qty < 0 for part in self.parts):
+            raise ValueError("Part quantities must not be negative")
+        piece_count = sum(part.qty for part in self.parts)
+        if piece_count > MAX_NESTING_PIECES:
+            raise ValueError(f"Too many pieces to nest: {piece_count} (maximum {MAX_NESTING_PIECES})")
+        return self
+
+class SheetPlacement(BaseModel):
+    """مكان قطعة على اللوح (من الركن العلوي الأيسر)"""
+    name: str = Field(description="اسم القطعة")
+    x_cm: float = Field(description="المسافة على طول اللوح")
+    y_cm: float = Field(description="المسافة على عرض اللوح")
+    length_cm: float = Field(description="طول القطعة على اللوح (في اتجاه طول اللوح)")
+    width_cm: float = Field(description="عرض القطعة على اللوح (في اتجاه عرض اللوح)")
+    rotated: bool = Field(description="هل تم تدوير القطعة 90 درجة")
+
+class SheetLayout(BaseModel):
+    """رص لوح واحد"""
+    index: int = Field(description="رقم اللوح")
+    placements: List[SheetPlacement] = Field(description="القطع على اللوح")
+    used_area_m2: float = Field(description="مساحة القطع على اللوح بالمتر المربع")
+    utilization_percent: float = Field(description="نسبة استغلال اللوح")
+
+class SheetNestingResult(BaseModel):
+    """نتيجة رص القطع على الألواح"""
+    sheet_length_cm: float = Field(description="طول اللوح الخام")
+    sheet_width_cm: float = Field(description="عرض اللوح الخام")
+    saw_kerf_cm: float = Field(description="سمك سلاح المنشار")
+    sheet_count: int = Field(description="عدد الألواح الفعلي")
+    parts_count: int = Field(description="عدد القطع (بعد فك الكميات)")
+    parts_area_m2: float = Field(description="مساحة القطع المرصوصة بالمتر المربع")
+    utilization_percent: float = Field(description="نسبة استغلال الألواح")
+    sheets: List[SheetLayout] = Field(default_factory=list, description="رص كل لوح")
+    oversized_parts: List[str] = Field(
+        default_factory=list,
+        description="قطع أكبر من اللوح ولا يمكن رصها"
+    )
+    oversized_sheet_count: int = Field(
+        default=0,
+        description="ألواح القطع الأكبر من اللوح (مساحة القطعة على مساحة اللوح مقربة لأعلى لكل قطعة)"
+    )
+
+    @computed_field(description="عدد الألواح في التكلفة (المرصوصة + ألواح القطع الأكبر من اللوح)")
+    @property
+    def priced_sheet_count(self) -> int:
+        return self.sheet_count + self.oversized_sheet_count
@@ -0,0 +1,46 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional, Dict
+from app.models.units import UnitCalculateRequest
+
+# الحد الأقصى لعدد سيناريوهات الأسعار في الطلب الواحد
+MAX_PRICE_SCENARIOS = 100
+
+class PriceScenario(BaseModel):
+    """سيناريو أسعار (مثلاً مورد آخر أو زيادة 10%) - القيم الفارغة تأخذ سعر الإعدادات الحالي"""
+    name: str = Field(description="اسم السيناريو")
+    plywood_price_per_sheet: Optional[float] = Field(default=None, ge=0, description="سعر لوح الخشب")
+    edge_band_price_per_meter: Optional[float] = Field(default=None, ge=0, description="سعر متر الشريط")
+    price_factor: float = Field(default=1.0, gt=0, description="معامل على كل الأسعار (1.1 = زيادة 10%)")
+
+class UnitPriceScenariosRequest(BaseModel):
+    """طلب تسعير وحدة بأكثر من سيناريو أسعار"""
+    unit: UnitCalculateRequest = Field(description="الوحدة المطلوب تسعيرها")
+    scenarios: List[PriceScenario] = Field(
+        min_length=1,
+        max_length=MAX_PRICE_SCENARIOS,
+        description="سيناريوهات الأسعار"
+    )
+
+class ProjectPriceScenariosRequest(BaseModel):
+    """طلب تسعير مشروع بأكثر من سيناريو أسعار"""
+    scenarios: List[PriceScenario] = Field(
+        min_length=1,
+        max_length=MAX_PRICE_SCENARIOS,
+        description="سيناريوهات الأسعار"
+    )
+
+class ScenarioCost(BaseModel):
+    """تكلفة سيناريو واحد"""
+    name: str = Field(description="اسم السيناريو")
+    plywood_price_per_sheet: float = Field(description="سعر اللوح المستخدم")
+    edge_band_price_per_meter: float = Field(description="سعر متر الشريط المستخدم")
+    cost_breakdown: Dict[str, float] = Field(description="تفاصيل التكلفة لكل مادة")
+    total_cost: float = Field(description="التكلفة الإجمالية")
+    difference: float = Field(description="الفرق عن التكلفة بالأسعار الحالية")
+
+class PriceScenariosResponse(BaseModel):
+    """نتيجة تسعير الكميات بكل السيناريوهات"""
+    sheet_count: float = Field(description="عدد الألواح")
+    edge_band_m: float = Field(description="متر الشريط")
+    current: ScenarioCost = Field(description="التكلفة بأسعار الإعدادات الحالية")
+    scenarios: List[ScenarioCost] = Field(description="التكلفة لكل سيناريو بنفس الترتيب")
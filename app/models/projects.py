@@ -1,7 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict
 from datetime import datetime
-from app.models.units import UnitDocument
+from app.models.units import UnitDocument, EdgeDistribution
 
 class ProjectCreateRequest(BaseModel):
     """طلب إنشاء مشروع جديد"""
@@ -25,6 +25,28 @@ class ProjectResponse(BaseModel):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
+class ProjectSummaryResponse(BaseModel):
+    """ملخص المشروع في القائمة (بدون الوحدات وقطعها)"""
+    project_id: str
+    name: str
+    description: Optional[str] = ""
+    client_name: Optional[str] = ""
+    unit_count: int = Field(default=0, description="عدد الوحدات")
+    total_area_m2: float = Field(default=0.0, description="إجمالي مساحة الوحدات بالمتر المربع")
+    total_cost: float = Field(default=0.0, description="إجمالي التكلفة المقدرة للوحدات")
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+class ProjectPageResponse(BaseModel):
+    """صفحة من قائمة المشاريع"""
+    items: List[ProjectResponse] = Field(default_factory=list)
+    next_cursor: Optional[str] = Field(default=None, description="مؤشر الصفحة التالية (None في آخر صفحة)")
+
+class ProjectSummaryPageResponse(BaseModel):
+    """صفحة من ملخصات المشاريع"""
+    items: List[ProjectSummaryResponse] = Field(default_factory=list)
+    next_cursor: Optional[str] = Field(default=None, description="مؤشر الصفحة التالية (None في آخر صفحة)")
+
 class ProjectDocument(BaseModel):
     """نموذج المشروع المحفوظ في MongoDB"""
     _id: str
@@ -33,4 +55,25 @@ class ProjectDocument(BaseModel):
     client_name: Optional[str] = ""
     unit_ids: List[str] = Field(default_factory=list)
     created_at: datetime
-    updated_at: Optional[datetime] = None
\ No newline at end of file
+    updated_at: Optional[datetime] = None
+
+class CutListLine(BaseModel):
+    """سطر في قائمة القص المجمعة (قطع متطابقة من كل الوحدات)"""
+    name: str = Field(description="اسم القطعة (بدون الترقيم)")
+    width_cm: float = Field(description="العرض بالسنتيمتر")
+    height_cm: float = Field(description="الارتفاع بالسنتيمتر")
+    thickness_cm: float = Field(description="سمك اللوح بالسنتيمتر")
+    qty: int = Field(description="إجمالي الكمية")
+    edge_distribution: Optional[EdgeDistribution] = Field(default=None, description="توزيع الشريط")
+    edge_band_m: float = Field(description="متر الشريط للقطعة الواحدة")
+    area_m2: float = Field(description="إجمالي المساحة بالمتر المربع")
+    units_count: int = Field(description="عدد الوحدات التي تحتوي القطعة")
+
+class ProjectCutListResponse(BaseModel):
+    """قائمة القص المجمعة للمشروع"""
+    project_id: str
+    units_count: int = Field(description="عدد الوحدات")
+    parts_count: int = Field(description="إجمالي عدد القطع")
+    total_area_m2: float = Field(description="إجمالي المساحة بالمتر المربع")
+    total_edge_band_m: float = Field(description="إجمالي متر الشريط")
+    lines: List[CutListLine] = Field(default_factory=list)
@@ -49,6 +49,8 @@ class MaterialInfo(BaseModel):
     price_per_sheet: Optional[float] = None
     sheet_size_m2: Optional[float] = None
     price_per_meter: Optional[float] = None
+    roll_length_m: Optional[float] = Field(default=None, gt=0, description="طول لفة الشريط بالمتر")
+    price_per_roll: Optional[float] = Field(default=None, ge=0, description="سعر لفة الشريط")
     description: Optional[str] = None
 
 class SettingsModel(BaseModel):
@@ -144,6 +146,32 @@ class SettingsModel(BaseModel):
         description="هدر مكنة لصق الشريط لكل مقاس بالسنتيمتر"
     )
     
+    # مقاس اللوح الخام (للرص على الألواح)
+    sheet_length_cm: float = Field(
+        default=244.0,
+        gt=0,
+        description="طول اللوح الخام بالسنتيمتر"
+    )
+    
+    sheet_width_cm: float = Field(
+        default=122.0,
+        gt=0,
+        description="عرض اللوح الخام بالسنتيمتر"
+    )
+    
+    # سمك سلاح المنشار (هدر كل قطع)
+    saw_kerf_cm: float = Field(
+        default=0.4,
+        ge=0,
+        description="سمك سلاح المنشار بالسنتيمتر"
+    )
+    
+    # السماح بتدوير القطع 90 درجة عند الرص (False للخامات ذات الاتجاه/العرق)
+    allow_part_rotation: bool = Field(
+        default=True,
+        description="السماح بتدوير القطع عند الرص على الألواح"
+    )
+    
     # أسعار الخامات
     materials: Dict[str, MaterialInfo] = Field(
         default_factory=dict,
@@ -156,7 +184,16 @@ class SettingsModel(BaseModel):
         description="تاريخ آخر تحديث"
     )
 
+    # رقم نسخة الإعدادات (يزيد مع كل تحديث)
+    version: int = Field(
+        default=0,
+        ge=0,
+        description="رقم نسخة الإعدادات"
+    )
+
     model_config = {
+        # نسخة واحدة مشتركة بين الطلبات (settings_snapshot) فلا يتم تعديلها
+        "frozen": True,
         "json_schema_extra": {
             "example": {
                 "assembly_method": "full_sides_back_routed",
@@ -173,13 +210,19 @@ class SettingsModel(BaseModel):
                 "shelf_depth_deduction": 5.0,
                 "ground_door_height_deduction_no_edge": 1.0,
                 "edge_banding_waste_per_size": 6.0,
+                "sheet_length_cm": 244.0,
+                "sheet_width_cm": 122.0,
+                "saw_kerf_cm": 0.4,
+                "allow_part_rotation": True,
                 "materials": {
                     "plywood_sheet": {
                         "price_per_sheet": 1200,
                         "sheet_size_m2": 2.98
                     },
                     "edge_band_per_meter": {
-                        "price_per_meter": 5
+                        "price_per_meter": 5,
+                        "roll_length_m": 100,
+                        "price_per_roll": 450
                     }
                 }
             }
@@ -206,4 +249,8 @@ class SettingsUpdate(BaseModel):
     shelf_depth_deduction: Optional[float] = Field(default=None, description="تخصيم الرف من العمق")
     ground_door_height_deduction_no_edge: Optional[float] = Field(default=None, description="تخصيم ارتفاع الضلفة الارضي بدون الشريط")
     edge_banding_waste_per_size: Optional[float] = Field(default=None, description="هدر مكنة لصق الشريط لكل مقاس")
+    sheet_length_cm: Optional[float] = Field(default=None, gt=0, description="طول اللوح الخام")
+    sheet_width_cm: Optional[float] = Field(default=None, gt=0, description="عرض اللوح الخام")
+    saw_kerf_cm: Optional[float] = Field(default=None, ge=0, description="سمك سلاح المنشار")
+    allow_part_rotation: Optional[bool] = Field(default=None, description="السماح بتدوير القطع عند الرص")
     materials: Optional[Dict[str, MaterialInfo]] = Field(default=None, description="أسعار الخامات")
\ No newline at end of file
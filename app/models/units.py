@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PositiveFloat, NonNegativeInt
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from enum import Enum
@@ -177,6 +177,8 @@ class UnitEstimateResponse(BaseModel):
     depth_cm: float
     shelf_count: int
     parts: List[Part]
+    part_count: int = Field(default=0, description="عدد القطع المختلفة")
+    total_qty: int = Field(default=0, description="إجمالي كمية القطع")
     total_edge_band_m: float
     total_area_m2: float
     material_usage: Dict[str, float]
@@ -185,6 +187,100 @@ class UnitEstimateResponse(BaseModel):
     )
     total_cost: float = Field(description="التكلفة الإجمالية")
 
+# الحد الأقصى لعدد الوحدات في طلب الحساب المجمع
+MAX_BATCH_UNITS = 200
+
+class UnitCalculateBatchRequest(BaseModel):
+    """طلب حساب مجموعة وحدات دفعة واحدة"""
+    items: List[UnitCalculateRequest] = Field(
+        min_length=1,
+        max_length=MAX_BATCH_UNITS,
+        description="قائمة الوحدات المطلوب حسابها"
+    )
+
+class UnitCalculateBatchItem(BaseModel):
+    """نتيجة وحدة واحدة داخل الحساب المجمع"""
+    index: int = Field(description="ترتيب الوحدة في الطلب")
+    result: Optional[UnitCalculateResponse] = Field(default=None, description="نتيجة الحساب عند النجاح")
+    error: Optional[str] = Field(default=None, description="سبب الفشل إن وجد")
+
+class UnitCalculateBatchResponse(BaseModel):
+    """نتيجة الحساب المجمع"""
+    results: List[UnitCalculateBatchItem]
+    succeeded: int = Field(description="عدد الوحدات المحسوبة بنجاح")
+    failed: int = Field(description="عدد الوحدات التي فشل حسابها")
+
+class UnitEstimateBatchRequest(BaseModel):
+    """طلب تقدير تكلفة مجموعة وحدات دفعة واحدة"""
+    items: List[UnitEstimateRequest] = Field(
+        min_length=1,
+        max_length=MAX_BATCH_UNITS,
+        description="قائمة الوحدات المطلوب تقدير تكلفتها"
+    )
+
+class UnitEstimateBatchItem(BaseModel):
+    """نتيجة تقدير وحدة واحدة داخل الطلب المجمع"""
+    index: int = Field(description="ترتيب الوحدة في الطلب")
+    result: Optional[UnitEstimateResponse] = Field(default=None, description="نتيجة التقدير عند النجاح")
+    error: Optional[str] = Field(default=None, description="سبب الفشل إن وجد")
+
+class UnitEstimateBatchResponse(BaseModel):
+    """نتيجة التقدير المجمع"""
+    results: List[UnitEstimateBatchItem]
+    succeeded: int = Field(description="عدد الوحدات المقدرة بنجاح")
+    failed: int = Field(description="عدد الوحدات التي فشل تقديرها")
+    total_cost: float = Field(default=0.0, description="إجمالي تكلفة الوحدات الناجحة")
+
+class UnitSweepRequest(BaseModel):
+    """طلب حساب نوع وحدة واحد على شبكة من المقاسات (عرض × ارتفاع × عمق)"""
+    type: UnitType = Field(description="نوع الوحدة")
+    widths_cm: List[PositiveFloat] = Field(min_length=1, description="قيم العرض بالسنتيمتر")
+    heights_cm: List[PositiveFloat] = Field(min_length=1, description="قيم الارتفاع بالسنتيمتر")
+    depths_cm: List[PositiveFloat] = Field(min_length=1, description="قيم العمق بالسنتيمتر")
+    shelf_counts: List[NonNegativeInt] = Field(default_factory=lambda: [2], min_length=1, description="أعداد الرفوف")
+    door_counts: List[NonNegativeInt] = Field(default_factory=lambda: [2], min_length=1, description="أعداد الضلف")
+    drawer_counts: List[NonNegativeInt] = Field(default_factory=lambda: [0], min_length=1, description="أعداد الأدراج")
+    width_2_cm: float = Field(default=0.0, ge=0, description="عرض 2 للوحدات الركنة بالسنتيمتر")
+    depth_2_cm: float = Field(default=0.0, ge=0, description="عمق 2 للوحدات الركنة بالسنتيمتر")
+    door_type: DoorType = Field(default=DoorType.HINGED, description="نوع الضلفة")
+    flip_door_height: float = Field(default=0.0, ge=0)
+    bottom_door_height: float = Field(default=0.0, ge=0)
+    oven_height: float = Field(default=60.0, ge=0)
+    microwave_height: float = Field(default=35.0, ge=0)
+    vent_height: float = Field(default=10.0, ge=0)
+    drawer_height_cm: float = Field(default=20.0, gt=0)
+    fixed_part_cm: float = Field(default=0.0, ge=0)
+
+class UnitSweepPart(BaseModel):
+    """قطعة في نتيجة الـ sweep - كل قائمة لها قيمة لكل نقطة في الشبكة"""
+    name: str
+    qty: int
+    depth_cm: Optional[float] = None
+    edge_distribution: Optional[EdgeDistribution] = None
+    width_cm: List[float]
+    height_cm: List[float]
+    area_m2: List[float]
+    edge_band_m: List[float]
+
+class UnitSweepVariant(BaseModel):
+    """نتيجة تركيبة واحدة من أعداد الرفوف والضلف والأدراج"""
+    shelf_count: int
+    door_count: int
+    drawer_count: int
+    parts: List[UnitSweepPart] = Field(default_factory=list)
+    total_area_m2: List[float] = Field(default_factory=list)
+    total_edge_band_m: List[float] = Field(default_factory=list)
+    error: Optional[str] = Field(default=None, description="سبب فشل التركيبة إن وجد")
+
+class UnitSweepResponse(BaseModel):
+    """نتيجة حساب نوع وحدة على شبكة من المقاسات"""
+    type: UnitType
+    points: int = Field(description="عدد نقاط الشبكة لكل تركيبة")
+    width_cm: List[float] = Field(description="العرض لكل نقطة (عرض ثم ارتفاع ثم عمق)")
+    height_cm: List[float] = Field(description="الارتفاع لكل نقطة")
+    depth_cm: List[float] = Field(description="العمق لكل نقطة")
+    variants: List[UnitSweepVariant]
+
 class UnitDocument(BaseModel):
     """نموذج الوحدة المحفوظة في MongoDB"""
     id: Optional[str] = None
@@ -205,3 +301,8 @@ class UnitDocument(BaseModel):
     
     class Config:
         populate_by_name = True
+
+class UnitPageResponse(BaseModel):
+    """صفحة من الوحدات المحفوظة"""
+    items: List[UnitDocument] = Field(default_factory=list)
+    next_cursor: Optional[str] = Field(default=None, description="مؤشر الصفحة التالية (None في آخر صفحة)")
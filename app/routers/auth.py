@@ -12,6 +12,8 @@ from app.services.auth_service import (
     delete_user, update_user_role
 )
 from app.services.auth_service import TokenData
+from app.models.jobs import JobKind, JobResponse
+from app.services.job_service import JobQueueFullError, create_job, job_to_response
 import jwt
 from app.services.auth_service import SECRET_KEY, ALGORITHM
 from app.database import get_database
@@ -387,6 +389,48 @@ async def get_user_units_count_endpoint(
         )
 
 
+@router.post("/units-quota/reconcile", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def reconcile_units_quota(authorization: str = Header(None)):
+    """
+    إعادة بناء عدادات حد الوحدات اليومية من الوحدات المحفوظة (مدير النظام فقط)
+    
+    Returns:
+    - JobResponse: مهمة في الخلفية، الحالة من GET /jobs/{job_id}
+    """
+    try:
+        # Extract token from Authorization header
+        if not authorization or not authorization.startswith("Bearer "):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid authorization header"
+            )
+        
+        token = authorization[len("Bearer "):]
+        token_data = await get_admin_user(token)
+        
+        if get_database() is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Database connection not available"
+            )
+        
+        try:
+            job_doc = await create_job(JobKind.UNIT_QUOTA_RECONCILE, created_by=token_data.user_id)
+        except JobQueueFullError as e:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=str(e)
+            )
+        
+        return job_to_response(job_doc)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error starting units quota reconciliation: {str(e)}"
+        )
+
 @router.get("/users/{user_id}/subscription-status")
 async def get_user_subscription_status(
     user_id: str,
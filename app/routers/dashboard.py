@@ -2,7 +2,10 @@ from fastapi import APIRouter, HTTPException, status, Header
 from typing import Dict, Any, List
 from datetime import datetime, timedelta
 from app.database import get_database
+from app.models.jobs import JobKind, JobResponse
 from app.services.auth_service import TokenData
+from app.services.job_service import JobQueueFullError, create_job, job_to_response
+from app.services.user_stats import get_user_stats
 import jwt
 from app.services.auth_service import SECRET_KEY, ALGORITHM
 
@@ -32,7 +35,7 @@ async def get_dashboard_stats(authorization: str = Header(None)):
     جلب إحصائيات لوحة التحكم
     
     Returns:
-    - dict: إحصائيات المشاريع، الوحدات، حسابات التقطيع، والتوفير
+    - dict: إحصائيات المشاريع، الوحدات، حسابات التقطيع، المساحة، الشريط، التكلفة، والتوفير
     """
     try:
         # Extract token from Authorization header
@@ -52,26 +55,17 @@ async def get_dashboard_stats(authorization: str = Header(None)):
                 detail="Database connection not available"
             )
         
-        # Get user's projects count
-        projects_count = await db.projects.count_documents({
-            "created_by": token_data.user_id
-        })
+        # مستند إحصائيات المستخدم (قراءة واحدة بالـ _id)
+        user_stats = await get_user_stats(db, token_data.user_id)
         
-        # Get user's units count
-        units_cursor = db.units.find({"created_by": token_data.user_id})
-        units_count = 0
-        cutting_calculations_count = 0
-        
-        async for unit in units_cursor:
-            units_count += 1
-            cutting_calculations_count += 1  # Each unit calculation counts as one
-        
-        # For demo purposes, we'll return static values for some stats
-        # In a real application, these would be calculated from actual data
+        # For demo purposes, savings_percentage is still a static value
         stats = {
-            "projects": projects_count,
-            "units": units_count,
-            "cutting_calculations": cutting_calculations_count,
+            "projects": user_stats["projects"],
+            "units": user_stats["units"],
+            "cutting_calculations": user_stats["units"],  # Each unit calculation counts as one
+            "total_area_m2": round(user_stats["total_area_m2"], 4),
+            "edge_band_m": round(user_stats["edge_band_m"], 4),
+            "total_cost": round(user_stats["total_cost"], 2),
             "savings_percentage": 32  # Static value for demo
         }
         
@@ -85,6 +79,56 @@ async def get_dashboard_stats(authorization: str = Header(None)):
             detail=f"Error retrieving dashboard stats: {str(e)}"
         )
 
+@router.post("/stats/rebuild", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def rebuild_dashboard_stats(authorization: str = Header(None)):
+    """
+    إعادة حساب إحصائيات لوحة التحكم لكل المستخدمين (للمدير فقط)
+    
+    Returns:
+    - JobResponse: مهمة في الخلفية، الحالة من GET /jobs/{job_id}
+    """
+    try:
+        # Extract token from Authorization header
+        if not authorization or not authorization.startswith("Bearer "):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid authorization header"
+            )
+        
+        token = authorization[len("Bearer "):]
+        token_data = await get_current_user_from_token(token)
+        
+        if token_data.role != "admin":
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only admins can rebuild dashboard stats"
+            )
+        
+        db = get_database()
+        if db is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Database connection not available"
+            )
+        
+        try:
+            job_doc = await create_job(JobKind.USER_STATS_REBUILD, created_by=token_data.user_id)
+        except JobQueueFullError as e:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=str(e)
+            )
+        
+        return job_to_response(job_doc)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error starting dashboard stats rebuild: {str(e)}"
+        )
+
 @router.get("/recent-projects")
 async def get_recent_projects(limit: int = 3, authorization: str = Header(None)):
     """
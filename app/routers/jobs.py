@@ -0,0 +1,76 @@
+from fastapi import APIRouter, HTTPException, status, Header
+from typing import Optional
+from app.database import get_database
+from app.models.jobs import JobResponse
+from app.services.auth_service import TokenData
+from app.services.job_service import job_to_response
+import jwt
+from app.services.auth_service import SECRET_KEY, ALGORITHM
+
+router = APIRouter()
+
+async def get_current_user(authorization: str = Header(None)) -> Optional[TokenData]:
+    """Extract current user from authorization header"""
+    if not authorization or not authorization.startswith("Bearer "):
+        return None
+    
+    token = authorization[len("Bearer "):]
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        user_id: str = payload.get("sub")
+        role: str = payload.get("role")
+        if user_id is None:
+            return None
+        return TokenData(user_id=user_id, role=role)
+    except jwt.PyJWTError:
+        return None
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str, authorization: str = Header(None)):
+    """
+    جلب حالة مهمة في الخلفية ونسبة التقدم والنتيجة عند الانتهاء
+    
+    Parameters:
+    - job_id: معرف المهمة
+    
+    Returns:
+    - JobResponse: الحالة (pending/running/completed/failed) والتقدم والنتيجة
+    """
+    try:
+        current_user = await get_current_user(authorization)
+        if not current_user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Authentication required"
+            )
+        
+        db = get_database()
+        if db is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Database connection not available"
+            )
+        
+        job_doc = await db.jobs.find_one({"_id": job_id})
+        
+        if job_doc is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Job with id {job_id} not found"
+            )
+        
+        if current_user.role != "admin" and job_doc.get("created_by") != current_user.user_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to access this job"
+            )
+        
+        return job_to_response(job_doc)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error retrieving job: {str(e)}"
+        )
@@ -6,8 +6,10 @@ from app.models.marketplace import (
     MarketplaceItemCreate,
     MarketplaceItemUpdate,
     MarketplaceItemResponse,
+    MarketplaceItemPageResponse,
     ItemStatus
 )
+from app.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursorError
 from app.routers.auth import get_current_user
 from app.models.auth import UserResponse
 import shutil
@@ -17,6 +19,44 @@ import os
 router = APIRouter()
 UPLOAD_DIR = "uploads"
 
+def parse_status_filter(status: Optional[str]) -> Optional[ItemStatus]:
+    # Handle "all" status from frontend by passing None to service if status is generic or empty
+    status_enum = None
+    if status and status != 'all':
+        try:
+             status_enum = ItemStatus(status)
+        except ValueError:
+             pass # Ignore invalid status or handle as None
+    return status_enum
+
+async def get_items_page_response(
+    service: MarketplaceService,
+    query: dict,
+    sort_field: str,
+    cursor: Optional[str],
+    limit: int,
+    seller_name: Optional[str] = None
+) -> MarketplaceItemPageResponse:
+    """
+    Keyset page of items as a response envelope with next_cursor.
+    """
+    try:
+        items, next_cursor = await service.get_items_page(query, sort_field, cursor=cursor, limit=limit)
+    except InvalidCursorError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    
+    extra = {"seller_name": seller_name} if seller_name else {}
+    return MarketplaceItemPageResponse(
+        items=[
+            MarketplaceItemResponse(
+                item_id=item.id,
+                **extra,
+                **item.model_dump(exclude={'id'})
+            ) for item in items
+        ],
+        next_cursor=next_cursor
+    )
+
 @router.post("/upload", status_code=status.HTTP_201_CREATED)
 async def upload_image(
     file: UploadFile = File(...),
@@ -83,13 +123,7 @@ async def list_items(
     """
     List marketplace items with search and filter.
     """
-    # Handle "all" status from frontend by passing None to service if status is generic or empty
-    status_enum = None
-    if status and status != 'all':
-        try:
-             status_enum = ItemStatus(status)
-        except ValueError:
-             pass # Ignore invalid status or handle as None
+    status_enum = parse_status_filter(status)
              
     items = await service.get_items(status=status_enum, search_query=q, skip=skip, limit=limit)
     
@@ -103,6 +137,20 @@ async def list_items(
         ) for item in items
     ]
 
+@router.get("/items/page", response_model=MarketplaceItemPageResponse)
+async def list_items_page(
+    q: Optional[str] = Query(None, description="Search term for title or description"),
+    status: Optional[str] = Query('available', description="Filter by status (available, sold, reserved, My Orders)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    service: MarketplaceService = Depends(get_marketplace_service)
+):
+    """
+    List marketplace items page by page (newest first) with a cursor instead of skip.
+    """
+    query = service.items_query(status=parse_status_filter(status), search_query=q)
+    return await get_items_page_response(service, query, "created_at", cursor, limit)
+
 @router.get("/my-orders", response_model=List[MarketplaceItemResponse])
 async def get_my_orders(
     skip: int = Query(0, ge=0),
@@ -121,6 +169,19 @@ async def get_my_orders(
         ) for item in items
     ]
 
+@router.get("/my-orders/page", response_model=MarketplaceItemPageResponse)
+async def get_my_orders_page(
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    current_user: UserResponse = Depends(get_current_user),
+    service: MarketplaceService = Depends(get_marketplace_service)
+):
+    """
+    Get items bought by the current user page by page.
+    """
+    query = service.buyer_query(current_user.user_id)
+    return await get_items_page_response(service, query, "updated_at", cursor, limit)
+
 @router.get("/my-listings", response_model=List[MarketplaceItemResponse])
 async def get_my_listings(
     skip: int = Query(0, ge=0),
@@ -140,6 +201,21 @@ async def get_my_listings(
         ) for item in items
     ]
 
+@router.get("/my-listings/page", response_model=MarketplaceItemPageResponse)
+async def get_my_listings_page(
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    current_user: UserResponse = Depends(get_current_user),
+    service: MarketplaceService = Depends(get_marketplace_service)
+):
+    """
+    Get all items listed by the current user page by page.
+    """
+    query = service.owner_query(current_user.user_id)
+    return await get_items_page_response(
+        service, query, "created_at", cursor, limit, seller_name=current_user.full_name
+    )
+
 @router.get("/sales", response_model=List[MarketplaceItemResponse])
 async def get_my_sales(
     skip: int = Query(0, ge=0),
@@ -158,6 +234,19 @@ async def get_my_sales(
         ) for item in items
     ]
 
+@router.get("/sales/page", response_model=MarketplaceItemPageResponse)
+async def get_my_sales_page(
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    current_user: UserResponse = Depends(get_current_user),
+    service: MarketplaceService = Depends(get_marketplace_service)
+):
+    """
+    Get items sold by the current user page by page.
+    """
+    query = service.seller_query(current_user.user_id)
+    return await get_items_page_response(service, query, "updated_at", cursor, limit)
+
 @router.get("/items/{item_id}", response_model=MarketplaceItemResponse)
 async def get_item(
     item_id: str = Path(..., description="Item ID"),
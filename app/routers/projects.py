@@ -1,14 +1,57 @@
-from fastapi import APIRouter, HTTPException, status, Header
-from typing import List, Optional
+from fastapi import APIRouter, HTTPException, status, Header, Query, Response
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+from typing import Any, Dict, List, Optional, Union
+import os
 import uuid
 from datetime import datetime
 from app.models.projects import (
     ProjectCreateRequest, 
     ProjectUpdateRequest, 
     ProjectResponse,
-    ProjectDocument
+    ProjectDocument,
+    ProjectCutListResponse,
+    ProjectSummaryResponse,
+    ProjectPageResponse,
+    ProjectSummaryPageResponse
 )
 from app.models.units import UnitDocument
+from app.models.nesting import SheetNestingResult
+from app.models.edge_band import EdgeRollsResponse, EdgeType
+from app.models.pricing import ProjectPriceScenariosRequest, PriceScenariosResponse
+from app.models.assembly_comparison import AssemblyComparisonResponse
+from app.services.sheet_nesting import parts_from_unit_document
+from app.services.cut_list import build_cut_list
+from app.services.assembly_comparison import cheapest_variant, compare_assembly_variants
+from app.services.cost_engine import get_price_table
+from app.services.lazy_modules import price_scenarios
+from app.services.settings_snapshot import get_current_settings
+from app.services.etags import etag_matches, resource_etag
+from app.services.unit_quota import increment_unit_quota, quota_day, reconcile_unit_quotas
+from app.services.user_stats import (
+    increment_user_stats,
+    rebuild_user_stats,
+    sum_stats_deltas,
+    unit_stats_delta
+)
+from app.services.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    InvalidCursorError,
+    page_filter,
+    page_sort,
+    split_page
+)
+from app.services.project_excel_export import (
+    EXCEL_MEDIA_TYPE,
+    create_export_file,
+    iter_file_chunks,
+    remove_export_file,
+    write_project_workbook
+)
+from app.models.jobs import JobKind, JobResponse
+from app.services.job_service import create_job, job_to_response, run_in_job_pool, JobQueueFullError
+from app.services.project_optimizer import nest_project_parts, plan_project_edge_rolls
 from app.database import get_database
 from app.services.auth_service import TokenData, get_user_by_id, get_user_units_count
 import jwt
@@ -79,6 +122,7 @@ async def create_project(request: ProjectCreateRequest, authorization: str = Hea
         
         # حفظ المشروع في قاعدة البيانات
         await db.projects.insert_one(project_doc)
+        await increment_user_stats(db, current_user.user_id, {"projects": 1})
         
         return ProjectResponse(
             project_id=project_id,
@@ -98,13 +142,100 @@ async def create_project(request: ProjectCreateRequest, authorization: str = Hea
             detail=f"Error creating project: {str(e)}"
         )
 
-@router.get("/", response_model=List[ProjectResponse])
-async def list_projects(authorization: str = Header(None)):
+# حقول الوحدة في قائمة المشاريع (حقول UnitDocument فقط بدون مدخلات الطلب وغيرها)
+PROJECT_LIST_UNIT_FIELDS = [name for name in UnitDocument.model_fields if name != "id"]
+
+def project_list_pipeline(
+    query: Dict[str, Any],
+    summary: bool = False,
+    limit: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    aggregation واحد لقائمة المشاريع مع وحداتها ($lookup بدلاً من استعلام لكل مشروع)
+    
+    مع summary يتم حساب عدد الوحدات وإجمالي المساحة والتكلفة داخل MongoDB
+    ولا يرجع أي حقل من الوحدات. مع limit يتم الترتيب (الأحدث أولاً) والقص
+    قبل $lookup فلا تُجلب وحدات مشاريع خارج الصفحة.
+    
+    $lookup يحدد حقول الوحدات داخل pipeline الخاص به، فلا تخرج من units
+    إلا الحقول المطلوبة (المساحة والتكلفة فقط مع summary).
+    """
+    pipeline = [{"$match": query}]
+    if limit is not None:
+        pipeline.append({"$sort": dict(page_sort("created_at"))})
+        pipeline.append({"$limit": limit})
+    if summary:
+        unit_fields = {"_id": 0, "total_area_m2": 1, "price_estimate": 1}
+    else:
+        unit_fields = {field: 1 for field in PROJECT_LIST_UNIT_FIELDS}
+    pipeline.append({"$lookup": {
+        "from": "units",
+        "localField": "unit_ids",
+        "foreignField": "_id",
+        "pipeline": [{"$project": unit_fields}],
+        "as": "units"
+    }})
+    project_fields = {"name": 1, "description": 1, "client_name": 1, "created_at": 1, "updated_at": 1}
+    if summary:
+        pipeline.append({"$project": {
+            **project_fields,
+            "unit_count": {"$size": "$units"},
+            "total_area_m2": {"$sum": "$units.total_area_m2"},
+            "total_cost": {"$sum": "$units.price_estimate"}
+        }})
+    else:
+        pipeline.append({"$project": {**project_fields, "units": 1}})
+    return pipeline
+
+def project_list_item(
+    project_doc: Dict[str, Any],
+    summary: bool = False
+) -> Union[ProjectResponse, ProjectSummaryResponse]:
+    """تحويل نتيجة project_list_pipeline إلى عنصر في القائمة"""
+    if summary:
+        return ProjectSummaryResponse(
+            project_id=project_doc["_id"],
+            name=project_doc["name"],
+            description=project_doc.get("description", ""),
+            client_name=project_doc.get("client_name", ""),
+            unit_count=project_doc["unit_count"],
+            total_area_m2=round(project_doc["total_area_m2"], 4),
+            total_cost=round(project_doc["total_cost"], 2),
+            created_at=project_doc["created_at"],
+            updated_at=project_doc.get("updated_at")
+        )
+    
+    # تحويل المستند إلى UnitDocument مع ضمان وجود id
+    units = [
+        UnitDocument(**unit_doc, id=unit_doc["_id"])
+        for unit_doc in project_doc.get("units", [])
+    ]
+    
+    return ProjectResponse(
+        project_id=project_doc["_id"],
+        name=project_doc["name"],
+        description=project_doc.get("description", ""),
+        client_name=project_doc.get("client_name", ""),
+        units=units,
+        created_at=project_doc["created_at"],
+        updated_at=project_doc.get("updated_at")
+    )
+
+@router.get("/", response_model=Union[List[ProjectResponse], List[ProjectSummaryResponse]])
+async def list_projects(
+    summary: bool = Query(False, description="ملخص لكل مشروع (عدد الوحدات والمساحة والتكلفة) بدون الوحدات"),
+    authorization: str = Header(None)
+):
     """
     جلب قائمة بجميع المشاريع
     
+    المشاريع ووحداتها تُجلب في aggregation واحد.
+    
+    Parameters:
+    - summary: Query - إرجاع ProjectSummaryResponse لكل مشروع بدون الوحدات وقطعها
+    
     Returns:
-    - List[ProjectResponse]: قائمة بجميع المشاريع
+    - List[ProjectResponse] أو List[ProjectSummaryResponse]: قائمة بجميع المشاريع
     """
     try:
         # Extract user from token
@@ -127,29 +258,11 @@ async def list_projects(authorization: str = Header(None)):
         if current_user.role != "admin":
             query["created_by"] = current_user.user_id
             
-        projects_cursor = db.projects.find(query)
+        projects_cursor = db.projects.aggregate(project_list_pipeline(query, summary=summary))
         projects = []
         
         async for project_doc in projects_cursor:
-            # جلب الوحدات المرتبطة بالمشروع
-            units = []
-            if "unit_ids" in project_doc and project_doc["unit_ids"]:
-                units_cursor = db.units.find({"_id": {"$in": project_doc["unit_ids"]}})
-                async for unit_doc in units_cursor:
-                    # تحويل المستند إلى UnitDocument مع ضمان وجود id
-                    unit_data = unit_doc.copy()
-                    unit_data["id"] = unit_doc["_id"]
-                    units.append(UnitDocument(**unit_data))
-            
-            projects.append(ProjectResponse(
-                project_id=project_doc["_id"],
-                name=project_doc["name"],
-                description=project_doc.get("description", ""),
-                client_name=project_doc.get("client_name", ""),
-                units=units,
-                created_at=project_doc["created_at"],
-                updated_at=project_doc.get("updated_at")
-            ))
+            projects.append(project_list_item(project_doc, summary))
         
         return projects
         
@@ -161,11 +274,82 @@ async def list_projects(authorization: str = Header(None)):
             detail=f"Error listing projects: {str(e)}"
         )
 
+@router.get("/page", response_model=Union[ProjectPageResponse, ProjectSummaryPageResponse])
+async def list_projects_page(
+    cursor: Optional[str] = Query(None, description="next_cursor من الصفحة السابقة"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    summary: bool = Query(False, description="ملخص لكل مشروع (عدد الوحدات والمساحة والتكلفة) بدون الوحدات"),
+    authorization: str = Header(None)
+):
+    """
+    صفحة من قائمة المشاريع (الأحدث أولاً) بمؤشر بدلاً من skip
+    
+    Parameters:
+    - cursor: Query - next_cursor من الصفحة السابقة (بدونه تبدأ من أول صفحة)
+    - limit: Query - عدد المشاريع في الصفحة
+    - summary: Query - ملخص لكل مشروع بدون الوحدات
+    
+    Returns:
+    - ProjectPageResponse أو ProjectSummaryPageResponse: المشاريع و next_cursor
+    """
+    try:
+        # Extract user from token
+        current_user = await get_current_user(authorization)
+        if not current_user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Authentication required"
+            )
+        
+        db = get_database()
+        if db is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Database connection not available"
+            )
+        
+        query = {}
+        if current_user.role != "admin":
+            query["created_by"] = current_user.user_id
+        try:
+            query = page_filter(query, "created_at", cursor)
+        except InvalidCursorError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
+        
+        project_docs = await db.projects.aggregate(
+            project_list_pipeline(query, summary=summary, limit=limit + 1)
+        ).to_list(limit + 1)
+        project_docs, next_cursor = split_page(project_docs, "created_at", limit)
+        
+        items = [project_list_item(project_doc, summary) for project_doc in project_docs]
+        if summary:
+            return ProjectSummaryPageResponse(items=items, next_cursor=next_cursor)
+        return ProjectPageResponse(items=items, next_cursor=next_cursor)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error listing projects: {str(e)}"
+        )
+
 @router.get("/{project_id}", response_model=ProjectResponse)
-async def get_project(project_id: str, authorization: str = Header(None)):
+async def get_project(
+    project_id: str,
+    response: Response,
+    authorization: str = Header(None),
+    if_none_match: Optional[str] = Header(None)
+):
     """
     جلب تفاصيل مشروع معين
     
+    الـ ETag من مستند المشروع و updated_at لكل وحدة، و If-None-Match بنفس
+    القيمة يرجع 304 بدون تحميل الوحدات.
+    
     Parameters:
     - project_id: معرف المشروع
     
@@ -204,6 +388,21 @@ async def get_project(project_id: str, authorization: str = Header(None)):
                 detail="You don't have permission to access this project"
             )
         
+        # ETag: المشروع + تاريخ آخر تحديث لكل وحدة (بدون تحميل القطع)
+        unit_stamps = []
+        if project_doc.get("unit_ids"):
+            unit_stamps = await db.units.find(
+                {"_id": {"$in": project_doc["unit_ids"]}},
+                {"updated_at": 1}
+            ).to_list(length=None)
+        unit_stamps = sorted((unit_doc["_id"], unit_doc.get("updated_at")) for unit_doc in unit_stamps)
+        etag = resource_etag("project", project_doc, unit_stamps)
+        cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+        response.headers.update(cache_headers)
+        
         # جلب الوحدات المرتبطة بالمشروع
         units = []
         if "unit_ids" in project_doc and project_doc["unit_ids"]:
@@ -232,6 +431,557 @@ async def get_project(project_id: str, authorization: str = Header(None)):
             detail=f"Error retrieving project: {str(e)}"
         )
 
+@router.get("/{project_id}/cut-list", response_model=ProjectCutListResponse)
+async def get_project_cut_list(project_id: str, authorization: str = Header(None)):
+    """
+    قائمة القص المجمعة لكل وحدات المشروع
+    
+    القطع المتطابقة (نفس نوع الاسم والمقاس بالمليمتر والسمك وتوزيع الشريط)
+    من كل الوحدات تظهر في سطر واحد بكمية مجمعة.
+    
+    Parameters:
+    - project_id: معرف المشروع
+    
+    Returns:
+    - ProjectCutListResponse: أسطر القص والإجماليات
+    """
+    try:
+        # Extract user from token
+        current_user = await get_current_user(authorization)
+        if not current_user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Authentication required"
+            )
+        
+        db = get_database()
+        if db is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Database connection not available"
+            )
+        
+        project_doc = await db.projects.find_one({"_id": project_id}, {"created_by": 1, "unit_ids": 1})
+        
+        if project_doc is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Project with id {project_id} not found"
+            )
+        
+        # التحقق من صلاحيات الوصول للمستخدم العادي
+        if current_user.role != "admin" and project_doc.get("created_by") != current_user.user_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to access this project"
+            )
+        
+        # كل قطع الوحدات في query واحد
+        unit_docs = []
+        if project_doc.get("unit_ids"):
+            unit_docs = await db.units.find(
+                {"_id": {"$in": project_doc["unit_ids"]}},
+                {"parts_calculated": 1, "internal_counter_parts": 1}
+            ).to_list(length=None)
+        
+        lines = build_cut_list(unit_docs)
+        
+        return ProjectCutListResponse(
+            project_id=project_id,
+            units_count=len(unit_docs),
+            parts_count=sum(line.qty for line in lines),
+            total_area_m2=round(sum(line.area_m2 for line in lines), 4),
+            total_edge_band_m=round(sum(line.edge_band_m * line.qty for line in lines), 3),
+            lines=lines
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error building project cut list: {str(e)}"
+        )
+
+@router.get("/{project_id}/export-excel")
+async def export_project_to_excel(project_id: str, authorization: str = Header(None)):
+    """
+    تصدير قطع كل وحدات المشروع إلى ملف Excel واحد
+    
+    نفس شيتات تصدير الوحدة (القطع الأساسية، الضهر، الضلف) مع عمود للوحدة.
+    الوحدات تُقرأ من cursor وتُكتب مباشرة (openpyxl write_only) والملف
+    يُرسل على أجزاء، فالذاكرة لا تزيد مع حجم المشروع.
+    
+    Parameters:
+    - project_id: معرف المشروع
+    
+    Returns:
+    - Excel file with the parts of every unit
+    """
+    try:
+        # Extract user from token
+        current_user = await get_current_user(authorization)
+        if not current_user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Authentication required"
+            )
+        
+        db = get_database()
+        if db is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Database connection not available"
+            )
+        
+        project_doc = await db.projects.find_one({"_id": project_id}, {"created_by": 1, "unit_ids": 1})
+        
+        if project_doc is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Project with id {project_id} not found"
+            )
+        
+        # التحقق من صلاحيات الوصول للمستخدم العادي
+        if current_user.role != "admin" and project_doc.get("created_by") != current_user.user_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to access this project"
+            )
+        
+        units_cursor = db.units.find(
+            {"_id": {"$in": project_doc.get("unit_ids", [])}},
+            {"type": 1, "width_cm": 1, "height_cm": 1, "depth_cm": 1, "parts_calculated": 1}
+        ).sort("created_at", 1).batch_size(50)
+        
+        export_path = create_export_file()
+        try:
+            await write_project_workbook(units_cursor, export_path)
+        except Exception:
+            remove_export_file(export_path)
+            raise
+        
+        headers = {
+            "Content-Disposition": f"attachment; filename=project_details_{project_id}.xlsx",
+            "Content-Length": str(os.path.getsize(export_path))
+        }
+        
+        return StreamingResponse(
+            iter_file_chunks(export_path),
+            media_type=EXCEL_MEDIA_TYPE,
+            headers=headers,
+            background=BackgroundTask(remove_export_file, export_path)
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error exporting project to Excel: {str(e)}"
+        )
+
+@router.get("/{project_id}/nesting", response_model=SheetNestingResult)
+async def get_project_nesting(project_id: str, authorization: str = Header(None)):
+    """
+    رص قطع كل وحدات المشروع على الألواح الخام معاً
+    
+    الرص يعمل في process pool المهام (run_in_job_pool) حتى لا يحجز event loop.
+    
+    Parameters:
+    - project_id: معرف المشروع
+    
+    Returns:
+    - SheetNestingResult: رص كل لوح وعدد الألواح الفعلي للمشروع ونسبة الاستغلال
+    """
+    try:
+        # Extract user from token
+        current_user = await get_current_user(authorization)
+        if not current_user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Authentication required"
+            )
+        
+        db = get_database()
+        if db is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Database connection not available"
+            )
+        
+        project_doc = await db.projects.find_one({"_id": project_id})
+        
+        if project_doc is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Project with id {project_id} not found"
+            )
+        
+        # التحقق من صلاحيات الوصول للمستخدم العادي
+        if current_user.role != "admin" and project_doc.get("created_by") != current_user.user_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to access this project"
+            )
+        
+        # تجميع قطع كل الوحدات
+        parts = []
+        if project_doc.get("unit_ids"):
+            units_cursor = db.units.find(
+                {"_id": {"$in": project_doc["unit_ids"]}},
+                {"parts_calculated": 1, "internal_counter_parts": 1}
+            )
+            async for unit_doc in units_cursor:
+                parts.extend(parts_from_unit_document(unit_doc))
+        
+        settings = await get_current_settings()
+        
+        nesting = await run_in_job_pool(
+            nest_project_parts,
+            [part.model_dump(mode="json") for part in parts],
+            settings.model_dump(mode="json")
+        )
+        return SheetNestingResult(**nesting)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error nesting project parts: {str(e)}"
+        )
+
+@router.get("/{project_id}/edge-rolls", response_model=EdgeRollsResponse)
+async def get_project_edge_rolls(project_id: str, edge_type: Optional[str] = None, authorization: str = Header(None)):
+    """
+    خطة شراء لفات الشريط لكل وحدات المشروع
+    
+    يتم توزيع كل قطع الشريط (طول الحافة + هدر المكنة) على لفات بالطول
+    المحدد في خامة الشريط (roll_length_m) لكل نوع شريط، في process pool المهام.
+    
+    Parameters:
+    - project_id: معرف المشروع
+    - edge_type: نوع الشريط (wood/pvc) - اختياري
+    
+    Returns:
+    - EdgeRollsResponse: عدد اللفات والهدر والتكلفة لكل نوع شريط
+    """
+    try:
+        # Extract user from token
+        current_user = await get_current_user(authorization)
+        if not current_user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Authentication required"
+            )
+        
+        selected_edge_type = EdgeType.PVC  # Default
+        if edge_type:
+            try:
+                selected_edge_type = EdgeType(edge_type.lower())
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Invalid edge_type: {edge_type}. Must be 'wood' or 'pvc'"
+                )
+        
+        db = get_database()
+        if db is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Database connection not available"
+            )
+        
+        project_doc = await db.projects.find_one({"_id": project_id})
+        
+        if project_doc is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Project with id {project_id} not found"
+            )
+        
+        # التحقق من صلاحيات الوصول للمستخدم العادي
+        if current_user.role != "admin" and project_doc.get("created_by") != current_user.user_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to access this project"
+            )
+        
+        parts_data = []
+        if project_doc.get("unit_ids"):
+            units_cursor = db.units.find(
+                {"_id": {"$in": project_doc["unit_ids"]}},
+                {"parts_calculated": 1}
+            )
+            async for unit_doc in units_cursor:
+                parts_data.extend(unit_doc.get("parts_calculated", []))
+        
+        settings = await get_current_settings()
+        
+        # توزيع الشرائط على اللفات في process pool المهام
+        edge_rolls = await run_in_job_pool(
+            plan_project_edge_rolls, parts_data, settings.model_dump(mode="json"), selected_edge_type.value
+        )
+        total_cost = sum(plan["cost"] for plan in edge_rolls["roll_plan"] if plan["cost"])
+        
+        return EdgeRollsResponse(
+            project_id=project_id,
+            total_edge_m=edge_rolls["total_edge_m"],
+            roll_plan=edge_rolls["roll_plan"],
+            total_cost=round(total_cost, 2) if total_cost > 0 else None
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error planning project edge rolls: {str(e)}"
+        )
+
+@router.post("/{project_id}/price-scenarios", response_model=PriceScenariosResponse)
+async def price_project_scenarios(
+    project_id: str,
+    request: ProjectPriceScenariosRequest,
+    authorization: str = Header(None)
+):
+    """
+    تكلفة المشروع بأسعار الإعدادات الحالية وبكل سيناريو أسعار
+    
+    عدد الألواح من رص قطع كل الوحدات معاً (في process pool المهام)، ومتر
+    الشريط من مجموع الوحدات، ثم تُسعر كل السيناريوهات معاً.
+    
+    Parameters:
+    - project_id: معرف المشروع
+    - request: ProjectPriceScenariosRequest - سيناريوهات الأسعار
+    
+    Returns:
+    - PriceScenariosResponse - التكلفة الحالية وتكلفة كل سيناريو
+    """
+    try:
+        # Extract user from token
+        current_user = await get_current_user(authorization)
+        if not current_user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Authentication required"
+            )
+        
+        db = get_database()
+        if db is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Database connection not available"
+            )
+        
+        project_doc = await db.projects.find_one({"_id": project_id})
+        
+        if project_doc is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Project with id {project_id} not found"
+            )
+        
+        # التحقق من صلاحيات الوصول للمستخدم العادي
+        if current_user.role != "admin" and project_doc.get("created_by") != current_user.user_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to access this project"
+            )
+        
+        parts = []
+        edge_band_m = 0.0
+        if project_doc.get("unit_ids"):
+            units_cursor = db.units.find(
+                {"_id": {"$in": project_doc["unit_ids"]}},
+                {"parts_calculated": 1, "internal_counter_parts": 1, "edge_band_m": 1}
+            )
+            async for unit_doc in units_cursor:
+                parts.extend(parts_from_unit_document(unit_doc))
+                edge_band_m += unit_doc.get("edge_band_m") or 0
+        
+        settings = await get_current_settings()
+        
+        # الرص (الجزء البطيء) في process pool المهام، والتسعير المتجه بعده
+        nesting = await run_in_job_pool(
+            nest_project_parts,
+            [part.model_dump(mode="json") for part in parts],
+            settings.model_dump(mode="json")
+        )
+        return price_scenarios().price_scenarios(
+            float(nesting["priced_sheet_count"]),
+            round(edge_band_m, 2),
+            request.scenarios,
+            get_price_table(settings)
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error pricing project scenarios: {str(e)}"
+        )
+
+@router.get("/{project_id}/assembly-comparison", response_model=AssemblyComparisonResponse)
+async def compare_project_assembly(project_id: str, authorization: str = Header(None)):
+    """
+    حساب كل وحدات المشروع بكل طرق التجميع وأنواع المقابض ومقارنة النتائج
+
+    الوحدات يُعاد حسابها من مدخلات الطلب المحفوظة، وعدد الألواح لكل تركيبة
+    من رص قطع كل الوحدات معاً. الوحدات القديمة بدون مدخلات الطلب لا تدخل في
+    المقارنة (skipped_units).
+
+    Parameters:
+    - project_id: معرف المشروع
+
+    Returns:
+    - AssemblyComparisonResponse - نتيجة كل تركيبة والتركيبة الأقل تكلفة
+    """
+    try:
+        # Extract user from token
+        current_user = await get_current_user(authorization)
+        if not current_user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Authentication required"
+            )
+
+        db = get_database()
+        if db is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Database connection not available"
+            )
+
+        project_doc = await db.projects.find_one({"_id": project_id})
+
+        if project_doc is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Project with id {project_id} not found"
+            )
+
+        # التحقق من صلاحيات الوصول للمستخدم العادي
+        if current_user.role != "admin" and project_doc.get("created_by") != current_user.user_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to access this project"
+            )
+
+        units_inputs = []
+        skipped_units = 0
+        if project_doc.get("unit_ids"):
+            units_cursor = db.units.find(
+                {"_id": {"$in": project_doc["unit_ids"]}},
+                {"request_inputs": 1}
+            )
+            async for unit_doc in units_cursor:
+                if unit_doc.get("request_inputs"):
+                    units_inputs.append(unit_doc["request_inputs"])
+                else:
+                    skipped_units += 1
+
+        settings = await get_current_settings()
+
+        variants = await compare_assembly_variants(units_inputs, settings, nest=True)
+        return AssemblyComparisonResponse(
+            current_assembly_method=settings.assembly_method,
+            current_handle_type=settings.handle_type,
+            unit_count=len(units_inputs),
+            skipped_units=skipped_units,
+            variants=variants,
+            cheapest=cheapest_variant(variants)
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error comparing project assembly methods: {str(e)}"
+        )
+
+@router.post("/{project_id}/optimize", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def optimize_project(project_id: str, edge_type: Optional[str] = None, authorization: str = Header(None)):
+    """
+    بدء مهمة في الخلفية لرص ألواح المشروع ولفات الشريط وحساب التكلفة
+    
+    الحساب يعمل في process pool منفصل ولا يحجز السيرفر، وتتم متابعة
+    التقدم والنتيجة من GET /jobs/{job_id}.
+    
+    Parameters:
+    - project_id: معرف المشروع
+    - edge_type: نوع الشريط (wood/pvc) - اختياري
+    
+    Returns:
+    - JobResponse: المهمة الجديدة (pending)
+    """
+    try:
+        # Extract user from token
+        current_user = await get_current_user(authorization)
+        if not current_user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Authentication required"
+            )
+        
+        selected_edge_type = EdgeType.PVC  # Default
+        if edge_type:
+            try:
+                selected_edge_type = EdgeType(edge_type.lower())
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Invalid edge_type: {edge_type}. Must be 'wood' or 'pvc'"
+                )
+        
+        db = get_database()
+        if db is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Database connection not available"
+            )
+        
+        project_doc = await db.projects.find_one({"_id": project_id}, {"created_by": 1})
+        
+        if project_doc is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Project with id {project_id} not found"
+            )
+        
+        # التحقق من صلاحيات الوصول للمستخدم العادي
+        if current_user.role != "admin" and project_doc.get("created_by") != current_user.user_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to access this project"
+            )
+        
+        try:
+            job_doc = await create_job(
+                JobKind.PROJECT_OPTIMIZE,
+                created_by=current_user.user_id,
+                project_id=project_id,
+                params={"edge_type": selected_edge_type.value}
+            )
+        except JobQueueFullError as e:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=str(e)
+            )
+        
+        return job_to_response(job_doc)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error starting project optimization: {str(e)}"
+        )
+
 @router.put("/{project_id}", response_model=ProjectResponse)
 async def update_project(project_id: str, request: ProjectUpdateRequest, authorization: str = Header(None)):
     """
@@ -363,12 +1113,36 @@ async def delete_project(project_id: str, authorization: str = Header(None)):
                 detail="You don't have permission to delete this project"
             )
         
-        # حذف الوحدات المرتبطة بالمشروع
+        # حذف الوحدات المرتبطة بالمشروع (مع طرحها من إحصائيات أصحابها)
         if "unit_ids" in project_doc and project_doc["unit_ids"]:
-            await db.units.delete_many({"_id": {"$in": project_doc["unit_ids"]}})
+            unit_docs = await db.units.find(
+                {"_id": {"$in": project_doc["unit_ids"]}},
+                {"created_by": 1, "created_at": 1, "total_area_m2": 1, "edge_band_m": 1, "price_estimate": 1}
+            ).to_list(None)
+            delete_result = await db.units.delete_many({"_id": {"$in": project_doc["unit_ids"]}})
+            
+            owner_deltas: Dict[str, List[Dict[str, float]]] = {}
+            owner_quota_days: Dict[str, Dict[str, int]] = {}
+            for unit_doc in unit_docs:
+                owner_id = unit_doc.get("created_by")
+                owner_deltas.setdefault(owner_id, []).append(unit_stats_delta(unit_doc, -1))
+                if unit_doc.get("created_at"):
+                    quota_days = owner_quota_days.setdefault(owner_id, {})
+                    day = quota_day(unit_doc["created_at"])
+                    quota_days[day] = quota_days.get(day, 0) - 1
+            for owner_id, deltas in owner_deltas.items():
+                if delete_result.deleted_count == len(unit_docs):
+                    await increment_user_stats(db, owner_id, sum_stats_deltas(deltas))
+                    await increment_unit_quota(db, owner_id, owner_quota_days.get(owner_id, {}))
+                elif owner_id:
+                    # حذف متزامن لنفس الوحدات: لا نعرف ما حذفه هذا الطلب
+                    await rebuild_user_stats(db, owner_id)
+                    await reconcile_unit_quotas(db, owner_id)
         
         # حذف المشروع
-        await db.projects.delete_one({"_id": project_id})
+        delete_result = await db.projects.delete_one({"_id": project_id})
+        if delete_result.deleted_count:
+            await increment_user_stats(db, project_doc.get("created_by"), {"projects": -1})
         
         return None
         
@@ -1,45 +1,30 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, status, Response, Header
 from app.database import get_database
 from app.models.settings import SettingsModel, SettingsUpdate
+from app.models.jobs import JobKind
+from app.services.calculation_cache import clear_unit_calculation_cache
+from app.services.job_service import create_job, JobQueueFullError
+from app.services.settings_dependencies import affected_unit_types
+from app.services.settings_snapshot import (
+    SETTINGS_ID,
+    get_current_settings,
+    get_settings_from_db,
+    refresh_current_settings
+)
+from app.services.etags import etag_matches, resource_etag
 from datetime import datetime
-from typing import Dict, Any
-from bson import ObjectId
+from typing import Optional
 
 router = APIRouter()
 
-SETTINGS_ID = "global"
-
-async def get_settings_from_db() -> Dict[str, Any]:
-    """Get settings from MongoDB"""
-    db = get_database()
-    if db is None:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Database connection not available"
-        )
-    
-    settings_collection = db.settings
-    settings_doc = await settings_collection.find_one({"_id": SETTINGS_ID})
-    
-    if settings_doc is None:
-        # Create default settings if not exists
-        default_settings = SettingsModel().model_dump()
-        default_settings["_id"] = SETTINGS_ID
-        default_settings["last_updated"] = datetime.utcnow()
-        await settings_collection.insert_one(default_settings)
-        return default_settings
-    
-    # Convert ObjectId to string if present
-    if "_id" in settings_doc and isinstance(settings_doc["_id"], ObjectId):
-        settings_doc["_id"] = str(settings_doc["_id"])
-    
-    return settings_doc
-
 @router.get("", response_model=SettingsModel)
-async def get_settings():
+async def get_settings(response: Response, if_none_match: Optional[str] = Header(None)):
     """
     جلب الإعدادات الحالية
     
+    The ETag comes from the settings version; If-None-Match with the current
+    ETag returns 304.
+    
     Returns the current application settings including:
     - assembly_method: طريقة التجميع
     - handle_type: نوع المقبض
@@ -48,17 +33,17 @@ async def get_settings():
     - materials: أسعار الخامات
     """
     try:
-        settings_doc = await get_settings_from_db()
-        # Remove _id from response
-        settings_doc.pop("_id", None)
+        # Invalid/outdated DB data falls back to defaults (see settings_snapshot)
+        # so the user can re-save valid settings
+        settings = await get_current_settings()
+        
+        etag = resource_etag("settings", settings.version, settings.last_updated)
+        cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+        response.headers.update(cache_headers)
         
-        try:
-            return SettingsModel(**settings_doc)
-        except Exception as validation_error:
-            # If DB data is invalid/outdated, log it and return defaults
-            # This prevents 500 error and allows user to re-save valid settings
-            print(f"WARNING: Settings validation failed: {validation_error}. Returning defaults.")
-            return SettingsModel()
+        return settings
             
     except Exception as e:
         raise HTTPException(
@@ -67,11 +52,15 @@ async def get_settings():
         )
 
 @router.put("", response_model=SettingsModel)
-async def update_settings(settings_update: SettingsUpdate):
+async def update_settings(settings_update: SettingsUpdate, response: Response):
     """
     تحديث الإعدادات
     
     Updates application settings. Only provided fields will be updated.
+    
+    If a changed field is read by some unit types, their saved units are
+    recalculated by a background job; its id is returned in the
+    X-Recalculation-Job-Id header (poll it with GET /jobs/{job_id}).
     """
     try:
         db = get_database()
@@ -91,8 +80,12 @@ async def update_settings(settings_update: SettingsUpdate):
         
         if not update_data:
             # No fields to update, return current settings
-            current_settings.pop("_id", None)
-            return SettingsModel(**current_settings)
+            return await get_current_settings()
+        
+        changed_fields = [
+            field for field, value in update_data.items()
+            if current_settings.get(field) != value
+        ]
         
         # Add last_updated timestamp
         update_data["last_updated"] = datetime.utcnow()
@@ -100,15 +93,28 @@ async def update_settings(settings_update: SettingsUpdate):
         # Update settings
         result = await settings_collection.update_one(
             {"_id": SETTINGS_ID},
-            {"$set": update_data},
+            {"$set": update_data, "$inc": {"version": 1}},
             upsert=True
         )
         
-        # Get updated settings
-        updated_settings = await get_settings_from_db()
-        updated_settings.pop("_id", None)
+        # Cached unit calculations were computed with the old settings
+        clear_unit_calculation_cache()
+        
+        # Saved units of the affected types keep stale parts and prices
+        recalculation_types = affected_unit_types(changed_fields)
+        if recalculation_types:
+            try:
+                job_doc = await create_job(
+                    JobKind.UNITS_RECALCULATE,
+                    created_by=None,
+                    params={"unit_types": recalculation_types, "changed_fields": changed_fields}
+                )
+                response.headers["X-Recalculation-Job-Id"] = job_doc["_id"]
+            except JobQueueFullError as e:
+                print(f"WARNING: Saved units were not recalculated: {e}")
         
-        return SettingsModel(**updated_settings)
+        # Other workers pick the new version up on their next version poll
+        return await refresh_current_settings()
         
     except HTTPException:
         raise
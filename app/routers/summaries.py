@@ -2,7 +2,7 @@ from fastapi import APIRouter, HTTPException, status
 from app.database import get_database
 from app.models.summary import SummaryRequest, SummaryResponse, SummaryItem
 from app.models.settings import SettingsModel
-from app.routers.settings import get_settings_from_db
+from app.services.settings_snapshot import get_current_settings
 from app.services.summary_generator import generate_summary
 from datetime import datetime
 from typing import Dict, Any
@@ -12,10 +12,8 @@ import uuid
 router = APIRouter()
 
 async def get_settings_model() -> SettingsModel:
-    """Get settings as SettingsModel"""
-    settings_doc = await get_settings_from_db()
-    settings_doc.pop("_id", None)
-    return SettingsModel(**settings_doc)
+    """Get the process-wide settings snapshot (shared, do not modify)"""
+    return await get_current_settings()
 
 @router.post("/generate", response_model=SummaryResponse)
 async def generate_unit_summary(request: SummaryRequest):
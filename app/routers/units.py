@@ -1,22 +1,31 @@
 from fastapi import APIRouter, HTTPException, status, Query, Depends, Header, Response
-from typing import List, Optional, Dict
+from starlette.concurrency import run_in_threadpool
+from typing import Any, List, Optional, Dict, Union
 import uuid
 from datetime import datetime
 from app.models.units import (
     UnitCalculateRequest, UnitCalculateResponse, 
     UnitEstimateRequest, UnitEstimateResponse,
-    UnitType
+    UnitCalculateBatchRequest, UnitCalculateBatchResponse, UnitCalculateBatchItem,
+    UnitEstimateBatchRequest, UnitEstimateBatchResponse, UnitEstimateBatchItem,
+    UnitSweepRequest, UnitSweepResponse, UnitSweepVariant, UnitSweepPart,
+    UnitType, Part, UnitDocument, UnitPageResponse
 )
 from app.models.internal_counter import (
     InternalCounterRequest, InternalCounterResponse,
     InternalCounterOptions
 )
 from app.models.edge_band import EdgeBreakdownResponse, EdgeType
-from app.services.unit_calculators import (
-    calculate_unit_parts,
-    calculate_total_edge_band,
-    calculate_total_area,
-    calculate_material_usage
+from app.models.pricing import UnitPriceScenariosRequest, PriceScenariosResponse
+from app.models.assembly_comparison import AssemblyComparisonResponse
+from app.services.unit_registry import is_unit_type_implemented
+from app.services.edge_roll_optimizer import plan_edge_rolls
+from app.services.sheet_nesting import nest_parts_with_settings, parts_from_unit_document
+from app.models.nesting import NestingRequest, SheetNestingResult
+from app.services.calculation_cache import (
+    CachedUnitCalculation,
+    calculation_key,
+    get_unit_calculation_cache
 )
 from app.services.internal_counter_calculator import (
     calculate_internal_counter_parts,
@@ -31,6 +40,12 @@ from app.services.edge_band_calculator import (
 )
 from app.database import get_database
 from app.models.settings import SettingsModel
+from app.services.settings_snapshot import get_current_settings
+from app.services.export_cache import export_cache_key, get_export_cache
+from app.services.etags import content_hash, etag_matches, make_etag, resource_etag
+from app.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursorError, fetch_page
+from app.services.user_stats import increment_user_stats, unit_stats_delta
+from app.services.unit_quota import increment_unit_quota, quota_day
 from app.services.auth_service import (
     TokenData, 
     get_user_by_id, 
@@ -38,8 +53,12 @@ from app.services.auth_service import (
 )
 import jwt
 from app.services.auth_service import SECRET_KEY, ALGORITHM
-from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, PatternFill
+from app.services.assembly_comparison import cheapest_variant, compare_assembly_variants
+from app.services.cost_engine import get_price_table
+from app.services.lazy_modules import openpyxl, price_scenarios, unit_calculators, unit_sweep
+
+# دوال الحساب (unit_calculators) و openpyxl و numpy (unit_sweep، price_scenarios)
+# تُستورد عند أول استخدام عن طريق lazy_modules حتى لا تتأخر بداية التشغيل بسببها
 
 router = APIRouter()
 
@@ -73,32 +92,32 @@ async def get_current_user_from_token(token: str) -> TokenData:
     return token_data
 
 async def get_settings_model() -> SettingsModel:
-    """Get settings model from database"""
-    from app.routers.settings import get_settings_from_db
-    settings_doc = await get_settings_from_db()
-    settings_doc.pop("_id", None)
-    
-    try:
-        return SettingsModel(**settings_doc)
-    except Exception as validation_error:
-         # If DB data is invalid/outdated, log it and return defaults
-        print(f"WARNING: Settings validation failed in units router: {validation_error}. Returning defaults.")
-        return SettingsModel()
+    """Get the process-wide settings snapshot (shared, do not modify)"""
+    return await get_current_settings()
+
+def ensure_unit_type_implemented(unit_type: UnitType) -> None:
+    """رفض نوع الوحدة الذي ليس له دالة حساب قبل بدء الحساب"""
+    if not is_unit_type_implemented(unit_type.value):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unit type '{unit_type.value}' not implemented yet"
+        )
 
-@router.get("/types", response_model=List[Dict[str, str]])
+@router.get("/types", response_model=List[Dict[str, Any]])
 async def get_unit_types():
     """
     جلب أنواع الوحدات المتاحة في النظام
     
     Returns:
-    - List[Dict[str, str]]: قائمة بأنواع الوحدات مع تسمياتها
+    - List[Dict[str, Any]]: قائمة بأنواع الوحدات مع تسمياتها وهل لها حساب (implemented)
     """
     try:
         unit_types = []
         for unit_type in UnitType:
             unit_types.append({
                 "value": unit_type.value,
-                "label": UNIT_TYPE_LABELS.get(unit_type.value, unit_type.value)
+                "label": UNIT_TYPE_LABELS.get(unit_type.value, unit_type.value),
+                "implemented": is_unit_type_implemented(unit_type.value)
             })
         return unit_types
     except Exception as e:
@@ -107,6 +126,140 @@ async def get_unit_types():
             detail=f"Error retrieving unit types: {str(e)}"
         )
 
+@router.get("/cache/stats", response_model=Dict[str, Any])
+async def get_calculation_cache_stats():
+    """
+    إحصائيات كاش حسابات الوحدات (لضبط السعة unit_cache_size)
+    
+    Returns:
+    - size, max_size, hits, misses, evictions, hit_rate
+    """
+    return get_unit_calculation_cache().stats()
+
+async def enforce_units_quota(authorization: Optional[str]) -> Optional[TokenData]:
+    """
+    التحقق من حد الوحدات الشهري للمستخدم صاحب التوكن (إن وجد)
+    
+    التوكن اختياري: إذا كان غير صالح يتم المتابعة بدون تتبع المستخدم،
+    أما تجاوز الحد فيرفع 403.
+    
+    Returns:
+    - TokenData أو None إذا لم يتم إرسال توكن صالح
+    """
+    if not authorization or not authorization.startswith("Bearer "):
+        return None
+    
+    token = authorization[len("Bearer "):]
+    try:
+        token_data = await get_current_user_from_token(token)
+    except HTTPException:
+        # If token is invalid, continue without user tracking
+        return None
+    
+    # Get user to check subscription limits (non-admin users only)
+    if token_data.role != "admin":
+        user = await get_user_by_id(token_data.user_id)
+        if user:
+            # Check unlimited expiry
+            is_unlimited = user.subscription.is_unlimited_units
+            if is_unlimited and user.subscription.unlimited_expiry_date:
+                if datetime.utcnow() > user.subscription.unlimited_expiry_date:
+                    is_unlimited = False
+            
+            if not is_unlimited:
+                # Get user's current unit count for the month
+                current_units_count = await get_user_units_count(token_data.user_id, 30)
+                
+                # Check if user has reached their limit
+                if current_units_count >= user.subscription.max_units_per_month:
+                    raise HTTPException(
+                        status_code=status.HTTP_403_FORBIDDEN,
+                        detail=f"لقد بلغت الحد الأقصى من الوحدات ({user.subscription.max_units_per_month} وحدة/شهر). يرجى التواصل مع المسؤول لزيادة الحد."
+                    )
+    
+    return token_data
+
+def calculate_request_result(
+    request: Union[UnitCalculateRequest, UnitEstimateRequest],
+    settings: SettingsModel,
+    totals_only: bool = False
+) -> CachedUnitCalculation:
+    """
+    حساب القطع والإجماليات واستخدام المواد للطلب مع استخدام كاش الحسابات
+    
+    النتيجة مشتركة مع الطلبات المماثلة فلا يتم تعديل القطع أو material_usage.
+    مع totals_only لا يتم تحويل القطع لـ Part (parts فارغة)، وتُستخدم نتيجة
+    الكاش إن وجدت بدون حفظ النتيجة الجديدة فيه.
+    """
+    calculators = unit_calculators()
+    arguments = request.model_dump(mode="json")
+    
+    def compute() -> CachedUnitCalculation:
+        result = calculators.calculate_unit_result(request.type.value, arguments, settings)
+        return CachedUnitCalculation(
+            parts=() if totals_only else tuple(result.parts()),
+            total_area_m2=result.total_area_m2,
+            total_edge_band_m=result.total_edge_band_m,
+            material_usage=calculators.calculate_material_usage(
+                result.total_area_m2, result.total_edge_band_m, settings, result.specs
+            ),
+            part_count=result.part_count,
+            total_qty=result.total_qty
+        )
+    
+    key = calculation_key(request.type.value, arguments, settings)
+    cache = get_unit_calculation_cache()
+    if totals_only:
+        return cache.get(key) or compute()
+    return cache.get_or_compute(key, compute)
+
+def build_calculate_response(request: UnitCalculateRequest, settings: SettingsModel) -> UnitCalculateResponse:
+    """حساب الوحدة وتجهيز الاستجابة (بدون حفظ)"""
+    result = calculate_request_result(request, settings)
+    
+    return UnitCalculateResponse(
+        unit_id=str(uuid.uuid4()),
+        type=request.type,
+        width_cm=request.width_cm,
+        height_cm=request.height_cm,
+        depth_cm=request.depth_cm,
+        shelf_count=request.shelf_count,
+        parts=list(result.parts),
+        total_edge_band_m=result.total_edge_band_m,
+        total_area_m2=result.total_area_m2,
+        material_usage=dict(result.material_usage)
+    )
+
+def build_estimate_response(
+    request: UnitEstimateRequest,
+    settings: SettingsModel,
+    totals_only: bool = False
+) -> UnitEstimateResponse:
+    """حساب الوحدة وتقدير تكلفتها وتجهيز الاستجابة (بدون القطع مع totals_only)"""
+    result = calculate_request_result(request, settings, totals_only=totals_only)
+    
+    # Calculate cost based on materials
+    cost_breakdown, total_cost = unit_calculators().estimate_material_costs(
+        result.material_usage, result.total_edge_band_m, settings
+    )
+    
+    return UnitEstimateResponse(
+        unit_id=str(uuid.uuid4()),
+        type=request.type,
+        width_cm=request.width_cm,
+        height_cm=request.height_cm,
+        depth_cm=request.depth_cm,
+        shelf_count=request.shelf_count,
+        parts=[] if totals_only else list(result.parts),
+        part_count=result.part_count,
+        total_qty=result.total_qty,
+        total_edge_band_m=result.total_edge_band_m,
+        total_area_m2=result.total_area_m2,
+        material_usage=dict(result.material_usage),
+        cost_breakdown=cost_breakdown,
+        total_cost=total_cost
+    )
+
 @router.post("/calculate", response_model=UnitCalculateResponse)
 async def calculate_unit(request: UnitCalculateRequest, authorization: str = Header(None)):
     """
@@ -120,79 +273,13 @@ async def calculate_unit(request: UnitCalculateRequest, authorization: str = Hea
     - UnitCalculateResponse - تفاصيل القطع والأبعاد
     """
     try:
-        # Extract token from Authorization header if provided
-        if authorization and authorization.startswith("Bearer "):
-            token = authorization[len("Bearer "):]
-            try:
-                token_data = await get_current_user_from_token(token)
-                
-                # Get user to check subscription limits (non-admin users only)
-                if token_data.role != "admin":
-                    user = await get_user_by_id(token_data.user_id)
-                    if user:
-                        # Check unlimited expiry
-                        is_unlimited = user.subscription.is_unlimited_units
-                        if is_unlimited and user.subscription.unlimited_expiry_date:
-                            if datetime.utcnow() > user.subscription.unlimited_expiry_date:
-                                is_unlimited = False
-                        
-                        if not is_unlimited:
-                            # Get user's current unit count for the month
-                            current_units_count = await get_user_units_count(token_data.user_id, 30)
-                            
-                            # Check if user has reached their limit
-                            if current_units_count >= user.subscription.max_units_per_month:
-                                raise HTTPException(
-                                    status_code=status.HTTP_403_FORBIDDEN,
-                                    detail=f"لقد بلغت الحد الأقصى من الوحدات ({user.subscription.max_units_per_month} وحدة/شهر). يرجى التواصل مع المسؤول لزيادة الحد."
-                                )
-            except:
-                # If token is invalid, continue without user tracking
-                pass
+        ensure_unit_type_implemented(request.type)
+        await enforce_units_quota(authorization)
         
         # Get settings
         settings = await get_settings_model()
         
-        # Calculate parts (convert cm to mm for calculation)
-        parts = calculate_unit_parts(
-            unit_type=request.type.value,
-            width_cm=request.width_cm,
-            height_cm=request.height_cm,
-            depth_cm=request.depth_cm,
-            shelf_count=request.shelf_count,
-            door_count=request.door_count,
-            door_type=request.door_type.value,
-            flip_door_height=request.flip_door_height,
-            bottom_door_height=request.bottom_door_height,
-            oven_height=request.oven_height,
-            microwave_height=request.microwave_height,
-            vent_height=request.vent_height,
-            width_2_cm=request.width_2_cm,
-            depth_2_cm=request.depth_2_cm,
-            drawer_count=request.drawer_count,
-            drawer_height_cm=request.drawer_height_cm,
-            fixed_part_cm=request.fixed_part_cm,
-            settings=settings
-        )
-        
-        # Calculate material usage
-        total_area = calculate_total_area(parts)
-        total_edge_meters = calculate_total_edge_band(parts)
-        material_usage = calculate_material_usage(total_area, total_edge_meters, settings)
-        
-        # Convert to cm for response
-        return UnitCalculateResponse(
-            unit_id=str(uuid.uuid4()),
-            type=request.type,
-            width_cm=request.width_cm,
-            height_cm=request.height_cm,
-            depth_cm=request.depth_cm,
-            shelf_count=request.shelf_count,
-            parts=parts,
-            total_edge_band_m=total_edge_meters,
-            total_area_m2=total_area,
-            material_usage=material_usage
-        )
+        return build_calculate_response(request, settings)
     except HTTPException:
         raise
     except Exception as e:
@@ -202,133 +289,388 @@ async def calculate_unit(request: UnitCalculateRequest, authorization: str = Hea
         )
 
 @router.post("/estimate", response_model=UnitEstimateResponse)
-async def estimate_unit_cost(request: UnitEstimateRequest, authorization: str = Header(None)):
+async def estimate_unit_cost(
+    request: UnitEstimateRequest,
+    totals_only: bool = Query(False, description="الإجماليات والتكلفة فقط بدون قائمة القطع"),
+    authorization: str = Header(None)
+):
     """
     تقدير تكلفة الوحدة
     
     Parameters:
     - request: UnitEstimateRequest - تفاصيل الوحدة المطلوب تقدير تكلفتها
+    - totals_only: Query - إرجاع الإجماليات والتكلفة فقط (parts فارغة)
     - authorization: Header - توكن المستخدم (اختياري)
     
     Returns:
     - UnitEstimateResponse - تقدير التكلفة
     """
     try:
-        # Extract token from Authorization header if provided
-        user_id = None
-        if authorization and authorization.startswith("Bearer "):
-            token = authorization[len("Bearer "):]
-            try:
-                token_data = await get_current_user_from_token(token)
-                user_id = token_data.user_id
-                
-                # Get user to check subscription limits (non-admin users only)
-                if token_data.role != "admin":
-                    user = await get_user_by_id(token_data.user_id)
-                    if user:
-                        # Check unlimited expiry
-                        is_unlimited = user.subscription.is_unlimited_units
-                        if is_unlimited and user.subscription.unlimited_expiry_date:
-                            if datetime.utcnow() > user.subscription.unlimited_expiry_date:
-                                is_unlimited = False
-
-                        if not is_unlimited:
-                            # Get user's current unit count for the month
-                            current_units_count = await get_user_units_count(token_data.user_id, 30)
-                            
-                            # Check if user has reached their limit
-                            if current_units_count >= user.subscription.max_units_per_month:
-                                raise HTTPException(
-                                    status_code=status.HTTP_403_FORBIDDEN,
-                                    detail=f"لقد بلغت الحد الأقصى من الوحدات ({user.subscription.max_units_per_month} وحدة/شهر). يرجى التواصل مع المسؤول لزيادة الحد."
-                                )
-            except:
-                # If token is invalid, continue without user tracking
-                pass
+        ensure_unit_type_implemented(request.type)
+        await enforce_units_quota(authorization)
         
         # Get settings
         settings = await get_settings_model()
         
-        # Calculate parts (convert cm to mm for calculation)
-        parts = calculate_unit_parts(
+        return build_estimate_response(request, settings, totals_only=totals_only)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error estimating unit cost: {str(e)}"
+        )
+
+@router.post("/calculate/batch", response_model=UnitCalculateBatchResponse)
+async def calculate_units_batch(request: UnitCalculateBatchRequest, authorization: str = Header(None)):
+    """
+    حساب مجموعة وحدات في طلب واحد
+    
+    يتم جلب الإعدادات والتحقق من حد المستخدم مرة واحدة فقط لكل الطلب،
+    وفشل وحدة لا يوقف حساب باقي الوحدات.
+    
+    Parameters:
+    - request: UnitCalculateBatchRequest - قائمة الوحدات
+    - authorization: Header - توكن المستخدم (اختياري)
+    
+    Returns:
+    - UnitCalculateBatchResponse - نتيجة أو خطأ لكل وحدة بنفس الترتيب
+    """
+    try:
+        await enforce_units_quota(authorization)
+        
+        # Get settings once for the whole batch
+        settings = await get_settings_model()
+        
+        results = []
+        for index, item in enumerate(request.items):
+            try:
+                results.append(UnitCalculateBatchItem(
+                    index=index,
+                    result=build_calculate_response(item, settings)
+                ))
+            except Exception as e:
+                results.append(UnitCalculateBatchItem(index=index, error=str(e)))
+        
+        failed = sum(1 for item in results if item.error is not None)
+        return UnitCalculateBatchResponse(
+            results=results,
+            succeeded=len(results) - failed,
+            failed=failed
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error calculating units batch: {str(e)}"
+        )
+
+@router.post("/estimate/batch", response_model=UnitEstimateBatchResponse)
+async def estimate_units_batch(
+    request: UnitEstimateBatchRequest,
+    totals_only: bool = Query(False, description="الإجماليات والتكلفة فقط بدون قائمة القطع"),
+    authorization: str = Header(None)
+):
+    """
+    تقدير تكلفة مجموعة وحدات في طلب واحد
+    
+    Parameters:
+    - request: UnitEstimateBatchRequest - قائمة الوحدات
+    - totals_only: Query - إرجاع الإجماليات والتكلفة فقط لكل وحدة
+    - authorization: Header - توكن المستخدم (اختياري)
+    
+    Returns:
+    - UnitEstimateBatchResponse - تقدير أو خطأ لكل وحدة بنفس الترتيب مع إجمالي التكلفة
+    """
+    try:
+        await enforce_units_quota(authorization)
+        
+        # Get settings once for the whole batch
+        settings = await get_settings_model()
+        
+        results = []
+        total_cost = 0.0
+        for index, item in enumerate(request.items):
+            try:
+                estimate = build_estimate_response(item, settings, totals_only=totals_only)
+                total_cost += estimate.total_cost
+                results.append(UnitEstimateBatchItem(index=index, result=estimate))
+            except Exception as e:
+                results.append(UnitEstimateBatchItem(index=index, error=str(e)))
+        
+        failed = sum(1 for item in results if item.error is not None)
+        return UnitEstimateBatchResponse(
+            results=results,
+            succeeded=len(results) - failed,
+            failed=failed,
+            total_cost=total_cost
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error estimating units batch: {str(e)}"
+        )
+
+@router.post("/price-scenarios", response_model=PriceScenariosResponse)
+async def price_unit_scenarios(request: UnitPriceScenariosRequest, authorization: str = Header(None)):
+    """
+    تكلفة الوحدة بأسعار الإعدادات الحالية وبكل سيناريو أسعار
+    
+    القطع والإجماليات تُحسب مرة واحدة، وكل السيناريوهات تُسعر معاً.
+    
+    Parameters:
+    - request: UnitPriceScenariosRequest - الوحدة وسيناريوهات الأسعار
+    - authorization: Header - توكن المستخدم (اختياري)
+    
+    Returns:
+    - PriceScenariosResponse - التكلفة الحالية وتكلفة كل سيناريو
+    """
+    try:
+        ensure_unit_type_implemented(request.unit.type)
+        await enforce_units_quota(authorization)
+        
+        settings = await get_settings_model()
+        
+        result = calculate_request_result(request.unit, settings, totals_only=True)
+        scenarios = price_scenarios()
+        sheet_count, edge_band_m = scenarios.usage_quantities(result.material_usage, result.total_edge_band_m)
+        
+        return scenarios.price_scenarios(sheet_count, edge_band_m, request.scenarios, get_price_table(settings))
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error pricing unit scenarios: {str(e)}"
+        )
+
+@router.post("/assembly-comparison", response_model=AssemblyComparisonResponse)
+async def compare_unit_assembly(request: UnitCalculateRequest, authorization: str = Header(None)):
+    """
+    حساب الوحدة بكل طرق التجميع وأنواع المقابض ومقارنة المساحة والشريط والتكلفة
+
+    كل التركيبات تستخدم نفس لقطة الإعدادات وتُحسب في نفس الوقت.
+
+    Parameters:
+    - request: UnitCalculateRequest - تفاصيل الوحدة
+    - authorization: Header - توكن المستخدم (اختياري)
+
+    Returns:
+    - AssemblyComparisonResponse - نتيجة كل تركيبة والتركيبة الأقل تكلفة
+    """
+    try:
+        ensure_unit_type_implemented(request.type)
+        await enforce_units_quota(authorization)
+
+        settings = await get_settings_model()
+
+        variants = await compare_assembly_variants([request.model_dump(mode="json")], settings)
+        return AssemblyComparisonResponse(
+            current_assembly_method=settings.assembly_method,
+            current_handle_type=settings.handle_type,
+            unit_count=1,
+            variants=variants,
+            cheapest=cheapest_variant(variants)
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error comparing unit assembly methods: {str(e)}"
+        )
+
+@router.post("/sweep", response_model=UnitSweepResponse)
+async def sweep_unit(request: UnitSweepRequest):
+    """
+    حساب نوع وحدة واحد لكل تركيبات المقاسات دفعة واحدة (لبناء الكتالوج)
+    
+    يتم حساب الشبكة الكاملة عرض × ارتفاع × عمق لكل تركيبة من أعداد
+    الرفوف والضلف والأدراج، والنتيجة تطابق /units/calculate لكل نقطة.
+    
+    Parameters:
+    - request: UnitSweepRequest - نوع الوحدة وقوائم المقاسات والأعداد
+    
+    Returns:
+    - UnitSweepResponse - أبعاد ومساحة ومتر شريط كل قطعة كقوائم لكل نقطة
+    """
+    try:
+        ensure_unit_type_implemented(request.type)
+        
+        points = len(request.widths_cm) * len(request.heights_cm) * len(request.depths_cm)
+        variants_count = len(request.shelf_counts) * len(request.door_counts) * len(request.drawer_counts)
+        sweep = unit_sweep()
+        if points * variants_count > sweep.MAX_SWEEP_POINTS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Sweep too large: {points * variants_count} points (max {sweep.MAX_SWEEP_POINTS})"
+            )
+        
+        settings = await get_settings_model()
+        
+        variants = sweep.sweep_unit_parts(
             unit_type=request.type.value,
-            width_cm=request.width_cm,
-            height_cm=request.height_cm,
-            depth_cm=request.depth_cm,
-            shelf_count=request.shelf_count,
-            door_count=request.door_count,
+            widths_cm=request.widths_cm,
+            heights_cm=request.heights_cm,
+            depths_cm=request.depths_cm,
+            settings=settings,
+            shelf_counts=request.shelf_counts,
+            door_counts=request.door_counts,
+            drawer_counts=request.drawer_counts,
             door_type=request.door_type.value,
             flip_door_height=request.flip_door_height,
             bottom_door_height=request.bottom_door_height,
             oven_height=request.oven_height,
             microwave_height=request.microwave_height,
             vent_height=request.vent_height,
-            width_2_cm=request.width_2_cm,
-            depth_2_cm=request.depth_2_cm,
-            drawer_count=request.drawer_count,
             drawer_height_cm=request.drawer_height_cm,
             fixed_part_cm=request.fixed_part_cm,
-            settings=settings
+            width_2_cm=request.width_2_cm,
+            depth_2_cm=request.depth_2_cm
         )
         
-        # Calculate total area
-        total_area = calculate_total_area(parts)
+        return UnitSweepResponse(
+            type=request.type,
+            points=points,
+            width_cm=variants[0]["width_cm"].tolist(),
+            height_cm=variants[0]["height_cm"].tolist(),
+            depth_cm=variants[0]["depth_cm"].tolist(),
+            variants=[
+                UnitSweepVariant(
+                    shelf_count=variant["shelf_count"],
+                    door_count=variant["door_count"],
+                    drawer_count=variant["drawer_count"],
+                    parts=[
+                        UnitSweepPart(
+                            name=part.name,
+                            qty=part.qty,
+                            depth_cm=part.depth_cm,
+                            edge_distribution=part.edge_distribution,
+                            width_cm=part.width_cm.tolist(),
+                            height_cm=part.height_cm.tolist(),
+                            area_m2=part.area_m2.tolist(),
+                            edge_band_m=part.edge_band_m.tolist()
+                        )
+                        for part in variant["parts"]
+                    ],
+                    total_area_m2=variant["total_area_m2"].tolist() if variant["error"] is None else [],
+                    total_edge_band_m=variant["total_edge_band_m"].tolist() if variant["error"] is None else [],
+                    error=variant["error"]
+                )
+                for variant in variants
+            ]
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error sweeping unit: {str(e)}"
+        )
+
+@router.post("/nesting", response_model=SheetNestingResult)
+async def nest_parts_on_sheets(request: NestingRequest, authorization: str = Header(None)):
+    """
+    رص قائمة قطع على الألواح الخام (مقاس اللوح وسمك المنشار والتدوير من الإعدادات)
+    
+    عدد القطع بعد فك الكميات محدود (MAX_NESTING_PIECES)، والرص يعمل في
+    threadpool حتى لا يحجز event loop.
+    
+    Parameters:
+    - request: NestingRequest - القطع مع كمياتها
+    - authorization: Header - توكن المستخدم
+    
+    Returns:
+    - SheetNestingResult - رص كل لوح وعدد الألواح الفعلي ونسبة الاستغلال
+    """
+    try:
+        if not authorization or not authorization.startswith("Bearer "):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid authorization header"
+            )
+        await get_current_user_from_token(authorization[len("Bearer "):])
+        
+        settings = await get_settings_model()
+        return await run_in_threadpool(nest_parts_with_settings, request.parts, settings)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error nesting parts: {str(e)}"
+        )
+
+@router.get("/page", response_model=UnitPageResponse)
+async def list_units_page(
+    cursor: Optional[str] = Query(None, description="next_cursor من الصفحة السابقة"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    authorization: str = Header(None)
+):
+    """
+    صفحة من الوحدات المحفوظة للمستخدم (الأحدث أولاً) بمؤشر بدلاً من skip
+    
+    المسؤول يرى وحدات كل المستخدمين.
+    
+    Parameters:
+    - cursor: Query - next_cursor من الصفحة السابقة (بدونه تبدأ من أول صفحة)
+    - limit: Query - عدد الوحدات في الصفحة
+    - authorization: Header - توكن المستخدم
+    
+    Returns:
+    - UnitPageResponse - الوحدات و next_cursor
+    """
+    try:
+        if not authorization or not authorization.startswith("Bearer "):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid authorization header"
+            )
+        token_data = await get_current_user_from_token(authorization[len("Bearer "):])
         
-        # Calculate edge band
-        total_edge_meters = calculate_total_edge_band(parts)
+        db = get_database()
+        if db is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Database connection not available"
+            )
         
-        # Calculate material usage
-        material_usage = calculate_material_usage(total_area, total_edge_meters, settings)
+        query = {}
+        if token_data.role != "admin":
+            query["created_by"] = token_data.user_id
+        projection = {field: 1 for field in UnitDocument.model_fields if field != "id"}
+        try:
+            unit_docs, next_cursor = await fetch_page(db.units, query, "created_at", cursor, limit, projection)
+        except InvalidCursorError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
         
-        # Calculate cost based on materials
-        total_cost = 0.0
-        plywood_cost = 0.0
-        edge_band_cost = 0.0
-        
-        if settings.materials.get("plywood_sheet"):
-            plywood = settings.materials["plywood_sheet"]
-            if plywood.price_per_sheet and material_usage.get("ألواح الخشب"):
-                plywood_cost = material_usage["ألواح الخشب"] * plywood.price_per_sheet
-                total_cost += plywood_cost
-        
-        # Calculate edge band cost
-        if total_edge_meters and settings.materials.get("edge_band_per_meter"):
-            edge_band = settings.materials["edge_band_per_meter"]
-            if edge_band.price_per_meter and material_usage.get("شريط الحافة"):
-                edge_band_cost = material_usage["شريط الحافة"] * edge_band.price_per_meter
-                total_cost += edge_band_cost
-        
-        # Convert to cm for response
-        return UnitEstimateResponse(
-            unit_id=str(uuid.uuid4()),
-            type=request.type,
-            width_cm=request.width_cm,
-            height_cm=request.height_cm,
-            depth_cm=request.depth_cm,
-            shelf_count=request.shelf_count,
-            parts=parts,
-            total_edge_band_m=total_edge_meters,
-            total_area_m2=total_area,
-            material_usage=material_usage,
-            cost_breakdown={
-                "ألواح الخشب": plywood_cost,
-                "شريط الحافة": edge_band_cost
-            },
-            total_cost=total_cost
+        return UnitPageResponse(
+            items=[UnitDocument(**unit_doc, id=unit_doc["_id"]) for unit_doc in unit_docs],
+            next_cursor=next_cursor
         )
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error estimating unit cost: {str(e)}"
+            detail=f"Error listing units: {str(e)}"
         )
 
 @router.get("/{unit_id}", response_model=UnitCalculateResponse)
-async def get_unit(unit_id: str):
+async def get_unit(unit_id: str, response: Response, if_none_match: Optional[str] = Header(None)):
     """
     جلب تفاصيل وحدة محفوظة
     
+    الـ ETag من updated_at للوحدة ورقم نسخة الإعدادات (التكلفة بالأسعار
+    الحالية)، و If-None-Match بنفس القيمة يرجع 304 بدون تحميل القطع أو
+    إعادة حساب التكلفة.
+    
     Parameters:
     - unit_id: str - معرف الوحدة
     
@@ -344,6 +686,23 @@ async def get_unit(unit_id: str):
             )
         
         units_collection = db.units
+        
+        # Get settings for cost calculation
+        settings = await get_settings_model()
+        cache_headers = {"Cache-Control": "private, no-cache"}
+        
+        # Check the ETag against updated_at before loading the parts
+        stamp_doc = await units_collection.find_one({"_id": unit_id}, {"updated_at": 1})
+        if stamp_doc is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Unit not found"
+            )
+        if stamp_doc.get("updated_at") is not None:
+            etag = resource_etag("unit", unit_id, stamp_doc["updated_at"], settings.version)
+            if etag_matches(if_none_match, etag):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, **cache_headers})
+        
         unit_doc = await units_collection.find_one({"_id": unit_id})
         
         if unit_doc is None:
@@ -352,8 +711,15 @@ async def get_unit(unit_id: str):
                 detail="Unit not found"
             )
         
-        # Get settings for cost calculation
-        settings = await get_settings_model()
+        # Units without updated_at get an ETag from their content
+        unit_stamp = unit_doc.get("updated_at")
+        if unit_stamp is None:
+            unit_stamp = content_hash(unit_doc)
+        etag = resource_etag("unit", unit_id, unit_stamp, settings.version)
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, **cache_headers})
+        response.headers["ETag"] = etag
+        response.headers.update(cache_headers)
         
         # Convert database document to response format
         response_data = unit_doc.copy()
@@ -380,24 +746,9 @@ async def get_unit(unit_id: str):
             total_edge_meters = response_data.get("total_edge_band_m", 0)
             
             # Calculate cost based on materials
-            total_cost = 0.0
-            cost_breakdown = {}
-            
-            # Calculate plywood cost - using the correct material key from settings
-            if settings.materials.get("plywood_sheet"):
-                plywood = settings.materials["plywood_sheet"]
-                if plywood.price_per_sheet and material_usage.get("ألواح الخشب"):
-                    plywood_cost = material_usage["ألواح الخشب"] * plywood.price_per_sheet
-                    cost_breakdown["ألواح الخشب"] = plywood_cost
-                    total_cost += plywood_cost
-            
-            # Calculate edge band cost - using the correct material key from settings
-            if settings.materials.get("edge_band_per_meter"):
-                edge_band = settings.materials["edge_band_per_meter"]
-                if edge_band.price_per_meter and material_usage.get("شريط الحافة"):
-                    edge_band_cost = material_usage["شريط الحافة"] * edge_band.price_per_meter
-                    cost_breakdown["شريط الحافة"] = edge_band_cost
-                    total_cost += edge_band_cost
+            cost_breakdown, total_cost = unit_calculators().estimate_material_costs(
+                material_usage, total_edge_meters, settings
+            )
             
             response_data["total_cost"] = total_cost
             response_data["cost_breakdown"] = cost_breakdown
@@ -439,57 +790,22 @@ async def save_unit(request: UnitCalculateRequest, authorization: str = Header(N
         token = authorization[len("Bearer "):]
         token_data = await get_current_user_from_token(token)
         
+        ensure_unit_type_implemented(request.type)
+        
         # Get settings
         settings = await get_settings_model()
         
-        # Calculate parts (convert cm to mm for calculation)
-        parts = calculate_unit_parts(
-            unit_type=request.type.value,
-            width_cm=request.width_cm,
-            height_cm=request.height_cm,
-            depth_cm=request.depth_cm,
-            shelf_count=request.shelf_count,
-            door_count=request.door_count,
-            door_type=request.door_type.value,
-            flip_door_height=request.flip_door_height,
-            bottom_door_height=request.bottom_door_height,
-            oven_height=request.oven_height,
-            microwave_height=request.microwave_height,
-            vent_height=request.vent_height,
-            width_2_cm=request.width_2_cm,
-            depth_2_cm=request.depth_2_cm,
-            drawer_count=request.drawer_count,
-            drawer_height_cm=request.drawer_height_cm,
-            fixed_part_cm=request.fixed_part_cm,
-            settings=settings
-        )
-        
-        # Calculate total area
-        total_area = calculate_total_area(parts)
-        
-        # Calculate edge band
-        total_edge_meters = calculate_total_edge_band(parts)
-        
-        # Calculate material usage
-        material_usage = calculate_material_usage(total_area, total_edge_meters, settings)
+        # Calculate parts, totals and material usage
+        result = calculate_request_result(request, settings)
+        parts = list(result.parts)
+        total_area = result.total_area_m2
+        total_edge_meters = result.total_edge_band_m
+        material_usage = dict(result.material_usage)
         
         # Calculate cost based on materials
-        total_cost = 0.0
-        plywood_cost = 0.0
-        edge_band_cost = 0.0
-        
-        if settings.materials.get("plywood_sheet"):
-            plywood = settings.materials["plywood_sheet"]
-            if plywood.price_per_sheet and material_usage.get("ألواح الخشب"):
-                plywood_cost = material_usage["ألواح الخشب"] * plywood.price_per_sheet
-                total_cost += plywood_cost
-        
-        # Calculate edge band cost
-        if total_edge_meters and settings.materials.get("edge_band_per_meter"):
-            edge_band = settings.materials["edge_band_per_meter"]
-            if edge_band.price_per_meter and material_usage.get("شريط الحافة"):
-                edge_band_cost = material_usage["شريط الحافة"] * edge_band.price_per_meter
-                total_cost += edge_band_cost
+        cost_breakdown, total_cost = unit_calculators().estimate_material_costs(
+            material_usage, total_edge_meters, settings
+        )
         
         # Create unit document (store in cm)
         unit_id = str(uuid.uuid4())
@@ -500,15 +816,14 @@ async def save_unit(request: UnitCalculateRequest, authorization: str = Header(N
             "height_cm": request.height_cm,
             "depth_cm": request.depth_cm,
             "shelf_count": request.shelf_count,
+            # كل مدخلات الطلب لإعادة الحساب عند تغيير الإعدادات
+            "request_inputs": request.model_dump(mode="json"),
             "parts_calculated": [part.model_dump() for part in parts],
             "edge_band_m": total_edge_meters,
             "total_area_m2": total_area,
             "material_usage": material_usage,
             "price_estimate": total_cost,
-            "cost_breakdown": {
-                "ألواح الخشب": plywood_cost,
-                "شريط الحافة": edge_band_cost
-            },
+            "cost_breakdown": cost_breakdown,
             "created_by": token_data.user_id,  # Track who created the unit
             "created_at": datetime.utcnow(),
             "updated_at": datetime.utcnow()
@@ -524,6 +839,8 @@ async def save_unit(request: UnitCalculateRequest, authorization: str = Header(N
         
         units_collection = db.units
         await units_collection.insert_one(unit_doc)
+        await increment_user_stats(db, token_data.user_id, unit_stats_delta(unit_doc))
+        await increment_unit_quota(db, token_data.user_id, {quota_day(unit_doc["created_at"]): 1})
         
         # Return response (convert to cm for response)
         response_data = unit_doc.copy()
@@ -609,7 +926,8 @@ async def calculate_internal_counter(unit_id: str, request: InternalCounterReque
         material_usage = calculate_internal_material_usage(
             total_area_m2=total_area_m2,
             edge_band_m=total_edge_band_m,
-            settings=settings
+            settings=settings,
+            parts=internal_parts
         )
         
         # حفظ القطع الداخلية في الوحدة (update)
@@ -643,6 +961,49 @@ async def calculate_internal_counter(unit_id: str, request: InternalCounterReque
             detail=f"Error calculating internal counter: {str(e)}"
         )
 
+@router.get("/{unit_id}/nesting", response_model=SheetNestingResult)
+async def get_unit_nesting(unit_id: str):
+    """
+    رص قطع وحدة محفوظة على الألواح الخام
+    
+    يشمل القطع الداخلية إذا تم حسابها للوحدة.
+    
+    Parameters:
+    - unit_id: str - معرف الوحدة
+    
+    Returns:
+    - SheetNestingResult - رص كل لوح وعدد الألواح الفعلي ونسبة الاستغلال
+    """
+    try:
+        db = get_database()
+        if db is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Database connection not available"
+            )
+        
+        unit_doc = await db.units.find_one(
+            {"_id": unit_id},
+            {"parts_calculated": 1, "internal_counter_parts": 1}
+        )
+        
+        if unit_doc is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Unit with id {unit_id} not found"
+            )
+        
+        settings = await get_settings_model()
+        return await run_in_threadpool(nest_parts_with_settings, parts_from_unit_document(unit_doc), settings)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error nesting unit parts: {str(e)}"
+        )
+
 @router.get("/{unit_id}/edge-breakdown", response_model=EdgeBreakdownResponse)
 async def get_edge_breakdown(unit_id: str, edge_type: Optional[str] = None):
     """
@@ -653,7 +1014,8 @@ async def get_edge_breakdown(unit_id: str, edge_type: Optional[str] = None):
     - طول كل حافة بالمليمتر والمتر
     - نوع الشريط (خشبي/PVC)
     - إجمالي متر الشريط لكل قطعة
-    - التكلفة الإجمالية
+    - التكلفة الإجمالية (من عدد لفات الشريط الفعلي)
+    - عدد اللفات والهدر لكل نوع شريط
     
     Parameters:
     - unit_id: معرف الوحدة
@@ -702,15 +1064,17 @@ async def get_edge_breakdown(unit_id: str, edge_type: Optional[str] = None):
         # حساب الإجماليات
         total_edge_m = calculate_total_edge_meters(edge_breakdown)
         
-        # حساب التكلفة
-        cost_info = calculate_edge_cost(edge_breakdown, settings)
+        # حساب عدد اللفات والتكلفة من اللفات
+        roll_plan = plan_edge_rolls(edge_breakdown, settings)
+        cost_info = calculate_edge_cost(edge_breakdown, settings, roll_plan)
         
         return EdgeBreakdownResponse(
             unit_id=unit_id,
             parts=edge_breakdown,
             total_edge_m=round(total_edge_m, 3),
             total_cost=cost_info["total"] if cost_info["total"] > 0 else None,
-            cost_breakdown=cost_info["breakdown"] if cost_info["breakdown"] else None
+            cost_breakdown=cost_info["breakdown"] if cost_info["breakdown"] else None,
+            roll_plan=roll_plan
         )
         
     except HTTPException:
@@ -721,8 +1085,130 @@ async def get_edge_breakdown(unit_id: str, edge_type: Optional[str] = None):
             detail=f"Error calculating edge breakdown: {str(e)}"
         )
 
+def render_unit_workbook(unit_doc: Dict[str, Any]) -> bytes:
+    """ملف Excel لقطع الوحدة (القطع الأساسية، الضهر، الضلف)"""
+    xl = openpyxl()
+    
+    # Convert database document to response format
+    response_data = unit_doc.copy()
+    
+    # Map database field names to response field names
+    if "_id" in response_data:
+        response_data["unit_id"] = str(response_data["_id"])
+        del response_data["_id"]
+    
+    if "parts_calculated" in response_data:
+        # Convert parts_calculated to Part objects
+        from app.models.units import Part
+        parts = [Part(**part_data) for part_data in response_data["parts_calculated"]]
+    else:
+        parts = []
+    
+    # Categorize parts
+    main_parts = []
+    doors_parts = []
+    backs_parts = []
+    
+    for part in parts:
+        name_lower = part.name.lower()
+        if "door" in name_lower or "front" in name_lower:
+            doors_parts.append(part)
+        elif "back_panel" in name_lower:
+            backs_parts.append(part)
+        else:
+            main_parts.append(part)
+    
+    # Create Excel workbook
+    wb = xl.Workbook()
+    
+    # Helper function to create sheet content
+    def create_sheet_content(ws, title, parts_list):
+        ws.title = title
+        ws.sheet_view.rightToLeft = True # Enable RTL
+        
+        # Set column headers with styling
+        headers = ["اسم القطعة", "العرض (سم)", "الارتفاع (سم)", "الكمية", "المساحة (م²)", "طول الحافة (م)"]
+        ws.append(headers)
+        
+        # Style the header row
+        header_font = xl.styles.Font(bold=True)
+        header_fill = xl.styles.PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
+        header_alignment = xl.styles.Alignment(horizontal="center")
+        
+        for col in range(1, len(headers) + 1):
+            cell = ws.cell(row=1, column=col)
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.alignment = header_alignment
+            
+        # Add data rows
+        total_qty = 0
+        total_area = 0.0
+        total_edge = 0.0
+        
+        for part in parts_list:
+            row = [
+                part.name,
+                part.width_cm,
+                part.height_cm,
+                part.qty,
+                round(part.area_m2, 2) if part.area_m2 else 0,
+                round(part.edge_band_m, 2) if part.edge_band_m else 0
+            ]
+            ws.append(row)
+            
+            # Update totals
+            total_qty += part.qty
+            total_area += part.area_m2 or 0
+            total_edge += part.edge_band_m or 0
+        
+        # Add totals row
+        totals_row = ["المجموع", "", "", total_qty, round(total_area, 2), round(total_edge, 2)]
+        ws.append(totals_row)
+        
+        # Style the totals row
+        totals_font = xl.styles.Font(bold=True)
+        for col in range(1, len(totals_row) + 1):
+            cell = ws.cell(row=ws.max_row, column=col)
+            cell.font = totals_font
+        
+        # Auto-adjust column widths
+        for column in ws.columns:
+            max_length = 0
+            column_letter = column[0].column_letter
+            for cell in column:
+                try:
+                    if len(str(cell.value)) > max_length:
+                        max_length = len(str(cell.value))
+                except:
+                    pass
+            adjusted_width = (max_length + 2)
+            ws.column_dimensions[column_letter].width = adjusted_width
+
+    # Sheet 1: Main Parts (القطع الأساسية)
+    ws1 = wb.active
+    create_sheet_content(ws1, "القطع الأساسية", main_parts)
+    
+    # Sheet 2: Backs (الضهر)
+    ws2 = wb.create_sheet("الضهر")
+    create_sheet_content(ws2, "الضهر", backs_parts)
+    
+    # Sheet 3: Doors (الضلف)
+    ws3 = wb.create_sheet("الضلف")
+    create_sheet_content(ws3, "الضلف", doors_parts)
+    
+    # Save to bytes
+    from io import BytesIO
+    excel_buffer = BytesIO()
+    wb.save(excel_buffer)
+    return excel_buffer.getvalue()
+
 @router.get("/{unit_id}/export-excel", response_class=Response)
-async def export_unit_to_excel(unit_id: str, authorization: str = Header(None)):
+async def export_unit_to_excel(
+    unit_id: str,
+    authorization: str = Header(None),
+    if_none_match: Optional[str] = Header(None)
+):
     """
     تصدير تفاصيل الوحدة إلى ملف Excel
     
@@ -731,7 +1217,7 @@ async def export_unit_to_excel(unit_id: str, authorization: str = Header(None)):
     - authorization: Header - توكن المستخدم
     
     Returns:
-    - Excel file with unit parts details
+    - Excel file with unit parts details (304 if If-None-Match has the current ETag)
     """
     try:
         # Extract token from Authorization header
@@ -762,129 +1248,29 @@ async def export_unit_to_excel(unit_id: str, authorization: str = Header(None)):
         # Get settings for cost calculation
         settings = await get_settings_model()
         
-        # Convert database document to response format
-        response_data = unit_doc.copy()
+        # Same unit document + settings version -> same file and ETag
+        cache_key = export_cache_key("unit-xlsx", unit_doc, settings.version)
+        etag = make_etag(cache_key)
+        cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
         
-        # Map database field names to response field names
-        if "_id" in response_data:
-            response_data["unit_id"] = str(response_data["_id"])
-            del response_data["_id"]
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
         
-        if "parts_calculated" in response_data:
-            # Convert parts_calculated to Part objects
-            from app.models.units import Part
-            parts = [Part(**part_data) for part_data in response_data["parts_calculated"]]
-        else:
-            parts = []
-        
-        # Categorize parts
-        main_parts = []
-        doors_parts = []
-        backs_parts = []
-        
-        for part in parts:
-            name_lower = part.name.lower()
-            if "door" in name_lower or "front" in name_lower:
-                doors_parts.append(part)
-            elif "back_panel" in name_lower:
-                backs_parts.append(part)
-            else:
-                main_parts.append(part)
-        
-        # Create Excel workbook
-        wb = Workbook()
-        
-        # Helper function to create sheet content
-        def create_sheet_content(ws, title, parts_list):
-            ws.title = title
-            ws.sheet_view.rightToLeft = True # Enable RTL
-            
-            # Set column headers with styling
-            headers = ["اسم القطعة", "العرض (سم)", "الارتفاع (سم)", "الكمية", "المساحة (م²)", "طول الحافة (م)"]
-            ws.append(headers)
-            
-            # Style the header row
-            header_font = Font(bold=True)
-            header_fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
-            header_alignment = Alignment(horizontal="center")
-            
-            for col in range(1, len(headers) + 1):
-                cell = ws.cell(row=1, column=col)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = header_alignment
-                
-            # Add data rows
-            total_qty = 0
-            total_area = 0.0
-            total_edge = 0.0
-            
-            for part in parts_list:
-                row = [
-                    part.name,
-                    part.width_cm,
-                    part.height_cm,
-                    part.qty,
-                    round(part.area_m2, 2) if part.area_m2 else 0,
-                    round(part.edge_band_m, 2) if part.edge_band_m else 0
-                ]
-                ws.append(row)
-                
-                # Update totals
-                total_qty += part.qty
-                total_area += part.area_m2 or 0
-                total_edge += part.edge_band_m or 0
-            
-            # Add totals row
-            totals_row = ["المجموع", "", "", total_qty, round(total_area, 2), round(total_edge, 2)]
-            ws.append(totals_row)
-            
-            # Style the totals row
-            totals_font = Font(bold=True)
-            for col in range(1, len(totals_row) + 1):
-                cell = ws.cell(row=ws.max_row, column=col)
-                cell.font = totals_font
-            
-            # Auto-adjust column widths
-            for column in ws.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = (max_length + 2)
-                ws.column_dimensions[column_letter].width = adjusted_width
-
-        # Sheet 1: Main Parts (القطع الأساسية)
-        ws1 = wb.active
-        create_sheet_content(ws1, "القطع الأساسية", main_parts)
-        
-        # Sheet 2: Backs (الضهر)
-        ws2 = wb.create_sheet("الضهر")
-        create_sheet_content(ws2, "الضهر", backs_parts)
-        
-        # Sheet 3: Doors (الضلف)
-        ws3 = wb.create_sheet("الضلف")
-        create_sheet_content(ws3, "الضلف", doors_parts)
-        
-        # Save to bytes
-        from io import BytesIO
-        excel_buffer = BytesIO()
-        wb.save(excel_buffer)
-        excel_buffer.seek(0)
+        # Rendering and the file write block, so they run in the thread pool
+        excel_content = await run_in_threadpool(
+            get_export_cache().get_or_create, cache_key, "xlsx", lambda: render_unit_workbook(unit_doc)
+        )
         
         print(f"DEBUG: Exporting unit {unit_id} with 3 sheets logic")
 
         # Return Excel file as response
         headers = {
             "Content-Disposition": f"attachment; filename=unit_details_{unit_id}_v2.xlsx",
-            "Content-Type": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            "Content-Type": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            **cache_headers
         }
         
-        return Response(content=excel_buffer.getvalue(), headers=headers)
+        return Response(content=excel_content, headers=headers)
         
     except HTTPException:
         raise
@@ -0,0 +1,184 @@
+"""
+Assembly Comparison - حساب وحدة أو مشروع بكل طرق التجميع وأنواع المقابض
+
+لكل تركيبة AssemblyMethod × HandleType يتم حساب القطع من مدخلات الطلب
+بنسخة من نفس لقطة الإعدادات (يتغير فيها طريقة التجميع ونوع المقبض فقط)،
+ثم المساحة ومتر الشريط وعدد الألواح والتكلفة:
+
+- للوحدة: عدد الألواح والتكلفة من استخدام المواد (نفس نتيجة /units/estimate).
+- للمشروع: رص قطع كل الوحدات معاً لعدد الألواح الفعلي.
+
+compare_variant تستقبل وترجع بيانات بسيطة فتعمل في process pool المهام
+(run_in_job_pool يحد عدد الحسابات المرسلة له في نفس الوقت). لا توجد دالة حساب
+تقرأ handle_type حالياً (settings_dependencies)، فيتم حساب نتيجة واحدة لكل
+طريقة تجميع وتكرارها لكل نوع مقبض. نتائج التركيبات محفوظة في كاش بمفتاح
+المدخلات + ختم الإعدادات + التركيبة، فلا يُعاد إرسال إلا الناقص منها.
+"""
+import asyncio
+import itertools
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.models.assembly_comparison import AssemblyVariantResult
+from app.models.settings import AssemblyMethod, HandleType, SettingsModel
+from app.models.units import UnitCalculateRequest
+from app.services.calculation_cache import settings_stamp
+from app.services.cost_engine import EDGE_USAGE_KEY, SHEETS_USAGE_KEY, get_price_table
+from app.services.etags import content_hash
+from app.services.job_service import run_in_job_pool
+from app.services.lazy_modules import unit_calculators
+from app.services.settings_dependencies import unit_settings_dependencies
+from app.services.sheet_nesting import nest_parts_with_settings
+
+# عدد نتائج التركيبات المحفوظة (حتى 24 تركيبة لكل وحدة أو مشروع)
+MAX_VARIANT_RESULTS = 512
+
+
+def assembly_variants() -> List[Tuple[AssemblyMethod, HandleType]]:
+    """كل تركيبات طريقة التجميع × نوع المقبض بترتيب ثابت"""
+    return list(itertools.product(AssemblyMethod, HandleType))
+
+
+def handle_type_affects_results() -> bool:
+    """هل يقرأ حساب أي نوع وحدة (أو الحساب المشترك) نوع المقبض"""
+    return any("handle_type" in fields for fields in unit_settings_dependencies().values())
+
+
+def compare_variant(
+    units_inputs: List[Dict[str, Any]],
+    settings_data: Dict[str, Any],
+    assembly_method: str,
+    handle_type: str,
+    nest: bool = False
+) -> Dict[str, Any]:
+    """
+    إجماليات وتكلفة الوحدات بطريقة تجميع ونوع مقبض واحد
+
+    Args:
+        units_inputs: مدخلات طلب كل وحدة (UnitCalculateRequest كـ dict)
+        settings_data: لقطة الإعدادات كـ dict
+        nest: رص القطع لعدد الألواح الفعلي بدلاً من تقدير المساحة
+
+    Returns:
+        AssemblyVariantResult كـ dict (مع error بدل الإجماليات عند الفشل)
+    """
+    calculators = unit_calculators()
+    variant = {"assembly_method": assembly_method, "handle_type": handle_type}
+    try:
+        settings = SettingsModel(**settings_data).model_copy(update={
+            "assembly_method": AssemblyMethod(assembly_method),
+            "handle_type": HandleType(handle_type)
+        })
+
+        total_area = 0.0
+        total_edge_meters = 0.0
+        part_count = 0
+        material_usage = {SHEETS_USAGE_KEY: 0.0, EDGE_USAGE_KEY: 0.0}
+        parts = []
+        for inputs in units_inputs:
+            request = UnitCalculateRequest(**inputs)
+            result = calculators.calculate_unit_result(request.type.value, request.model_dump(mode="json"), settings)
+            total_area += result.total_area_m2
+            total_edge_meters += result.total_edge_band_m
+            part_count += result.part_count
+            if nest:
+                parts.extend(result.parts())
+            else:
+                unit_usage = calculators.calculate_material_usage(
+                    result.total_area_m2, result.total_edge_band_m, settings, result.specs
+                )
+                for key in material_usage:
+                    material_usage[key] += unit_usage.get(key) or 0.0
+
+        if nest:
+            material_usage = {
+                SHEETS_USAGE_KEY: float(nest_parts_with_settings(parts, settings).priced_sheet_count),
+                EDGE_USAGE_KEY: round(total_edge_meters, 2)
+            }
+        cost_breakdown, total_cost = get_price_table(settings).price_usage(material_usage, total_edge_meters)
+    except Exception as e:
+        return {**variant, "error": str(e)}
+
+    return {
+        **variant,
+        "total_area_m2": round(total_area, 4),
+        "total_edge_band_m": round(total_edge_meters, 2),
+        "part_count": part_count,
+        "sheet_count": material_usage[SHEETS_USAGE_KEY],
+        "cost_breakdown": cost_breakdown,
+        "total_cost": total_cost
+    }
+
+
+_variant_results: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_variant_results_lock = threading.Lock()
+
+
+def _get_variant_result(key: str) -> Optional[Dict[str, Any]]:
+    with _variant_results_lock:
+        result = _variant_results.get(key)
+        if result is not None:
+            _variant_results.move_to_end(key)
+        return result
+
+
+def _store_variant_result(key: str, result: Dict[str, Any]) -> None:
+    with _variant_results_lock:
+        _variant_results[key] = result
+        while len(_variant_results) > MAX_VARIANT_RESULTS:
+            _variant_results.popitem(last=False)
+
+
+def clear_variant_results() -> None:
+    with _variant_results_lock:
+        _variant_results.clear()
+
+
+async def compare_assembly_variants(
+    units_inputs: List[Dict[str, Any]],
+    settings: SettingsModel,
+    nest: bool = False
+) -> List[AssemblyVariantResult]:
+    """
+    نتيجة كل تركيبة بنفس لقطة الإعدادات
+
+    التركيبات غير الموجودة في الكاش تُحسب في process pool المهام. إذا لم يكن
+    نوع المقبض يؤثر على الحساب تُحسب كل طريقة تجميع مرة واحدة (بنوع المقبض
+    الحالي) وتتكرر النتيجة لكل أنواع المقابض.
+    """
+    settings_data = settings.model_dump(mode="json")
+    inputs_key = content_hash(units_inputs, settings_stamp(settings), nest)
+    by_handle = handle_type_affects_results()
+
+    def computed_variant(method: AssemblyMethod, handle: HandleType) -> Tuple[AssemblyMethod, HandleType]:
+        return (method, handle) if by_handle else (method, settings.handle_type)
+
+    variants = assembly_variants()
+    computed_variants = list(dict.fromkeys(computed_variant(method, handle) for method, handle in variants))
+    keys = {
+        variant: content_hash(inputs_key, variant[0].value, variant[1].value)
+        for variant in computed_variants
+    }
+
+    results = {variant: _get_variant_result(key) for variant, key in keys.items()}
+    missing = [variant for variant in computed_variants if results[variant] is None]
+    computed = await asyncio.gather(*(
+        run_in_job_pool(compare_variant, units_inputs, settings_data, method.value, handle.value, nest)
+        for method, handle in missing
+    ))
+    for variant, result in zip(missing, computed):
+        results[variant] = result
+        if result.get("error") is None:
+            _store_variant_result(keys[variant], result)
+
+    return [
+        AssemblyVariantResult(**{**results[computed_variant(method, handle)], "handle_type": handle.value})
+        for method, handle in variants
+    ]
+
+
+def cheapest_variant(variants: List[AssemblyVariantResult]) -> Optional[AssemblyVariantResult]:
+    """التركيبة الأقل تكلفة (بدون التركيبات التي فشل حسابها)"""
+    succeeded = [variant for variant in variants if variant.error is None]
+    return min(succeeded, key=lambda variant: variant.total_cost) if succeeded else None
@@ -10,6 +10,7 @@ from app.models.auth import (
     Token, TokenData, UserRole, SubscriptionPlan, DeviceInfo
 )
 from app.database import get_database
+from app.services.unit_quota import count_recent_units
 from fastapi import HTTPException, status
 import jwt
 from passlib.context import CryptContext
@@ -240,7 +241,7 @@ async def deactivate_device(user_id: str, device_id: str) -> bool:
     return result.modified_count > 0
 
 async def get_user_units_count(user_id: str, period_days: int = 30) -> int:
-    """Get the number of units created by user in the specified period"""
+    """Get the number of units created by user in the specified period (whole UTC days)"""
     db = get_database()
     if db is None:
         raise HTTPException(
@@ -248,16 +249,8 @@ async def get_user_units_count(user_id: str, period_days: int = 30) -> int:
             detail="Database connection not available"
         )
     
-    # Calculate date range
-    from_date = datetime.utcnow() - timedelta(days=period_days)
-    
-    # Count units created by user in the period
-    count = await db.units.count_documents({
-        "created_by": user_id,
-        "created_at": {"$gte": from_date}
-    })
-    
-    return count
+    # Sum of the user's daily buckets (one read by _id)
+    return await count_recent_units(db, user_id, period_days)
 
 async def delete_user(user_id: str) -> bool:
     """Delete a user (admin only)"""
@@ -0,0 +1,147 @@
+"""
+Calculation Cache - كاش نتائج حساب الوحدات (LRU محدود الحجم)
+
+أغلب طلبات /units/calculate و /units/estimate تتكرر لنفس المقاسات القياسية،
+فيتم حفظ نتيجة الحساب (القطع والإجماليات واستخدام المواد) بمفتاح هو hash
+لحقول الطلب التي يستخدمها نوع الوحدة فعلاً + ختم نسخة الإعدادات.
+
+تغيير الإعدادات يغير الختم (version) فلا تُستخدم نتائج قديمة، كما أن
+PUT /settings يمسح الكاش بالكامل.
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from app.database import settings as app_settings
+from app.models.units import Part
+from app.models.settings import SettingsModel
+from app.services.unit_registry import get_unit_calculator
+
+DEFAULT_CACHE_SIZE = 1024
+
+
+@dataclass(frozen=True)
+class CachedUnitCalculation:
+    """نتيجة حساب وحدة محفوظة في الكاش (لا يتم تعديلها بعد الحفظ)"""
+    parts: Tuple[Part, ...]
+    total_area_m2: float
+    total_edge_band_m: float
+    material_usage: Mapping[str, float]
+    part_count: int = 0
+    total_qty: int = 0
+
+
+def settings_stamp(settings: SettingsModel) -> str:
+    """
+    ختم نسخة الإعدادات
+
+    version يزيد مع كل PUT /settings. الإعدادات بدون version (مستندات
+    قديمة) تستخدم last_updated، والافتراضية تأخذ hash لمحتواها.
+    """
+    if settings.version:
+        return f"v{settings.version}"
+    if settings.last_updated is not None:
+        return settings.last_updated.isoformat()
+    return hashlib.sha256(
+        settings.model_dump_json(exclude={"last_updated", "version"}).encode("utf-8")
+    ).hexdigest()
+
+
+def calculation_key(unit_type: str, arguments: Mapping[str, Any], settings: SettingsModel) -> str:
+    """
+    مفتاح الكاش: sha256 لـ JSON مرتب لنوع الوحدة ومعاملاتها + ختم الإعدادات
+
+    يتم أخذ المعاملات التي تستخدمها دالة الحساب فقط، فمثلاً ارتفاع الفرن
+    لا يغير مفتاح وحدة أرضي عادية.
+
+    Raises:
+        ValueError: إذا لم يكن لنوع الوحدة دالة حساب
+    """
+    spec = get_unit_calculator(unit_type)
+    payload = {
+        "type": unit_type,
+        "arguments": {name: arguments[name] for name in spec.parameters},
+        "settings": settings_stamp(settings)
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class CalculationCache:
+    """كاش LRU بسعة ثابتة مع عدادات hit/miss/eviction"""
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, CachedUnitCalculation]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[CachedUnitCalculation]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, entry: CachedUnitCalculation) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], CachedUnitCalculation]
+    ) -> CachedUnitCalculation:
+        """جلب النتيجة من الكاش أو حسابها وحفظها"""
+        entry = self.get(key)
+        if entry is None:
+            entry = compute()
+            self.put(key, entry)
+        return entry
+
+    def clear(self) -> None:
+        """مسح كل النتائج (العدادات لا تتأثر)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+
+
+_unit_calculation_cache: Optional[CalculationCache] = None
+
+
+def get_unit_calculation_cache() -> CalculationCache:
+    """كاش حسابات الوحدات المشترك (السعة من unit_cache_size في إعدادات التطبيق)"""
+    global _unit_calculation_cache
+    if _unit_calculation_cache is None:
+        _unit_calculation_cache = CalculationCache(app_settings.unit_cache_size)
+    return _unit_calculation_cache
+
+
+def clear_unit_calculation_cache() -> None:
+    """مسح كاش حسابات الوحدات (يُستدعى بعد تحديث الإعدادات)"""
+    get_unit_calculation_cache().clear()
@@ -0,0 +1,157 @@
+"""
+Cost Engine - تسعير الوحدات من جدول أسعار محسوب مرة لكل نسخة إعدادات
+
+settings.materials يتحول مرة واحدة لكل نسخة إعدادات (settings_stamp) إلى
+PriceTable: سعر اللوح لكل خامة ألواح، وسعر متر ولفة الشريط لكل EdgeType
+(edge_band_<type>_per_meter أو edge_band_per_meter العامة). كل أماكن التسعير
+(التقدير، حفظ وقراءة الوحدة، الملخص، لفات الشريط) تستخدم نفس الجدول.
+
+الوحدة لا تحدد نوع الشريط، فتكلفة الوحدة (price_usage) من لوح plywood_sheet
+وسعر الشريط العام. أسعار كل نوع شريط تُستخدم في تكلفة لفات الشريط فقط.
+"""
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional, Tuple
+
+from app.models.edge_band import EdgeType
+from app.models.settings import MaterialInfo, SettingsModel
+from app.services.calculation_cache import settings_stamp
+
+# خامة الألواح الافتراضية وخامة الشريط العامة في settings.materials
+DEFAULT_BOARD_MATERIAL = "plywood_sheet"
+DEFAULT_EDGE_MATERIAL = "edge_band_per_meter"
+
+# مفاتيح استخدام المواد (calculate_material_usage) وتفاصيل التكلفة
+SHEETS_USAGE_KEY = "ألواح الخشب"
+EDGE_USAGE_KEY = "شريط الحافة"
+
+# عدد جداول الأسعار المحفوظة (نسخ إعدادات مختلفة في نفس الوقت)
+MAX_PRICE_TABLES = 8
+
+
+def edge_material_key(edge_type: EdgeType) -> str:
+    """مفتاح خامة نوع الشريط في settings.materials"""
+    return f"edge_band_{edge_type.value}_per_meter"
+
+
+@dataclass(frozen=True)
+class EdgePrice:
+    """أسعار نوع شريط واحد"""
+    price_per_meter: Optional[float]
+    price_per_roll: Optional[float]
+    roll_length_m: Optional[float]
+
+
+@dataclass(frozen=True)
+class PriceTable:
+    """أسعار الخامات بعد التحويل من settings.materials"""
+    board_prices: Mapping[str, float]
+    edge_prices: Mapping[EdgeType, EdgePrice]
+    default_edge_rate: Optional[float]
+
+    @classmethod
+    def from_materials(cls, materials: Mapping[str, MaterialInfo]) -> "PriceTable":
+        board_prices = {
+            key: material.price_per_sheet
+            for key, material in materials.items()
+            if material.price_per_sheet
+        }
+        edge_prices = {}
+        for edge_type in EdgeType:
+            material = materials.get(edge_material_key(edge_type)) or materials.get(DEFAULT_EDGE_MATERIAL)
+            if material is not None:
+                edge_prices[edge_type] = EdgePrice(
+                    price_per_meter=material.price_per_meter,
+                    price_per_roll=material.price_per_roll,
+                    roll_length_m=material.roll_length_m
+                )
+        default_edge = materials.get(DEFAULT_EDGE_MATERIAL)
+        return cls(
+            board_prices=board_prices,
+            edge_prices=edge_prices,
+            default_edge_rate=default_edge.price_per_meter if default_edge else None
+        )
+
+    def board_price(self, material: str = DEFAULT_BOARD_MATERIAL) -> Optional[float]:
+        """سعر اللوح للخامة (None إذا لم يُحدد)"""
+        return self.board_prices.get(material)
+
+    def edge_rate(self, edge_type: Optional[EdgeType] = None) -> Optional[float]:
+        """سعر متر الشريط لنوع الشريط، أو سعر الشريط العام بدون نوع"""
+        if edge_type is None:
+            return self.default_edge_rate
+        edge_price = self.edge_prices.get(edge_type)
+        return edge_price.price_per_meter if edge_price else None
+
+    def roll_length_m(self, edge_type: EdgeType) -> Optional[float]:
+        edge_price = self.edge_prices.get(edge_type)
+        return edge_price.roll_length_m if edge_price else None
+
+    def roll_cost(self, edge_type: EdgeType, roll_count: int, roll_length_m: float) -> Optional[float]:
+        """تكلفة اللفات: سعر اللفة، أو طول اللفة × سعر المتر إذا لم يُحدد سعر اللفة"""
+        edge_price = self.edge_prices.get(edge_type)
+        if edge_price is None:
+            return None
+        if edge_price.price_per_roll:
+            return round(roll_count * edge_price.price_per_roll, 2)
+        if edge_price.price_per_meter:
+            return round(roll_count * roll_length_m * edge_price.price_per_meter, 2)
+        return None
+
+    def price_usage(
+        self,
+        material_usage: Mapping[str, float],
+        total_edge_meters: float
+    ) -> Tuple[Dict[str, float], float]:
+        """
+        تكلفة الألواح والشريط من استخدام المواد لوحدة
+
+        Returns:
+            (cost_breakdown, total_cost)
+        """
+        total_cost = 0.0
+        plywood_cost = 0.0
+        edge_band_cost = 0.0
+
+        plywood_price = self.board_price()
+        if plywood_price and material_usage.get(SHEETS_USAGE_KEY):
+            plywood_cost = material_usage[SHEETS_USAGE_KEY] * plywood_price
+            total_cost += plywood_cost
+
+        edge_rate = self.default_edge_rate
+        if total_edge_meters and edge_rate and material_usage.get(EDGE_USAGE_KEY):
+            edge_band_cost = material_usage[EDGE_USAGE_KEY] * edge_rate
+            total_cost += edge_band_cost
+
+        cost_breakdown = {
+            SHEETS_USAGE_KEY: plywood_cost,
+            EDGE_USAGE_KEY: edge_band_cost
+        }
+        return cost_breakdown, total_cost
+
+
+_price_tables: "OrderedDict[str, PriceTable]" = OrderedDict()
+_price_tables_lock = threading.Lock()
+
+
+def get_price_table(settings: SettingsModel) -> PriceTable:
+    """جدول أسعار نسخة الإعدادات (يُحسب مرة واحدة لكل نسخة)"""
+    stamp = settings_stamp(settings)
+    with _price_tables_lock:
+        table = _price_tables.get(stamp)
+        if table is not None:
+            _price_tables.move_to_end(stamp)
+            return table
+
+    table = PriceTable.from_materials(settings.materials)
+    with _price_tables_lock:
+        _price_tables[stamp] = table
+        while len(_price_tables) > MAX_PRICE_TABLES:
+            _price_tables.popitem(last=False)
+    return table
+
+
+def clear_price_tables() -> None:
+    with _price_tables_lock:
+        _price_tables.clear()
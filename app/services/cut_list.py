@@ -0,0 +1,101 @@
+"""
+Cut List - قائمة القص المجمعة لكل وحدات المشروع
+
+القطع المتطابقة من كل الوحدات تُدمج في سطر واحد بكمية مجمعة. القطعتان
+متطابقتان إذا اتفقتا في نوع الاسم (بدون الترقيم مثل side_1 / drawer_2_bottom)
+والعرض والارتفاع والسمك وتوزيع الشريط.
+
+المقاسات في المفتاح بالمليمتر كأعداد صحيحة حتى لا تنقسم نفس القطعة لسطرين
+بسبب فروق الكسور العشرية الناتجة عن round() المتكرر في الحسابات.
+"""
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.models.projects import CutListLine
+from app.models.units import EdgeDistribution
+from app.services.lazy_modules import unit_calculators
+
+# ترقيم داخل الاسم: side_1 -> side ، drawer_2_bottom -> drawer_bottom
+_NUMBER_SUFFIX = re.compile(r"_\d+(?=_|$)")
+
+EdgeKey = Optional[Tuple[bool, bool, bool, bool]]
+CutListKey = Tuple[str, int, int, int, EdgeKey]
+
+
+def part_name_class(name: str) -> str:
+    """نوع القطعة من اسمها بدون الترقيم"""
+    return _NUMBER_SUFFIX.sub("", name)
+
+
+def to_mm(value_cm: float) -> int:
+    """تحويل السنتيمتر لأقرب مليمتر صحيح"""
+    return int(round(value_cm * 10))
+
+
+def _edge_key(part_data: Dict[str, Any]) -> EdgeKey:
+    edges = part_data.get("edge_distribution")
+    if not edges:
+        return None
+    return (
+        bool(edges.get("top")),
+        bool(edges.get("bottom")),
+        bool(edges.get("left")),
+        bool(edges.get("right"))
+    )
+
+
+def cut_list_key(part_data: Dict[str, Any]) -> CutListKey:
+    """مفتاح الدمج: (نوع الاسم، العرض، الارتفاع، السمك بالمليمتر، توزيع الشريط)"""
+    return (
+        part_name_class(part_data["name"]),
+        to_mm(part_data["width_cm"]),
+        to_mm(part_data["height_cm"]),
+        to_mm(part_data.get("depth_cm") or unit_calculators().DEFAULT_BOARD_THICKNESS),
+        _edge_key(part_data)
+    )
+
+
+def build_cut_list(unit_docs: Iterable[Dict[str, Any]]) -> List[CutListLine]:
+    """
+    دمج قطع الوحدات (parts_calculated + internal_counter_parts) في قائمة قص
+
+    Returns:
+        الأسطر مرتبة بالسمك ثم الاسم ثم المقاس (الأكبر أولاً)
+    """
+    quantities: Dict[CutListKey, int] = {}
+    unit_ids: Dict[CutListKey, set] = {}
+
+    for unit_doc in unit_docs:
+        for part_data in unit_doc.get("parts_calculated", []) + unit_doc.get("internal_counter_parts", []):
+            qty = int(part_data.get("qty") or 0)
+            if qty <= 0 or part_data["width_cm"] <= 0 or part_data["height_cm"] <= 0:
+                continue
+            key = cut_list_key(part_data)
+            quantities[key] = quantities.get(key, 0) + qty
+            unit_ids.setdefault(key, set()).add(unit_doc.get("_id"))
+
+    lines = []
+    for key, qty in quantities.items():
+        name, width_mm, height_mm, thickness_mm, edges = key
+        edge_band_mm = 0
+        if edges is not None:
+            top, bottom, left, right = edges
+            edge_band_mm = (top + bottom) * width_mm + (left + right) * height_mm
+
+        lines.append(CutListLine(
+            name=name,
+            width_cm=width_mm / 10,
+            height_cm=height_mm / 10,
+            thickness_cm=thickness_mm / 10,
+            qty=qty,
+            edge_distribution=(
+                EdgeDistribution(top=edges[0], bottom=edges[1], left=edges[2], right=edges[3])
+                if edges is not None else None
+            ),
+            edge_band_m=edge_band_mm / 1000,
+            area_m2=round(width_mm * height_mm * qty / 1_000_000, 4),
+            units_count=len(unit_ids[key])
+        ))
+
+    lines.sort(key=lambda line: (-line.thickness_cm, line.name, -line.height_cm, -line.width_cm))
+    return lines
@@ -3,8 +3,9 @@ Service for calculating edge band breakdown
 """
 from typing import List, Dict, Optional
 from app.models.units import Part, EdgeDistribution
-from app.models.edge_band import EdgeDetail, EdgeBandPart, EdgeType
+from app.models.edge_band import EdgeDetail, EdgeBandPart, EdgeRollPlan, EdgeType
 from app.models.settings import SettingsModel
+from app.services.edge_roll_optimizer import plan_edge_rolls
 
 def calculate_edge_breakdown_for_part(
     part: Part,
@@ -17,8 +18,8 @@ def calculate_edge_breakdown_for_part(
     Returns:
         EdgeBandPart with detailed edge information
     """
-    # استخدام edge_overlap_cm من settings مباشرة
-    edge_overlap_cm = settings.edge_overlap_cm
+    # هدر مكنة لصق الشريط لكل مقاس (يُضاف لطول كل حافة عليها شريط)
+    edge_overlap_cm = settings.edge_banding_waste_per_size
     
     # تحديد توزيع الشريط
     if part.edge_distribution is None:
@@ -151,43 +152,29 @@ def calculate_total_edge_meters(edge_breakdown: List[EdgeBandPart]) -> float:
 
 def calculate_edge_cost(
     edge_breakdown: List[EdgeBandPart],
-    settings: SettingsModel
+    settings: SettingsModel,
+    roll_plan: Optional[List[EdgeRollPlan]] = None
 ) -> Dict[str, float]:
     """
     حساب تكلفة الشريط حسب النوع
     
+    التكلفة من عدد اللفات الفعلي (plan_edge_rolls) وليس من الأمتار الخام.
+    
     Returns:
         Dict with cost breakdown by edge type
     """
+    if roll_plan is None:
+        roll_plan = plan_edge_rolls(edge_breakdown, settings)
+    
     cost_breakdown = {}
     total_cost = 0.0
     
-    # حساب التكلفة لكل نوع شريط
-    for edge_type in EdgeType:
-        type_parts = [p for p in edge_breakdown if p.edge_type == edge_type]
-        if not type_parts:
-            continue
-        
-        total_meters = sum(p.total_edge_m for p in type_parts)
-        
-        # البحث عن سعر الشريط في settings
-        material_key = f"edge_band_{edge_type.value}_per_meter"
-        if material_key in settings.materials:
-            price = settings.materials[material_key].price_per_meter
-            if price:
-                cost = total_meters * price
-                cost_breakdown[edge_type.value] = round(cost, 2)
-                total_cost += cost
-        else:
-            # Fallback: استخدام السعر العام للشريط
-            if "edge_band_per_meter" in settings.materials:
-                price = settings.materials["edge_band_per_meter"].price_per_meter
-                if price:
-                    cost = total_meters * price
-                    cost_breakdown[edge_type.value] = round(cost, 2)
-                    total_cost += cost
+    for plan in roll_plan:
+        if plan.cost:
+            cost_breakdown[plan.edge_type.value] = round(plan.cost, 2)
+            total_cost += plan.cost
     
     return {
         "breakdown": cost_breakdown,
         "total": round(total_cost, 2)
-    }
\ No newline at end of file
+    }
@@ -0,0 +1,107 @@
+"""
+Edge Roll Optimizer - توزيع قطع الشريط على اللفات (1D cutting stock)
+
+كل حافة عليها شريط تُقص من اللفة كقطعة واحدة (طول الحافة + هدر المكنة)،
+فيتم رص القطع على لفات بالطول المحدد لكل نوع شريط لمعرفة عدد اللفات
+الفعلي المطلوب شراؤه والهدر، بدلاً من قسمة إجمالي الأمتار على طول اللفة.
+
+الخوارزمية: Best Fit Decreasing - القطع من الأطول للأقصر، وكل قطعة توضع
+في اللفة التي يتبقى فيها أقل طول يكفيها (بحث ثنائي على الأطوال المتبقية).
+الأطوال بالمليمتر كأعداد صحيحة لتجنب أخطاء الكسور العشرية.
+"""
+import math
+from bisect import bisect_left, insort
+from typing import Dict, List, Tuple
+
+from app.models.edge_band import EdgeBandPart, EdgeRollPlan, EdgeType
+from app.models.settings import SettingsModel
+from app.services.cost_engine import get_price_table
+
+# طول اللفة الافتراضي إذا لم يُحدد roll_length_m للخامة
+DEFAULT_EDGE_ROLL_LENGTH_M = 100.0
+
+
+def collect_edge_strips(edge_breakdown: List[EdgeBandPart]) -> Dict[EdgeType, List[int]]:
+    """أطوال قطع الشريط بالمليمتر لكل نوع شريط (كل حافة × كمية القطعة)"""
+    strips: Dict[EdgeType, List[int]] = {}
+    for part in edge_breakdown:
+        lengths = [
+            math.ceil(round(edge.length_m * 1000, 6))
+            for edge in part.edges
+            if edge.has_edge and edge.length_m > 0
+        ]
+        if lengths:
+            strips.setdefault(part.edge_type, []).extend(lengths * part.qty)
+    return strips
+
+
+def pack_strips(strip_lengths_mm: List[int], roll_length_mm: int) -> Tuple[int, int]:
+    """
+    توزيع القطع على اللفات (Best Fit Decreasing)
+
+    القطعة الأطول من اللفة تأخذ لفات كاملة متتالية (لحام) والباقي يدخل
+    كلفة مفتوحة.
+
+    Returns:
+        (roll_count, used_mm)
+    """
+    remaining: List[int] = []  # المتبقي في كل لفة مفتوحة (مرتب)
+    roll_count = 0
+    used_mm = 0
+
+    for length in sorted(strip_lengths_mm, reverse=True):
+        used_mm += length
+        if length > roll_length_mm:
+            full_rolls, length = divmod(length, roll_length_mm)
+            roll_count += full_rolls
+            if length == 0:
+                continue
+
+        index = bisect_left(remaining, length)
+        if index < len(remaining):
+            left = remaining.pop(index) - length
+        else:
+            roll_count += 1
+            left = roll_length_mm - length
+        if left > 0:
+            insort(remaining, left)
+
+    return roll_count, used_mm
+
+
+def plan_edge_rolls(edge_breakdown: List[EdgeBandPart], settings: SettingsModel) -> List[EdgeRollPlan]:
+    """
+    خطة لفات الشريط لكل نوع شريط
+
+    التكلفة = عدد اللفات × price_per_roll، أو عدد اللفات × طول اللفة ×
+    price_per_meter إذا لم يُحدد سعر اللفة (جدول أسعار cost_engine).
+    """
+    prices = get_price_table(settings)
+    plans = []
+    strips_by_type = collect_edge_strips(edge_breakdown)
+
+    for edge_type in EdgeType:
+        strips = strips_by_type.get(edge_type)
+        if not strips:
+            continue
+
+        roll_length_m = prices.roll_length_m(edge_type) or DEFAULT_EDGE_ROLL_LENGTH_M
+        roll_length_mm = int(round(roll_length_m * 1000))
+
+        roll_count, used_mm = pack_strips(strips, roll_length_mm)
+        total_mm = roll_count * roll_length_mm
+
+        cost = prices.roll_cost(edge_type, roll_count, roll_length_m)
+
+        plans.append(EdgeRollPlan(
+            edge_type=edge_type,
+            roll_length_m=roll_length_m,
+            roll_count=roll_count,
+            strip_count=len(strips),
+            strips_m=round(used_mm / 1000, 3),
+            waste_m=round((total_mm - used_mm) / 1000, 3),
+            utilization_percent=round(used_mm / total_mm * 100, 2) if total_mm else 0.0,
+            cost=cost
+        ))
+
+    return plans
@@ -0,0 +1,37 @@
+"""
+ETags - إنشاء ETag ومقارنة If-None-Match
+
+الـ ETag هو sha256 لمدخلات المورد (مثل updated_at ورقم نسخة الإعدادات)،
+فيمكن الرد بـ 304 بدون قراءة أو تجهيز المحتوى الكامل.
+"""
+import hashlib
+import json
+from typing import Any, Optional
+
+
+def content_hash(*inputs: Any) -> str:
+    """sha256 لـ JSON مرتب للمدخلات"""
+    canonical = json.dumps(list(inputs), sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def make_etag(key: str) -> str:
+    return f'"{key}"'
+
+
+def resource_etag(*inputs: Any) -> str:
+    """ETag قوي من مدخلات المورد"""
+    return make_etag(content_hash(*inputs))
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """هل قيمة If-None-Match تحتوي الـ ETag (أو *)"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == "*" or candidate == etag:
+            return True
+    return False
@@ -0,0 +1,164 @@
+"""
+Export Cache - كاش ملفات التصدير على القرص (content-addressed)
+
+مفتاح كل ملف هو sha256 لكل مدخلات التصدير (مثل مستند الوحدة + رقم نسخة
+الإعدادات)، فنفس المدخلات تعطي نفس الملف ونفس الـ ETag، وأي تعديل في
+الوحدة أو الإعدادات يعطي مفتاحاً جديداً بدون الحاجة لمسح الكاش.
+
+- الملفات تُكتب في ملف مؤقت ثم os.replace (آمن مع أكثر من عملية).
+- القراءة تحدث وقت تعديل الملف، والحذف يبدأ بالأقدم (LRU) عند تجاوز الحجم
+  الأقصى export_cache_max_mb.
+- الحجم الإجمالي وترتيب الاستخدام محفوظان في الذاكرة ويتحدثان مع كل كتابة
+  وقراءة، والمجلد يُفحص كاملاً فقط في أول كتابة ثم كل RESCAN_EVERY_WRITES
+  كتابة (لرؤية ملفات العمليات الأخرى).
+- نفس الكاش يُستخدم لأي نوع تصدير (xlsx / csv) عن طريق kind والامتداد.
+"""
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from app.database import settings as app_settings
+from app.services.etags import content_hash
+
+# إعادة فحص المجلد كل كم كتابة
+RESCAN_EVERY_WRITES = 100
+
+
+def export_cache_key(kind: str, *inputs: Any) -> str:
+    """sha256 لـ JSON مرتب لنوع التصدير ومدخلاته"""
+    return content_hash(kind, *inputs)
+
+
+class ExportCache:
+    """ملفات تصدير على القرص بحد أقصى للحجم"""
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # path -> size بترتيب الاستخدام (الأقدم أولاً)
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        self._writes_since_scan: Optional[int] = None
+        os.makedirs(directory, exist_ok=True)
+
+    def path_for(self, key: str, extension: str) -> str:
+        return os.path.join(self.directory, f"{key}.{extension}")
+
+    def read(self, key: str, extension: str) -> Optional[bytes]:
+        """محتوى الملف المحفوظ أو None"""
+        path = self.path_for(key, extension)
+        try:
+            with open(path, "rb") as cached_file:
+                content = cached_file.read()
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+            if path in self._entries:
+                self._entries.move_to_end(path)
+        return content
+
+    def write(self, key: str, extension: str, content: bytes) -> None:
+        """حفظ الملف (كتابة مؤقتة ثم استبدال) ثم حذف الأقدم عند تجاوز الحجم"""
+        if len(content) > self.max_bytes:
+            return
+        path = self.path_for(key, extension)
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "wb") as temp_file:
+                temp_file.write(content)
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        with self._lock:
+            if self._writes_since_scan is None or self._writes_since_scan >= RESCAN_EVERY_WRITES:
+                self._scan_locked()
+            else:
+                self._total_bytes += len(content) - self._entries.pop(path, 0)
+                self._entries[path] = len(content)
+                self._writes_since_scan += 1
+            self._evict_locked()
+
+    def get_or_create(self, key: str, extension: str, build: Callable[[], bytes]) -> bytes:
+        content = self.read(key, extension)
+        if content is None:
+            content = build()
+            self.write(key, extension, content)
+        return content
+
+    def _scan_locked(self) -> None:
+        """قراءة حجم ووقت تعديل كل ملفات المجلد (الترتيب بوقت التعديل)"""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if not entry.is_file() or entry.name.endswith(".tmp"):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, entry.path, stat.st_size))
+
+        entries.sort()
+        self._entries = OrderedDict((path, size) for _, path, size in entries)
+        self._total_bytes = sum(self._entries.values())
+        self._writes_since_scan = 0
+
+    def _evict_locked(self) -> None:
+        while self._total_bytes > self.max_bytes and self._entries:
+            path, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            try:
+                os.remove(path)
+                self.evictions += 1
+            except FileNotFoundError:
+                pass
+
+    def evict(self) -> None:
+        """حذف الملفات الأقل استخداماً حتى يصبح الحجم أقل من الحد الأقصى"""
+        with self._lock:
+            self._evict_locked()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+            for entry in os.scandir(self.directory):
+                if entry.is_file():
+                    try:
+                        os.remove(entry.path)
+                    except FileNotFoundError:
+                        pass
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "directory": self.directory,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions
+            }
+
+
+_export_cache: Optional[ExportCache] = None
+
+
+def get_export_cache() -> ExportCache:
+    """كاش التصدير المشترك (المسار والحجم من إعدادات التطبيق)"""
+    global _export_cache
+    if _export_cache is None:
+        directory = app_settings.export_cache_dir or os.path.join(tempfile.gettempdir(), "kubecut_export_cache")
+        _export_cache = ExportCache(directory, app_settings.export_cache_max_mb * 1024 * 1024)
+    return _export_cache
@@ -0,0 +1,135 @@
+"""
+Index Manager - الفهارس المطلوبة لكل collection وإنشاؤها عند التشغيل
+
+كل استعلام متكرر (حد الوحدات الشهري، مشاريع المستخدم، ربط الوحدة بمشروع،
+قوائم السوق، السلة، تسجيل الدخول، ملخص الوحدة، المهام المنتظرة) له فهرس
+معرّف هنا. ensure_indexes تعمل كـ task في الخلفية عند التشغيل
+(ensure_database_indexes بمهلة index_check_timeout_ms، فالتشغيل لا ينتظر
+MongoDB)، أو يدوياً قبل النشر:
+
+    python -m app.services.index_manager
+
+- create_indexes بنفس الاسم والمواصفات لا يفعل شيئاً إذا كان الفهرس موجوداً
+  (آمن مع كل تشغيل ومع أكثر من سيرفر).
+- فشل collection (مثلاً أرقام هاتف مكررة تمنع الفهرس الفريد) لا يوقف باقي
+  الفهارس ولا تشغيل السيرفر، ويظهر في التقرير.
+- التقرير يوضح الفهارس الناقصة التي تم إنشاؤها، والفهارس الموجودة غير
+  المعرفة هنا، والفهارس المعرفة (الموجودة من قبل) التي لم تُستخدم منذ
+  تشغيل MongoDB ($indexStats).
+"""
+from typing import Any, Dict, List
+
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import OperationFailure
+
+REQUIRED_INDEXES: Dict[str, List[IndexModel]] = {
+    "units": [
+        # حد الوحدات الشهري (count_documents) ووحدات المستخدم وصفحات /units/page
+        IndexModel(
+            [("created_by", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+            name="created_by_created_at_id"
+        ),
+        # مهمة إعادة حساب الوحدات بعد تغيير الإعدادات
+        IndexModel([("type", ASCENDING)], name="type"),
+    ],
+    "projects": [
+        # مشاريع المستخدم (الأحدث أولاً) وعددها وصفحات /projects/page
+        IndexModel(
+            [("created_by", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+            name="created_by_created_at_id"
+        ),
+        # التحقق من أن الوحدة غير مرتبطة بمشروع آخر
+        IndexModel([("unit_ids", ASCENDING)], name="unit_ids"),
+    ],
+    # القوائم والصفحات (الترتيب بالتاريخ ثم _id من الفهرس)
+    "marketplace_items": [
+        IndexModel(
+            [("status", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+            name="status_created_at_id"
+        ),
+        IndexModel(
+            [("seller_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+            name="seller_id_created_at_id"
+        ),
+        IndexModel(
+            [("seller_id", ASCENDING), ("status", ASCENDING), ("updated_at", DESCENDING), ("_id", DESCENDING)],
+            name="seller_id_status_updated_at_id"
+        ),
+        IndexModel(
+            [("buyer_id", ASCENDING), ("status", ASCENDING), ("updated_at", DESCENDING), ("_id", DESCENDING)],
+            name="buyer_id_status_updated_at_id"
+        ),
+    ],
+    "carts": [
+        IndexModel([("user_id", ASCENDING)], name="user_id", unique=True),
+    ],
+    "users": [
+        IndexModel([("phone", ASCENDING)], name="phone", unique=True),
+    ],
+    "unit_summaries": [
+        IndexModel([("unit_id", ASCENDING)], name="unit_id"),
+    ],
+    "jobs": [
+        # استئناف المهام غير المنتهية عند التشغيل
+        IndexModel([("status", ASCENDING)], name="status"),
+    ],
+}
+
+
+async def ensure_indexes(db) -> Dict[str, Dict[str, Any]]:
+    """
+    إنشاء الفهارس الناقصة وتقرير حالة الفهارس لكل collection
+
+    أخطاء الاتصال بـ MongoDB ترتفع كما هي (لا داعي لمحاولة باقي الـ collections).
+
+    Returns:
+        collection -> {"created", "unmanaged", "unused", "error"}
+    """
+    report: Dict[str, Dict[str, Any]] = {}
+    for collection_name, indexes in REQUIRED_INDEXES.items():
+        collection = db[collection_name]
+        declared = {index.document["name"] for index in indexes}
+        collection_report: Dict[str, Any] = {"created": [], "unmanaged": [], "unused": [], "error": None}
+        report[collection_name] = collection_report
+        try:
+            existing = set(await collection.index_information())
+            await collection.create_indexes(indexes)
+        except OperationFailure as e:
+            collection_report["error"] = str(e)
+            continue
+
+        collection_report["created"] = sorted(declared - existing)
+        collection_report["unmanaged"] = sorted(existing - declared - {"_id_"})
+        try:
+            async for stats in collection.aggregate([{"$indexStats": {}}]):
+                if stats["name"] in declared & existing and not stats.get("accesses", {}).get("ops"):
+                    collection_report["unused"].append(stats["name"])
+        except OperationFailure:
+            # $indexStats يحتاج صلاحيات قد لا تكون متاحة لمستخدم التطبيق
+            pass
+        collection_report["unused"].sort()
+    return report
+
+
+def format_index_report(report: Dict[str, Dict[str, Any]]) -> List[str]:
+    """سطر لكل collection فيه تغيير أو ملاحظة"""
+    lines = []
+    for collection_name, collection_report in report.items():
+        if collection_report["error"]:
+            lines.append(f"WARNING: Could not ensure indexes on {collection_name}: {collection_report['error']}")
+            continue
+        if collection_report["created"]:
+            lines.append(f"Created indexes on {collection_name}: {', '.join(collection_report['created'])}")
+        if collection_report["unmanaged"]:
+            lines.append(f"Unmanaged indexes on {collection_name}: {', '.join(collection_report['unmanaged'])}")
+        if collection_report["unused"]:
+            lines.append(f"Unused indexes on {collection_name}: {', '.join(collection_report['unused'])}")
+    return lines
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    from app.database import ensure_database_indexes
+
+    asyncio.run(ensure_database_indexes())
@@ -1,10 +1,11 @@
 """
 Service for calculating internal counter parts
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from app.models.units import UnitType
 from app.models.internal_counter import InternalCounterPart, InternalCounterOptions
 from app.models.settings import SettingsModel
+from app.services.sheet_nesting import nest_parts_with_settings
 from app.services.unit_calculator import calculate_piece_edge_meters
 from app.models.units import Part, EdgeDistribution
 
@@ -228,22 +229,26 @@ def calculate_internal_total_area(parts: List[InternalCounterPart]) -> float:
 def calculate_internal_material_usage(
     total_area_m2: float,
     edge_band_m: float,
-    settings: SettingsModel
+    settings: SettingsModel,
+    parts: Optional[List[InternalCounterPart]] = None
 ) -> Dict[str, float]:
     """
     حساب استخدام المواد للقطع الداخلية
     
-    يستخدم sheet_size_m2 من settings
+    عدد الألواح من رص القطع فعلياً على الألواح (sheet_nesting) إذا تم تمرير
+    القطع، وإلا تقدير بالمساحة على مقاس اللوح من settings
     """
-    # استخدام sheet_size_m2 من settings
-    sheet_size_m2 = settings.sheet_size_m2
-    # Fallback من materials إذا كان موجود
-    if settings.materials and "plywood_sheet" in settings.materials:
-        sheet_size = settings.materials["plywood_sheet"].sheet_size_m2
-        if sheet_size:
-            sheet_size_m2 = sheet_size
-    
-    plywood_sheets = (total_area_m2 / sheet_size_m2) if sheet_size_m2 > 0 else 0
+    if parts is not None:
+        nesting = nest_parts_with_settings(parts, settings)
+        plywood_sheets = float(nesting.priced_sheet_count)
+    else:
+        # تقدير تقريبي بالمساحة
+        sheet_size_m2 = (settings.sheet_length_cm * settings.sheet_width_cm) / 10000
+        if settings.materials and "plywood_sheet" in settings.materials:
+            sheet_size = settings.materials["plywood_sheet"].sheet_size_m2
+            if sheet_size:
+                sheet_size_m2 = sheet_size
+        plywood_sheets = (total_area_m2 / sheet_size_m2) if sheet_size_m2 > 0 else 0
     
     return {
         "ألواح الخشب": round(plywood_sheets, 2),
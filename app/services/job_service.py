@@ -0,0 +1,427 @@
+"""
+Job Service - مهام الخلفية (تحسين المشاريع الكبيرة)
+
+العمليات الثقيلة (رص الألواح ولفات الشريط لمشروع كامل) لا تعمل داخل
+coroutine الطلب حتى لا تحجز event loop لباقي المستخدمين:
+
+- الطلب ينشئ مستند مهمة في MongoDB (jobs) ويرجع معرفها فوراً.
+- المهمة تعمل كـ asyncio task، والحسابات نفسها تُرسل لـ ProcessPoolExecutor
+  محدود العدد (job_workers)، مع تحديث التقدم في المستند بين المراحل.
+- الحالة والنتيجة محفوظة في MongoDB. العملية التي تنفذ المهمة تحجزها
+  (worker_id و lease_until) وتجدد الحجز كل ثلث job_lease_s، وكل تحديثات
+  المهمة مشروطة بأنها ما زالت صاحبة الحجز.
+- المهام المعلقة والمهام التي انتهى حجزها (العملية توقفت) يتم استئنافها عند
+  التشغيل ثم كل job_lease_s (watch_unfinished_jobs)، بدون لمس مهام تعمل في
+  عملية أخرى.
+"""
+import asyncio
+import multiprocessing
+import os
+import socket
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from app.database import get_database, settings as app_settings
+from app.models.jobs import JobKind, JobResponse, JobStatus
+from app.services.project_optimizer import (
+    nest_project_parts,
+    plan_project_edge_rolls,
+    summarize_project_cost
+)
+from app.services.lazy_modules import unit_recalculation
+from app.services.settings_snapshot import get_current_settings
+from app.services.unit_quota import reconcile_unit_quotas
+from app.services.user_stats import (
+    increment_user_stats,
+    rebuild_user_stats,
+    sum_stats_deltas,
+    unit_stats_delta
+)
+from pymongo import UpdateOne
+
+ProgressReporter = Callable[[int, str], Awaitable[None]]
+JobHandler = Callable[[Dict[str, Any], ProgressReporter], Awaitable[Dict[str, Any]]]
+
+_executor: Optional[ProcessPoolExecutor] = None
+_job_slots: Optional[asyncio.Semaphore] = None
+_pool_slots: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = None
+_running_tasks: Set[asyncio.Task] = set()
+_scheduled_job_ids: Set[str] = set()
+
+# معرف هذه العملية في حجز المهام
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class JobQueueFullError(Exception):
+    """عدد المهام المنتظرة وصل للحد الأقصى"""
+
+
+def get_job_executor() -> ProcessPoolExecutor:
+    """process pool المشترك للمهام (spawn حتى لا يتم نسخ اتصالات MongoDB)"""
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=app_settings.job_workers,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _executor
+
+
+def shutdown_job_executor() -> None:
+    """إيقاف الـ process pool (المهام غير المنتهية تُستأنف عند التشغيل التالي)"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def _get_pool_slots() -> asyncio.Semaphore:
+    global _pool_slots
+    loop = asyncio.get_running_loop()
+    if _pool_slots is None or _pool_slots[0] is not loop:
+        _pool_slots = (loop, asyncio.Semaphore(app_settings.job_workers))
+    return _pool_slots[1]
+
+
+async def run_in_job_pool(function: Callable[..., Any], *args: Any) -> Any:
+    """
+    تشغيل دالة (معاملاتها ونتيجتها قابلة للـ pickle) في process pool المهام
+
+    لا يُرسل للـ pool أكثر من job_workers حساب في نفس الوقت (بالترتيب)، فطلب
+    واحد يرسل عدة حسابات لا يملأ طابور الـ pool أمام المهام والطلبات الأخرى.
+    """
+    async with _get_pool_slots():
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_job_executor(), function, *args)
+
+
+def _get_job_slots() -> asyncio.Semaphore:
+    global _job_slots
+    if _job_slots is None:
+        _job_slots = asyncio.Semaphore(app_settings.job_workers)
+    return _job_slots
+
+
+def _lease_deadline() -> datetime:
+    return datetime.utcnow() + timedelta(seconds=app_settings.job_lease_s)
+
+
+async def update_job(job_id: str, **fields: Any) -> bool:
+    """تحديث مهمة تحجزها هذه العملية (False إذا انتقل الحجز لعملية أخرى)"""
+    db = get_database()
+    result = await db.jobs.update_one({"_id": job_id, "worker_id": WORKER_ID}, {"$set": fields})
+    return result.matched_count > 0
+
+
+async def _renew_lease(job_id: str) -> None:
+    """تجديد حجز المهمة كل ثلث job_lease_s حتى تنتهي أو يضيع الحجز"""
+    while True:
+        await asyncio.sleep(app_settings.job_lease_s / 3)
+        try:
+            if not await update_job(job_id, lease_until=_lease_deadline()):
+                print(f"WARNING: Job {job_id} lease was taken over, its result will not be saved")
+                return
+        except Exception as e:
+            print(f"WARNING: Could not renew lease of job {job_id}: {e}")
+
+
+def job_to_response(job_doc: Dict[str, Any]) -> JobResponse:
+    return JobResponse(
+        job_id=job_doc["_id"],
+        kind=job_doc["kind"],
+        status=job_doc["status"],
+        progress=job_doc.get("progress", 0),
+        stage=job_doc.get("stage"),
+        project_id=job_doc.get("project_id"),
+        result=job_doc.get("result"),
+        error=job_doc.get("error"),
+        created_by=job_doc.get("created_by"),
+        created_at=job_doc["created_at"],
+        started_at=job_doc.get("started_at"),
+        finished_at=job_doc.get("finished_at")
+    )
+
+
+async def _run_project_optimize(job: Dict[str, Any], report: ProgressReporter) -> Dict[str, Any]:
+    """رص ألواح المشروع وتخطيط لفات الشريط وحساب التكلفة"""
+    db = get_database()
+    project_doc = await db.projects.find_one({"_id": job["project_id"]}, {"unit_ids": 1})
+    if project_doc is None:
+        raise ValueError(f"Project with id {job['project_id']} not found")
+
+    await report(5, "loading_parts")
+    parts_data = []
+    nesting_parts_data = []
+    units_count = 0
+    if project_doc.get("unit_ids"):
+        units_cursor = db.units.find(
+            {"_id": {"$in": project_doc["unit_ids"]}},
+            {"parts_calculated": 1, "internal_counter_parts": 1}
+        )
+        async for unit_doc in units_cursor:
+            units_count += 1
+            parts_data.extend(unit_doc.get("parts_calculated", []))
+            nesting_parts_data.extend(unit_doc.get("parts_calculated", []))
+            nesting_parts_data.extend(unit_doc.get("internal_counter_parts", []))
+
+    settings_data = (await get_current_settings()).model_dump(mode="json")
+
+    await report(15, "nesting")
+    nesting = await run_in_job_pool(nest_project_parts, nesting_parts_data, settings_data)
+
+    await report(70, "edge_rolls")
+    edge_rolls = await run_in_job_pool(
+        plan_project_edge_rolls, parts_data, settings_data, job["params"].get("edge_type", "pvc")
+    )
+
+    await report(95, "cost")
+    return {
+        "units_count": units_count,
+        "parts_count": len(parts_data),
+        "nesting": nesting,
+        "edge_rolls": edge_rolls,
+        "cost": summarize_project_cost(nesting, edge_rolls, settings_data)
+    }
+
+
+# أقصى عدد أخطاء يتم حفظه في نتيجة مهمة إعادة الحساب
+MAX_REPORTED_ERRORS = 50
+
+
+async def _run_units_recalculate(job: Dict[str, Any], report: ProgressReporter) -> Dict[str, Any]:
+    """
+    إعادة حساب الوحدات المحفوظة من الأنواع المتأثرة بتغيير الإعدادات
+
+    الوحدات تُقرأ من cursor على دفعات، كل دفعة تُحسب في process pool ثم
+    تُكتب بـ bulk_write واحد. الإعدادات تُقرأ مع كل دفعة حتى لا تكتب المهمة
+    نتائج بإعدادات قديمة إذا تغيرت الإعدادات أثناء التنفيذ.
+
+    إحصائيات لوحة التحكم تتحدث مع كل دفعة بالفرق بين القيم القديمة والجديدة
+    لكل مالك ($inc). إذا لم تُكتب كل وحدات الدفعة (حُذفت أثناء المهمة) يتم
+    إعادة حساب إحصائيات مالكي الدفعة فقط.
+    """
+    recalculation = unit_recalculation()
+    db = get_database()
+    unit_types = job["params"]["unit_types"]
+    query = {"type": {"$in": unit_types}, "request_inputs": {"$exists": True}}
+
+    await report(0, "counting")
+    total = await db.units.count_documents(query)
+    # وحدات محفوظة قبل حفظ مدخلات الطلب لا يمكن إعادة حسابها بدقة
+    skipped = await db.units.count_documents({"type": {"$in": unit_types}, "request_inputs": {"$exists": False}})
+
+    processed = 0
+    updated = 0
+    errors = []
+
+    async def flush(chunk_docs) -> None:
+        nonlocal processed, updated
+        chunk = [(unit_doc["_id"], unit_doc["request_inputs"]) for unit_doc in chunk_docs]
+        old_units = {unit_doc["_id"]: unit_doc for unit_doc in chunk_docs}
+        settings_data = (await get_current_settings()).model_dump(mode="json")
+        chunk_result = await run_in_job_pool(recalculation.recalculate_units_chunk, chunk, settings_data)
+
+        now = datetime.utcnow()
+        operations = []
+        owner_deltas: Dict[str, List[Dict[str, float]]] = {}
+        for unit_id, fields in chunk_result["updates"]:
+            operations.append(UpdateOne({"_id": unit_id}, {"$set": {**fields, "updated_at": now}}))
+            old_unit = old_units[unit_id]
+            owner_deltas.setdefault(old_unit.get("created_by"), []).extend([
+                unit_stats_delta(old_unit, -1), unit_stats_delta(fields)
+            ])
+        if operations:
+            write_result = await db.units.bulk_write(operations, ordered=False)
+            updated += write_result.modified_count
+            for owner_id, deltas in owner_deltas.items():
+                if write_result.matched_count == len(operations):
+                    await increment_user_stats(db, owner_id, sum_stats_deltas(deltas))
+                elif owner_id:
+                    await rebuild_user_stats(db, owner_id)
+
+        errors.extend(chunk_result["errors"][:MAX_REPORTED_ERRORS - len(errors)])
+        processed += len(chunk)
+        await report(min(99, processed * 100 // max(total, 1)), "recalculating")
+
+    chunk = []
+    projection = {"request_inputs": 1, "created_by": 1, "total_area_m2": 1, "edge_band_m": 1, "price_estimate": 1}
+    units_cursor = db.units.find(query, projection).batch_size(recalculation.RECALCULATION_CHUNK_SIZE)
+    async for unit_doc in units_cursor:
+        chunk.append(unit_doc)
+        if len(chunk) >= recalculation.RECALCULATION_CHUNK_SIZE:
+            await flush(chunk)
+            chunk = []
+    if chunk:
+        await flush(chunk)
+
+    return {
+        "unit_types": unit_types,
+        "changed_fields": job["params"].get("changed_fields", []),
+        "matched": total,
+        "processed": processed,
+        "updated": updated,
+        "skipped_without_inputs": skipped,
+        "errors": errors
+    }
+
+
+async def _run_user_stats_rebuild(job: Dict[str, Any], report: ProgressReporter) -> Dict[str, Any]:
+    """إعادة حساب مستندات user_stats من الوحدات والمشاريع بـ aggregation واحد"""
+    await report(0, "aggregating")
+    users = await rebuild_user_stats(get_database())
+    return {"users": users}
+
+
+async def _run_unit_quota_reconcile(job: Dict[str, Any], report: ProgressReporter) -> Dict[str, Any]:
+    """إعادة بناء خانات حد الوحدات اليومية (unit_quotas) من الوحدات"""
+    await report(0, "aggregating")
+    users = await reconcile_unit_quotas(get_database())
+    return {"users_with_units": users}
+
+
+# نوع المهمة -> الدالة التي تنفذها
+JOB_HANDLERS: Dict[JobKind, JobHandler] = {
+    JobKind.PROJECT_OPTIMIZE: _run_project_optimize,
+    JobKind.UNITS_RECALCULATE: _run_units_recalculate,
+    JobKind.USER_STATS_REBUILD: _run_user_stats_rebuild,
+    JobKind.UNIT_QUOTA_RECONCILE: _run_unit_quota_reconcile,
+}
+
+
+async def _execute_job(job_id: str) -> None:
+    async with _get_job_slots():
+        db = get_database()
+        if db is None:
+            return
+
+        # حجز المهمة (pending -> running) حتى لا تعمل مرتين
+        job = await db.jobs.find_one_and_update(
+            {"_id": job_id, "status": JobStatus.PENDING.value},
+            {"$set": {
+                "status": JobStatus.RUNNING.value,
+                "started_at": datetime.utcnow(),
+                "progress": 0,
+                "worker_id": WORKER_ID,
+                "lease_until": _lease_deadline()
+            }}
+        )
+        if job is None:
+            return
+
+        async def report(progress: int, stage: str) -> None:
+            await update_job(job_id, progress=progress, stage=stage)
+
+        heartbeat = asyncio.create_task(_renew_lease(job_id))
+        try:
+            result = await JOB_HANDLERS[JobKind(job["kind"])](job, report)
+        except Exception as e:
+            print(f"ERROR: Job {job_id} failed: {e}")
+            await update_job(
+                job_id,
+                status=JobStatus.FAILED.value,
+                error=str(e),
+                lease_until=None,
+                finished_at=datetime.utcnow()
+            )
+            return
+        finally:
+            heartbeat.cancel()
+
+        await update_job(
+            job_id,
+            status=JobStatus.COMPLETED.value,
+            progress=100,
+            stage=None,
+            result=result,
+            lease_until=None,
+            finished_at=datetime.utcnow()
+        )
+
+
+def schedule_job(job_id: str) -> None:
+    """تشغيل المهمة كـ asyncio task (مع الاحتفاظ بمرجع لها)"""
+    task = asyncio.create_task(_execute_job(job_id))
+    _running_tasks.add(task)
+    _scheduled_job_ids.add(job_id)
+    task.add_done_callback(_running_tasks.discard)
+    task.add_done_callback(lambda _: _scheduled_job_ids.discard(job_id))
+
+
+async def create_job(
+    kind: JobKind,
+    created_by: Optional[str],
+    project_id: Optional[str] = None,
+    params: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    إنشاء مهمة وحفظها في MongoDB ثم جدولتها
+
+    Raises:
+        JobQueueFullError: إذا وصل عدد المهام غير المنتهية لـ job_queue_limit
+    """
+    if len(_running_tasks) >= app_settings.job_queue_limit:
+        raise JobQueueFullError(f"Too many queued jobs (max {app_settings.job_queue_limit})")
+
+    job_doc = {
+        "_id": str(uuid.uuid4()),
+        "kind": kind.value,
+        "status": JobStatus.PENDING.value,
+        "progress": 0,
+        "stage": None,
+        "project_id": project_id,
+        "params": params or {},
+        "result": None,
+        "error": None,
+        "created_by": created_by,
+        "created_at": datetime.utcnow(),
+        "started_at": None,
+        "finished_at": None,
+        "worker_id": None,
+        "lease_until": None
+    }
+    db = get_database()
+    await db.jobs.insert_one(job_doc)
+    schedule_job(job_doc["_id"])
+    return job_doc
+
+
+async def resume_unfinished_jobs() -> None:
+    """
+    استئناف المهام التي لم تنته
+
+    المهام running التي انتهى حجزها (العملية التي تنفذها توقفت) تعود pending
+    (الحساب يُعاد من البداية)، والمهام التي تعمل في عملية حية لا تُلمس. كل
+    المهام pending تُجدول هنا، وحجزها يضمن أنها تعمل في عملية واحدة فقط.
+    """
+    db = get_database()
+    if db is None:
+        return
+
+    try:
+        await db.jobs.update_many(
+            {
+                "status": JobStatus.RUNNING.value,
+                "$or": [{"lease_until": {"$lt": datetime.utcnow()}}, {"lease_until": None}]
+            },
+            {"$set": {
+                "status": JobStatus.PENDING.value,
+                "progress": 0,
+                "stage": None,
+                "worker_id": None,
+                "lease_until": None
+            }}
+        )
+        async for job_doc in db.jobs.find({"status": JobStatus.PENDING.value}, {"_id": 1}):
+            if job_doc["_id"] not in _scheduled_job_ids:
+                schedule_job(job_doc["_id"])
+    except Exception as e:
+        print(f"WARNING: Could not resume unfinished jobs: {e}")
+
+
+async def watch_unfinished_jobs() -> None:
+    """استئناف المهام عند التشغيل ثم كل job_lease_s (حتى يتم إلغاء الـ task)"""
+    while True:
+        await resume_unfinished_jobs()
+        await asyncio.sleep(app_settings.job_lease_s)
@@ -0,0 +1,46 @@
+"""
+Lazy Modules - الموديولات الثقيلة التي تُستورد عند أول استخدام
+
+unit_calculators (كل دوال الوحدات) و unit_sweep و unit_recalculation و
+price_scenarios (numpy) و openpyxl لا تُستورد مع بداية التشغيل حتى لا تتأخر
+بداية كل worker بسببها (benchmarks/bench_startup.py). الكود يصل لها من هنا
+فقط بدلاً من import داخل كل دالة، فيبقى الاستيراد المؤجل في مكان واحد:
+
+    calculators = unit_calculators()
+    calculators.calculate_unit_result(...)
+"""
+import importlib
+from functools import lru_cache
+from types import ModuleType
+
+
+@lru_cache(maxsize=None)
+def _load(*names: str) -> ModuleType:
+    """استيراد الموديولات بالترتيب وإرجاع أولها (يحدث مرة واحدة)"""
+    modules = [importlib.import_module(name) for name in names]
+    return modules[0]
+
+
+def unit_calculators() -> ModuleType:
+    """app.services.unit_calculators"""
+    return _load("app.services.unit_calculators")
+
+
+def unit_sweep() -> ModuleType:
+    """app.services.unit_sweep (numpy)"""
+    return _load("app.services.unit_sweep")
+
+
+def unit_recalculation() -> ModuleType:
+    """app.services.unit_recalculation"""
+    return _load("app.services.unit_recalculation")
+
+
+def price_scenarios() -> ModuleType:
+    """app.services.price_scenarios (numpy)"""
+    return _load("app.services.price_scenarios")
+
+
+def openpyxl() -> ModuleType:
+    """openpyxl مع styles و cell و utils (openpyxl().styles.Font ...)"""
+    return _load("openpyxl", "openpyxl.styles", "openpyxl.cell", "openpyxl.utils")
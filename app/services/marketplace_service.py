@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 from uuid import uuid4
 from fastapi import HTTPException, status
@@ -11,6 +11,7 @@ from app.models.marketplace import (
     MarketplaceItemResponse
 )
 from app.database import get_database
+from app.services.pagination import DEFAULT_PAGE_SIZE, fetch_page
 
 class MarketplaceService:
     def __init__(self, db: AsyncIOMotorDatabase):
@@ -31,7 +32,8 @@ class MarketplaceService:
         await self.collection.insert_one(item_doc.model_dump(by_alias=True))
         return item_doc
 
-    async def get_items(self, status: Optional[ItemStatus] = ItemStatus.AVAILABLE, search_query: str = None, skip: int = 0, limit: int = 20) -> List[MarketplaceItemDocument]:
+    @staticmethod
+    def items_query(status: Optional[ItemStatus] = ItemStatus.AVAILABLE, search_query: str = None) -> dict:
         query = {}
         if status:
             query["status"] = status
@@ -43,38 +45,49 @@ class MarketplaceService:
                 {"title": regex},
                 {"description": regex}
             ]
-            
-        cursor = self.collection.find(query).skip(skip).limit(limit).sort("created_at", -1)
+        return query
+
+    @staticmethod
+    def buyer_query(buyer_id: str) -> dict:
+        return {"buyer_id": buyer_id, "status": ItemStatus.SOLD}
+
+    @staticmethod
+    def owner_query(seller_id: str) -> dict:
+        """All items listed by a specific seller (owner) regardless of status"""
+        return {"seller_id": seller_id}
+
+    @staticmethod
+    def seller_query(seller_id: str) -> dict:
+        # Items sold by this seller
+        return {"seller_id": seller_id, "status": {"$in": [ItemStatus.SOLD, ItemStatus.PENDING]}}
+
+    async def _find_items(self, query: dict, sort_field: str, skip: int, limit: int) -> List[MarketplaceItemDocument]:
+        cursor = self.collection.find(query).skip(skip).limit(limit).sort(sort_field, -1)
         items = []
         async for doc in cursor:
             items.append(MarketplaceItemDocument(**doc))
         return items
 
+    async def get_items(self, status: Optional[ItemStatus] = ItemStatus.AVAILABLE, search_query: str = None, skip: int = 0, limit: int = 20) -> List[MarketplaceItemDocument]:
+        return await self._find_items(self.items_query(status, search_query), "created_at", skip, limit)
+
     async def get_items_by_buyer(self, buyer_id: str, skip: int = 0, limit: int = 20) -> List[MarketplaceItemDocument]:
-        query = {"buyer_id": buyer_id, "status": ItemStatus.SOLD}
-        cursor = self.collection.find(query).skip(skip).limit(limit).sort("updated_at", -1)
-        items = []
-        async for doc in cursor:
-            items.append(MarketplaceItemDocument(**doc))
-        return items
+        return await self._find_items(self.buyer_query(buyer_id), "updated_at", skip, limit)
 
     async def get_items_by_owner(self, seller_id: str, skip: int = 0, limit: int = 20) -> List[MarketplaceItemDocument]:
         """Get all items listed by a specific seller (owner) regardless of status"""
-        query = {"seller_id": seller_id}
-        cursor = self.collection.find(query).skip(skip).limit(limit).sort("created_at", -1)
-        items = []
-        async for doc in cursor:
-            items.append(MarketplaceItemDocument(**doc))
-        return items
+        return await self._find_items(self.owner_query(seller_id), "created_at", skip, limit)
 
     async def get_items_by_seller(self, seller_id: str, skip: int = 0, limit: int = 20) -> List[MarketplaceItemDocument]:
-        # Get items sold by this seller
-        query = {"seller_id": seller_id, "status": {"$in": [ItemStatus.SOLD, ItemStatus.PENDING]}}
-        cursor = self.collection.find(query).skip(skip).limit(limit).sort("updated_at", -1)
-        items = []
-        async for doc in cursor:
-            items.append(MarketplaceItemDocument(**doc))
-        return items
+        return await self._find_items(self.seller_query(seller_id), "updated_at", skip, limit)
+
+    async def get_items_page(self, query: dict, sort_field: str, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE) -> Tuple[List[MarketplaceItemDocument], Optional[str]]:
+        """
+        Keyset page of items (newest first by sort_field) and the cursor of the next page.
+        Raises InvalidCursorError for a malformed cursor.
+        """
+        docs, next_cursor = await fetch_page(self.collection, query, sort_field, cursor, limit)
+        return [MarketplaceItemDocument(**doc) for doc in docs], next_cursor
 
     async def get_item_by_id(self, item_id: str) -> Optional[MarketplaceItemDocument]:
         doc = await self.collection.find_one({"_id": item_id})
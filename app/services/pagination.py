@@ -0,0 +1,104 @@
+"""
+Pagination - صفحات بمؤشر (keyset) بدلاً من skip/limit
+
+الصفحة مرتبة تنازلياً بحقل تاريخ (created_at أو updated_at) ثم _id، والمؤشر
+next_cursor هو (قيمة حقل الترتيب، _id) لآخر مستند في الصفحة مشفرة base64.
+الصفحة التالية تبدأ بشرط على الفهرس ({field: {$lte: value}} ثم استبعاد ما
+قبل المؤشر) فيبقى زمن الصفحة ثابتاً مهما كان عمقها، بعكس skip الذي يمر على
+كل المستندات السابقة.
+
+حقل الترتيب يجب أن يكون موجوداً في كل المستندات (created_at / updated_at
+تُحفظ مع إنشاء المشاريع والوحدات وعناصر السوق).
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+# حجم الصفحة الافتراضي والأقصى
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class InvalidCursorError(ValueError):
+    """مؤشر صفحة غير صالح (تم تعديله أو من endpoint آخر)"""
+
+
+def encode_cursor(sort_value: Optional[datetime], doc_id: Any) -> str:
+    """مؤشر نصي معتم من قيمة الترتيب و _id"""
+    payload = json.dumps([sort_value.isoformat() if sort_value else None, doc_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], Any]:
+    """
+    (قيمة الترتيب، _id) من المؤشر
+
+    Raises:
+        InvalidCursorError: إذا لم يكن المؤشر من encode_cursor
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sort_value, doc_id = json.loads(payload)
+        return (datetime.fromisoformat(sort_value) if sort_value is not None else None), doc_id
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+
+
+def page_sort(sort_field: str) -> List[Tuple[str, int]]:
+    """الترتيب: الأحدث أولاً و _id لفك التساوي"""
+    return [(sort_field, -1), ("_id", -1)]
+
+
+def page_filter(query: Dict[str, Any], sort_field: str, cursor: Optional[str]) -> Dict[str, Any]:
+    """
+    شرط الاستعلام للصفحة التي تبدأ بعد المؤشر
+
+    Raises:
+        InvalidCursorError: إذا كان المؤشر غير صالح
+    """
+    if not cursor:
+        return query
+    sort_value, doc_id = decode_cursor(cursor)
+    if sort_value is None:
+        # المستندات بدون حقل الترتيب تأتي في النهاية (null أقل من أي تاريخ)
+        after_cursor = {sort_field: None, "_id": {"$lt": doc_id}}
+    else:
+        after_cursor = {
+            sort_field: {"$lte": sort_value},
+            "$or": [{sort_field: {"$lt": sort_value}}, {"_id": {"$lt": doc_id}}]
+        }
+    return {"$and": [query, after_cursor]} if query else after_cursor
+
+
+def split_page(
+    docs: List[Dict[str, Any]],
+    sort_field: str,
+    limit: int
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    الصفحة ومؤشر الصفحة التالية من limit + 1 مستند
+
+    Returns:
+        (أول limit مستند، next_cursor أو None إذا كانت الصفحة الأخيرة)
+    """
+    if len(docs) <= limit:
+        return docs, None
+    last = docs[limit - 1]
+    return docs[:limit], encode_cursor(last.get(sort_field), last["_id"])
+
+
+async def fetch_page(
+    collection,
+    query: Dict[str, Any],
+    sort_field: str,
+    cursor: Optional[str],
+    limit: int,
+    projection: Optional[Dict[str, Any]] = None
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """صفحة من collection بـ find واحد (limit + 1 لمعرفة وجود صفحة تالية)"""
+    docs = await collection.find(page_filter(query, sort_field, cursor), projection).sort(
+        page_sort(sort_field)
+    ).limit(limit + 1).to_list(limit + 1)
+    return split_page(docs, sort_field, limit)
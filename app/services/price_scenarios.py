@@ -0,0 +1,71 @@
+"""
+Price Scenarios - تسعير نفس الكميات بأكثر من سيناريو أسعار
+
+الكميات (عدد الألواح ومتر الشريط) تُحسب مرة واحدة، وأسعار كل السيناريوهات
+توضع في مصفوفة (سيناريو × خامة) فتُحسب كل التكاليف بعملية ضرب واحدة في
+numpy بدلاً من تغيير الإعدادات وإعادة الحساب لكل سيناريو. الصف الأول هو
+أسعار الإعدادات الحالية (نفس نتيجة PriceTable.price_usage).
+"""
+from typing import List, Mapping, Tuple
+
+import numpy as np
+
+from app.models.pricing import PriceScenario, PriceScenariosResponse, ScenarioCost
+from app.services.cost_engine import EDGE_USAGE_KEY, SHEETS_USAGE_KEY, PriceTable
+
+CURRENT_SCENARIO_NAME = "current"
+
+
+def scenario_price_matrix(scenarios: List[PriceScenario], prices: PriceTable) -> np.ndarray:
+    """مصفوفة الأسعار: صف لكل سيناريو (الحالي أولاً) وعمود للوح وعمود لمتر الشريط"""
+    current = (prices.board_price() or 0.0, prices.edge_rate() or 0.0)
+    rows = [current]
+    factors = [1.0]
+    for scenario in scenarios:
+        rows.append((
+            current[0] if scenario.plywood_price_per_sheet is None else scenario.plywood_price_per_sheet,
+            current[1] if scenario.edge_band_price_per_meter is None else scenario.edge_band_price_per_meter
+        ))
+        factors.append(scenario.price_factor)
+    return np.array(rows, dtype=np.float64) * np.array(factors, dtype=np.float64)[:, None]
+
+
+def price_scenarios(
+    sheet_count: float,
+    edge_band_m: float,
+    scenarios: List[PriceScenario],
+    prices: PriceTable
+) -> PriceScenariosResponse:
+    """تكلفة الكميات بأسعار الإعدادات الحالية وبكل سيناريو"""
+    price_matrix = scenario_price_matrix(scenarios, prices)
+    costs = price_matrix * np.array([sheet_count, edge_band_m], dtype=np.float64)
+    totals = costs[:, 0] + costs[:, 1]
+    differences = totals - totals[0]
+
+    names = [CURRENT_SCENARIO_NAME] + [scenario.name for scenario in scenarios]
+    results = [
+        ScenarioCost(
+            name=name,
+            plywood_price_per_sheet=float(unit_prices[0]),
+            edge_band_price_per_meter=float(unit_prices[1]),
+            cost_breakdown={SHEETS_USAGE_KEY: float(cost[0]), EDGE_USAGE_KEY: float(cost[1])},
+            total_cost=float(total),
+            difference=float(difference)
+        )
+        for name, unit_prices, cost, total, difference in zip(
+            names, price_matrix.tolist(), costs.tolist(), totals.tolist(), differences.tolist()
+        )
+    ]
+    return PriceScenariosResponse(
+        sheet_count=sheet_count,
+        edge_band_m=edge_band_m,
+        current=results[0],
+        scenarios=results[1:]
+    )
+
+
+def usage_quantities(material_usage: Mapping[str, float], total_edge_meters: float) -> Tuple[float, float]:
+    """(عدد الألواح، متر الشريط) من استخدام المواد بنفس قواعد price_usage"""
+    sheet_count = material_usage.get(SHEETS_USAGE_KEY) or 0.0
+    edge_band_m = (material_usage.get(EDGE_USAGE_KEY) or 0.0) if total_edge_meters else 0.0
+    return sheet_count, edge_band_m
@@ -0,0 +1,172 @@
+"""
+Project Excel Export - تصدير قطع كل وحدات المشروع لملف Excel واحد
+
+الملف يُكتب بـ openpyxl في وضع write_only: كل صف يُكتب مباشرة لملف مؤقت
+للشيت ولا يبقى في الذاكرة، والوحدات تُقرأ من cursor على دفعات، فتظل الذاكرة
+ثابتة مهما كان عدد الوحدات. الملف النهائي يُحفظ في ملف مؤقت ويُرسل على أجزاء.
+
+في وضع write_only يتم كتابة عرض الأعمدة قبل أول صف، لذلك العرض محسوب مسبقاً
+من العناوين وأقصى طول متوقع للقيم (الأرقام مقربة لرقمين عشريين، والأسماء
+لها حد أقصى) بدلاً من المرور على كل الخلايا بعد الكتابة.
+
+openpyxl يُستورد عند أول تصدير فقط (استيراده يأخذ جزءاً كبيراً من زمن بداية
+التشغيل).
+"""
+import asyncio
+import os
+import tempfile
+from typing import TYPE_CHECKING, Any, AsyncIterable, Dict, Iterator, List, Tuple
+
+from app.services.lazy_modules import openpyxl
+
+if TYPE_CHECKING:
+    from openpyxl import Workbook
+
+EXCEL_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# (مفتاح الشيت، اسم الشيت) بنفس تقسيم تصدير الوحدة الواحدة
+PART_SHEETS: List[Tuple[str, str]] = [
+    ("main", "القطع الأساسية"),
+    ("backs", "الضهر"),
+    ("doors", "الضلف"),
+]
+
+# (العنوان، أقصى طول للقيمة)
+COLUMNS: List[Tuple[str, int]] = [
+    ("الوحدة", 40),
+    ("اسم القطعة", 32),
+    ("العرض (سم)", 8),
+    ("الارتفاع (سم)", 8),
+    ("الكمية", 6),
+    ("المساحة (م²)", 10),
+    ("طول الحافة (م)", 10),
+]
+
+
+def part_sheet_key(part_name: str) -> str:
+    """الشيت الخاص بالقطعة: الضلف والواجهات، الظهر، أو القطع الأساسية"""
+    name_lower = part_name.lower()
+    if "door" in name_lower or "front" in name_lower:
+        return "doors"
+    if "back_panel" in name_lower:
+        return "backs"
+    return "main"
+
+
+def column_widths() -> List[int]:
+    """عرض كل عمود = أطول من العنوان والقيمة المتوقعة + 2"""
+    return [max(len(header), max_value_length) + 2 for header, max_value_length in COLUMNS]
+
+
+def unit_label(index: int, unit_doc: Dict[str, Any]) -> str:
+    """اسم الوحدة في الملف: الترتيب والنوع والمقاسات"""
+    label = (
+        f"{index}. {unit_doc.get('type', '')} "
+        f"{unit_doc.get('width_cm', '')}x{unit_doc.get('height_cm', '')}x{unit_doc.get('depth_cm', '')}"
+    )
+    return label[:COLUMNS[0][1]]
+
+
+class _PartsSheet:
+    __slots__ = ("worksheet", "total_qty", "total_area", "total_edge")
+
+    def __init__(self, workbook: "Workbook", title: str):
+        xl = openpyxl()
+
+        self.worksheet = workbook.create_sheet(title)
+        self.worksheet.sheet_view.rightToLeft = True
+        for column_index, width in enumerate(column_widths(), start=1):
+            self.worksheet.column_dimensions[xl.utils.get_column_letter(column_index)].width = width
+
+        header_font = xl.styles.Font(bold=True)
+        header_fill = xl.styles.PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
+        header_alignment = xl.styles.Alignment(horizontal="center")
+        header_cells = []
+        for header, _ in COLUMNS:
+            cell = xl.cell.WriteOnlyCell(self.worksheet, value=header)
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.alignment = header_alignment
+            header_cells.append(cell)
+        self.worksheet.append(header_cells)
+
+        self.total_qty = 0
+        self.total_area = 0.0
+        self.total_edge = 0.0
+
+    def append_part(self, label: str, part_data: Dict[str, Any]) -> None:
+        area_m2 = part_data.get("area_m2") or 0
+        edge_band_m = part_data.get("edge_band_m") or 0
+        self.worksheet.append([
+            label,
+            part_data["name"],
+            part_data["width_cm"],
+            part_data["height_cm"],
+            part_data["qty"],
+            round(area_m2, 2),
+            round(edge_band_m, 2)
+        ])
+        self.total_qty += part_data["qty"]
+        self.total_area += area_m2
+        self.total_edge += edge_band_m
+
+    def append_totals(self) -> None:
+        xl = openpyxl()
+
+        totals_font = xl.styles.Font(bold=True)
+        totals_cells = []
+        for value in ["المجموع", "", "", "", self.total_qty, round(self.total_area, 2), round(self.total_edge, 2)]:
+            cell = xl.cell.WriteOnlyCell(self.worksheet, value=value)
+            cell.font = totals_font
+            totals_cells.append(cell)
+        self.worksheet.append(totals_cells)
+
+
+async def write_project_workbook(unit_docs: AsyncIterable[Dict[str, Any]], path: str) -> int:
+    """
+    كتابة قطع الوحدات (بالترتيب الذي تصل به) لملف xlsx
+
+    Returns:
+        عدد الوحدات المكتوبة
+    """
+    workbook = openpyxl().Workbook(write_only=True)
+    sheets = {key: _PartsSheet(workbook, title) for key, title in PART_SHEETS}
+
+    units_count = 0
+    async for unit_doc in unit_docs:
+        units_count += 1
+        label = unit_label(units_count, unit_doc)
+        for part_data in unit_doc.get("parts_calculated", []):
+            sheets[part_sheet_key(part_data["name"])].append_part(label, part_data)
+
+    for sheet in sheets.values():
+        sheet.append_totals()
+
+    # ضغط الملف النهائي (zip) خارج event loop
+    await asyncio.get_running_loop().run_in_executor(None, workbook.save, path)
+    return units_count
+
+
+def create_export_file() -> str:
+    """مسار ملف مؤقت فارغ للتصدير (يحذفه المستدعي بعد الإرسال)"""
+    file_descriptor, path = tempfile.mkstemp(suffix=".xlsx", prefix="project_export_")
+    os.close(file_descriptor)
+    return path
+
+
+def iter_file_chunks(path: str, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """قراءة الملف على أجزاء لـ StreamingResponse"""
+    with open(path, "rb") as export_file:
+        while True:
+            chunk = export_file.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+
+def remove_export_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -0,0 +1,58 @@
+"""
+Project Optimizer - حسابات المشروع الثقيلة التي تعمل في process pool
+
+الدوال هنا تستقبل وترجع dict/list فقط (قابلة للـ pickle) حتى يمكن تشغيلها
+في عملية منفصلة عبر ProcessPoolExecutor بدون حجز event loop الخاص بالسيرفر.
+"""
+from typing import Any, Dict, List
+
+from app.models.edge_band import EdgeType
+from app.models.settings import SettingsModel
+from app.models.units import Part
+from app.services.cost_engine import get_price_table
+from app.services.edge_band_calculator import calculate_edge_breakdown, calculate_total_edge_meters
+from app.services.edge_roll_optimizer import plan_edge_rolls
+from app.services.sheet_nesting import nest_parts_with_settings
+
+
+def nest_project_parts(parts_data: List[Dict[str, Any]], settings_data: Dict[str, Any]) -> Dict[str, Any]:
+    """رص كل قطع المشروع على الألواح (SheetNestingResult كـ dict)"""
+    settings = SettingsModel(**settings_data)
+    parts = [Part(**part_data) for part_data in parts_data]
+    return nest_parts_with_settings(parts, settings).model_dump(mode="json")
+
+
+def plan_project_edge_rolls(
+    parts_data: List[Dict[str, Any]],
+    settings_data: Dict[str, Any],
+    edge_type: str = EdgeType.PVC.value
+) -> Dict[str, Any]:
+    """خطة لفات الشريط لكل قطع المشروع"""
+    settings = SettingsModel(**settings_data)
+    parts = [Part(**part_data) for part_data in parts_data]
+    edge_breakdown = calculate_edge_breakdown(parts, settings, EdgeType(edge_type))
+    return {
+        "total_edge_m": round(calculate_total_edge_meters(edge_breakdown), 3),
+        "roll_plan": [plan.model_dump(mode="json") for plan in plan_edge_rolls(edge_breakdown, settings)]
+    }
+
+
+def summarize_project_cost(
+    nesting: Dict[str, Any],
+    edge_rolls: Dict[str, Any],
+    settings_data: Dict[str, Any]
+) -> Dict[str, float]:
+    """تكلفة المشروع من عدد الألواح الفعلي ولفات الشريط"""
+    settings = SettingsModel(**settings_data)
+    plywood_cost = 0.0
+    plywood_price = get_price_table(settings).board_price()
+    if plywood_price:
+        plywood_cost = nesting["priced_sheet_count"] * plywood_price
+
+    edge_band_cost = sum(plan["cost"] or 0 for plan in edge_rolls["roll_plan"])
+
+    return {
+        "ألواح الخشب": round(plywood_cost, 2),
+        "شريط الحافة": round(edge_band_cost, 2),
+        "total": round(plywood_cost + edge_band_cost, 2)
+    }
@@ -0,0 +1,90 @@
+"""
+Settings Dependencies - حقول الإعدادات التي يقرأها كل نوع وحدة
+
+يتم تحليل كود دوال الحساب (AST) وجمع كل `settings.<field>` و
+`getattr(settings, "<field>")`، مع تتبع الدوال المساعدة في نفس الموديول التي
+تستقبل settings. عند تغيير الإعدادات يتم إعادة حساب الوحدات المحفوظة من
+الأنواع التي تقرأ أحد الحقول المتغيرة فقط.
+"""
+import ast
+import inspect
+import textwrap
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Iterable, List, Set
+
+from app.services.lazy_modules import unit_calculators
+from app.services.sheet_nesting import nest_parts_with_settings
+from app.services.unit_registry import UNIT_CALCULATORS
+
+SETTINGS_ARGUMENT = "settings"
+
+# حقول تؤثر على تكلفة كل الوحدات (أسعار الخامات)
+PRICING_FIELDS = frozenset({"materials"})
+
+
+def _is_settings(node: ast.AST) -> bool:
+    return isinstance(node, ast.Name) and node.id == SETTINGS_ARGUMENT
+
+
+def _collect(function: Callable, seen: Set[Callable]) -> Set[str]:
+    if function in seen:
+        return set()
+    seen.add(function)
+
+    tree = ast.parse(textwrap.dedent(inspect.getsource(function)))
+    module_globals = getattr(function, "__globals__", {})
+    fields: Set[str] = set()
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Attribute) and _is_settings(node.value):
+            fields.add(node.attr)
+        elif isinstance(node, ast.Call):
+            arguments = list(node.args) + [keyword.value for keyword in node.keywords]
+            if (
+                isinstance(node.func, ast.Name) and node.func.id == "getattr"
+                and len(node.args) >= 2 and _is_settings(node.args[0])
+                and isinstance(node.args[1], ast.Constant)
+            ):
+                fields.add(node.args[1].value)
+            elif isinstance(node.func, ast.Name) and any(_is_settings(argument) for argument in arguments):
+                # دالة مساعدة تستقبل settings
+                helper = module_globals.get(node.func.id)
+                if inspect.isfunction(helper):
+                    fields |= _collect(helper, seen)
+
+    return fields
+
+
+def settings_fields_read(function: Callable) -> FrozenSet[str]:
+    """حقول الإعدادات التي تقرأها الدالة (والدوال المساعدة التي تمرر لها settings)"""
+    return frozenset(_collect(function, set()))
+
+
+@lru_cache(maxsize=None)
+def shared_settings_fields() -> FrozenSet[str]:
+    """حقول يقرأها حساب كل الأنواع: خصم الشريط، رص الألواح، والأسعار"""
+    return (
+        settings_fields_read(unit_calculators().calculate_unit_result)
+        | settings_fields_read(nest_parts_with_settings)
+        | PRICING_FIELDS
+    )
+
+
+@lru_cache(maxsize=None)
+def unit_settings_dependencies() -> Dict[str, FrozenSet[str]]:
+    """نوع الوحدة -> كل حقول الإعدادات التي تؤثر على نتيجة حسابها المحفوظة"""
+    shared = shared_settings_fields()
+    return {
+        unit_type: settings_fields_read(spec.load()) | shared
+        for unit_type, spec in UNIT_CALCULATORS.items()
+    }
+
+
+def affected_unit_types(changed_fields: Iterable[str]) -> List[str]:
+    """أنواع الوحدات التي تقرأ أحد الحقول المتغيرة"""
+    changed = set(changed_fields)
+    return [
+        unit_type
+        for unit_type, fields in unit_settings_dependencies().items()
+        if fields & changed
+    ]
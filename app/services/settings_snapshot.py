@@ -0,0 +1,182 @@
+"""
+Settings Snapshot - نسخة الإعدادات المحملة في ذاكرة العملية
+
+بدلاً من قراءة مستند الإعدادات من MongoDB وعمل validation لـ SettingsModel
+في كل طلب، يتم الاحتفاظ بـ SettingsModel واحد (frozen) مع رقم نسخته:
+
+- PUT /settings يزيد حقل version في المستند ($inc) ويحدّث النسخة فوراً.
+- باقي عمليات uvicorn تقرأ حقل version فقط (projection) مرة كل
+  config_refresh_s ثانية، وتعيد تحميل المستند إذا تغير.
+- الطلبات المتزامنة عند عدم وجود نسخة أو انتهاء مدتها تنتظر نفس القراءة
+  (قراءة واحدة من قاعدة البيانات).
+"""
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from bson import ObjectId
+from fastapi import HTTPException, status
+
+from app.database import get_database, settings as app_settings
+from app.models.settings import SettingsModel
+
+# معرف مستند الإعدادات في collection settings
+SETTINGS_ID = "global"
+
+DocumentLoader = Callable[[], Awaitable[Dict[str, Any]]]
+VersionLoader = Callable[[], Awaitable[int]]
+
+
+@dataclass(frozen=True)
+class SettingsSnapshot:
+    """إعدادات بعد الـ validation مع رقم النسخة"""
+    version: int
+    settings: SettingsModel
+
+
+def settings_from_document(settings_doc: Dict[str, Any]) -> SettingsModel:
+    """
+    تحويل مستند الإعدادات لـ SettingsModel
+
+    إذا كانت بيانات المستند قديمة/غير صالحة يتم استخدام الافتراضية (بنفس
+    رقم النسخة) حتى يمكن إعادة حفظ إعدادات صحيحة.
+    """
+    settings_doc = {key: value for key, value in settings_doc.items() if key != "_id"}
+    try:
+        return SettingsModel(**settings_doc)
+    except Exception as validation_error:
+        print(f"WARNING: Settings validation failed: {validation_error}. Returning defaults.")
+        return SettingsModel(version=settings_doc.get("version", 0))
+
+
+class SettingsSnapshotStore:
+    """نسخة الإعدادات الحالية مع التحقق الدوري من رقم النسخة"""
+
+    def __init__(
+        self,
+        load_document: DocumentLoader,
+        load_version: VersionLoader,
+        poll_interval_s: float = 1.0
+    ):
+        self._load_document = load_document
+        self._load_version = load_version
+        self.poll_interval_s = poll_interval_s
+        self._snapshot: Optional[SettingsSnapshot] = None
+        self._checked_at = 0.0
+        self._inflight: Optional[asyncio.Task] = None
+        self.document_loads = 0
+        self.version_checks = 0
+
+    @property
+    def snapshot(self) -> Optional[SettingsSnapshot]:
+        return self._snapshot
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._snapshot is not None
+            and time.monotonic() - self._checked_at < self.poll_interval_s
+        )
+
+    def _store(self, settings_doc: Dict[str, Any]) -> SettingsSnapshot:
+        settings = settings_from_document(settings_doc)
+        self._snapshot = SettingsSnapshot(version=settings.version, settings=settings)
+        self._checked_at = time.monotonic()
+        return self._snapshot
+
+    async def _reload(self) -> SettingsSnapshot:
+        self.document_loads += 1
+        return self._store(await self._load_document())
+
+    async def _revalidate(self) -> SettingsSnapshot:
+        snapshot = self._snapshot
+        if snapshot is not None:
+            self.version_checks += 1
+            try:
+                version = await self._load_version()
+            except Exception as e:
+                # قاعدة البيانات غير متاحة: الاستمرار بالنسخة الحالية
+                print(f"WARNING: Settings version check failed: {e}. Using cached settings.")
+                version = snapshot.version
+            if version == snapshot.version:
+                self._checked_at = time.monotonic()
+                return snapshot
+        return await self._reload()
+
+    async def get(self) -> SettingsModel:
+        """الإعدادات الحالية (بدون قراءة من قاعدة البيانات داخل مدة التحقق)"""
+        if self._is_fresh():
+            return self._snapshot.settings
+
+        # كل الطلبات المتزامنة تنتظر نفس القراءة
+        loop = asyncio.get_running_loop()
+        task = self._inflight
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = loop.create_task(self._revalidate())
+            self._inflight = task
+        return (await asyncio.shield(task)).settings
+
+    async def refresh(self) -> SettingsModel:
+        """إعادة التحميل فوراً (بعد تحديث الإعدادات في هذه العملية)"""
+        return (await self._reload()).settings
+
+    def clear(self) -> None:
+        self._snapshot = None
+        self._checked_at = 0.0
+
+
+async def get_settings_from_db() -> Dict[str, Any]:
+    """Get settings from MongoDB"""
+    db = get_database()
+    if db is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database connection not available"
+        )
+    
+    settings_collection = db.settings
+    settings_doc = await settings_collection.find_one({"_id": SETTINGS_ID})
+    
+    if settings_doc is None:
+        # Create default settings if not exists
+        default_settings = SettingsModel().model_dump()
+        default_settings["_id"] = SETTINGS_ID
+        default_settings["last_updated"] = datetime.utcnow()
+        await settings_collection.insert_one(default_settings)
+        return default_settings
+    
+    # Convert ObjectId to string if present
+    if "_id" in settings_doc and isinstance(settings_doc["_id"], ObjectId):
+        settings_doc["_id"] = str(settings_doc["_id"])
+    
+    return settings_doc
+
+
+async def _load_settings_version() -> int:
+    settings_doc = await get_database().settings.find_one({"_id": SETTINGS_ID}, {"version": 1})
+    return (settings_doc or {}).get("version", 0)
+
+
+_store: Optional[SettingsSnapshotStore] = None
+
+
+def get_settings_snapshot_store() -> SettingsSnapshotStore:
+    global _store
+    if _store is None:
+        _store = SettingsSnapshotStore(
+            get_settings_from_db,
+            _load_settings_version,
+            poll_interval_s=app_settings.config_refresh_s
+        )
+    return _store
+
+
+async def get_current_settings() -> SettingsModel:
+    """الإعدادات الحالية من نسخة العملية"""
+    return await get_settings_snapshot_store().get()
+
+
+async def refresh_current_settings() -> SettingsModel:
+    """إعادة تحميل نسخة العملية من قاعدة البيانات"""
+    return await get_settings_snapshot_store().refresh()
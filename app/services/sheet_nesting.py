@@ -0,0 +1,199 @@
+"""
+Sheet Nesting - رص القطع على الألواح الخام (Guillotine bin packing)
+
+بدلاً من تقدير عدد الألواح بقسمة المساحة على مساحة اللوح، يتم رص القطع
+فعلياً على ألواح بالمقاس المحدد في الإعدادات بقطعات مقصلة (من حافة لحافة)
+كما في مناشير التقطيع، مع خصم سمك سلاح المنشار بين القطع والسماح بتدوير
+القطع 90 درجة إذا كانت الخامة تسمح.
+
+الاتجاه: طول اللوح على المحور x، وعرضه على المحور y. القطعة بدون تدوير
+يكون height_cm (طولها) في اتجاه طول اللوح.
+
+الخوارزمية: القطع مرتبة من الأكبر للأصغر، وكل قطعة توضع في أنسب مستطيل
+فارغ (Best Short Side Fit) في أي لوح مفتوح، ثم يُقسم الباقي لمستطيلين
+بالقطع على المحور الأقصر للباقي (Shorter Leftover Axis). لا يتم فتح لوح
+جديد إلا إذا لم تكن هناك مساحة تسع القطعة.
+"""
+import math
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.models.nesting import SheetLayout, SheetNestingResult, SheetPlacement
+from app.models.settings import SettingsModel
+from app.models.units import Part
+
+# أقل بعد لمستطيل فارغ يستحق الاحتفاظ به (تجنب بقايا الكسور العشرية)
+MIN_FREE_SIZE_CM = 0.01
+
+# (x, y, length, width)
+FreeRect = Tuple[float, float, float, float]
+
+
+class _Sheet:
+    __slots__ = ("free", "free_area", "placements", "used_area_cm2")
+
+    def __init__(self, length_cm: float, width_cm: float):
+        self.free: List[FreeRect] = [(0.0, 0.0, length_cm, width_cm)]
+        self.free_area = length_cm * width_cm
+        self.placements: List[SheetPlacement] = []
+        self.used_area_cm2 = 0.0
+
+    def place(self, rect_index: int, name: str, length_cm: float, width_cm: float, rotated: bool, kerf_cm: float) -> None:
+        """وضع القطعة في الركن العلوي الأيسر للمستطيل الفارغ وتقسيم الباقي"""
+        x, y, free_length, free_width = self.free.pop(rect_index)
+        self.free_area -= free_length * free_width
+
+        self.placements.append(SheetPlacement(
+            name=name,
+            x_cm=round(x, 2),
+            y_cm=round(y, 2),
+            length_cm=length_cm,
+            width_cm=width_cm,
+            rotated=rotated
+        ))
+        self.used_area_cm2 += length_cm * width_cm
+
+        leftover_length = free_length - length_cm
+        leftover_width = free_width - width_cm
+        if leftover_length <= leftover_width:
+            # قطع بطول اللوح: الشريط السفلي يأخذ الطول الكامل
+            right = (x + length_cm + kerf_cm, y, leftover_length - kerf_cm, width_cm)
+            bottom = (x, y + width_cm + kerf_cm, free_length, leftover_width - kerf_cm)
+        else:
+            # قطع بعرض اللوح: الشريط الأيمن يأخذ العرض الكامل
+            right = (x + length_cm + kerf_cm, y, leftover_length - kerf_cm, free_width)
+            bottom = (x, y + width_cm + kerf_cm, length_cm, leftover_width - kerf_cm)
+
+        for rect in (right, bottom):
+            if rect[2] > MIN_FREE_SIZE_CM and rect[3] > MIN_FREE_SIZE_CM:
+                self.free.append(rect)
+                self.free_area += rect[2] * rect[3]
+
+
+def _expand_pieces(parts: Iterable[Any]) -> List[Tuple[str, float, float]]:
+    """فك الكميات إلى قطع منفصلة (name, length, width) مرتبة من الأكبر للأصغر"""
+    pieces = []
+    for part in parts:
+        length_cm = float(part.height_cm)
+        width_cm = float(part.width_cm)
+        if length_cm <= 0 or width_cm <= 0:
+            continue
+        pieces.extend([(part.name, length_cm, width_cm)] * int(part.qty or 0))
+
+    pieces.sort(key=lambda piece: (max(piece[1], piece[2]), piece[1] * piece[2]), reverse=True)
+    return pieces
+
+
+def nest_parts(
+    parts: Iterable[Any],
+    sheet_length_cm: float,
+    sheet_width_cm: float,
+    kerf_cm: float = 0.0,
+    allow_rotation: bool = True
+) -> SheetNestingResult:
+    """
+    رص القطع على ألواح خام
+
+    Args:
+        parts: قطع لها name و width_cm و height_cm و qty (Part أو InternalCounterPart)
+        sheet_length_cm: طول اللوح الخام
+        sheet_width_cm: عرض اللوح الخام
+        kerf_cm: سمك سلاح المنشار (يُخصم بعد كل قطع)
+        allow_rotation: السماح بتدوير القطع 90 درجة
+
+    Returns:
+        SheetNestingResult: رص كل لوح وعدد الألواح ونسبة الاستغلال، والقطع
+        الأكبر من اللوح في oversized_parts (ألواحها في priced_sheet_count)
+    """
+    sheets: List[_Sheet] = []
+    oversized: List[str] = []
+    oversized_sheet_count = 0
+    sheet_area_cm2 = sheet_length_cm * sheet_width_cm
+    parts_area_cm2 = 0.0
+    pieces = _expand_pieces(parts)
+
+    for name, length_cm, width_cm in pieces:
+        orientations = [(length_cm, width_cm, False)]
+        if allow_rotation and length_cm != width_cm:
+            orientations.append((width_cm, length_cm, True))
+        orientations = [
+            orientation for orientation in orientations
+            if orientation[0] <= sheet_length_cm and orientation[1] <= sheet_width_cm
+        ]
+        if not orientations:
+            # لا تُرص، لكن تُحسب في التكلفة بألواح على الأقل بقدر مساحتها
+            oversized.append(name)
+            oversized_sheet_count += max(1, math.ceil(length_cm * width_cm / sheet_area_cm2))
+            continue
+
+        piece_area = length_cm * width_cm
+        best: Optional[Tuple[Tuple[float, float], int, int, Tuple[float, float, bool]]] = None
+        for sheet_index, sheet in enumerate(sheets):
+            if sheet.free_area < piece_area:
+                continue
+            for rect_index, (_, _, free_length, free_width) in enumerate(sheet.free):
+                for orientation in orientations:
+                    leftover_length = free_length - orientation[0]
+                    leftover_width = free_width - orientation[1]
+                    if leftover_length < 0 or leftover_width < 0:
+                        continue
+                    score = (min(leftover_length, leftover_width), max(leftover_length, leftover_width))
+                    if best is None or score < best[0]:
+                        best = (score, sheet_index, rect_index, orientation)
+            if best is not None and best[0] == (0.0, 0.0):
+                break
+
+        if best is None:
+            sheets.append(_Sheet(sheet_length_cm, sheet_width_cm))
+            sheet_index, rect_index, orientation = len(sheets) - 1, 0, orientations[0]
+        else:
+            _, sheet_index, rect_index, orientation = best
+
+        sheets[sheet_index].place(rect_index, name, orientation[0], orientation[1], orientation[2], kerf_cm)
+        parts_area_cm2 += piece_area
+
+    layouts = [
+        SheetLayout(
+            index=index,
+            placements=sheet.placements,
+            used_area_m2=round(sheet.used_area_cm2 / 10000, 4),
+            utilization_percent=round(sheet.used_area_cm2 / sheet_area_cm2 * 100, 2)
+        )
+        for index, sheet in enumerate(sheets, start=1)
+    ]
+
+    return SheetNestingResult(
+        sheet_length_cm=sheet_length_cm,
+        sheet_width_cm=sheet_width_cm,
+        saw_kerf_cm=kerf_cm,
+        sheet_count=len(sheets),
+        parts_count=len(pieces),
+        parts_area_m2=round(parts_area_cm2 / 10000, 4),
+        utilization_percent=round(parts_area_cm2 / (sheet_area_cm2 * len(sheets)) * 100, 2) if sheets else 0.0,
+        sheets=layouts,
+        oversized_parts=oversized,
+        oversized_sheet_count=oversized_sheet_count
+    )
+
+
+def nest_parts_with_settings(parts: Iterable[Any], settings: SettingsModel) -> SheetNestingResult:
+    """رص القطع بمقاس اللوح وسمك المنشار وقاعدة التدوير من الإعدادات"""
+    return nest_parts(
+        parts,
+        sheet_length_cm=settings.sheet_length_cm,
+        sheet_width_cm=settings.sheet_width_cm,
+        kerf_cm=settings.saw_kerf_cm,
+        allow_rotation=settings.allow_part_rotation
+    )
+
+
+def parts_from_unit_document(unit_doc: Dict[str, Any]) -> List[Part]:
+    """قطع الوحدة المحفوظة التي تُقص من الألواح (الأساسية + القطع الداخلية إن وجدت)"""
+    parts = []
+    for part_data in unit_doc.get("parts_calculated", []) + unit_doc.get("internal_counter_parts", []):
+        parts.append(Part(
+            name=part_data["name"],
+            width_cm=part_data["width_cm"],
+            height_cm=part_data["height_cm"],
+            qty=part_data["qty"]
+        ))
+    return parts
@@ -20,6 +20,7 @@ from app.services.internal_counter_calculator import (
     calculate_internal_material_usage
 )
 from app.services.edge_band_calculator import calculate_edge_cost
+from app.services.cost_engine import get_price_table
 
 def part_to_summary_item(part: Part) -> SummaryItem:
     """تحويل Part إلى SummaryItem"""
@@ -86,7 +87,8 @@ def generate_summary(
     material_usage = calculate_material_usage(
         total_area_m2=total_area_m2,
         edge_band_m=total_edge_band_m,
-        settings=settings
+        settings=settings,
+        parts=parts
     )
     
     # تحويل القطع إلى SummaryItems
@@ -118,7 +120,8 @@ def generate_summary(
         internal_material_usage = calculate_internal_material_usage(
             total_area_m2=internal_area_m2,
             edge_band_m=internal_edge_band_m,
-            settings=settings
+            settings=settings,
+            parts=internal_parts
         )
         
         # إضافة القطع الداخلية إلى الملخص
@@ -142,19 +145,17 @@ def generate_summary(
     # حساب التكاليف
     costs = {}
     
+    prices = get_price_table(settings)
+    
     # تكلفة الألواح
-    if "plywood_sheet" in settings.materials:
-        plywood_price = settings.materials["plywood_sheet"].price_per_sheet
-        if plywood_price:
-            plywood_cost = material_usage["ألواح الخشب"] * plywood_price
-            costs["material_cost"] = round(plywood_cost, 2)
+    plywood_price = prices.board_price()
+    if plywood_price:
+        costs["material_cost"] = round(material_usage["ألواح الخشب"] * plywood_price, 2)
     
     # تكلفة الشريط
-    if "edge_band_per_meter" in settings.materials:
-        edge_price = settings.materials["edge_band_per_meter"].price_per_meter
-        if edge_price:
-            edge_cost = total_edge_band_m * edge_price
-            costs["edge_band_cost"] = round(edge_cost, 2)
+    edge_price = prices.edge_rate()
+    if edge_price:
+        costs["edge_band_cost"] = round(total_edge_band_m * edge_price, 2)
     
     # التكلفة الإجمالية
     costs["total_cost"] = round(
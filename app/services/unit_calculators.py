@@ -2,13 +2,69 @@
 Unit Calculators - حساب أجزاء الوحدات المختلفة
 كل دالة بتحسب الأجزاء المطلوبة لنوع وحدة معين بناءً على الإعدادات
 """
-from typing import List, Dict, Any
-from app.models.units import Part, EdgeDistribution, DoorType
+import math
+from typing import List, Dict, Any, Mapping, Optional, Tuple
+from pydantic import TypeAdapter
+from app.models.units import Part, DoorType
 from app.models.settings import SettingsModel
+from app.services.unit_registry import get_unit_calculator
+from app.services.sheet_nesting import nest_parts_with_settings
+from app.services.cost_engine import get_price_table
 
 # سمك اللوح الافتراضي
 DEFAULT_BOARD_THICKNESS = 1.8  # cm
 
+
+class EdgeSpec:
+    """توزيع الشريط داخل المحرك (بدون validation، يتحول لـ EdgeDistribution عند الإخراج)"""
+    __slots__ = ("top", "left", "right", "bottom")
+
+    def __init__(self, top: bool = True, left: bool = True, right: bool = True, bottom: bool = True):
+        self.top = top
+        self.left = left
+        self.right = right
+        self.bottom = bottom
+
+
+class PartSpec:
+    """
+    قطعة داخل المحرك
+
+    دوال الحساب وخصم الشريط وحساب المتر تعمل على هذا الكائن الخفيف
+    (__slots__ بدون validation)، ويتم التحويل لـ Part العام مرة واحدة فقط
+    في calculate_unit_parts.
+    """
+    __slots__ = ("name", "width_cm", "height_cm", "depth_cm", "qty", "edge_distribution", "area_m2", "edge_band_m")
+
+    def __init__(
+        self,
+        name: str,
+        width_cm: float,
+        height_cm: float,
+        qty: int,
+        depth_cm: Optional[float] = None,
+        edge_distribution: Optional[EdgeSpec] = None,
+        area_m2: Optional[float] = None,
+        edge_band_m: Optional[float] = None
+    ):
+        self.name = name
+        self.width_cm = width_cm
+        self.height_cm = height_cm
+        self.depth_cm = depth_cm
+        self.qty = qty
+        self.edge_distribution = edge_distribution
+        self.area_m2 = area_m2
+        self.edge_band_m = edge_band_m
+
+
+_PARTS_ADAPTER = TypeAdapter(List[Part])
+
+
+def part_specs_to_parts(specs: List[PartSpec]) -> List[Part]:
+    """تحويل قطع المحرك لـ Part العام في استدعاء validation واحد"""
+    return _PARTS_ADAPTER.validate_python(specs, from_attributes=True)
+
+
 def calculate_ground_unit(
     width_cm: float,
     height_cm: float,
@@ -16,7 +72,7 @@ def calculate_ground_unit(
     shelf_count: int,
     door_count: int,
     settings: SettingsModel
-) -> List[Part]:
+) -> List[PartSpec]:
     """
     حساب أجزاء الوحدة الأرضية
     
@@ -49,34 +105,34 @@ def calculate_ground_unit(
         base_width = depth_cm
         base_length = width_cm - (board_thickness * 2)
         
-    parts.append(Part(
+    parts.append(PartSpec(
         name="base",  # القاعدة
         width_cm=base_width,
         height_cm=base_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((base_width * base_length) / 10000, 4)
     ))
     
     # 2. المرايه الأمامية (Front Mirror)
     mirror_width = settings.mirror_width
     mirror_length = width_cm - (board_thickness * 2)
-    parts.append(Part(
+    parts.append(PartSpec(
         name="front_mirror",  # المرايه الأمامية
         width_cm=mirror_width,
         height_cm=mirror_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((mirror_width * mirror_length) / 10000, 4)
     ))
     
     # 3. المرايه الخلفية (Back Mirror)
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_mirror",  # المرايه الخلفية
         width_cm=mirror_width,
         height_cm=mirror_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((mirror_width * mirror_length) / 10000, 4)
     ))
     
@@ -93,12 +149,12 @@ def calculate_ground_unit(
         # الطول = الارتفاع
         side_height = height_cm
         
-    parts.append(Part(
+    parts.append(PartSpec(
         name="side_panel",  # الجانب
         width_cm=side_width,
         height_cm=side_height,
         qty=2,  # قطعتين
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((side_width * side_height * 2) / 10000, 4)
     ))
     
@@ -107,12 +163,12 @@ def calculate_ground_unit(
     if shelf_count > 0:
         shelf_width = depth_cm - settings.shelf_depth_deduction
         shelf_length = width_cm - (board_thickness * 2)
-        parts.append(Part(
+        parts.append(PartSpec(
             name="shelf",  # الرف
             width_cm=shelf_width,
             height_cm=shelf_length,
             qty=shelf_count,
-            edge_distribution=EdgeDistribution(top=True, bottom=False, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=False, left=True, right=True),
             area_m2=round((shelf_width * shelf_length * shelf_count) / 10000, 4)
         ))
     
@@ -122,13 +178,13 @@ def calculate_ground_unit(
     back_width = width_cm - settings.back_deduction
     back_height = height_cm - settings.back_deduction
     back_thickness = settings.router_thickness
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_panel",  # الظهر
         width_cm=back_width,
         height_cm=back_height,
         depth_cm=back_thickness,
         qty=1,
-        edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+        edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
         area_m2=round((back_width * back_height) / 10000, 4)
     ))
     
@@ -144,12 +200,12 @@ def calculate_ground_unit(
             - settings.ground_door_height_deduction_no_edge
         )
         
-        parts.append(Part(
+        parts.append(PartSpec(
             name="door",  # الضلفة
             width_cm=door_width,
             height_cm=door_height,
             qty=door_count,
-            edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
             area_m2=round((door_width * door_height * door_count) / 10000, 4)
         ))
     
@@ -163,7 +219,7 @@ def calculate_sink_unit(
     shelf_count: int,
     door_count: int,
     settings: SettingsModel
-) -> List[Part]:
+) -> List[PartSpec]:
     """
     حساب أجزاء وحدة الحوض
     
@@ -195,24 +251,24 @@ def calculate_sink_unit(
         base_width = depth_cm
         base_length = width_cm - (board_thickness * 2)
         
-    parts.append(Part(
+    parts.append(PartSpec(
         name="base",  # القاعدة
         width_cm=base_width,
         height_cm=base_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((base_width * base_length) / 10000, 4)
     ))
     
     # 2. مرايه أمامية فقط (Front Mirror Only - 3 pieces)
     mirror_width = settings.mirror_width
     mirror_length = width_cm - (board_thickness * 2)
-    parts.append(Part(
+    parts.append(PartSpec(
         name="front_mirror",  # مرايه أمامية
         width_cm=mirror_width,
         height_cm=mirror_length,
         qty=3,  # 3 قطع للحوض
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((mirror_width * mirror_length * 3) / 10000, 4)
     ))
     
@@ -226,12 +282,12 @@ def calculate_sink_unit(
         # الجناب كاملة
         side_height = height_cm
         
-    parts.append(Part(
+    parts.append(PartSpec(
         name="side_panel",  # الجانب
         width_cm=side_width,
         height_cm=side_height,
         qty=2,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((side_width * side_height * 2) / 10000, 4)
     ))
     
@@ -239,12 +295,12 @@ def calculate_sink_unit(
     if shelf_count > 0:
         shelf_width = depth_cm - settings.shelf_depth_deduction
         shelf_length = width_cm - (board_thickness * 2)
-        parts.append(Part(
+        parts.append(PartSpec(
             name="shelf",  # الرف
             width_cm=shelf_width,
             height_cm=shelf_length,
             qty=shelf_count,
-            edge_distribution=EdgeDistribution(top=True, bottom=False, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=False, left=True, right=True),
             area_m2=round((shelf_width * shelf_length * shelf_count) / 10000, 4)
         ))
     
@@ -257,12 +313,12 @@ def calculate_sink_unit(
             - settings.ground_door_height_deduction_no_edge
         )
         
-        parts.append(Part(
+        parts.append(PartSpec(
             name="door",  # الضلفة
             width_cm=door_width,
             height_cm=door_height,
             qty=door_count,
-            edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
             area_m2=round((door_width * door_height * door_count) / 10000, 4)
         ))
     
@@ -280,7 +336,7 @@ def calculate_drawers_unit(
     drawer_count: int,
     drawer_height_cm: float,
     settings: SettingsModel
-) -> List[Part]:
+) -> List[PartSpec]:
     """
     حساب أجزاء وحدة الأدراج
     
@@ -310,34 +366,34 @@ def calculate_drawers_unit(
         base_width = depth_cm
         base_length = width_cm - (board_thickness * 2)
         
-    parts.append(Part(
+    parts.append(PartSpec(
         name="base",
         width_cm=base_width,
         height_cm=base_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((base_width * base_length) / 10000, 4)
     ))
     
     # 2. مرايه أمامية (Front Mirror)
     mirror_width = settings.mirror_width
     mirror_length = width_cm - (board_thickness * 2)
-    parts.append(Part(
+    parts.append(PartSpec(
         name="front_mirror",
         width_cm=mirror_width,
         height_cm=mirror_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((mirror_width * mirror_length) / 10000, 4)
     ))
     
     # 3. مرايه خلفية (Back Mirror)
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_mirror",
         width_cm=mirror_width,
         height_cm=mirror_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((mirror_width * mirror_length) / 10000, 4)
     ))
     
@@ -351,12 +407,12 @@ def calculate_drawers_unit(
         # الجناب كاملة
         side_height = height_cm
 
-    parts.append(Part(
+    parts.append(PartSpec(
         name="side_panel",
         width_cm=side_width,
         height_cm=side_height,
         qty=2,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((side_width * side_height * 2) / 10000, 4)
     ))
     
@@ -371,12 +427,12 @@ def calculate_drawers_unit(
         drawer_width_length = width_cm - (board_thickness * 2) - (board_thickness * 2) - 2.6
         drawer_width_width = drawer_height_cm
         drawer_width_qty = 2 * drawer_count
-        parts.append(Part(
+        parts.append(PartSpec(
             name="drawer_width",  # عرض الدرج
             width_cm=drawer_width_width,
             height_cm=drawer_width_length,
             qty=drawer_width_qty,
-            edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
             area_m2=round((drawer_width_width * drawer_width_length * drawer_width_qty) / 10000, 4)
         ))
         
@@ -387,12 +443,12 @@ def calculate_drawers_unit(
         drawer_depth_width = drawer_height_cm
         drawer_depth_length = depth_cm - 8
         drawer_depth_qty = 2 * drawer_count
-        parts.append(Part(
+        parts.append(PartSpec(
             name="drawer_depth",  # عمق الدرج
             width_cm=drawer_depth_width,
             height_cm=drawer_depth_length,
             qty=drawer_depth_qty,
-            edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
             area_m2=round((drawer_depth_width * drawer_depth_length * drawer_depth_qty) / 10000, 4)
         ))
         
@@ -402,12 +458,12 @@ def calculate_drawers_unit(
         # العدد = عدد الأدراج
         drawer_bottom_length = depth_cm - 8 - settings.back_deduction
         drawer_bottom_width = width_cm - (board_thickness * 2) - settings.back_deduction - 2.6
-        parts.append(Part(
+        parts.append(PartSpec(
             name="drawer_bottom",  # قاع الدرج
             width_cm=drawer_bottom_width,
             height_cm=drawer_bottom_length,
             qty=drawer_count,
-            edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+            edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
             area_m2=round((drawer_bottom_width * drawer_bottom_length * drawer_count) / 10000, 4)
         ))
     
@@ -415,13 +471,13 @@ def calculate_drawers_unit(
     back_width = width_cm - settings.back_deduction
     back_height = height_cm - settings.back_deduction
     back_thickness = settings.router_thickness
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_panel",
         width_cm=back_width,
         height_cm=back_height,
         depth_cm=back_thickness,
         qty=1,
-        edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+        edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
         area_m2=round((back_width * back_height) / 10000, 4)
     ))
     
@@ -440,7 +496,7 @@ def calculate_drawers_bottom_rail_unit(
     drawer_count: int,
     drawer_height_cm: float,
     settings: SettingsModel
-) -> List[Part]:
+) -> List[PartSpec]:
     """
     حساب أجزاء وحدة ادراج مجرة سفلية
     
@@ -461,34 +517,34 @@ def calculate_drawers_bottom_rail_unit(
         base_width = depth_cm
         base_length = width_cm - (board_thickness * 2)
         
-    parts.append(Part(
+    parts.append(PartSpec(
         name="base",
         width_cm=base_width,
         height_cm=base_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((base_width * base_length) / 10000, 4)
     ))
     
     # 2. مرايه أمامية (Front Mirror)
     mirror_width = settings.mirror_width
     mirror_length = width_cm - (board_thickness * 2)
-    parts.append(Part(
+    parts.append(PartSpec(
         name="front_mirror",
         width_cm=mirror_width,
         height_cm=mirror_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((mirror_width * mirror_length) / 10000, 4)
     ))
     
     # 3. مرايه خلفية (Back Mirror)
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_mirror",
         width_cm=mirror_width,
         height_cm=mirror_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((mirror_width * mirror_length) / 10000, 4)
     ))
     
@@ -502,12 +558,12 @@ def calculate_drawers_bottom_rail_unit(
         # الجناب كاملة
         side_height = height_cm
 
-    parts.append(Part(
+    parts.append(PartSpec(
         name="side_panel",
         width_cm=side_width,
         height_cm=side_height,
         qty=2,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((side_width * side_height * 2) / 10000, 4)
     ))
     
@@ -522,12 +578,12 @@ def calculate_drawers_bottom_rail_unit(
         drawer_width_length = width_cm - 8.4
         drawer_width_width = drawer_height_cm
         drawer_width_qty = 2 * drawer_count
-        parts.append(Part(
+        parts.append(PartSpec(
             name="drawer_width",
             width_cm=drawer_width_width,
             height_cm=drawer_width_length,
             qty=drawer_width_qty,
-            edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
             area_m2=round((drawer_width_width * drawer_width_length * drawer_width_qty) / 10000, 4)
         ))
         
@@ -538,12 +594,12 @@ def calculate_drawers_bottom_rail_unit(
         drawer_depth_width = drawer_height_cm
         drawer_depth_length = depth_cm - 8
         drawer_depth_qty = 2 * drawer_count
-        parts.append(Part(
+        parts.append(PartSpec(
             name="drawer_depth",
             width_cm=drawer_depth_width,
             height_cm=drawer_depth_length,
             qty=drawer_depth_qty,
-            edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
             area_m2=round((drawer_depth_width * drawer_depth_length * drawer_depth_qty) / 10000, 4)
         ))
         
@@ -553,12 +609,12 @@ def calculate_drawers_bottom_rail_unit(
         # العدد = عدد الأدراج
         drawer_bottom_length = depth_cm - 8 - settings.back_deduction
         drawer_bottom_width = width_cm - 6.4
-        parts.append(Part(
+        parts.append(PartSpec(
             name="drawer_bottom",
             width_cm=drawer_bottom_width,
             height_cm=drawer_bottom_length,
             qty=drawer_count,
-            edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+            edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
             area_m2=round((drawer_bottom_width * drawer_bottom_length * drawer_count) / 10000, 4)
         ))
     
@@ -566,13 +622,13 @@ def calculate_drawers_bottom_rail_unit(
     back_width = width_cm - settings.back_deduction
     back_height = height_cm - settings.back_deduction
     back_thickness = settings.router_thickness
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_panel",
         width_cm=back_width,
         height_cm=back_height,
         depth_cm=back_thickness,
         qty=1,
-        edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+        edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
         area_m2=round((back_width * back_height) / 10000, 4)
     ))
     
@@ -582,6 +638,106 @@ def calculate_drawers_bottom_rail_unit(
     return parts
 
 
+# خصم الشريط (2 مم) لأنواع O, OM, C, CM من قطع القاعدة والرفوف والأسقف
+EDGE_DEDUCTION_TYPES = frozenset({"O", "OM", "C", "CM"})
+EDGE_DEDUCTION_PARTS = frozenset({"base", "shelf", "internal_shelf", "top", "unit_top", "internal_base"})
+EDGE_DEDUCTION_CM = 0.2  # 2 mm = 0.2 cm
+
+
+class UnitCalculationResult:
+    """
+    نتيجة المحرك لوحدة واحدة
+
+    الإجماليات تُجمع أثناء نفس المرور على القطع الذي يطبق خصم الشريط ويحسب
+    متر الشريط، فلا حاجة لـ calculate_total_area / calculate_total_edge_band
+    بعد الحساب. القطع تبقى PartSpec ويتم تحويلها لـ Part فقط عند طلبها.
+    """
+    __slots__ = ("specs", "total_area_m2", "total_edge_band_m", "part_count", "total_qty")
+
+    def __init__(self, specs: List[PartSpec], total_area_m2: float, total_edge_band_m: float, total_qty: int):
+        self.specs = specs
+        self.total_area_m2 = total_area_m2
+        self.total_edge_band_m = total_edge_band_m
+        self.part_count = len(specs)
+        self.total_qty = total_qty
+
+    def parts(self) -> List[Part]:
+        """القطع كـ Part العام"""
+        return part_specs_to_parts(self.specs)
+
+
+def calculate_unit_result(
+    unit_type: str,
+    arguments: Mapping[str, Any],
+    settings: SettingsModel
+) -> UnitCalculationResult:
+    """
+    حساب أجزاء الوحدة مع خصم الشريط ومتر الشريط والإجماليات في مرور واحد
+    
+    Args:
+        unit_type: نوع الوحدة
+        arguments: معاملات الحساب بأسماء حقول UnitCalculateRequest
+        settings: إعدادات التقطيع
+    
+    Raises:
+        ValueError: إذا لم يكن لنوع الوحدة دالة حساب في unit_registry
+    """
+    # تحديد نوع الوحدة وحساب الأجزاء من سجل الأنواع
+    parts = get_unit_calculator(unit_type).calculate(arguments, settings)
+    
+    deduct = bool(settings.edge_banding_type) and settings.edge_banding_type.value in EDGE_DEDUCTION_TYPES
+    deduction = EDGE_DEDUCTION_CM
+    total_area_m2 = 0
+    total_edge_band_m = 0
+    total_qty = 0
+    
+    for part in parts:
+        # تطبيق خصم الشريط إذا كان النوع المختار يتطلب ذلك
+        if deduct and part.name in EDGE_DEDUCTION_PARTS:
+            # خصم من العرض
+            if part.width_cm > deduction:
+                part.width_cm = round(part.width_cm - deduction, 2)
+            
+            # خصم من الطول/العمق
+            if part.height_cm > deduction:
+                part.height_cm = round(part.height_cm - deduction, 2)
+            
+            # إعادة حساب المساحة
+            part.area_m2 = round((part.width_cm * part.height_cm) / 10000, 4)
+        
+        # متر الشريط بناءً على الأبعاد (بعد الخصم إن وجد) وتوزيع الشريط
+        edges = part.edge_distribution
+        if edges:
+            perimeter_cm = 0
+            if edges.top: perimeter_cm += part.width_cm
+            if edges.bottom: perimeter_cm += part.width_cm
+            if edges.left: perimeter_cm += part.height_cm
+            if edges.right: perimeter_cm += part.height_cm
+            
+            part.edge_band_m = round(perimeter_cm / 100, 3)
+        
+        # نفس ترتيب الجمع في calculate_total_area / calculate_total_edge_band
+        total_area_m2 += part.area_m2 or 0
+        total_edge_band_m += part.edge_band_m or 0
+        total_qty += part.qty
+    
+    return UnitCalculationResult(parts, total_area_m2, total_edge_band_m, total_qty)
+
+
+def calculate_unit_part_specs(
+    unit_type: str,
+    arguments: Mapping[str, Any],
+    settings: SettingsModel
+) -> List[PartSpec]:
+    """
+    حساب أجزاء الوحدة كـ PartSpec مع خصم الشريط ومتر الشريط لكل قطعة
+    
+    Raises:
+        ValueError: إذا لم يكن لنوع الوحدة دالة حساب في unit_registry
+    """
+    return calculate_unit_result(unit_type, arguments, settings).specs
+
+
 def calculate_unit_parts(
     unit_type: str,
     width_cm: float,
@@ -619,162 +775,35 @@ def calculate_unit_parts(
         microwave_height: ارتفاع الميكرويف
         vent_height: ارتفاع الهواية
     دالة موحدة لحساب أجزاء أي وحدة وتطبيق خصومات الشريط
-    """
-    parts = []
     
-    # تحديد نوع الوحدة وحساب الأجزاء
-    if unit_type == "ground":
-        parts = calculate_ground_unit(
-            width_cm, height_cm, depth_cm, shelf_count, door_count, settings
-        )
-    elif unit_type == "sink":
-        parts = calculate_sink_unit(
-            width_cm, height_cm, depth_cm, shelf_count, door_count, settings
-        )
-    elif unit_type == "wall":
-        parts = calculate_wall_unit(
-            width_cm, height_cm, depth_cm, shelf_count, door_count, door_type, settings
-        )
-    elif unit_type == "drawers":
-        return calculate_drawers_unit(
-            width_cm, height_cm, depth_cm, shelf_count, door_count,
-            drawer_count, drawer_height_cm, settings
-        )
-    elif unit_type == "drawers_bottom_rail":
-        parts = calculate_drawers_bottom_rail_unit(
-            width_cm, height_cm, depth_cm, shelf_count, door_count,
-            drawer_count, drawer_height_cm, settings
-        )
-    elif unit_type == "ground_fixed":
-        parts = calculate_ground_fixed_unit(
-            width_cm, height_cm, depth_cm, shelf_count, door_count,
-            fixed_part_cm, settings
-        )
-    elif unit_type == "sink_fixed":
-        parts = calculate_sink_fixed_unit(
-            width_cm, height_cm, depth_cm, shelf_count, door_count,
-            fixed_part_cm, settings
-        )
-    elif unit_type == "wall_fixed":
-        parts = calculate_wall_fixed_unit(
-            width_cm, height_cm, depth_cm, shelf_count, door_count,
-            fixed_part_cm, settings
-        )
-    elif unit_type == "wall_flip_top_doors_bottom":
-        parts = calculate_wall_flip_top_doors_bottom_unit(
-            width_cm, height_cm, depth_cm, shelf_count, door_count,
-            flip_door_height, settings
-        )
-    elif unit_type == "tall_doors":
-        parts = calculate_tall_doors_unit(
-            width_cm, height_cm, depth_cm, shelf_count, door_count,
-            bottom_door_height, settings
-        )
-    elif unit_type == "tall_doors_appliances":
-        parts = calculate_tall_doors_appliances_unit(
-            width_cm, height_cm, depth_cm, shelf_count, door_count, door_type,
-            bottom_door_height, oven_height, microwave_height, vent_height, settings
-        )
-    elif unit_type == "corner_l_wall":
-        parts = calculate_corner_l_wall_unit(
-            width_cm, width_2_cm, height_cm, depth_cm, depth_2_cm,
-            shelf_count, settings
-        )
-    elif unit_type == "tall_drawers_side_doors_top":
-        parts = calculate_tall_drawers_side_doors_top_unit(
-            width_cm, height_cm, depth_cm, shelf_count, door_count, door_type,
-            drawer_count, drawer_height_cm, bottom_door_height, settings
-        )
-    elif unit_type == "tall_drawers_bottom_rail_top_doors":
-        parts = calculate_tall_drawers_bottom_rail_top_doors_unit(
-            width_cm, height_cm, depth_cm, shelf_count, door_count, door_type,
-            drawer_count, drawer_height_cm, bottom_door_height, settings
-        )
-    elif unit_type == "tall_drawers_side_appliances_doors":
-        parts = calculate_tall_drawers_side_appliances_doors_unit(
-            width_cm, height_cm, depth_cm, shelf_count, door_count, door_type,
-            drawer_count, drawer_height_cm, bottom_door_height, oven_height,
-            microwave_height, vent_height, settings
-        )
-    elif unit_type == "tall_drawers_bottom_appliances_doors_top":
-        parts = calculate_tall_drawers_bottom_appliances_doors_top_unit(
-            width_cm, height_cm, depth_cm, shelf_count, door_count, door_type,
-            drawer_count, drawer_height_cm, bottom_door_height, oven_height,
-            microwave_height, vent_height, settings
-        )
-    elif unit_type == "two_small_20_one_large_side":
-        parts = calculate_two_small_20_one_large_side_unit(
-            width_cm, height_cm, depth_cm, drawer_count, settings
-        )
-    elif unit_type == "two_small_20_one_large_bottom":
-        parts = calculate_two_small_20_one_large_bottom_unit(
-            width_cm, height_cm, depth_cm, drawer_count, settings
-        )
-    elif unit_type == "one_small_16_two_large_side":
-        parts = calculate_one_small_16_two_large_side_unit(
-            width_cm, height_cm, depth_cm, drawer_count, settings
-        )
-    elif unit_type == "one_small_16_two_large_bottom":
-        parts = calculate_one_small_16_two_large_bottom_unit(
-            width_cm, height_cm, depth_cm, drawer_count, settings
-        )
-    elif unit_type == "wall_microwave":
-        parts = calculate_wall_microwave_unit(
-            width_cm, height_cm, depth_cm, shelf_count, door_count, door_type,
-            microwave_height, settings
-        )
-    elif unit_type == "tall_wooden_base":
-        parts = calculate_tall_wooden_base_unit(
-            width_cm, height_cm, depth_cm, shelf_count, door_count, settings
-        )
-    elif unit_type == "three_turbo":
-        parts = calculate_three_turbo_unit(
-            width_cm, height_cm, depth_cm, settings
-        )
-    elif unit_type == "drawer_built_in_oven":
-        parts = calculate_drawer_built_in_oven_unit(
-            width_cm, height_cm, depth_cm, oven_height, settings
-        )
-    elif unit_type == "drawer_bottom_rail_built_in_oven":
-        parts = calculate_drawer_bottom_rail_built_in_oven_unit(
-            width_cm, height_cm, depth_cm, oven_height, settings
-        )
+    الحساب يتم على PartSpec ويتم التحويل لـ Part العام هنا مرة واحدة.
     
-    # TODO: إضافة باقي أنواع الوحدات
-    else:
-        raise ValueError(f"Unit type '{unit_type}' not implemented yet")
-
-    # تطبيق خصم الشريط (2 مم) إذا كان النوع المختار يتطلب ذلك
-    # الأنواع: O, OM, C, CM
-    if settings.edge_banding_type and settings.edge_banding_type.value in ["O", "OM", "C", "CM"]:
-        deduction = 0.2  # 2 mm = 0.2 cm
-        target_parts = ["base", "shelf", "internal_shelf", "top", "unit_top", "internal_base"]
-        
-        for part in parts:
-            if part.name in target_parts:
-                # خصم من العرض
-                if part.width_cm > deduction:
-                    part.width_cm = round(part.width_cm - deduction, 2)
-                
-                # خصم من الطول/العمق
-                if part.height_cm > deduction:
-                    part.height_cm = round(part.height_cm - deduction, 2)
-                
-                # إعادة حساب المساحة
-                part.area_m2 = round((part.width_cm * part.height_cm) / 10000, 4)
-
-    # حساب متر الشريط لكل قطعة بناءً على الأبعاد (بعد الخصم إن وجد) وتوزيع الشريط
-    for part in parts:
-        if part.edge_distribution:
-            perimeter_cm = 0
-            if part.edge_distribution.top: perimeter_cm += part.width_cm
-            if part.edge_distribution.bottom: perimeter_cm += part.width_cm
-            if part.edge_distribution.left: perimeter_cm += part.height_cm
-            if part.edge_distribution.right: perimeter_cm += part.height_cm
-            
-            part.edge_band_m = round(perimeter_cm / 100, 3)
-
-    return parts
+    Raises:
+        ValueError: إذا لم يكن لنوع الوحدة دالة حساب في unit_registry
+    """
+    result = calculate_unit_result(
+        unit_type,
+        {
+            "width_cm": width_cm,
+            "height_cm": height_cm,
+            "depth_cm": depth_cm,
+            "shelf_count": shelf_count,
+            "door_count": door_count,
+            "door_type": door_type,
+            "flip_door_height": flip_door_height,
+            "bottom_door_height": bottom_door_height,
+            "oven_height": oven_height,
+            "microwave_height": microwave_height,
+            "vent_height": vent_height,
+            "drawer_count": drawer_count,
+            "drawer_height_cm": drawer_height_cm,
+            "fixed_part_cm": fixed_part_cm,
+            "width_2_cm": width_2_cm,
+            "depth_2_cm": depth_2_cm,
+        },
+        settings
+    )
+    return result.parts()
 
 
 def calculate_total_edge_band(parts: List[Part]) -> float:
@@ -790,18 +819,44 @@ def calculate_total_area(parts: List[Part]) -> float:
 def calculate_material_usage(
     total_area_m2: float,
     edge_band_m: float,
-    settings: SettingsModel
+    settings: SettingsModel,
+    parts: Optional[List[Part]] = None
 ) -> Dict[str, float]:
     """
     حساب استخدام المواد
     
+    عدد الألواح من رص القطع فعلياً على الألواح (sheet_nesting) إذا تم
+    تمرير القطع (مع ألواح القطع الأكبر من اللوح)، وإلا المساحة على مساحة
+    اللوح مقربة لأعلى.
+    
     Returns:
         Dict with material usage
     """
-    return {
-        "المساحة الإجمالية": round(total_area_m2, 4),
-        "شريط الحافة": round(edge_band_m, 2)
-    }
+    usage = {}
+    if parts is not None:
+        nesting = nest_parts_with_settings(parts, settings)
+        usage["ألواح الخشب"] = float(nesting.priced_sheet_count)
+        usage["نسبة استغلال الألواح"] = nesting.utilization_percent
+    else:
+        sheet_area_m2 = settings.sheet_length_cm * settings.sheet_width_cm / 10000
+        usage["ألواح الخشب"] = float(math.ceil(round(total_area_m2 / sheet_area_m2, 6))) if sheet_area_m2 > 0 else 0.0
+    
+    usage["المساحة الإجمالية"] = round(total_area_m2, 4)
+    usage["شريط الحافة"] = round(edge_band_m, 2)
+    return usage
+
+def estimate_material_costs(
+    material_usage: Dict[str, float],
+    total_edge_meters: float,
+    settings: SettingsModel
+) -> Tuple[Dict[str, float], float]:
+    """
+    حساب تكلفة الألواح والشريط من استخدام المواد (جدول أسعار cost_engine)
+    
+    Returns:
+        (cost_breakdown, total_cost)
+    """
+    return get_price_table(settings).price_usage(material_usage, total_edge_meters)
 
 def calculate_ground_fixed_unit(
     width_cm: float,
@@ -811,7 +866,7 @@ def calculate_ground_fixed_unit(
     door_count: int,
     fixed_part_cm: float,
     settings: SettingsModel
-) -> List[Part]:
+) -> List[PartSpec]:
     """
     حساب أجزاء وحدة ارضي ثابت
     
@@ -840,34 +895,34 @@ def calculate_ground_fixed_unit(
         base_width = depth_cm
         base_length = width_cm - (board_thickness * 2)
         
-    parts.append(Part(
+    parts.append(PartSpec(
         name="base",
         width_cm=base_width,
         height_cm=base_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((base_width * base_length) / 10000, 4)
     ))
     
     # 2. مرايا أمامية (Front Mirror)
     mirror_width = settings.mirror_width
     mirror_length = width_cm - (board_thickness * 2)
-    parts.append(Part(
+    parts.append(PartSpec(
         name="front_mirror",
         width_cm=mirror_width,
         height_cm=mirror_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((mirror_width * mirror_length) / 10000, 4)
     ))
     
     # 3. مرايا خلفية (Back Mirror)
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_mirror",
         width_cm=mirror_width,
         height_cm=mirror_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((mirror_width * mirror_length) / 10000, 4)
     ))
     
@@ -881,12 +936,12 @@ def calculate_ground_fixed_unit(
         # الجناب كاملة
         side_height = height_cm
 
-    parts.append(Part(
+    parts.append(PartSpec(
         name="side_panel",
         width_cm=side_width,
         height_cm=side_height,
         qty=2,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((side_width * side_height * 2) / 10000, 4)
     ))
     
@@ -894,24 +949,24 @@ def calculate_ground_fixed_unit(
     if shelf_count > 0:
         shelf_width = depth_cm - settings.shelf_depth_deduction
         shelf_length = width_cm - (board_thickness * 2)
-        parts.append(Part(
+        parts.append(PartSpec(
             name="shelf",
             width_cm=shelf_width,
             height_cm=shelf_length,
             qty=shelf_count,
-            edge_distribution=EdgeDistribution(top=True, bottom=False, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=False, left=True, right=True),
             area_m2=round((shelf_width * shelf_length * shelf_count) / 10000, 4)
         ))
     
     # 6. مرايا التركيب المفصلة (Detailed Installation Mirror)
     # الطول = الارتفاع - سمك الجانبين (1.8 + 1.8)
     detailed_mirror_length = height_cm - (board_thickness * 2)
-    parts.append(Part(
+    parts.append(PartSpec(
         name="detailed_installation_mirror",
         width_cm=mirror_width,
         height_cm=detailed_mirror_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((mirror_width * detailed_mirror_length) / 10000, 4)
     ))
     
@@ -919,12 +974,12 @@ def calculate_ground_fixed_unit(
     # العرض = الجزء الثابت - 4.5
     fixed_part_width = fixed_part_cm - 4.5
     fixed_part_height = height_cm
-    parts.append(Part(
+    parts.append(PartSpec(
         name="fixed_part",
         width_cm=fixed_part_width,
         height_cm=fixed_part_height,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((fixed_part_width * fixed_part_height) / 10000, 4)
     ))
     
@@ -932,13 +987,13 @@ def calculate_ground_fixed_unit(
     back_width = width_cm - settings.back_deduction
     back_height = height_cm - settings.back_deduction
     back_thickness = settings.router_thickness
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_panel",
         width_cm=back_width,
         height_cm=back_height,
         depth_cm=back_thickness,
         qty=1,
-        edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+        edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
         area_m2=round((back_width * back_height) / 10000, 4)
     ))
     
@@ -949,24 +1004,24 @@ def calculate_ground_fixed_unit(
         # الطول = الارتفاع - ارتفاع قطاع المقبض
         door_height = height_cm - settings.handle_profile_height
         
-        parts.append(Part(
+        parts.append(PartSpec(
             name="door",
             width_cm=door_width,
             height_cm=door_height,
             qty=door_count,
-            edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
             area_m2=round((door_width * door_height * door_count) / 10000, 4)
         ))
     
     # 10. فيلر (Filler)
     filler_width = mirror_width
     filler_height = height_cm
-    parts.append(Part(
+    parts.append(PartSpec(
         name="filler",
         width_cm=filler_width,
         height_cm=filler_height,
         qty=2,  # قطعتين
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((filler_width * filler_height * 2) / 10000, 4)
     ))
     
@@ -981,7 +1036,7 @@ def calculate_sink_fixed_unit(
     door_count: int,
     fixed_part_cm: float,
     settings: SettingsModel
-) -> List[Part]:
+) -> List[PartSpec]:
     """
     حساب أجزاء وحدة حوض ثابت
     
@@ -1014,24 +1069,24 @@ def calculate_sink_fixed_unit(
         base_width = depth_cm
         base_length = width_cm - (board_thickness * 2)
         
-    parts.append(Part(
+    parts.append(PartSpec(
         name="base",
         width_cm=base_width,
         height_cm=base_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((base_width * base_length) / 10000, 4)
     ))
     
     # 2. مرايا أمامية (Front Mirror) - 3 قطع للحوض الثابت
     mirror_width = settings.mirror_width
     mirror_length = width_cm - (board_thickness * 2)
-    parts.append(Part(
+    parts.append(PartSpec(
         name="front_mirror",
         width_cm=mirror_width,
         height_cm=mirror_length,
         qty=3,  # 3 قطع للحوض الثابت
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((mirror_width * mirror_length * 3) / 10000, 4)
     ))
     
@@ -1044,12 +1099,12 @@ def calculate_sink_fixed_unit(
     else:
         # الجناب كاملة
         side_height = height_cm
-    parts.append(Part(
+    parts.append(PartSpec(
         name="side_panel",
         width_cm=side_width,
         height_cm=side_height,
         qty=2,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((side_width * side_height * 2) / 10000, 4)
     ))
     
@@ -1057,35 +1112,35 @@ def calculate_sink_fixed_unit(
     if shelf_count > 0:
         shelf_width = depth_cm - settings.shelf_depth_deduction
         shelf_length = width_cm - (board_thickness * 2)
-        parts.append(Part(
+        parts.append(PartSpec(
             name="shelf",
             width_cm=shelf_width,
             height_cm=shelf_length,
             qty=shelf_count,
-            edge_distribution=EdgeDistribution(top=True, bottom=False, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=False, left=True, right=True),
             area_m2=round((shelf_width * shelf_length * shelf_count) / 10000, 4)
         ))
     
     # 5. مرايا التركيب المفصلة (Detailed Installation Mirror)
     detailed_mirror_length = height_cm - (board_thickness * 2)
-    parts.append(Part(
+    parts.append(PartSpec(
         name="detailed_installation_mirror",
         width_cm=mirror_width,
         height_cm=detailed_mirror_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((mirror_width * detailed_mirror_length) / 10000, 4)
     ))
     
     # 6. الجزء الثابت (Fixed Part)
     fixed_part_width = fixed_part_cm - 4.5
     fixed_part_height = height_cm
-    parts.append(Part(
+    parts.append(PartSpec(
         name="fixed_part",
         width_cm=fixed_part_width,
         height_cm=fixed_part_height,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((fixed_part_width * fixed_part_height) / 10000, 4)
     ))
     
@@ -1096,24 +1151,24 @@ def calculate_sink_fixed_unit(
         # الطول = الارتفاع - ارتفاع قطاع المقبض
         door_height = height_cm - settings.handle_profile_height
         
-        parts.append(Part(
+        parts.append(PartSpec(
             name="door",
             width_cm=door_width,
             height_cm=door_height,
             qty=door_count,
-            edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
             area_m2=round((door_width * door_height * door_count) / 10000, 4)
         ))
     
     # 8. فيلر (Filler)
     filler_width = mirror_width
     filler_height = height_cm
-    parts.append(Part(
+    parts.append(PartSpec(
         name="filler",
         width_cm=filler_width,
         height_cm=filler_height,
         qty=2,  # قطعتين
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((filler_width * filler_height * 2) / 10000, 4)
     ))
     
@@ -1130,7 +1185,7 @@ def calculate_wall_unit(
     door_count: int,
     door_type: str,
     settings: SettingsModel
-) -> List[Part]:
+) -> List[PartSpec]:
     """
     حساب أجزاء الوحدة العلوية
     
@@ -1152,12 +1207,12 @@ def calculate_wall_unit(
     # 1. القاعدة (Base)
     base_width = depth_cm
     base_length = width_cm - (board_thickness * 2)
-    parts.append(Part(
+    parts.append(PartSpec(
         name="base",
         width_cm=base_width,
         height_cm=base_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((base_width * base_length) / 10000, 4)
     ))
     
@@ -1165,24 +1220,24 @@ def calculate_wall_unit(
     # العرض = العمق - مقبض الشاسية
     top_width = depth_cm - settings.chassis_handle_drop
     top_length = width_cm - (board_thickness * 2)
-    parts.append(Part(
+    parts.append(PartSpec(
         name="top_ceiling",  # برنيطة
         width_cm=top_width,
         height_cm=top_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((top_width * top_length) / 10000, 4)
     ))
     
     # 3. الجانبين (Side Panels)
     side_width = depth_cm
     side_height = height_cm
-    parts.append(Part(
+    parts.append(PartSpec(
         name="side_panel",
         width_cm=side_width,
         height_cm=side_height,
         qty=2,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((side_width * side_height * 2) / 10000, 4)
     ))
     
@@ -1190,12 +1245,12 @@ def calculate_wall_unit(
     if shelf_count > 0:
         shelf_width = depth_cm - settings.shelf_depth_deduction
         shelf_length = width_cm - (board_thickness * 2)
-        parts.append(Part(
+        parts.append(PartSpec(
             name="shelf",
             width_cm=shelf_width,
             height_cm=shelf_length,
             qty=shelf_count,
-            edge_distribution=EdgeDistribution(top=True, bottom=False, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=False, left=True, right=True),
             area_m2=round((shelf_width * shelf_length * shelf_count) / 10000, 4)
         ))
     
@@ -1203,13 +1258,13 @@ def calculate_wall_unit(
     back_width = width_cm - settings.back_deduction
     back_height = height_cm - settings.back_deduction
     back_thickness = settings.router_thickness
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_panel",
         width_cm=back_width,
         height_cm=back_height,
         depth_cm=back_thickness,
         qty=1,
-        edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+        edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
         area_m2=round((back_width * back_height) / 10000, 4)
     ))
     
@@ -1219,24 +1274,24 @@ def calculate_wall_unit(
             # ضلف مفصلي
             door_width = (width_cm / door_count) - settings.door_width_deduction_no_edge
             door_height = height_cm - settings.handle_profile_height
-            parts.append(Part(
+            parts.append(PartSpec(
                 name="door_hinged",  # ضلفة مفصلي
                 width_cm=door_width,
                 height_cm=door_height,
                 qty=door_count,
-                edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+                edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
                 area_m2=round((door_width * door_height * door_count) / 10000, 4)
             ))
         else:  # flip
             # ضلف قلاب
             door_width = width_cm - settings.door_width_deduction_no_edge
             door_height = (height_cm / door_count) - settings.handle_profile_height - 0.5
-            parts.append(Part(
+            parts.append(PartSpec(
                 name="door_flip",  # ضلفة قلاب
                 width_cm=door_width,
                 height_cm=door_height,
                 qty=door_count,
-                edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+                edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
                 area_m2=round((door_width * door_height * door_count) / 10000, 4)
             ))
     
@@ -1251,7 +1306,7 @@ def calculate_wall_fixed_unit(
     door_count: int,
     fixed_part_cm: float,
     settings: SettingsModel
-) -> List[Part]:
+) -> List[PartSpec]:
     """
     حساب أجزاء وحدة علوي ثابت
     
@@ -1273,12 +1328,12 @@ def calculate_wall_fixed_unit(
     # 1. القاعدة (Base)
     base_width = depth_cm
     base_length = width_cm - (board_thickness * 2)
-    parts.append(Part(
+    parts.append(PartSpec(
         name="base",
         width_cm=base_width,
         height_cm=base_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((base_width * base_length) / 10000, 4)
     ))
     
@@ -1286,24 +1341,24 @@ def calculate_wall_fixed_unit(
     # العرض = العمق (بدون تخصيم مقبض الشاسية في الثابت)
     top_width = depth_cm
     top_length = width_cm - (board_thickness * 2)
-    parts.append(Part(
+    parts.append(PartSpec(
         name="top_ceiling",  # برنيطة
         width_cm=top_width,
         height_cm=top_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((top_width * top_length) / 10000, 4)
     ))
     
     # 3. الجانبين (Side Panels)
     side_width = depth_cm
     side_height = height_cm
-    parts.append(Part(
+    parts.append(PartSpec(
         name="side_panel",
         width_cm=side_width,
         height_cm=side_height,
         qty=2,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((side_width * side_height * 2) / 10000, 4)
     ))
     
@@ -1311,36 +1366,36 @@ def calculate_wall_fixed_unit(
     if shelf_count > 0:
         shelf_width = depth_cm - settings.shelf_depth_deduction
         shelf_length = width_cm - (board_thickness * 2)
-        parts.append(Part(
+        parts.append(PartSpec(
             name="shelf",
             width_cm=shelf_width,
             height_cm=shelf_length,
             qty=shelf_count,
-            edge_distribution=EdgeDistribution(top=True, bottom=False, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=False, left=True, right=True),
             area_m2=round((shelf_width * shelf_length * shelf_count) / 10000, 4)
         ))
     
     # 5. مرايا التركيب المفصلة (Detailed Installation Mirror)
     mirror_width = settings.mirror_width
     detailed_mirror_length = height_cm - (board_thickness * 2)
-    parts.append(Part(
+    parts.append(PartSpec(
         name="detailed_installation_mirror",
         width_cm=mirror_width,
         height_cm=detailed_mirror_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((mirror_width * detailed_mirror_length) / 10000, 4)
     ))
     
     # 6. الجزء الثابت (Fixed Part)
     fixed_part_width = fixed_part_cm - 4.5
     fixed_part_height = height_cm
-    parts.append(Part(
+    parts.append(PartSpec(
         name="fixed_part",
         width_cm=fixed_part_width,
         height_cm=fixed_part_height,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((fixed_part_width * fixed_part_height) / 10000, 4)
     ))
     
@@ -1348,13 +1403,13 @@ def calculate_wall_fixed_unit(
     back_width = width_cm - settings.back_deduction
     back_height = height_cm - settings.back_deduction
     back_thickness = settings.router_thickness
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_panel",
         width_cm=back_width,
         height_cm=back_height,
         depth_cm=back_thickness,
         qty=1,
-        edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+        edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
         area_m2=round((back_width * back_height) / 10000, 4)
     ))
     
@@ -1365,24 +1420,24 @@ def calculate_wall_fixed_unit(
         # الطول = الارتفاع - ارتفاع قطاع المقبض
         door_height = height_cm - settings.handle_profile_height
         
-        parts.append(Part(
+        parts.append(PartSpec(
             name="door",
             width_cm=door_width,
             height_cm=door_height,
             qty=door_count,
-            edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
             area_m2=round((door_width * door_height * door_count) / 10000, 4)
         ))
     
     # 9. فيلر (Filler)
     filler_width = mirror_width
     filler_height = height_cm
-    parts.append(Part(
+    parts.append(PartSpec(
         name="filler",
         width_cm=filler_width,
         height_cm=filler_height,
         qty=2,  # قطعتين
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((filler_width * filler_height * 2) / 10000, 4)
     ))
     
@@ -1396,7 +1451,7 @@ def calculate_wall_flip_top_doors_bottom_unit(
     door_count: int,
     flip_door_height: float,
     settings: SettingsModel
-) -> List[Part]:
+) -> List[PartSpec]:
     """
     حساب أجزاء وحدة علوية ضلفة قلاب + ضلفة سفلية
     
@@ -1419,12 +1474,12 @@ def calculate_wall_flip_top_doors_bottom_unit(
     # العرض = العمق، الطول = العرض - (سمك الجنبين)
     base_width = depth_cm
     base_length = width_cm - (board_thickness * 2)
-    parts.append(Part(
+    parts.append(PartSpec(
         name="base",
         width_cm=base_width,
         height_cm=base_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((base_width * base_length) / 10000, 4)
     ))
     
@@ -1432,24 +1487,24 @@ def calculate_wall_flip_top_doors_bottom_unit(
     # العرض = العمق - مقبض الشاسية
     top_width = depth_cm - settings.chassis_handle_drop
     top_length = width_cm - (board_thickness * 2)
-    parts.append(Part(
+    parts.append(PartSpec(
         name="top_ceiling",  # برنيطة
         width_cm=top_width,
         height_cm=top_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((top_width * top_length) / 10000, 4)
     ))
     
     # 3. الجانبين (Side Panels)
     side_width = depth_cm
     side_height = height_cm
-    parts.append(Part(
+    parts.append(PartSpec(
         name="side_panel",
         width_cm=side_width,
         height_cm=side_height,
         qty=2,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((side_width * side_height * 2) / 10000, 4)
     ))
     
@@ -1457,12 +1512,12 @@ def calculate_wall_flip_top_doors_bottom_unit(
     if shelf_count > 0:
         shelf_width = depth_cm - settings.shelf_depth_deduction
         shelf_length = width_cm - (board_thickness * 2)
-        parts.append(Part(
+        parts.append(PartSpec(
             name="shelf",
             width_cm=shelf_width,
             height_cm=shelf_length,
             qty=shelf_count,
-            edge_distribution=EdgeDistribution(top=True, bottom=False, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=False, left=True, right=True),
             area_m2=round((shelf_width * shelf_length * shelf_count) / 10000, 4)
         ))
     
@@ -1471,12 +1526,12 @@ def calculate_wall_flip_top_doors_bottom_unit(
     # الطول = العرض - سمك الجانبين
     extra_shelf_width = depth_cm - settings.router_distance - settings.router_thickness - 0.2
     extra_shelf_length = width_cm - (board_thickness * 2)
-    parts.append(Part(
+    parts.append(PartSpec(
         name="extra_shelf",  # الرف الإضافي
         width_cm=extra_shelf_width,
         height_cm=extra_shelf_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=False, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=False, left=True, right=True),
         area_m2=round((extra_shelf_width * extra_shelf_length) / 10000, 4)
     ))
     
@@ -1484,13 +1539,13 @@ def calculate_wall_flip_top_doors_bottom_unit(
     back_width = width_cm - settings.back_deduction
     back_height = height_cm - settings.back_deduction
     back_thickness = settings.router_thickness
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_panel",
         width_cm=back_width,
         height_cm=back_height,
         depth_cm=back_thickness,
         qty=1,
-        edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+        edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
         area_m2=round((back_width * back_height) / 10000, 4)
     ))
     
@@ -1501,12 +1556,12 @@ def calculate_wall_flip_top_doors_bottom_unit(
         # الطول = الارتفاع - ارتفاع قطاع المقبض - ارتفاع ضلفة القلاب - 0.5
         door_height = height_cm - settings.handle_profile_height - flip_door_height - 0.5
         
-        parts.append(Part(
+        parts.append(PartSpec(
             name="bottom_door",  # ضلفة سفلية
             width_cm=door_width,
             height_cm=door_height,
             qty=door_count,
-            edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
             area_m2=round((door_width * door_height * door_count) / 10000, 4)
         ))
     
@@ -1516,12 +1571,12 @@ def calculate_wall_flip_top_doors_bottom_unit(
     # الطول = ارتفاع ضلفة القلاب - ارتفاع قطاع المقبض - 2.0
     flip_door_calculated_height = flip_door_height - settings.handle_profile_height - 2.0
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="flip_door",  # ضلفة قلاب
         width_cm=flip_door_width,
         height_cm=flip_door_calculated_height,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((flip_door_width * flip_door_calculated_height) / 10000, 4)
     ))
     
@@ -1535,7 +1590,7 @@ def calculate_tall_doors_unit(
     door_count: int,
     bottom_door_height: float,
     settings: SettingsModel
-) -> List[Part]:
+) -> List[PartSpec]:
     """
     حساب أجزاء وحدة دولاب ضلفة سفلية وعلوي ضلفة
     
@@ -1564,12 +1619,12 @@ def calculate_tall_doors_unit(
         base_width = depth_cm
         base_length = width_cm - (board_thickness * 2)
         
-    parts.append(Part(
+    parts.append(PartSpec(
         name="base",
         width_cm=base_width,
         height_cm=base_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((base_width * base_length) / 10000, 4)
     ))
     
@@ -1583,12 +1638,12 @@ def calculate_tall_doors_unit(
         top_width = depth_cm
         top_length = width_cm - (board_thickness * 2)
         
-    parts.append(Part(
+    parts.append(PartSpec(
         name="top_ceiling",
         width_cm=top_width,
         height_cm=top_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((top_width * top_length) / 10000, 4)
     ))
     
@@ -1602,12 +1657,12 @@ def calculate_tall_doors_unit(
         # الجناب كاملة
         side_height = height_cm
 
-    parts.append(Part(
+    parts.append(PartSpec(
         name="side_panel",
         width_cm=side_width,
         height_cm=side_height,
         qty=2,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((side_width * side_height * 2) / 10000, 4)
     ))
     
@@ -1615,12 +1670,12 @@ def calculate_tall_doors_unit(
     if shelf_count > 0:
         shelf_width = depth_cm - settings.shelf_depth_deduction
         shelf_length = width_cm - (board_thickness * 2)
-        parts.append(Part(
+        parts.append(PartSpec(
             name="shelf",
             width_cm=shelf_width,
             height_cm=shelf_length,
             qty=shelf_count,
-            edge_distribution=EdgeDistribution(top=True, bottom=False, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=False, left=True, right=True),
             area_m2=round((shelf_width * shelf_length * shelf_count) / 10000, 4)
         ))
     
@@ -1629,12 +1684,12 @@ def calculate_tall_doors_unit(
     # الطول = العرض - سمك الجانبين
     extra_shelf_width = depth_cm - settings.router_distance - settings.router_thickness - 0.2
     extra_shelf_length = width_cm - (board_thickness * 2)
-    parts.append(Part(
+    parts.append(PartSpec(
         name="extra_shelf",
         width_cm=extra_shelf_width,
         height_cm=extra_shelf_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=False, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=False, left=True, right=True),
         area_m2=round((extra_shelf_width * extra_shelf_length) / 10000, 4)
     ))
     
@@ -1642,13 +1697,13 @@ def calculate_tall_doors_unit(
     back_width = width_cm - settings.back_deduction
     back_height = height_cm - settings.back_deduction
     back_thickness = settings.router_thickness
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_panel",
         width_cm=back_width,
         height_cm=back_height,
         depth_cm=back_thickness,
         qty=1,
-        edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+        edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
         area_m2=round((back_width * back_height) / 10000, 4)
     ))
     
@@ -1663,12 +1718,12 @@ def calculate_tall_doors_unit(
             - settings.ground_door_height_deduction_no_edge
             - settings.handle_profile_height
         )
-        parts.append(Part(
+        parts.append(PartSpec(
             name="bottom_door",
             width_cm=door_width,
             height_cm=bottom_door_calc_height,
             qty=door_count,
-            edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
             area_m2=round((door_width * bottom_door_calc_height * door_count) / 10000, 4)
         ))
         
@@ -1681,12 +1736,12 @@ def calculate_tall_doors_unit(
             - bottom_door_height
             - settings.handle_profile_height
         )
-        parts.append(Part(
+        parts.append(PartSpec(
             name="top_door",
             width_cm=door_width,
             height_cm=top_door_calc_height,
             qty=door_count,
-            edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
             area_m2=round((door_width * top_door_calc_height * door_count) / 10000, 4)
         ))
     
@@ -1700,7 +1755,7 @@ def calculate_corner_l_wall_unit(
     depth_2_cm: float,
     shelf_count: int,
     settings: SettingsModel
-) -> List[Part]:
+) -> List[PartSpec]:
     """
     حساب أجزاء وحدة ركنة حرف L (علوي)
     
@@ -1730,12 +1785,12 @@ def calculate_corner_l_wall_unit(
     # الطول = عرض 2 - سمك الجنب
     base_width = w1 - board_thickness
     base_length = w2 - board_thickness
-    parts.append(Part(
+    parts.append(PartSpec(
         name="base",
         width_cm=base_width,
         height_cm=base_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((base_width * base_length) / 10000, 4)
     ))
     
@@ -1744,12 +1799,12 @@ def calculate_corner_l_wall_unit(
     # الطول = عرض 2 - سمك الجنب
     top_width = w1 - board_thickness
     top_length = w2 - board_thickness
-    parts.append(Part(
+    parts.append(PartSpec(
         name="top_ceiling",
         width_cm=top_width,
         height_cm=top_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((top_width * top_length) / 10000, 4)
     ))
     
@@ -1758,12 +1813,12 @@ def calculate_corner_l_wall_unit(
     # الطول = الارتفاع
     side1_width = d1
     side1_height = height_cm
-    parts.append(Part(
+    parts.append(PartSpec(
         name="side_1",
         width_cm=side1_width,
         height_cm=side1_height,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((side1_width * side1_height) / 10000, 4)
     ))
     
@@ -1772,12 +1827,12 @@ def calculate_corner_l_wall_unit(
     # الطول = الارتفاع
     side2_width = d2
     side2_height = height_cm
-    parts.append(Part(
+    parts.append(PartSpec(
         name="side_2",
         width_cm=side2_width,
         height_cm=side2_height,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((side2_width * side2_height) / 10000, 4)
     ))
     
@@ -1788,12 +1843,12 @@ def calculate_corner_l_wall_unit(
         # الطول = عرض 2 - سمك الجنب - بعد المفحار - سمك المفحار
         shelf_length = w2 - board_thickness - settings.router_distance - settings.router_thickness
         
-        parts.append(Part(
+        parts.append(PartSpec(
             name="shelf",
             width_cm=shelf_width,
             height_cm=shelf_length,
             qty=shelf_count,
-            edge_distribution=EdgeDistribution(top=True, bottom=False, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=False, left=True, right=True),
             area_m2=round((shelf_width * shelf_length * shelf_count) / 10000, 4)
         ))
     
@@ -1804,13 +1859,13 @@ def calculate_corner_l_wall_unit(
     back1_height = height_cm - settings.back_deduction
     back_thickness = settings.router_thickness
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_1",
         width_cm=back1_width,
         height_cm=back1_height,
         depth_cm=back_thickness,
         qty=1,
-        edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+        edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
         area_m2=round((back1_width * back1_height) / 10000, 4)
     ))
     
@@ -1820,13 +1875,13 @@ def calculate_corner_l_wall_unit(
     back2_width = w2 - settings.router_distance - settings.router_thickness - 5
     back2_height = height_cm - settings.back_deduction
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_2",
         width_cm=back2_width,
         height_cm=back2_height,
         depth_cm=back_thickness,
         qty=1,
-        edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+        edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
         area_m2=round((back2_width * back2_height) / 10000, 4)
     ))
     
@@ -1836,12 +1891,12 @@ def calculate_corner_l_wall_unit(
     door1_width = w1 - d1 - 2.3
     door1_height = height_cm - settings.handle_profile_height
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="door_1",
         width_cm=door1_width,
         height_cm=door1_height,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((door1_width * door1_height) / 10000, 4)
     ))
     
@@ -1851,12 +1906,12 @@ def calculate_corner_l_wall_unit(
     flip_width = w2 - d2 - 1.2
     flip_height = height_cm - settings.handle_profile_height
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="flip_door",
         width_cm=flip_width,
         height_cm=flip_height,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((flip_width * flip_height) / 10000, 4)
     ))
     
@@ -1874,7 +1929,7 @@ def calculate_tall_doors_appliances_unit(
     microwave_height: float,
     vent_height: float,
     settings: SettingsModel
-) -> List[Part]:
+) -> List[PartSpec]:
     """
     حساب أجزاء وحدة دولاب ضلف + أجهزة
     
@@ -1907,12 +1962,12 @@ def calculate_tall_doors_appliances_unit(
         base_width = depth_cm
         base_length = width_cm - (board_thickness * 2)
         
-    parts.append(Part(
+    parts.append(PartSpec(
         name="base",
         width_cm=base_width,
         height_cm=base_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((base_width * base_length) / 10000, 4)
     ))
     
@@ -1926,12 +1981,12 @@ def calculate_tall_doors_appliances_unit(
         top_width = depth_cm
         top_length = width_cm - (board_thickness * 2)
         
-    parts.append(Part(
+    parts.append(PartSpec(
         name="top_ceiling",
         width_cm=top_width,
         height_cm=top_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((top_width * top_length) / 10000, 4)
     ))
     
@@ -1945,22 +2000,22 @@ def calculate_tall_doors_appliances_unit(
         # الجناب كاملة
         side_height = height_cm
 
-    parts.append(Part(
+    parts.append(PartSpec(
         name="side_1",
         width_cm=side_width,
         height_cm=side_height,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((side_width * side_height) / 10000, 4)
     ))
     
     # 4. جنب 2 (Side 2)
-    parts.append(Part(
+    parts.append(PartSpec(
         name="side_2",
         width_cm=side_width,
         height_cm=side_height,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((side_width * side_height) / 10000, 4)
     ))
     
@@ -1968,12 +2023,12 @@ def calculate_tall_doors_appliances_unit(
     if shelf_count > 0:
         shelf_width = depth_cm - settings.shelf_depth_deduction
         shelf_length = width_cm - (board_thickness * 2)
-        parts.append(Part(
+        parts.append(PartSpec(
             name="shelf",
             width_cm=shelf_width,
             height_cm=shelf_length,
             qty=shelf_count,
-            edge_distribution=EdgeDistribution(top=True, bottom=False, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=False, left=True, right=True),
             area_m2=round((shelf_width * shelf_length * shelf_count) / 10000, 4)
         ))
     
@@ -1981,12 +2036,12 @@ def calculate_tall_doors_appliances_unit(
     appliance_shelf_count = 3
     app_shelf_width = depth_cm - settings.router_distance - settings.router_thickness
     app_shelf_length = width_cm - (board_thickness * 2)
-    parts.append(Part(
+    parts.append(PartSpec(
         name="appliance_shelf",
         width_cm=app_shelf_width,
         height_cm=app_shelf_length,
         qty=appliance_shelf_count,
-        edge_distribution=EdgeDistribution(top=True, bottom=False, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=False, left=True, right=True),
         area_m2=round((app_shelf_width * app_shelf_length * appliance_shelf_count) / 10000, 4)
     ))
     
@@ -1994,13 +2049,13 @@ def calculate_tall_doors_appliances_unit(
     back_width = width_cm - settings.back_deduction
     back_height = height_cm - settings.back_deduction
     back_thickness = settings.router_thickness
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_panel",
         width_cm=back_width,
         height_cm=back_height,
         depth_cm=back_thickness,
         qty=1,
-        edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+        edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
         area_m2=round((back_width * back_height) / 10000, 4)
     ))
     
@@ -2011,12 +2066,12 @@ def calculate_tall_doors_appliances_unit(
     # بما أن الهواية قطعة واحدة، غالباً يقصد العرض الكلي - تخصيم.
     vent_width = width_cm - settings.door_width_deduction_no_edge
     vent_calculated_height = vent_height - 2.0
-    parts.append(Part(
+    parts.append(PartSpec(
         name="vent",
         width_cm=vent_width,
         height_cm=vent_calculated_height,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((vent_width * vent_calculated_height) / 10000, 4)
     ))
     
@@ -2035,12 +2090,12 @@ def calculate_tall_doors_appliances_unit(
             - settings.ground_door_height_deduction_no_edge
             - settings.handle_profile_height
         )
-        parts.append(Part(
+        parts.append(PartSpec(
             name="bottom_door",
             width_cm=door_width,
             height_cm=bottom_door_calc_height,
             qty=door_count,
-            edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
             area_m2=round((door_width * bottom_door_calc_height * door_count) / 10000, 4)
         ))
         
@@ -2061,12 +2116,12 @@ def calculate_tall_doors_appliances_unit(
                 - (vent_height + 2.0)
                 - 0.2
             )
-            parts.append(Part(
+            parts.append(PartSpec(
                 name="top_door_hinged",
                 width_cm=door_width,
                 height_cm=top_door_calc_height,
                 qty=door_count,
-                edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+                edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
                 area_m2=round((door_width * top_door_calc_height * door_count) / 10000, 4)
             ))
             
@@ -2115,12 +2170,12 @@ def calculate_tall_doors_appliances_unit(
             if door_count > 1:
                 top_door_calc_height = top_door_calc_height / door_count
 
-            parts.append(Part(
+            parts.append(PartSpec(
                 name="top_door_flip",
                 width_cm=top_flip_width,
                 height_cm=top_door_calc_height,
                 qty=door_count,
-                edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+                edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
                 area_m2=round((top_flip_width * top_door_calc_height * door_count) / 10000, 4)
             ))
             
@@ -2137,7 +2192,7 @@ def calculate_tall_drawers_side_doors_top_unit(
     drawer_height_cm: float,
     bottom_door_height: float,
     settings: SettingsModel
-) -> List[Part]:
+) -> List[PartSpec]:
     """
     حساب أجزاء وحدة دولاب ادراج مجرة جانبية + ضلف علوية
     
@@ -2169,12 +2224,12 @@ def calculate_tall_drawers_side_doors_top_unit(
         base_width = depth_cm
         base_length = width_cm - (board_thickness * 2)
         
-    parts.append(Part(
+    parts.append(PartSpec(
         name="base",
         width_cm=base_width,
         height_cm=base_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((base_width * base_length) / 10000, 4)
     ))
     
@@ -2188,12 +2243,12 @@ def calculate_tall_drawers_side_doors_top_unit(
         top_width = depth_cm
         top_length = width_cm - (board_thickness * 2)
         
-    parts.append(Part(
+    parts.append(PartSpec(
         name="top_ceiling",
         width_cm=top_width,
         height_cm=top_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((top_width * top_length) / 10000, 4)
     ))
     
@@ -2207,12 +2262,12 @@ def calculate_tall_drawers_side_doors_top_unit(
         # الجناب كاملة
         side_height = height_cm
 
-    parts.append(Part(
+    parts.append(PartSpec(
         name="side_panel",
         width_cm=side_width,
         height_cm=side_height,
         qty=2,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((side_width * side_height * 2) / 10000, 4)
     ))
     
@@ -2220,12 +2275,12 @@ def calculate_tall_drawers_side_doors_top_unit(
     if shelf_count > 0:
         shelf_width = depth_cm - settings.shelf_depth_deduction
         shelf_length = width_cm - (board_thickness * 2)
-        parts.append(Part(
+        parts.append(PartSpec(
             name="shelf",
             width_cm=shelf_width,
             height_cm=shelf_length,
             qty=shelf_count,
-            edge_distribution=EdgeDistribution(top=True, bottom=False, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=False, left=True, right=True),
             area_m2=round((shelf_width * shelf_length * shelf_count) / 10000, 4)
         ))
     
@@ -2233,13 +2288,13 @@ def calculate_tall_drawers_side_doors_top_unit(
     back_width = width_cm - settings.back_deduction
     back_height = height_cm - settings.back_deduction
     back_thickness = settings.router_thickness
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_panel",
         width_cm=back_width,
         height_cm=back_height,
         depth_cm=back_thickness,
         qty=1,
-        edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+        edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
         area_m2=round((back_width * back_height) / 10000, 4)
     ))
     
@@ -2270,12 +2325,12 @@ def calculate_tall_drawers_side_doors_top_unit(
         # سأجعل الكمية drawer_count * 2 لكل من "عرض الدرج" و "عمق الدرج" لتكوين الصندوق.
         
         # جزء "عرض الدرج" (Front/Back of Drawer Box)
-        parts.append(Part(
+        parts.append(PartSpec(
             name="drawer_width_part",
             width_cm=drawer_height_cm, # العرض = ارتفاع الدرج
             height_cm=drawer_box_length,
             qty=drawer_count * 2,
-            edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
             area_m2=round((drawer_height_cm * drawer_box_length * drawer_count * 2) / 10000, 4)
         ))
         
@@ -2283,12 +2338,12 @@ def calculate_tall_drawers_side_doors_top_unit(
         # العرض = ارتفاع الدرج
         # الطول = العمق - 8
         drawer_depth_length = depth_cm - 8.0
-        parts.append(Part(
+        parts.append(PartSpec(
             name="drawer_depth_part",
             width_cm=drawer_height_cm,
             height_cm=drawer_depth_length,
             qty=drawer_count * 2,
-            edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
             area_m2=round((drawer_height_cm * drawer_depth_length * drawer_count * 2) / 10000, 4)
         ))
         
@@ -2298,12 +2353,12 @@ def calculate_tall_drawers_side_doors_top_unit(
         # ملاحظة: سمك الجنبين هنا يقصد (1.8+1.8) أي 3.6
         drawer_bottom_width = width_cm - (board_thickness * 2) - 2.6 - settings.back_deduction
         drawer_bottom_length = depth_cm - 8.0 - settings.back_deduction
-        parts.append(Part(
+        parts.append(PartSpec(
             name="drawer_bottom",
             width_cm=drawer_bottom_width,
             height_cm=drawer_bottom_length,
             qty=drawer_count,
-            edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+            edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
             area_m2=round((drawer_bottom_width * drawer_bottom_length * drawer_count) / 10000, 4)
         ))
         
@@ -2312,12 +2367,12 @@ def calculate_tall_drawers_side_doors_top_unit(
         # الطول = (ارتفاع الضلفة السفلية / عدد الأدراج) - مقبض - 0.5
         drawer_face_width = width_cm - settings.door_width_deduction_no_edge
         drawer_face_height = (bottom_door_height / drawer_count) - settings.handle_profile_height - 0.5
-        parts.append(Part(
+        parts.append(PartSpec(
             name="drawer_face",
             width_cm=drawer_face_width,
             height_cm=drawer_face_height,
             qty=drawer_count,
-            edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
             area_m2=round((drawer_face_width * drawer_face_height * drawer_count) / 10000, 4)
         ))
         
@@ -2330,12 +2385,12 @@ def calculate_tall_drawers_side_doors_top_unit(
             door_width = (width_cm / door_count) - settings.door_width_deduction_no_edge
             door_height = height_cm - bottom_door_height - settings.handle_profile_height - 0.3
             
-            parts.append(Part(
+            parts.append(PartSpec(
                 name="top_door_hinged",
                 width_cm=door_width,
                 height_cm=door_height,
                 qty=door_count,
-                edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+                edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
                 area_m2=round((door_width * door_height * door_count) / 10000, 4)
             ))
             
@@ -2349,12 +2404,12 @@ def calculate_tall_drawers_side_doors_top_unit(
             # أو يقصد لو ضلفة واحدة فالقسمة على 1.
             door_height = ((height_cm - bottom_door_height) / door_count) - settings.handle_profile_height - 0.4
             
-            parts.append(Part(
+            parts.append(PartSpec(
                 name="top_door_flip",
                 width_cm=door_width,
                 height_cm=door_height,
                 qty=door_count,
-                edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+                edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
                 area_m2=round((door_width * door_height * door_count) / 10000, 4)
             ))
 
@@ -2372,7 +2427,7 @@ def calculate_tall_drawers_bottom_rail_top_doors_unit(
     drawer_height_cm: float,
     bottom_door_height: float,
     settings: SettingsModel
-) -> List[Part]:
+) -> List[PartSpec]:
     """
     حساب أجزاء دولاب ادراج مجرة سفلية + ضلف علوية
     
@@ -2407,12 +2462,12 @@ def calculate_tall_drawers_bottom_rail_top_doors_unit(
         # تجميع بجانبين كاملين
         base_length = width_cm - (board_thickness * 2)
         
-    parts.append(Part(
+    parts.append(PartSpec(
         name="base",
         width_cm=base_width,
         height_cm=base_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((base_width * base_length) / 10000, 4)
     ))
     
@@ -2429,12 +2484,12 @@ def calculate_tall_drawers_bottom_rail_top_doors_unit(
         # سقف بين الجنبين
         top_length = width_cm - (board_thickness * 2)
         
-    parts.append(Part(
+    parts.append(PartSpec(
         name="top_ceiling",
         width_cm=top_width,
         height_cm=top_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((top_width * top_length) / 10000, 4)
     ))
     
@@ -2452,12 +2507,12 @@ def calculate_tall_drawers_bottom_rail_top_doors_unit(
         # الجناب كاملة
         side_height = height_cm
 
-    parts.append(Part(
+    parts.append(PartSpec(
         name="side_panel",
         width_cm=side_width,
         height_cm=side_height,
         qty=2,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((side_width * side_height * 2) / 10000, 4)
     ))
     
@@ -2468,12 +2523,12 @@ def calculate_tall_drawers_bottom_rail_top_doors_unit(
     if shelf_count > 0:
         shelf_width = depth_cm - settings.shelf_depth_deduction
         shelf_length = width_cm - (board_thickness * 2)
-        parts.append(Part(
+        parts.append(PartSpec(
             name="shelf",
             width_cm=shelf_width,
             height_cm=shelf_length,
             qty=shelf_count,
-            edge_distribution=EdgeDistribution(top=True, bottom=False, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=False, left=True, right=True),
             area_m2=round((shelf_width * shelf_length * shelf_count) / 10000, 4)
         ))
         
@@ -2483,12 +2538,12 @@ def calculate_tall_drawers_bottom_rail_top_doors_unit(
     # عرض: العمق - بعد المفحار - سمك الظهر
     extra_shelf_width = depth_cm - settings.router_distance - settings.router_thickness
     extra_shelf_length = width_cm - (board_thickness * 2)
-    parts.append(Part(
+    parts.append(PartSpec(
         name="intermediate_shelf",
         width_cm=extra_shelf_width,
         height_cm=extra_shelf_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=False, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=False, left=True, right=True),
         area_m2=round((extra_shelf_width * extra_shelf_length) / 10000, 4)
     ))
     
@@ -2500,12 +2555,12 @@ def calculate_tall_drawers_bottom_rail_top_doors_unit(
         drawer_width_length = width_cm - 8.4
         drawer_width_width = drawer_height_cm
         drawer_width_qty = drawer_count * 2
-        parts.append(Part(
+        parts.append(PartSpec(
             name="drawer_width",
             width_cm=drawer_width_width,
             height_cm=drawer_width_length,
             qty=drawer_width_qty,
-            edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
             area_m2=round((drawer_width_width * drawer_width_length * drawer_width_qty) / 10000, 4)
         ))
         
@@ -2516,12 +2571,12 @@ def calculate_tall_drawers_bottom_rail_top_doors_unit(
         drawer_depth_length = depth_cm - 8.0
         drawer_depth_width = drawer_height_cm
         drawer_depth_qty = drawer_count * 2
-        parts.append(Part(
+        parts.append(PartSpec(
             name="drawer_depth",
             width_cm=drawer_depth_width,
             height_cm=drawer_depth_length,
             qty=drawer_depth_qty,
-            edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
             area_m2=round((drawer_depth_width * drawer_depth_length * drawer_depth_qty) / 10000, 4)
         ))
         
@@ -2531,12 +2586,12 @@ def calculate_tall_drawers_bottom_rail_top_doors_unit(
         # عرض: عرض الوحدة - 6,4 سم
         drawer_bottom_length = depth_cm - 10.0
         drawer_bottom_width = width_cm - 6.4
-        parts.append(Part(
+        parts.append(PartSpec(
             name="drawer_bottom",
             width_cm=drawer_bottom_width,
             height_cm=drawer_bottom_length,
             qty=drawer_count,
-            edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+            edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
             area_m2=round((drawer_bottom_width * drawer_bottom_length * drawer_count) / 10000, 4)
         ))
         
@@ -2550,12 +2605,12 @@ def calculate_tall_drawers_bottom_rail_top_doors_unit(
         one_drawer_front_height = (bottom_door_height / drawer_count) - settings.handle_profile_height - 0.5
         drawer_front_width = width_cm - settings.door_width_deduction_no_edge
         
-        parts.append(Part(
+        parts.append(PartSpec(
             name="drawer_front",
             width_cm=drawer_front_width,
             height_cm=one_drawer_front_height,
             qty=drawer_count,
-            edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
             area_m2=round((drawer_front_width * one_drawer_front_height * drawer_count) / 10000, 4)
         ))
 
@@ -2566,13 +2621,13 @@ def calculate_tall_drawers_bottom_rail_top_doors_unit(
     back_width = width_cm - settings.back_deduction
     back_height = height_cm - settings.back_deduction
     back_thickness = settings.router_thickness
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_panel",
         width_cm=back_width,
         height_cm=back_height,
         depth_cm=back_thickness,
         qty=1,
-        edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+        edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
         area_m2=round((back_width * back_height) / 10000, 4)
     ))
 
@@ -2589,12 +2644,12 @@ def calculate_tall_drawers_bottom_rail_top_doors_unit(
             # I'll use profile height.
             top_door_height = height_cm - bottom_door_height - settings.handle_profile_height
             
-            parts.append(Part(
+            parts.append(PartSpec(
                 name="top_door_hinged",
                 width_cm=door_width,
                 height_cm=top_door_height,
                 qty=door_count,
-                edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+                edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
                 area_m2=round((door_width * top_door_height * door_count) / 10000, 4)
             ))
             
@@ -2612,12 +2667,12 @@ def calculate_tall_drawers_bottom_rail_top_doors_unit(
             
             top_door_height = ((height_cm - bottom_door_height) / door_count) - settings.handle_profile_height - 0.4
             
-            parts.append(Part(
+            parts.append(PartSpec(
                 name="top_door_flip",
                 width_cm=flip_door_width,
                 height_cm=top_door_height,
                 qty=door_count,
-                edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+                edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
                 area_m2=round((flip_door_width * top_door_height * door_count) / 10000, 4)
             ))
 
@@ -2638,7 +2693,7 @@ def calculate_tall_drawers_side_appliances_doors_unit(
     microwave_height: float,
     vent_height: float,
     settings: SettingsModel
-) -> List[Part]:
+) -> List[PartSpec]:
     """
     حساب أجزاء دولاب ادراج مجرى جانبية + أجهزة + ضلف
     
@@ -2676,12 +2731,12 @@ def calculate_tall_drawers_side_appliances_doors_unit(
         # تجميع بجانبين كاملين
         base_length = width_cm - (board_thickness * 2)
 
-    parts.append(Part(
+    parts.append(PartSpec(
         name="base",
         width_cm=base_width,
         height_cm=base_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((base_width * base_length) / 10000, 4)
     ))
     
@@ -2698,12 +2753,12 @@ def calculate_tall_drawers_side_appliances_doors_unit(
         # سقف بين الجنبين
         top_length = width_cm - (board_thickness * 2)
 
-    parts.append(Part(
+    parts.append(PartSpec(
         name="top_ceiling",
         width_cm=top_width,
         height_cm=top_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((top_width * top_length) / 10000, 4)
     ))
     
@@ -2721,12 +2776,12 @@ def calculate_tall_drawers_side_appliances_doors_unit(
         # الجناب كاملة
         side_height = height_cm
 
-    parts.append(Part(
+    parts.append(PartSpec(
         name="side_panel",
         width_cm=side_width,
         height_cm=side_height,
         qty=2,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((side_width * side_height * 2) / 10000, 4)
     ))
     
@@ -2738,12 +2793,12 @@ def calculate_tall_drawers_side_appliances_doors_unit(
     if regular_shelf_count > 0:
         shelf_width = depth_cm - settings.shelf_depth_deduction
         shelf_length = width_cm - (board_thickness * 2)
-        parts.append(Part(
+        parts.append(PartSpec(
             name="shelf",
             width_cm=shelf_width,
             height_cm=shelf_length,
             qty=regular_shelf_count,
-            edge_distribution=EdgeDistribution(top=True, bottom=False, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=False, left=True, right=True),
             area_m2=round((shelf_width * shelf_length * regular_shelf_count) / 10000, 4)
         ))
         
@@ -2754,12 +2809,12 @@ def calculate_tall_drawers_side_appliances_doors_unit(
     extra_shelf_count = 3
     extra_shelf_width = depth_cm - settings.router_distance - settings.router_thickness
     extra_shelf_length = width_cm - (board_thickness * 2)
-    parts.append(Part(
+    parts.append(PartSpec(
         name="appliance_shelf",
         width_cm=extra_shelf_width,
         height_cm=extra_shelf_length,
         qty=extra_shelf_count,
-        edge_distribution=EdgeDistribution(top=True, bottom=False, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=False, left=True, right=True),
         area_m2=round((extra_shelf_width * extra_shelf_length * extra_shelf_count) / 10000, 4)
     ))
     
@@ -2771,12 +2826,12 @@ def calculate_tall_drawers_side_appliances_doors_unit(
         drawer_width_length = width_cm - (board_thickness * 2) - 2.6 - (board_thickness * 2)
         drawer_width_width = drawer_height_cm
         drawer_width_qty = drawer_count * 2
-        parts.append(Part(
+        parts.append(PartSpec(
             name="drawer_width",
             width_cm=drawer_width_width,
             height_cm=drawer_width_length,
             qty=drawer_width_qty,
-            edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
             area_m2=round((drawer_width_width * drawer_width_length * drawer_width_qty) / 10000, 4)
         ))
         
@@ -2787,12 +2842,12 @@ def calculate_tall_drawers_side_appliances_doors_unit(
         drawer_depth_length = depth_cm - 8.0
         drawer_depth_width = drawer_height_cm
         drawer_depth_qty = drawer_count * 2
-        parts.append(Part(
+        parts.append(PartSpec(
             name="drawer_depth",
             width_cm=drawer_depth_width,
             height_cm=drawer_depth_length,
             qty=drawer_depth_qty,
-            edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
             area_m2=round((drawer_depth_width * drawer_depth_length * drawer_depth_qty) / 10000, 4)
         ))
         
@@ -2803,12 +2858,12 @@ def calculate_tall_drawers_side_appliances_doors_unit(
         # عرض: عرض الوحدة - سمك الجانبين - 2.6 - تخصيم الظهر
         drawer_bottom_length = depth_cm - 10.0
         drawer_bottom_width = width_cm - (board_thickness * 2) - 2.6 - settings.back_deduction
-        parts.append(Part(
+        parts.append(PartSpec(
             name="drawer_bottom",
             width_cm=drawer_bottom_width,
             height_cm=drawer_bottom_length,
             qty=drawer_count,
-            edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+            edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
             area_m2=round((drawer_bottom_width * drawer_bottom_length * drawer_count) / 10000, 4)
         ))
         
@@ -2818,12 +2873,12 @@ def calculate_tall_drawers_side_appliances_doors_unit(
         # عرض: العرض-تخصيم عرض الضلفة بدون شريط
         one_drawer_front_height = (bottom_door_height / drawer_count) - settings.handle_profile_height - 0.5
         drawer_front_width = width_cm - settings.door_width_deduction_no_edge
-        parts.append(Part(
+        parts.append(PartSpec(
             name="drawer_front",
             width_cm=drawer_front_width,
             height_cm=one_drawer_front_height,
             qty=drawer_count,
-            edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
             area_m2=round((drawer_front_width * one_drawer_front_height * drawer_count) / 10000, 4)
         ))
 
@@ -2834,13 +2889,13 @@ def calculate_tall_drawers_side_appliances_doors_unit(
     back_width = width_cm - settings.back_deduction
     back_height = height_cm - settings.back_deduction
     back_thickness = settings.router_thickness
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_panel",
         width_cm=back_width,
         height_cm=back_height,
         depth_cm=back_thickness,
         qty=1,
-        edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+        edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
         area_m2=round((back_width * back_height) / 10000, 4)
     ))
 
@@ -2850,12 +2905,12 @@ def calculate_tall_drawers_side_appliances_doors_unit(
     # عرض: العرض - تخصيم عرض الضلف بدون شريط
     vent_part_height = vent_height - 0.2
     vent_part_width = width_cm - settings.door_width_deduction_no_edge
-    parts.append(Part(
+    parts.append(PartSpec(
         name="vent_panel",
         width_cm=vent_part_width,
         height_cm=vent_part_height,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((vent_part_width * vent_part_height) / 10000, 4)
     ))
 
@@ -2871,12 +2926,12 @@ def calculate_tall_drawers_side_appliances_doors_unit(
             # المفصلي: الارتفاع Available
             top_door_height = available_height
             
-            parts.append(Part(
+            parts.append(PartSpec(
                 name="top_door_hinged",
                 width_cm=door_width,
                 height_cm=top_door_height,
                 qty=door_count,
-                edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+                edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
                 area_m2=round((door_width * top_door_height * door_count) / 10000, 4)
             ))
         else:
@@ -2886,12 +2941,12 @@ def calculate_tall_drawers_side_appliances_doors_unit(
             flip_door_width = width_cm - settings.door_width_deduction_no_edge
             top_door_height = (available_height / door_count) - settings.handle_profile_height - 0.4
             
-            parts.append(Part(
+            parts.append(PartSpec(
                 name="top_door_flip",
                 width_cm=flip_door_width,
                 height_cm=top_door_height,
                 qty=door_count,
-                edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+                edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
                 area_m2=round((flip_door_width * top_door_height * door_count) / 10000, 4)
             ))
 
@@ -2912,7 +2967,7 @@ def calculate_tall_drawers_bottom_appliances_doors_top_unit(
     microwave_height: float,
     vent_height: float,
     settings: SettingsModel
-) -> List[Part]:
+) -> List[PartSpec]:
     """
     حساب أجزاء دولاب ادراج مجرة سفلية + أجهزة + ضلف علوية
     
@@ -2950,12 +3005,12 @@ def calculate_tall_drawers_bottom_appliances_doors_top_unit(
         # تجميع بجانبين كاملين
         base_length = width_cm - (board_thickness * 2)
 
-    parts.append(Part(
+    parts.append(PartSpec(
         name="base",
         width_cm=base_width,
         height_cm=base_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((base_width * base_length) / 10000, 4)
     ))
     
@@ -2972,12 +3027,12 @@ def calculate_tall_drawers_bottom_appliances_doors_top_unit(
         # سقف بين الجنبين
         top_length = width_cm - (board_thickness * 2)
 
-    parts.append(Part(
+    parts.append(PartSpec(
         name="top_ceiling",
         width_cm=top_width,
         height_cm=top_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((top_width * top_length) / 10000, 4)
     ))
     
@@ -2995,12 +3050,12 @@ def calculate_tall_drawers_bottom_appliances_doors_top_unit(
         # الجناب كاملة
         side_height = height_cm
 
-    parts.append(Part(
+    parts.append(PartSpec(
         name="side_panel",
         width_cm=side_width,
         height_cm=side_height,
         qty=2,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((side_width * side_height * 2) / 10000, 4)
     ))
     
@@ -3012,12 +3067,12 @@ def calculate_tall_drawers_bottom_appliances_doors_top_unit(
     if regular_shelf_count > 0:
         shelf_width = depth_cm - settings.shelf_depth_deduction
         shelf_length = width_cm - (board_thickness * 2)
-        parts.append(Part(
+        parts.append(PartSpec(
             name="shelf",
             width_cm=shelf_width,
             height_cm=shelf_length,
             qty=regular_shelf_count,
-            edge_distribution=EdgeDistribution(top=True, bottom=False, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=False, left=True, right=True),
             area_m2=round((shelf_width * shelf_length * regular_shelf_count) / 10000, 4)
         ))
         
@@ -3028,12 +3083,12 @@ def calculate_tall_drawers_bottom_appliances_doors_top_unit(
     extra_shelf_count = 3
     extra_shelf_width = depth_cm - settings.router_distance - settings.router_thickness
     extra_shelf_length = width_cm - (board_thickness * 2)
-    parts.append(Part(
+    parts.append(PartSpec(
         name="appliance_shelf",
         width_cm=extra_shelf_width,
         height_cm=extra_shelf_length,
         qty=extra_shelf_count,
-        edge_distribution=EdgeDistribution(top=True, bottom=False, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=False, left=True, right=True),
         area_m2=round((extra_shelf_width * extra_shelf_length * extra_shelf_count) / 10000, 4)
     ))
     
@@ -3045,12 +3100,12 @@ def calculate_tall_drawers_bottom_appliances_doors_top_unit(
         drawer_width_length = width_cm - 8.4
         drawer_width_width = drawer_height_cm
         drawer_width_qty = drawer_count * 2
-        parts.append(Part(
+        parts.append(PartSpec(
             name="drawer_width",
             width_cm=drawer_width_width,
             height_cm=drawer_width_length,
             qty=drawer_width_qty,
-            edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
             area_m2=round((drawer_width_width * drawer_width_length * drawer_width_qty) / 10000, 4)
         ))
         
@@ -3061,12 +3116,12 @@ def calculate_tall_drawers_bottom_appliances_doors_top_unit(
         drawer_depth_length = depth_cm - 8.0
         drawer_depth_width = drawer_height_cm
         drawer_depth_qty = drawer_count * 2
-        parts.append(Part(
+        parts.append(PartSpec(
             name="drawer_depth",
             width_cm=drawer_depth_width,
             height_cm=drawer_depth_length,
             qty=drawer_depth_qty,
-            edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
             area_m2=round((drawer_depth_width * drawer_depth_length * drawer_depth_qty) / 10000, 4)
         ))
         
@@ -3076,12 +3131,12 @@ def calculate_tall_drawers_bottom_appliances_doors_top_unit(
         # عرض: عرض الوحدة - 6.4 (User wrote 6,4 cm, likely full width minus 6.4)
         drawer_bottom_length = depth_cm - 10.0
         drawer_bottom_width = width_cm - 6.4
-        parts.append(Part(
+        parts.append(PartSpec(
             name="drawer_bottom",
             width_cm=drawer_bottom_width,
             height_cm=drawer_bottom_length,
             qty=drawer_count,
-            edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+            edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
             area_m2=round((drawer_bottom_width * drawer_bottom_length * drawer_count) / 10000, 4)
         ))
         
@@ -3091,12 +3146,12 @@ def calculate_tall_drawers_bottom_appliances_doors_top_unit(
         # عرض: العرض-تخصيم عرض الضلفة بدون شريط
         one_drawer_front_height = (bottom_door_height / drawer_count) - settings.handle_profile_height - 0.5
         drawer_front_width = width_cm - settings.door_width_deduction_no_edge
-        parts.append(Part(
+        parts.append(PartSpec(
             name="drawer_front",
             width_cm=drawer_front_width,
             height_cm=one_drawer_front_height,
             qty=drawer_count,
-            edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
             area_m2=round((drawer_front_width * one_drawer_front_height * drawer_count) / 10000, 4)
         ))
 
@@ -3107,13 +3162,13 @@ def calculate_tall_drawers_bottom_appliances_doors_top_unit(
     back_width = width_cm - settings.back_deduction
     back_height = height_cm - settings.back_deduction
     back_thickness = settings.router_thickness
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_panel",
         width_cm=back_width,
         height_cm=back_height,
         depth_cm=back_thickness,
         qty=1,
-        edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+        edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
         area_m2=round((back_width * back_height) / 10000, 4)
     ))
 
@@ -3123,12 +3178,12 @@ def calculate_tall_drawers_bottom_appliances_doors_top_unit(
     # عرض: العرض - تخصيم عرض الضلف بدون شريط
     vent_part_height = vent_height - 0.2
     vent_part_width = width_cm - settings.door_width_deduction_no_edge
-    parts.append(Part(
+    parts.append(PartSpec(
         name="vent_panel",
         width_cm=vent_part_width,
         height_cm=vent_part_height,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((vent_part_width * vent_part_height) / 10000, 4)
     ))
 
@@ -3147,12 +3202,12 @@ def calculate_tall_drawers_bottom_appliances_doors_top_unit(
             # المفصلي:
             top_door_height = available_height - settings.handle_profile_height
             
-            parts.append(Part(
+            parts.append(PartSpec(
                 name="top_door_hinged",
                 width_cm=door_width,
                 height_cm=top_door_height,
                 qty=door_count,
-                edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+                edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
                 area_m2=round((door_width * top_door_height * door_count) / 10000, 4)
             ))
         else:
@@ -3162,12 +3217,12 @@ def calculate_tall_drawers_bottom_appliances_doors_top_unit(
             flip_door_width = width_cm - settings.door_width_deduction_no_edge
             top_door_height = (available_height / door_count) - settings.handle_profile_height - 0.4
             
-            parts.append(Part(
+            parts.append(PartSpec(
                 name="top_door_flip",
                 width_cm=flip_door_width,
                 height_cm=top_door_height,
                 qty=door_count,
-                edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+                edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
                 area_m2=round((flip_door_width * top_door_height * door_count) / 10000, 4)
             ))
 
@@ -3180,7 +3235,7 @@ def calculate_two_small_20_one_large_side_unit(
     depth_cm: float,
     drawer_count: int,
     settings: SettingsModel
-) -> List[Part]:
+) -> List[PartSpec]:
     """
     حساب أجزاء وحدة 2 درج صغير 20 سم + درج كبير مجرى جانبية
     
@@ -3210,12 +3265,12 @@ def calculate_two_small_20_one_large_side_unit(
         # تجميع بجانبين كاملين
         base_length = width_cm - (board_thickness * 2)
 
-    parts.append(Part(
+    parts.append(PartSpec(
         name="base",
         width_cm=base_width,
         height_cm=base_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((base_width * base_length) / 10000, 4)
     ))
     
@@ -3231,12 +3286,12 @@ def calculate_two_small_20_one_large_side_unit(
     # I'll rely on settings typically having it, or default to 10.
     mirror_width = getattr(settings, 'mirror_width', 10.0)
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="front_rail_mirror",
         width_cm=mirror_width,
         height_cm=rail_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((mirror_width * rail_length) / 10000, 4)
     ))
     
@@ -3244,12 +3299,12 @@ def calculate_two_small_20_one_large_side_unit(
     # العدد: 1
     # طول: عرض - سمك الجنبين
     # عرض: عرض المرايا
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_rail_mirror",
         width_cm=mirror_width,
         height_cm=rail_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((mirror_width * rail_length) / 10000, 4)
     ))
 
@@ -3266,12 +3321,12 @@ def calculate_two_small_20_one_large_side_unit(
         # الجناب كاملة
         side_height = height_cm
 
-    parts.append(Part(
+    parts.append(PartSpec(
         name="side_panel",
         width_cm=side_width,
         height_cm=side_height,
         qty=2,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((side_width * side_height * 2) / 10000, 4)
     ))
     
@@ -3283,12 +3338,12 @@ def calculate_two_small_20_one_large_side_unit(
     small_drawer_side_length = width_cm - (board_thickness * 2) - 2.6 - (board_thickness * 2)
     small_drawer_side_width = 12.0
     small_drawer_side_qty = small_drawer_count * 2
-    parts.append(Part(
+    parts.append(PartSpec(
         name="small_drawer_width_side",
         width_cm=small_drawer_side_width,
         height_cm=small_drawer_side_length,
         qty=small_drawer_side_qty,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((small_drawer_side_width * small_drawer_side_length * small_drawer_side_qty) / 10000, 4)
     ))
     
@@ -3299,12 +3354,12 @@ def calculate_two_small_20_one_large_side_unit(
     small_drawer_depth_length = depth_cm - 8.0
     small_drawer_depth_width = 12.0
     small_drawer_depth_qty = small_drawer_count * 2
-    parts.append(Part(
+    parts.append(PartSpec(
         name="small_drawer_depth",
         width_cm=small_drawer_depth_width,
         height_cm=small_drawer_depth_length,
         qty=small_drawer_depth_qty,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((small_drawer_depth_width * small_drawer_depth_length * small_drawer_depth_qty) / 10000, 4)
     ))
     
@@ -3316,12 +3371,12 @@ def calculate_two_small_20_one_large_side_unit(
     large_drawer_side_length = width_cm - (board_thickness * 2) - 2.6 - (board_thickness * 2)
     large_drawer_side_width = height_cm - 46.0
     large_drawer_side_qty = large_drawer_count * 2
-    parts.append(Part(
+    parts.append(PartSpec(
         name="large_drawer_width_side",
         width_cm=large_drawer_side_width,
         height_cm=large_drawer_side_length,
         qty=large_drawer_side_qty,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((large_drawer_side_width * large_drawer_side_length * large_drawer_side_qty) / 10000, 4)
     ))
     
@@ -3332,12 +3387,12 @@ def calculate_two_small_20_one_large_side_unit(
     large_drawer_depth_length = depth_cm - 8.0
     large_drawer_depth_width = height_cm - 46.0
     large_drawer_depth_qty = large_drawer_count * 2
-    parts.append(Part(
+    parts.append(PartSpec(
         name="large_drawer_depth",
         width_cm=large_drawer_depth_width,
         height_cm=large_drawer_depth_length,
         qty=large_drawer_depth_qty,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((large_drawer_depth_width * large_drawer_depth_length * large_drawer_depth_qty) / 10000, 4)
     ))
     
@@ -3348,13 +3403,13 @@ def calculate_two_small_20_one_large_side_unit(
     back_width = width_cm - settings.back_deduction
     back_height = height_cm - settings.back_deduction
     back_thickness = settings.router_thickness
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_panel",
         width_cm=back_width,
         height_cm=back_height,
         depth_cm=back_thickness,
         qty=1,
-        edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+        edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
         area_m2=round((back_width * back_height) / 10000, 4)
     ))
     
@@ -3365,12 +3420,12 @@ def calculate_two_small_20_one_large_side_unit(
     total_drawers = 3
     drawer_bottom_length = depth_cm - 10.0
     drawer_bottom_width = width_cm - (board_thickness * 2) - 2.6 - settings.back_deduction
-    parts.append(Part(
+    parts.append(PartSpec(
         name="drawer_bottom",
         width_cm=drawer_bottom_width,
         height_cm=drawer_bottom_length,
         qty=total_drawers,
-        edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+        edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
         area_m2=round((drawer_bottom_width * drawer_bottom_length * total_drawers) / 10000, 4)
     ))
     
@@ -3380,12 +3435,12 @@ def calculate_two_small_20_one_large_side_unit(
     # عرض: العرض-تخصيم عرض الضلفة بدون شريط
     small_front_height = 19.6 - settings.handle_profile_height
     front_width = width_cm - settings.door_width_deduction_no_edge
-    parts.append(Part(
+    parts.append(PartSpec(
         name="small_drawer_front",
         width_cm=front_width,
         height_cm=small_front_height,
         qty=2,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((front_width * small_front_height * 2) / 10000, 4)
     ))
     
@@ -3394,12 +3449,12 @@ def calculate_two_small_20_one_large_side_unit(
     # طول: H - 40 - Profile - 0.5
     # عرض: العرض-تخصيم عرض الضلفة بدون شريط
     large_front_height = height_cm - 40.0 - settings.handle_profile_height - 0.5
-    parts.append(Part(
+    parts.append(PartSpec(
         name="large_drawer_front",
         width_cm=front_width,
         height_cm=large_front_height,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((front_width * large_front_height) / 10000, 4)
     ))
 
@@ -3412,7 +3467,7 @@ def calculate_two_small_20_one_large_bottom_unit(
     depth_cm: float,
     drawer_count: int,
     settings: SettingsModel
-) -> List[Part]:
+) -> List[PartSpec]:
     """
     حساب أجزاء وحدة 2 درج صغير 20 سم + درج كبير مجرى سفلية
     
@@ -3442,12 +3497,12 @@ def calculate_two_small_20_one_large_bottom_unit(
         # تجميع بجانبين كاملين
         base_length = width_cm - (board_thickness * 2)
 
-    parts.append(Part(
+    parts.append(PartSpec(
         name="base",
         width_cm=base_width,
         height_cm=base_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((base_width * base_length) / 10000, 4)
     ))
     
@@ -3458,12 +3513,12 @@ def calculate_two_small_20_one_large_bottom_unit(
     rail_length = width_cm - (board_thickness * 2)
     mirror_width = getattr(settings, 'mirror_width', 10.0)
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="front_rail_mirror",
         width_cm=mirror_width,
         height_cm=rail_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((mirror_width * rail_length) / 10000, 4)
     ))
     
@@ -3471,12 +3526,12 @@ def calculate_two_small_20_one_large_bottom_unit(
     # العدد: 1
     # طول: عرض - سمك الجنبين
     # عرض: عرض المرايا
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_rail_mirror",
         width_cm=mirror_width,
         height_cm=rail_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((mirror_width * rail_length) / 10000, 4)
     ))
 
@@ -3493,12 +3548,12 @@ def calculate_two_small_20_one_large_bottom_unit(
         # الجناب كاملة
         side_height = height_cm
 
-    parts.append(Part(
+    parts.append(PartSpec(
         name="side_panel",
         width_cm=side_width,
         height_cm=side_height,
         qty=2,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((side_width * side_height * 2) / 10000, 4)
     ))
     
@@ -3510,12 +3565,12 @@ def calculate_two_small_20_one_large_bottom_unit(
     small_drawer_box_length = width_cm - (board_thickness * 2)
     small_drawer_box_width = 12.0
     small_drawer_box_qty = small_drawer_count * 2
-    parts.append(Part(
+    parts.append(PartSpec(
         name="small_drawer_width_box",
         width_cm=small_drawer_box_width,
         height_cm=small_drawer_box_length,
         qty=small_drawer_box_qty,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((small_drawer_box_width * small_drawer_box_length * small_drawer_box_qty) / 10000, 4)
     ))
     
@@ -3526,12 +3581,12 @@ def calculate_two_small_20_one_large_bottom_unit(
     small_drawer_depth_length = depth_cm - 8.0
     small_drawer_depth_width = 12.0
     small_drawer_depth_qty = small_drawer_count * 2
-    parts.append(Part(
+    parts.append(PartSpec(
         name="small_drawer_depth",
         width_cm=small_drawer_depth_width,
         height_cm=small_drawer_depth_length,
         qty=small_drawer_depth_qty,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((small_drawer_depth_width * small_drawer_depth_length * small_drawer_depth_qty) / 10000, 4)
     ))
     
@@ -3543,12 +3598,12 @@ def calculate_two_small_20_one_large_bottom_unit(
     large_drawer_box_length = width_cm - (board_thickness * 2)
     large_drawer_box_width = height_cm - 46.0
     large_drawer_box_qty = large_drawer_count * 2
-    parts.append(Part(
+    parts.append(PartSpec(
         name="large_drawer_width_box",
         width_cm=large_drawer_box_width,
         height_cm=large_drawer_box_length,
         qty=large_drawer_box_qty,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((large_drawer_box_width * large_drawer_box_length * large_drawer_box_qty) / 10000, 4)
     ))
     
@@ -3559,12 +3614,12 @@ def calculate_two_small_20_one_large_bottom_unit(
     large_drawer_depth_length = depth_cm - 8.0
     large_drawer_depth_width = height_cm - 46.0
     large_drawer_depth_qty = large_drawer_count * 2
-    parts.append(Part(
+    parts.append(PartSpec(
         name="large_drawer_depth",
         width_cm=large_drawer_depth_width,
         height_cm=large_drawer_depth_length,
         qty=large_drawer_depth_qty,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((large_drawer_depth_width * large_drawer_depth_length * large_drawer_depth_qty) / 10000, 4)
     ))
     
@@ -3575,13 +3630,13 @@ def calculate_two_small_20_one_large_bottom_unit(
     back_width = width_cm - settings.back_deduction
     back_height = height_cm - settings.back_deduction
     back_thickness = settings.router_thickness
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_panel",
         width_cm=back_width,
         height_cm=back_height,
         depth_cm=back_thickness,
         qty=1,
-        edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+        edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
         area_m2=round((back_width * back_height) / 10000, 4)
     ))
     
@@ -3593,12 +3648,12 @@ def calculate_two_small_20_one_large_bottom_unit(
     total_drawers = 3
     drawer_bottom_length = depth_cm - 10.0
     drawer_bottom_width = width_cm - 6.4
-    parts.append(Part(
+    parts.append(PartSpec(
         name="drawer_bottom",
         width_cm=drawer_bottom_width,
         height_cm=drawer_bottom_length,
         qty=total_drawers,
-        edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+        edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
         area_m2=round((drawer_bottom_width * drawer_bottom_length * total_drawers) / 10000, 4)
     ))
     
@@ -3608,12 +3663,12 @@ def calculate_two_small_20_one_large_bottom_unit(
     # عرض: العرض-تخصيم عرض الضلفة بدون شريط
     small_front_height = 19.6 - settings.handle_profile_height
     front_width = width_cm - settings.door_width_deduction_no_edge
-    parts.append(Part(
+    parts.append(PartSpec(
         name="small_drawer_front",
         width_cm=front_width,
         height_cm=small_front_height,
         qty=2,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((front_width * small_front_height * 2) / 10000, 4)
     ))
     
@@ -3622,12 +3677,12 @@ def calculate_two_small_20_one_large_bottom_unit(
     # طول: ارتفاع الوحدة - تخصيم ارتفاع الضلفة بدون شريط - 40 - ارتفاع قطاع المقبض ان وجد -.5
     # عرض: العرض-تخصيم عرض الضلفة بدون شريط
     large_front_height = height_cm - 40.0 - settings.handle_profile_height - 0.5
-    parts.append(Part(
+    parts.append(PartSpec(
         name="large_drawer_front",
         width_cm=front_width,
         height_cm=large_front_height,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((front_width * large_front_height) / 10000, 4)
     ))
 
@@ -3640,7 +3695,7 @@ def calculate_one_small_16_two_large_side_unit(
     depth_cm: float,
     drawer_count: int,
     settings: SettingsModel
-) -> List[Part]:
+) -> List[PartSpec]:
     """
     حساب أجزاء وحدة درج صغير 16 سم + 2 درج كبير مجرى جانبية
     
@@ -3670,12 +3725,12 @@ def calculate_one_small_16_two_large_side_unit(
         # تجميع بجانبين كاملين
         base_length = width_cm - (board_thickness * 2)
 
-    parts.append(Part(
+    parts.append(PartSpec(
         name="base",
         width_cm=base_width,
         height_cm=base_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((base_width * base_length) / 10000, 4)
     ))
     
@@ -3686,12 +3741,12 @@ def calculate_one_small_16_two_large_side_unit(
     rail_length = width_cm - (board_thickness * 2)
     mirror_width = getattr(settings, 'mirror_width', 10.0)
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="front_rail_mirror",
         width_cm=mirror_width,
         height_cm=rail_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((mirror_width * rail_length) / 10000, 4)
     ))
     
@@ -3699,12 +3754,12 @@ def calculate_one_small_16_two_large_side_unit(
     # العدد: 1
     # طول: عرض - سمك الجنبين
     # عرض: عرض المرايا
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_rail_mirror",
         width_cm=mirror_width,
         height_cm=rail_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((mirror_width * rail_length) / 10000, 4)
     ))
 
@@ -3721,12 +3776,12 @@ def calculate_one_small_16_two_large_side_unit(
         # الجناب كاملة
         side_height = height_cm
 
-    parts.append(Part(
+    parts.append(PartSpec(
         name="side_panel",
         width_cm=side_width,
         height_cm=side_height,
         qty=2,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((side_width * side_height * 2) / 10000, 4)
     ))
     
@@ -3739,12 +3794,12 @@ def calculate_one_small_16_two_large_side_unit(
     small_drawer_side_width = 12.0
     small_drawer_side_qty = small_drawer_count * 2
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="small_drawer_width_side",
         width_cm=small_drawer_side_width,
         height_cm=small_drawer_side_length,
         qty=small_drawer_side_qty,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((small_drawer_side_width * small_drawer_side_length * small_drawer_side_qty) / 10000, 4)
     ))
     
@@ -3755,12 +3810,12 @@ def calculate_one_small_16_two_large_side_unit(
     small_drawer_depth_length = depth_cm - 8.0
     small_drawer_depth_width = 12.0
     small_drawer_depth_qty = small_drawer_count * 2
-    parts.append(Part(
+    parts.append(PartSpec(
         name="small_drawer_depth",
         width_cm=small_drawer_depth_width,
         height_cm=small_drawer_depth_length,
         qty=small_drawer_depth_qty,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((small_drawer_depth_width * small_drawer_depth_length * small_drawer_depth_qty) / 10000, 4)
     ))
     
@@ -3772,12 +3827,12 @@ def calculate_one_small_16_two_large_side_unit(
     large_drawer_side_length = width_cm - (board_thickness * 2) - 2.6 - (board_thickness * 2)
     large_drawer_side_width = height_cm - 46.0
     large_drawer_side_qty = large_drawer_count * 2
-    parts.append(Part(
+    parts.append(PartSpec(
         name="large_drawer_width_side",
         width_cm=large_drawer_side_width,
         height_cm=large_drawer_side_length,
         qty=large_drawer_side_qty,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((large_drawer_side_width * large_drawer_side_length * large_drawer_side_qty) / 10000, 4)
     ))
     
@@ -3788,12 +3843,12 @@ def calculate_one_small_16_two_large_side_unit(
     large_drawer_depth_length = depth_cm - 8.0
     large_drawer_depth_width = height_cm - 46.0
     large_drawer_depth_qty = large_drawer_count * 2
-    parts.append(Part(
+    parts.append(PartSpec(
         name="large_drawer_depth",
         width_cm=large_drawer_depth_width,
         height_cm=large_drawer_depth_length,
         qty=large_drawer_depth_qty,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((large_drawer_depth_width * large_drawer_depth_length * large_drawer_depth_qty) / 10000, 4)
     ))
     
@@ -3804,13 +3859,13 @@ def calculate_one_small_16_two_large_side_unit(
     back_width = width_cm - settings.back_deduction
     back_height = height_cm - settings.back_deduction
     back_thickness = settings.router_thickness
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_panel",
         width_cm=back_width,
         height_cm=back_height,
         depth_cm=back_thickness,
         qty=1,
-        edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+        edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
         area_m2=round((back_width * back_height) / 10000, 4)
     ))
     
@@ -3821,12 +3876,12 @@ def calculate_one_small_16_two_large_side_unit(
     total_drawers = 3
     drawer_bottom_length = depth_cm - 10.0
     drawer_bottom_width = width_cm - (board_thickness * 2) - 2.6 - settings.back_deduction
-    parts.append(Part(
+    parts.append(PartSpec(
         name="drawer_bottom",
         width_cm=drawer_bottom_width,
         height_cm=drawer_bottom_length,
         qty=total_drawers,
-        edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+        edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
         area_m2=round((drawer_bottom_width * drawer_bottom_length * total_drawers) / 10000, 4)
     ))
     
@@ -3836,12 +3891,12 @@ def calculate_one_small_16_two_large_side_unit(
     # عرض: العرض-تخصيم عرض الضلفة بدون شريط
     small_front_height = 19.6 - settings.handle_profile_height
     front_width = width_cm - settings.door_width_deduction_no_edge
-    parts.append(Part(
+    parts.append(PartSpec(
         name="small_drawer_front",
         width_cm=front_width,
         height_cm=small_front_height,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((front_width * small_front_height * 1) / 10000, 4)
     ))
     
@@ -3868,12 +3923,12 @@ def calculate_one_small_16_two_large_side_unit(
     
     large_front_height = ((height_cm - 20.0) / 2) - settings.handle_profile_height - 0.5
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="large_drawer_front",
         width_cm=front_width,
         height_cm=large_front_height,
         qty=2,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((front_width * large_front_height * 2) / 10000, 4)
     ))
 
@@ -3886,7 +3941,7 @@ def calculate_one_small_16_two_large_bottom_unit(
     depth_cm: float,
     drawer_count: int,
     settings: SettingsModel
-) -> List[Part]:
+) -> List[PartSpec]:
     """
     حساب أجزاء وحدة درج صغير 16 سم + 2 درج كبير مجرى سفلية
     
@@ -3916,12 +3971,12 @@ def calculate_one_small_16_two_large_bottom_unit(
         # تجميع بجانبين كاملين
         base_length = width_cm - (board_thickness * 2)
 
-    parts.append(Part(
+    parts.append(PartSpec(
         name="base",
         width_cm=base_width,
         height_cm=base_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((base_width * base_length) / 10000, 4)
     ))
     
@@ -3932,12 +3987,12 @@ def calculate_one_small_16_two_large_bottom_unit(
     rail_length = width_cm - (board_thickness * 2)
     mirror_width = getattr(settings, 'mirror_width', 10.0)
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="front_rail_mirror",
         width_cm=mirror_width,
         height_cm=rail_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((mirror_width * rail_length) / 10000, 4)
     ))
     
@@ -3945,12 +4000,12 @@ def calculate_one_small_16_two_large_bottom_unit(
     # العدد: 1
     # طول: عرض - سمك الجنبين
     # عرض: عرض المرايا
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_rail_mirror",
         width_cm=mirror_width,
         height_cm=rail_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((mirror_width * rail_length) / 10000, 4)
     ))
 
@@ -3967,12 +4022,12 @@ def calculate_one_small_16_two_large_bottom_unit(
         # الجناب كاملة
         side_height = height_cm
 
-    parts.append(Part(
+    parts.append(PartSpec(
         name="side_panel",
         width_cm=side_width,
         height_cm=side_height,
         qty=2,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((side_width * side_height * 2) / 10000, 4)
     ))
     
@@ -3985,12 +4040,12 @@ def calculate_one_small_16_two_large_bottom_unit(
     small_drawer_box_width = 12.0
     small_drawer_box_qty = small_drawer_count * 2
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="small_drawer_width_box",
         width_cm=small_drawer_box_width,
         height_cm=small_drawer_box_length,
         qty=small_drawer_box_qty,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((small_drawer_box_width * small_drawer_box_length * small_drawer_box_qty) / 10000, 4)
     ))
     
@@ -4001,12 +4056,12 @@ def calculate_one_small_16_two_large_bottom_unit(
     small_drawer_depth_length = depth_cm - 8.0
     small_drawer_depth_width = 12.0
     small_drawer_depth_qty = small_drawer_count * 2
-    parts.append(Part(
+    parts.append(PartSpec(
         name="small_drawer_depth",
         width_cm=small_drawer_depth_width,
         height_cm=small_drawer_depth_length,
         qty=small_drawer_depth_qty,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((small_drawer_depth_width * small_drawer_depth_length * small_drawer_depth_qty) / 10000, 4)
     ))
     
@@ -4018,12 +4073,12 @@ def calculate_one_small_16_two_large_bottom_unit(
     large_drawer_box_length = width_cm - (board_thickness * 2)
     large_drawer_box_width = height_cm - 46.0
     large_drawer_box_qty = large_drawer_count * 2
-    parts.append(Part(
+    parts.append(PartSpec(
         name="large_drawer_width_box",
         width_cm=large_drawer_box_width,
         height_cm=large_drawer_box_length,
         qty=large_drawer_box_qty,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((large_drawer_box_width * large_drawer_box_length * large_drawer_box_qty) / 10000, 4)
     ))
     
@@ -4034,12 +4089,12 @@ def calculate_one_small_16_two_large_bottom_unit(
     large_drawer_depth_length = depth_cm - 8.0
     large_drawer_depth_width = height_cm - 46.0
     large_drawer_depth_qty = large_drawer_count * 2
-    parts.append(Part(
+    parts.append(PartSpec(
         name="large_drawer_depth",
         width_cm=large_drawer_depth_width,
         height_cm=large_drawer_depth_length,
         qty=large_drawer_depth_qty,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((large_drawer_depth_width * large_drawer_depth_length * large_drawer_depth_qty) / 10000, 4)
     ))
     
@@ -4050,13 +4105,13 @@ def calculate_one_small_16_two_large_bottom_unit(
     back_width = width_cm - settings.back_deduction
     back_height = height_cm - settings.back_deduction
     back_thickness = settings.router_thickness
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_panel",
         width_cm=back_width,
         height_cm=back_height,
         depth_cm=back_thickness,
         qty=1,
-        edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+        edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
         area_m2=round((back_width * back_height) / 10000, 4)
     ))
     
@@ -4067,12 +4122,12 @@ def calculate_one_small_16_two_large_bottom_unit(
     total_drawers = 3
     drawer_bottom_length = depth_cm - 10.0
     drawer_bottom_width = width_cm - 6.4
-    parts.append(Part(
+    parts.append(PartSpec(
         name="drawer_bottom",
         width_cm=drawer_bottom_width,
         height_cm=drawer_bottom_length,
         qty=total_drawers,
-        edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+        edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
         area_m2=round((drawer_bottom_width * drawer_bottom_length * total_drawers) / 10000, 4)
     ))
     
@@ -4082,12 +4137,12 @@ def calculate_one_small_16_two_large_bottom_unit(
     # عرض: (العرض-تخصيم عرض الضلفة بدون شريط)
     small_front_height = 19.6 - settings.handle_profile_height
     front_width = width_cm - settings.door_width_deduction_no_edge
-    parts.append(Part(
+    parts.append(PartSpec(
         name="small_drawer_front",
         width_cm=front_width,
         height_cm=small_front_height,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((front_width * small_front_height * 1) / 10000, 4)
     ))
     
@@ -4097,12 +4152,12 @@ def calculate_one_small_16_two_large_bottom_unit(
     # عرض: العرض-تخصيم عرض الضلفة بدون شريط
     # Interpretation: ((H - 20) / 2) - Handle - 0.5
     large_front_height = ((height_cm - 20.0) / 2) - settings.handle_profile_height - 0.5
-    parts.append(Part(
+    parts.append(PartSpec(
         name="large_drawer_front",
         width_cm=front_width,
         height_cm=large_front_height,
         qty=2,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((front_width * large_front_height * 2) / 10000, 4)
     ))
 
@@ -4118,7 +4173,7 @@ def calculate_wall_microwave_unit(
     door_type: str,
     microwave_height: float,
     settings: SettingsModel
-) -> List[Part]:
+) -> List[PartSpec]:
     """
     حساب أجزاء وحدة علوي بها ميكرويف
     
@@ -4146,12 +4201,12 @@ def calculate_wall_microwave_unit(
     base_length = width_cm - (board_thickness * 2)
     base_width = depth_cm
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="base",
         width_cm=base_width,
         height_cm=base_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((base_width * base_length) / 10000, 4)
     ))
 
@@ -4163,12 +4218,12 @@ def calculate_wall_microwave_unit(
     top_length = width_cm - (board_thickness * 2)
     top_width = depth_cm
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="top_panel",
         width_cm=top_width,
         height_cm=top_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((top_width * top_length) / 10000, 4)
     ))
 
@@ -4179,12 +4234,12 @@ def calculate_wall_microwave_unit(
     side_height = height_cm
     side_width = depth_cm
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="side_panel",
         width_cm=side_width,
         height_cm=side_height,
         qty=2,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((side_width * side_height * 2) / 10000, 4)
     ))
 
@@ -4196,12 +4251,12 @@ def calculate_wall_microwave_unit(
     if regular_shelf_count > 0:
         shelf_length = width_cm - (board_thickness * 2)
         shelf_width = depth_cm - settings.shelf_depth_deduction
-        parts.append(Part(
+        parts.append(PartSpec(
             name="shelf",
             width_cm=shelf_width,
             height_cm=shelf_length,
             qty=regular_shelf_count,
-            edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
             area_m2=round((shelf_width * shelf_length * regular_shelf_count) / 10000, 4)
         ))
 
@@ -4213,12 +4268,12 @@ def calculate_wall_microwave_unit(
     special_shelf_length = width_cm - (board_thickness * 2)
     special_shelf_width = depth_cm - settings.router_distance - settings.router_thickness - 0.1
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="microwave_shelf",
         width_cm=special_shelf_width,
         height_cm=special_shelf_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((special_shelf_width * special_shelf_length) / 10000, 4)
     ))
 
@@ -4230,13 +4285,13 @@ def calculate_wall_microwave_unit(
     back_height = height_cm - settings.back_deduction
     back_thickness = settings.router_thickness
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_panel",
         width_cm=back_width,
         height_cm=back_height,
         depth_cm=back_thickness,
         qty=1,
-        edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+        edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
         area_m2=round((back_width * back_height) / 10000, 4)
     ))
     
@@ -4261,12 +4316,12 @@ def calculate_wall_microwave_unit(
         door_part_height = ((height_cm - microwave_height) / door_count) - settings.handle_profile_height - 0.5
         door_part_width = width_cm - settings.door_width_deduction_no_edge
         
-        parts.append(Part(
+        parts.append(PartSpec(
             name="flip_door",
             width_cm=door_part_width,
             height_cm=door_part_height,
             qty=door_count,
-            edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
             area_m2=round((door_part_width * door_part_height * door_count) / 10000, 4)
         ))
         
@@ -4279,12 +4334,12 @@ def calculate_wall_microwave_unit(
         door_part_height = height_cm - settings.handle_profile_height - microwave_height - 0.5
         door_part_width = (width_cm / door_count) - settings.door_width_deduction_no_edge
         
-        parts.append(Part(
+        parts.append(PartSpec(
             name="door",
             width_cm=door_part_width,
             height_cm=door_part_height,
             qty=door_count,
-            edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
             area_m2=round((door_part_width * door_part_height * door_count) / 10000, 4)
         ))
 
@@ -4298,7 +4353,7 @@ def calculate_tall_wooden_base_unit(
     shelf_count: int,
     door_count: int,
     settings: SettingsModel
-) -> List[Part]:
+) -> List[PartSpec]:
     """
     حساب أجزاء بلاكار قاعدة خشبية
     
@@ -4332,12 +4387,12 @@ def calculate_tall_wooden_base_unit(
         # Base is internal -> Width - 2*Thickness
         base_length = width_cm - (board_thickness * 2)
 
-    parts.append(Part(
+    parts.append(PartSpec(
         name="base",
         width_cm=base_width,
         height_cm=base_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((base_width * base_length) / 10000, 4)
     ))
 
@@ -4348,12 +4403,12 @@ def calculate_tall_wooden_base_unit(
     top_length = width_cm - (board_thickness * 2)
     top_width = depth_cm
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="top_panel",
         width_cm=top_width,
         height_cm=top_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((top_width * top_length) / 10000, 4)
     ))
 
@@ -4370,12 +4425,12 @@ def calculate_tall_wooden_base_unit(
         # Sides are Full Height
         side_height = height_cm
 
-    parts.append(Part(
+    parts.append(PartSpec(
         name="side_panel",
         width_cm=side_width,
         height_cm=side_height,
         qty=2,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((side_width * side_height * 2) / 10000, 4)
     ))
 
@@ -4386,12 +4441,12 @@ def calculate_tall_wooden_base_unit(
     if shelf_count > 0:
         shelf_length = width_cm - (board_thickness * 2)
         shelf_width = depth_cm - settings.shelf_depth_deduction
-        parts.append(Part(
+        parts.append(PartSpec(
             name="shelf",
             width_cm=shelf_width,
             height_cm=shelf_length,
             qty=shelf_count,
-            edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+            edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
             area_m2=round((shelf_width * shelf_length * shelf_count) / 10000, 4)
         ))
 
@@ -4410,13 +4465,13 @@ def calculate_tall_wooden_base_unit(
     back_height = height_cm - settings.back_deduction
     back_thickness = settings.router_thickness
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_panel",
         width_cm=back_width,
         height_cm=back_height,
         depth_cm=back_thickness,
         qty=1,
-        edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+        edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
         area_m2=round((back_width * back_height) / 10000, 4)
     ))
     
@@ -4437,12 +4492,12 @@ def calculate_tall_wooden_base_unit(
     door_part_height = height_cm - settings.handle_profile_height - 0.5
     door_part_width = (width_cm / door_count) - settings.door_width_deduction_no_edge
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="door",
         width_cm=door_part_width,
         height_cm=door_part_height,
         qty=door_count,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((door_part_width * door_part_height * door_count) / 10000, 4)
     ))
 
@@ -4454,7 +4509,7 @@ def calculate_three_turbo_unit(
     height_cm: float,
     depth_cm: float,
     settings: SettingsModel
-) -> List[Part]:
+) -> List[PartSpec]:
     """
     حساب أجزاء وحدة 3 تربو
     
@@ -4483,12 +4538,12 @@ def calculate_three_turbo_unit(
         # تجميع بجانبين كاملين
         base_length = width_cm - (board_thickness * 2)
 
-    parts.append(Part(
+    parts.append(PartSpec(
         name="base",
         width_cm=base_width,
         height_cm=base_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((base_width * base_length) / 10000, 4)
     ))
     
@@ -4499,12 +4554,12 @@ def calculate_three_turbo_unit(
     rail_length = width_cm - (board_thickness * 2)
     mirror_width = getattr(settings, 'mirror_width', 10.0)
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="front_rail_mirror",
         width_cm=mirror_width,
         height_cm=rail_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((mirror_width * rail_length) / 10000, 4)
     ))
     
@@ -4512,12 +4567,12 @@ def calculate_three_turbo_unit(
     # العدد: 1
     # طول: عرض - سمك الجنبين
     # عرض: عرض المرايا
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_rail_mirror",
         width_cm=mirror_width,
         height_cm=rail_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((mirror_width * rail_length) / 10000, 4)
     ))
 
@@ -4534,12 +4589,12 @@ def calculate_three_turbo_unit(
         # الجناب كاملة
         side_height = height_cm
 
-    parts.append(Part(
+    parts.append(PartSpec(
         name="side_panel",
         width_cm=side_width,
         height_cm=side_height,
         qty=2,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((side_width * side_height * 2) / 10000, 4)
     ))
     
@@ -4552,12 +4607,12 @@ def calculate_three_turbo_unit(
     drawer_box_width = mirror_width
     drawer_box_qty = 6
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="drawer_width_strip",
         width_cm=drawer_box_width,
         height_cm=drawer_box_length,
         qty=drawer_box_qty,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((drawer_box_width * drawer_box_length * drawer_box_qty) / 10000, 4)
     ))
     
@@ -4569,12 +4624,12 @@ def calculate_three_turbo_unit(
     drawer_depth_width = mirror_width
     drawer_depth_qty = 6
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="drawer_depth_strip",
         width_cm=drawer_depth_width,
         height_cm=drawer_depth_length,
         qty=drawer_depth_qty,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((drawer_depth_width * drawer_depth_length * drawer_depth_qty) / 10000, 4)
     ))
     
@@ -4585,13 +4640,13 @@ def calculate_three_turbo_unit(
     back_width = width_cm - settings.back_deduction
     back_height = height_cm - settings.back_deduction
     back_thickness = settings.router_thickness
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_panel",
         width_cm=back_width,
         height_cm=back_height,
         depth_cm=back_thickness,
         qty=1,
-        edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+        edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
         area_m2=round((back_width * back_height) / 10000, 4)
     ))
     
@@ -4633,12 +4688,12 @@ def calculate_three_turbo_unit(
     front_height = ((height_cm) / 3) - settings.handle_profile_height - 0.4
     front_width = width_cm - settings.door_width_deduction_no_edge
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="drawer_front",
         width_cm=front_width,
         height_cm=front_height,
         qty=3,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((front_width * front_height * 3) / 10000, 4)
     ))
 
@@ -4651,7 +4706,7 @@ def calculate_drawer_built_in_oven_unit(
     depth_cm: float,
     oven_height: float,
     settings: SettingsModel
-) -> List[Part]:
+) -> List[PartSpec]:
     """
     حساب أجزاء وحدة درج + فرن بيلت ان
     
@@ -4681,12 +4736,12 @@ def calculate_drawer_built_in_oven_unit(
         # تجميع بجانبين كاملين
         base_length = width_cm - (board_thickness * 2)
 
-    parts.append(Part(
+    parts.append(PartSpec(
         name="base",
         width_cm=base_width,
         height_cm=base_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((base_width * base_length) / 10000, 4)
     ))
     
@@ -4697,12 +4752,12 @@ def calculate_drawer_built_in_oven_unit(
     rail_length = width_cm - (board_thickness * 2)
     mirror_width = getattr(settings, 'mirror_width', 10.0)
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="front_rail_mirror",
         width_cm=mirror_width,
         height_cm=rail_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((mirror_width * rail_length) / 10000, 4)
     ))
     
@@ -4710,12 +4765,12 @@ def calculate_drawer_built_in_oven_unit(
     # العدد: 1
     # طول: عرض - سمك الجنبين
     # عرض: عرض المرايا
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_rail_mirror",
         width_cm=mirror_width,
         height_cm=rail_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((mirror_width * rail_length) / 10000, 4)
     ))
 
@@ -4732,12 +4787,12 @@ def calculate_drawer_built_in_oven_unit(
         # الجناب كاملة
         side_height = height_cm
 
-    parts.append(Part(
+    parts.append(PartSpec(
         name="side_panel",
         width_cm=side_width,
         height_cm=side_height,
         qty=2,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((side_width * side_height * 2) / 10000, 4)
     ))
     
@@ -4749,12 +4804,12 @@ def calculate_drawer_built_in_oven_unit(
     drawer_box_width = mirror_width
     drawer_box_qty = 2
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="drawer_width_strip",
         width_cm=drawer_box_width,
         height_cm=drawer_box_length,
         qty=drawer_box_qty,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((drawer_box_width * drawer_box_length * drawer_box_qty) / 10000, 4)
     ))
     
@@ -4766,12 +4821,12 @@ def calculate_drawer_built_in_oven_unit(
     drawer_depth_width = mirror_width
     drawer_depth_qty = 2
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="drawer_depth_strip",
         width_cm=drawer_depth_width,
         height_cm=drawer_depth_length,
         qty=drawer_depth_qty,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((drawer_depth_width * drawer_depth_length * drawer_depth_qty) / 10000, 4)
     ))
     
@@ -4789,12 +4844,12 @@ def calculate_drawer_built_in_oven_unit(
     drawer_bottom_length = 40.0 - settings.back_deduction # Swapped to be positive: 40 - ded.
     drawer_bottom_width = width_cm - (board_thickness * 2) - 2.6 - settings.back_deduction
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="drawer_bottom",
         width_cm=drawer_bottom_width,
         height_cm=drawer_bottom_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+        edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
         area_m2=round((drawer_bottom_width * drawer_bottom_length) / 10000, 4)
     ))
     
@@ -4811,12 +4866,12 @@ def calculate_drawer_built_in_oven_unit(
     front_height = height_cm - oven_height - settings.handle_profile_height - 0.5
     front_width = width_cm - settings.door_width_deduction_no_edge
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="drawer_front",
         width_cm=front_width,
         height_cm=front_height,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((front_width * front_height) / 10000, 4)
     ))
 
@@ -4829,7 +4884,7 @@ def calculate_drawer_bottom_rail_built_in_oven_unit(
     depth_cm: float,
     oven_height: float,
     settings: SettingsModel
-) -> List[Part]:
+) -> List[PartSpec]:
     """
     حساب أجزاء وحدة درج مجره سفلية+ فرن بيلت
     
@@ -4859,12 +4914,12 @@ def calculate_drawer_bottom_rail_built_in_oven_unit(
         # تجميع بجانبين كاملين
         base_length = width_cm - (board_thickness * 2)
 
-    parts.append(Part(
+    parts.append(PartSpec(
         name="base",
         width_cm=base_width,
         height_cm=base_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((base_width * base_length) / 10000, 4)
     ))
     
@@ -4875,12 +4930,12 @@ def calculate_drawer_bottom_rail_built_in_oven_unit(
     rail_length = width_cm - (board_thickness * 2)
     mirror_width = getattr(settings, 'mirror_width', 10.0)
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="front_rail_mirror",
         width_cm=mirror_width,
         height_cm=rail_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((mirror_width * rail_length) / 10000, 4)
     ))
     
@@ -4888,12 +4943,12 @@ def calculate_drawer_bottom_rail_built_in_oven_unit(
     # العدد: 1
     # طول: عرض - سمك الجنبين
     # عرض: عرض المرايا
-    parts.append(Part(
+    parts.append(PartSpec(
         name="back_rail_mirror",
         width_cm=mirror_width,
         height_cm=rail_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((mirror_width * rail_length) / 10000, 4)
     ))
 
@@ -4910,12 +4965,12 @@ def calculate_drawer_bottom_rail_built_in_oven_unit(
         # الجناب كاملة
         side_height = height_cm
 
-    parts.append(Part(
+    parts.append(PartSpec(
         name="side_panel",
         width_cm=side_width,
         height_cm=side_height,
         qty=2,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((side_width * side_height * 2) / 10000, 4)
     ))
     
@@ -4927,12 +4982,12 @@ def calculate_drawer_bottom_rail_built_in_oven_unit(
     drawer_box_width = mirror_width
     drawer_box_qty = 2
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="drawer_width_strip",
         width_cm=drawer_box_width,
         height_cm=drawer_box_length,
         qty=drawer_box_qty,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((drawer_box_width * drawer_box_length * drawer_box_qty) / 10000, 4)
     ))
     
@@ -4944,12 +4999,12 @@ def calculate_drawer_bottom_rail_built_in_oven_unit(
     drawer_depth_width = mirror_width
     drawer_depth_qty = 2
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="drawer_depth_strip",
         width_cm=drawer_depth_width,
         height_cm=drawer_depth_length,
         qty=drawer_depth_qty,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((drawer_depth_width * drawer_depth_length * drawer_depth_qty) / 10000, 4)
     ))
     
@@ -4965,12 +5020,12 @@ def calculate_drawer_bottom_rail_built_in_oven_unit(
     drawer_bottom_length = 40.0 - settings.back_deduction 
     drawer_bottom_width = width_cm - 6.4
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="drawer_bottom",
         width_cm=drawer_bottom_width,
         height_cm=drawer_bottom_length,
         qty=1,
-        edge_distribution=EdgeDistribution(top=False, bottom=False, left=False, right=False),
+        edge_distribution=EdgeSpec(top=False, bottom=False, left=False, right=False),
         area_m2=round((drawer_bottom_width * drawer_bottom_length) / 10000, 4)
     ))
     
@@ -4982,12 +5037,12 @@ def calculate_drawer_bottom_rail_built_in_oven_unit(
     front_height = height_cm - oven_height - settings.handle_profile_height - 0.5
     front_width = width_cm - settings.door_width_deduction_no_edge
     
-    parts.append(Part(
+    parts.append(PartSpec(
         name="drawer_front",
         width_cm=front_width,
         height_cm=front_height,
         qty=1,
-        edge_distribution=EdgeDistribution(top=True, bottom=True, left=True, right=True),
+        edge_distribution=EdgeSpec(top=True, bottom=True, left=True, right=True),
         area_m2=round((front_width * front_height) / 10000, 4)
     ))
 
@@ -0,0 +1,149 @@
+"""
+Unit Quota - عداد الوحدات الشهري بخانات يومية لكل مستخدم
+
+حد الوحدات الشهري كان count_documents على وحدات المستخدم في آخر 30 يوم مع
+كل حساب وحدة. الآن unit_quotas فيها مستند لكل مستخدم (_id = معرف المستخدم)
+بخانة لكل يوم (UTC):
+
+    {"_id": user_id, "days": {"2025-01-15": 3, ...}, "reconciled_at": ..., "updated_at": ...}
+
+- حفظ وحدة يزيد خانة يوم إنشائها، وحذف وحدات مشروع ينقصها، في تحديث ذري
+  واحد يحذف أيضاً الخانات الأقدم من QUOTA_BUCKET_DAYS (والخانات الصفرية)
+  فلا يكبر المستند مع الوقت.
+- العدد في آخر N يوم (N <= QUOTA_BUCKET_DAYS) هو مجموع خانات اليوم والأيام
+  N - 1 السابقة من قراءة واحدة بالـ _id. النافذة بالأيام الكاملة وليس بالثانية.
+- reconcile_unit_quotas تعيد بناء الخانات من units بـ aggregation (وتحذف
+  الخانات الأقدم من QUOTA_BUCKET_DAYS). تعمل كمهمة في الخلفية، ولمستخدم واحد
+  عند أول قراءة إذا لم يُبنى مستنده من قبل (reconciled_at).
+"""
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+# عدد الأيام المحفوظة في مستند المستخدم (فترات أطول تُحسب من units مباشرة)
+QUOTA_BUCKET_DAYS = 30
+QUOTA_DAY_FORMAT = "%Y-%m-%d"
+
+
+def quota_day(created_at: datetime) -> str:
+    """اسم خانة اليوم (UTC) لوحدة أنشئت في created_at"""
+    return created_at.strftime(QUOTA_DAY_FORMAT)
+
+
+def window_start_day(period_days: int, now: Optional[datetime] = None) -> datetime:
+    """بداية أول يوم في نافذة آخر period_days يوم (اليوم الحالي منها)"""
+    today = (now or datetime.utcnow()).replace(hour=0, minute=0, second=0, microsecond=0)
+    return today - timedelta(days=period_days - 1)
+
+
+def sum_quota_days(days: Dict[str, int], period_days: int, now: Optional[datetime] = None) -> int:
+    """مجموع خانات آخر period_days يوم (أسماء الخانات تترتب كتواريخ)"""
+    first_day = quota_day(window_start_day(period_days, now))
+    return sum(count for day, count in days.items() if day >= first_day)
+
+
+def increment_unit_quota_update(day_deltas: Dict[str, int], now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """
+    تحديث (pipeline) يضيف day_deltas لخانات الأيام ويحذف الخانات الأقدم من
+    QUOTA_BUCKET_DAYS والخانات الصفرية
+    """
+    now = now or datetime.utcnow()
+    first_day = quota_day(window_start_day(QUOTA_BUCKET_DAYS, now))
+    incremented = {
+        day: {"$add": [{"$ifNull": [f"$days.{day}", 0]}, delta]}
+        for day, delta in day_deltas.items()
+    }
+    return [{"$set": {
+        "days": {"$arrayToObject": {"$filter": {
+            "input": {"$objectToArray": {"$mergeObjects": [{"$ifNull": ["$days", {}]}, incremented]}},
+            "as": "day",
+            "cond": {"$and": [{"$gte": ["$$day.k", first_day]}, {"$ne": ["$$day.v", 0]}]}
+        }}},
+        "updated_at": now
+    }}]
+
+
+async def increment_unit_quota(db, user_id: Optional[str], day_deltas: Dict[str, int]) -> None:
+    """
+    تحديث ذري لخانات أيام المستخدم (المستند يُنشأ إذا لم يكن موجوداً)
+
+    الفشل لا يوقف حفظ أو حذف الوحدات، و reconcile_unit_quotas تصحح أي فرق.
+    """
+    if not user_id or not day_deltas:
+        return
+    try:
+        await db.unit_quotas.update_one(
+            {"_id": user_id},
+            increment_unit_quota_update(day_deltas),
+            upsert=True
+        )
+    except Exception as e:
+        print(f"WARNING: Could not update unit quota of user {user_id}: {e}")
+
+
+def unit_quota_pipeline(window_start: datetime, user_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    """aggregation على units: خانات الأيام لكل مستخدم منذ window_start"""
+    owner_match = {"created_by": user_id} if user_id else {"created_by": {"$ne": None}}
+    return [
+        {"$match": {**owner_match, "created_at": {"$gte": window_start}}},
+        {"$group": {
+            "_id": {
+                "user": "$created_by",
+                "day": {"$dateToString": {"format": QUOTA_DAY_FORMAT, "date": "$created_at"}}
+            },
+            "count": {"$sum": 1}
+        }},
+        {"$group": {"_id": "$_id.user", "days": {"$push": {"k": "$_id.day", "v": "$count"}}}},
+        {"$set": {"days": {"$arrayToObject": "$days"}}}
+    ]
+
+
+async def reconcile_unit_quotas(db, user_id: Optional[str] = None) -> int:
+    """
+    إعادة بناء خانات الأيام من units (كل المستخدمين أو مستخدم واحد)
+
+    الخانات الأقدم من QUOTA_BUCKET_DAYS تُحذف، ومستخدمون بدون وحدات في
+    النافذة تصبح خاناتهم فارغة. $inc أثناء إعادة البناء قد يضيع.
+
+    Returns:
+        عدد المستخدمين الذين لهم وحدات في النافذة
+    """
+    reconciled_at = datetime.utcnow()
+    pipeline = unit_quota_pipeline(window_start_day(QUOTA_BUCKET_DAYS, reconciled_at), user_id)
+    reconciled_fields = {"reconciled_at": reconciled_at, "updated_at": reconciled_at}
+
+    if user_id:
+        docs = await db.units.aggregate(pipeline).to_list(None)
+        days = docs[0]["days"] if docs else {}
+        await db.unit_quotas.replace_one({"_id": user_id}, {"days": days, **reconciled_fields}, upsert=True)
+        return len(docs)
+
+    pipeline += [
+        {"$set": {field: {"$literal": value} for field, value in reconciled_fields.items()}},
+        {"$merge": {"into": "unit_quotas", "on": "_id", "whenMatched": "replace", "whenNotMatched": "insert"}}
+    ]
+    await db.units.aggregate(pipeline).to_list(None)
+    # مستخدمون لم يكتب لهم $merge مستنداً (لا وحدات في النافذة)
+    await db.unit_quotas.update_many(
+        {"updated_at": {"$lt": reconciled_at}},
+        {"$set": {"days": {}, **reconciled_fields}}
+    )
+    return await db.unit_quotas.count_documents({"reconciled_at": reconciled_at, "days": {"$ne": {}}})
+
+
+async def count_recent_units(db, user_id: str, period_days: int = QUOTA_BUCKET_DAYS) -> int:
+    """
+    عدد وحدات المستخدم في آخر period_days يوم من خانات الأيام
+
+    فترة أطول من QUOTA_BUCKET_DAYS تُحسب بـ count_documents على units.
+    """
+    if period_days > QUOTA_BUCKET_DAYS:
+        return await db.units.count_documents({
+            "created_by": user_id,
+            "created_at": {"$gte": datetime.utcnow() - timedelta(days=period_days)}
+        })
+
+    quota_doc = await db.unit_quotas.find_one({"_id": user_id})
+    if quota_doc is None or quota_doc.get("reconciled_at") is None:
+        await reconcile_unit_quotas(db, user_id)
+        quota_doc = await db.unit_quotas.find_one({"_id": user_id}) or {}
+    return sum_quota_days(quota_doc.get("days", {}), period_days)
@@ -0,0 +1,60 @@
+"""
+Unit Recalculation - إعادة حساب الوحدات المحفوظة بعد تغيير الإعدادات
+
+الوحدة المحفوظة تحتفظ بمدخلات الطلب (request_inputs)، فيتم إعادة حساب
+القطع والإجماليات واستخدام المواد والتكلفة بالإعدادات الجديدة. الدوال هنا
+تستقبل وترجع بيانات بسيطة حتى تعمل في process pool المهام.
+"""
+from typing import Any, Dict, List, Tuple
+
+from app.models.settings import SettingsModel
+from app.models.units import UnitCalculateRequest
+from app.services.unit_calculators import (
+    calculate_material_usage,
+    calculate_unit_result,
+    estimate_material_costs
+)
+
+# عدد الوحدات في كل دفعة (قراءة من MongoDB + حساب + bulk_write)
+RECALCULATION_CHUNK_SIZE = 200
+
+
+def recalculate_unit_fields(request_inputs: Dict[str, Any], settings: SettingsModel) -> Dict[str, Any]:
+    """حقول الحساب في مستند الوحدة (بنفس شكل save_unit) من مدخلات الطلب"""
+    request = UnitCalculateRequest(**request_inputs)
+    result = calculate_unit_result(request.type.value, request.model_dump(mode="json"), settings)
+    parts = result.parts()
+    total_area = result.total_area_m2
+    total_edge_meters = result.total_edge_band_m
+    material_usage = calculate_material_usage(total_area, total_edge_meters, settings, result.specs)
+    cost_breakdown, total_cost = estimate_material_costs(material_usage, total_edge_meters, settings)
+
+    return {
+        "parts_calculated": [part.model_dump() for part in parts],
+        "edge_band_m": total_edge_meters,
+        "total_area_m2": total_area,
+        "material_usage": material_usage,
+        "price_estimate": total_cost,
+        "cost_breakdown": cost_breakdown
+    }
+
+
+def recalculate_units_chunk(
+    units: List[Tuple[str, Dict[str, Any]]],
+    settings_data: Dict[str, Any]
+) -> Dict[str, List[Any]]:
+    """
+    إعادة حساب دفعة وحدات [(unit_id, request_inputs)]
+
+    Returns:
+        {"updates": [(unit_id, fields)], "errors": [{"unit_id", "error"}]}
+    """
+    settings = SettingsModel(**settings_data)
+    updates = []
+    errors = []
+    for unit_id, request_inputs in units:
+        try:
+            updates.append((unit_id, recalculate_unit_fields(request_inputs, settings)))
+        except Exception as e:
+            errors.append({"unit_id": unit_id, "error": str(e)})
+    return {"updates": updates, "errors": errors}
@@ -0,0 +1,130 @@
+"""
+Unit Registry - سجل أنواع الوحدات ودوال حسابها
+
+كل نوع وحدة مسجل مع اسم دالة الحساب والمعاملات التي تستقبلها (بنفس أسماء
+حقول UnitCalculateRequest)، فيتم الاختيار بقراءة من dict بدل سلسلة if/elif،
+ويتم استدعاء أي دالة بنفس الطريقة. موديول الدوال لا يُستورد إلا عند أول
+استخدام لنوع مسجل فيه.
+"""
+import importlib
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Tuple
+
+from app.models.units import UnitType
+from app.models.settings import SettingsModel
+
+if TYPE_CHECKING:
+    from app.services.unit_calculators import PartSpec
+
+CALCULATORS_MODULE = "app.services.unit_calculators"
+
+
+@lru_cache(maxsize=None)
+def _load_function(module: str, function_name: str) -> Callable[..., List["PartSpec"]]:
+    return getattr(importlib.import_module(module), function_name)
+
+
+@dataclass(frozen=True)
+class UnitCalculatorSpec:
+    """تعريف دالة حساب نوع وحدة والمعاملات التي تحتاجها (بدون settings)"""
+    unit_type: UnitType
+    function_name: str
+    parameters: Tuple[str, ...]
+    module: str = CALCULATORS_MODULE
+
+    def load(self) -> Callable[..., List["PartSpec"]]:
+        """استيراد دالة الحساب (مرة واحدة فقط)"""
+        return _load_function(self.module, self.function_name)
+
+    def calculate(self, arguments: Mapping[str, Any], settings: SettingsModel) -> List["PartSpec"]:
+        """
+        حساب القطع من قاموس معاملات موحد
+
+        arguments يمكن أن يحتوي معاملات أكثر من المطلوب (مثل كل حقول الطلب)،
+        ويتم تمرير المعاملات المعلنة فقط.
+        """
+        calculator = self.load()
+        return calculator(
+            **{name: arguments[name] for name in self.parameters},
+            settings=settings
+        )
+
+
+def _spec(unit_type: UnitType, *parameters: str) -> UnitCalculatorSpec:
+    return UnitCalculatorSpec(
+        unit_type=unit_type,
+        function_name=f"calculate_{unit_type.value}_unit",
+        parameters=parameters
+    )
+
+
+_SPECS = [
+    _spec(UnitType.GROUND, "width_cm", "height_cm", "depth_cm", "shelf_count", "door_count"),
+    _spec(UnitType.GROUND_FIXED, "width_cm", "height_cm", "depth_cm", "shelf_count", "door_count", "fixed_part_cm"),
+    _spec(UnitType.SINK, "width_cm", "height_cm", "depth_cm", "shelf_count", "door_count"),
+    _spec(UnitType.SINK_FIXED, "width_cm", "height_cm", "depth_cm", "shelf_count", "door_count", "fixed_part_cm"),
+    _spec(UnitType.DRAWERS, "width_cm", "height_cm", "depth_cm", "shelf_count", "door_count",
+          "drawer_count", "drawer_height_cm"),
+    _spec(UnitType.DRAWERS_BOTTOM_RAIL, "width_cm", "height_cm", "depth_cm", "shelf_count", "door_count",
+          "drawer_count", "drawer_height_cm"),
+    _spec(UnitType.WALL, "width_cm", "height_cm", "depth_cm", "shelf_count", "door_count", "door_type"),
+    _spec(UnitType.WALL_FIXED, "width_cm", "height_cm", "depth_cm", "shelf_count", "door_count", "fixed_part_cm"),
+    _spec(UnitType.WALL_FLIP_TOP_DOORS_BOTTOM, "width_cm", "height_cm", "depth_cm", "shelf_count", "door_count",
+          "flip_door_height"),
+    _spec(UnitType.CORNER_L_WALL, "width_cm", "width_2_cm", "height_cm", "depth_cm", "depth_2_cm", "shelf_count"),
+    _spec(UnitType.WALL_MICROWAVE, "width_cm", "height_cm", "depth_cm", "shelf_count", "door_count", "door_type",
+          "microwave_height"),
+    _spec(UnitType.TALL_DOORS, "width_cm", "height_cm", "depth_cm", "shelf_count", "door_count", "bottom_door_height"),
+    _spec(UnitType.TALL_DOORS_APPLIANCES, "width_cm", "height_cm", "depth_cm", "shelf_count", "door_count",
+          "door_type", "bottom_door_height", "oven_height", "microwave_height", "vent_height"),
+    _spec(UnitType.TALL_DRAWERS_SIDE_DOORS_TOP, "width_cm", "height_cm", "depth_cm", "shelf_count", "door_count",
+          "door_type", "drawer_count", "drawer_height_cm", "bottom_door_height"),
+    _spec(UnitType.TALL_DRAWERS_BOTTOM_RAIL_TOP_DOORS, "width_cm", "height_cm", "depth_cm", "shelf_count",
+          "door_count", "door_type", "drawer_count", "drawer_height_cm", "bottom_door_height"),
+    _spec(UnitType.TALL_DRAWERS_SIDE_APPLIANCES_DOORS, "width_cm", "height_cm", "depth_cm", "shelf_count",
+          "door_count", "door_type", "drawer_count", "drawer_height_cm", "bottom_door_height", "oven_height",
+          "microwave_height", "vent_height"),
+    _spec(UnitType.TALL_DRAWERS_BOTTOM_APPLIANCES_DOORS_TOP, "width_cm", "height_cm", "depth_cm", "shelf_count",
+          "door_count", "door_type", "drawer_count", "drawer_height_cm", "bottom_door_height", "oven_height",
+          "microwave_height", "vent_height"),
+    _spec(UnitType.TWO_SMALL_20_ONE_LARGE_SIDE, "width_cm", "height_cm", "depth_cm", "drawer_count"),
+    _spec(UnitType.TWO_SMALL_20_ONE_LARGE_BOTTOM, "width_cm", "height_cm", "depth_cm", "drawer_count"),
+    _spec(UnitType.ONE_SMALL_16_TWO_LARGE_SIDE, "width_cm", "height_cm", "depth_cm", "drawer_count"),
+    _spec(UnitType.ONE_SMALL_16_TWO_LARGE_BOTTOM, "width_cm", "height_cm", "depth_cm", "drawer_count"),
+    _spec(UnitType.TALL_WOODEN_BASE, "width_cm", "height_cm", "depth_cm", "shelf_count", "door_count"),
+    _spec(UnitType.THREE_TURBO, "width_cm", "height_cm", "depth_cm"),
+    _spec(UnitType.DRAWER_BUILT_IN_OVEN, "width_cm", "height_cm", "depth_cm", "oven_height"),
+    _spec(UnitType.DRAWER_BOTTOM_RAIL_BUILT_IN_OVEN, "width_cm", "height_cm", "depth_cm", "oven_height"),
+]
+
+# unit_type (القيمة النصية) -> تعريف دالة الحساب
+UNIT_CALCULATORS: Dict[str, UnitCalculatorSpec] = {spec.unit_type.value: spec for spec in _SPECS}
+
+
+def get_unit_calculator(unit_type: str) -> UnitCalculatorSpec:
+    """
+    جلب تعريف دالة الحساب لنوع الوحدة
+
+    Raises:
+        ValueError: إذا لم يكن للنوع دالة حساب بعد
+    """
+    spec = UNIT_CALCULATORS.get(unit_type)
+    if spec is None:
+        raise ValueError(f"Unit type '{unit_type}' not implemented yet")
+    return spec
+
+
+def is_unit_type_implemented(unit_type: str) -> bool:
+    """هل لنوع الوحدة دالة حساب"""
+    return unit_type in UNIT_CALCULATORS
+
+
+def implemented_unit_types() -> List[UnitType]:
+    """أنواع الوحدات التي لها دالة حساب (بترتيب UnitType)"""
+    return [unit_type for unit_type in UnitType if unit_type.value in UNIT_CALCULATORS]
+
+
+def unimplemented_unit_types() -> List[UnitType]:
+    """أنواع الوحدات الموجودة في UnitType بدون دالة حساب"""
+    return [unit_type for unit_type in UnitType if unit_type.value not in UNIT_CALCULATORS]
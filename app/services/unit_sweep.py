@@ -0,0 +1,297 @@
+"""
+Unit Sweep - حساب نوع وحدة واحد على شبكة كاملة من المقاسات دفعة واحدة
+
+بدلاً من استدعاء calculate_unit_parts لكل مقاس (وإنشاء آلاف كائنات القطع)،
+يتم تشغيل نفس دوال الحساب في unit_calculators مرة واحدة لكل تركيبة أعداد
+(رفوف/ضلف/أدراج) مع تمرير العرض والارتفاع والعمق كمصفوفات NumPy.
+الأبعاد تعتمد على المقاسات بعمليات حسابية فقط، فتخرج كل قطعة كمصفوفات.
+"""
+import itertools
+import types
+from typing import List, Dict, Any, Optional
+
+import numpy as np
+
+from app.models.settings import SettingsModel
+from app.services import unit_calculators
+from app.services.unit_calculators import PartSpec, calculate_unit_parts
+from app.services.unit_registry import get_unit_calculator
+
+# أنواع الشريط التي تتطلب خصم 2 مم من بعض القطع (نفس calculate_unit_parts)
+EDGE_DEDUCTION_BANDING_TYPES = ["O", "OM", "C", "CM"]
+EDGE_DEDUCTION_CM = 0.2
+EDGE_DEDUCTION_PARTS = ["base", "shelf", "internal_shelf", "top", "unit_top", "internal_base"]
+
+# الحد الأقصى لعدد نقاط الشبكة في طلب واحد
+MAX_SWEEP_POINTS = 100_000
+
+
+def _round_scalar(value, ndigits):
+    return round(float(value), ndigits)
+
+_round_elementwise = np.frompyfunc(_round_scalar, 2, 1)
+
+
+def exact_round(value, ndigits=None):
+    """
+    round() يعطي نفس نتيجة بايثون حرفياً لكل عنصر
+
+    np.round يضرب ثم يقرب وقد يختلف عن round() في الخانة الأخيرة،
+    لذلك يتم التقريب عنصر بعنصر حتى تطابق النتائج الحساب العادي تماماً.
+    """
+    if isinstance(value, np.ndarray):
+        return _round_elementwise(value, ndigits).astype(np.float64)
+    return round(value, ndigits)
+
+
+def _build_array_calculators() -> Dict[str, Any]:
+    """
+    نسخة من دوال unit_calculators تعمل على المصفوفات
+
+    نفس كود الدوال (__code__) لكن مع namespace خاص يستبدل round بـ exact_round،
+    بدون تعديل الموديول الأصلي. الدوال تبني PartSpec (بدون تحقق) فتقبل المصفوفات.
+    """
+    namespace = dict(vars(unit_calculators))
+    namespace["round"] = exact_round
+
+    for name, value in list(namespace.items()):
+        if isinstance(value, types.FunctionType) and value.__module__ == unit_calculators.__name__:
+            namespace[name] = types.FunctionType(
+                value.__code__, namespace, name, value.__defaults__, value.__closure__
+            )
+    return namespace
+
+_ARRAY_CALCULATORS = _build_array_calculators()
+
+
+def _get_array_calculator(unit_type: str):
+    spec = get_unit_calculator(unit_type)
+    return _ARRAY_CALCULATORS[spec.function_name], spec.parameters
+
+
+def _as_array(value, size: int) -> np.ndarray:
+    if isinstance(value, np.ndarray):
+        return value
+    return np.full(size, value, dtype=np.float64)
+
+
+def _finish_parts(parts: List[PartSpec], size: int, settings: SettingsModel) -> None:
+    """تطبيق خصم الشريط وحساب متر الشريط لكل قطعة (نسخة مصفوفات من calculate_unit_parts)"""
+    for part in parts:
+        part.width_cm = _as_array(part.width_cm, size)
+        part.height_cm = _as_array(part.height_cm, size)
+        part.area_m2 = _as_array(part.area_m2 if part.area_m2 is not None else 0.0, size)
+
+    if settings.edge_banding_type and settings.edge_banding_type.value in EDGE_DEDUCTION_BANDING_TYPES:
+        for part in parts:
+            if part.name in EDGE_DEDUCTION_PARTS:
+                part.width_cm = np.where(
+                    part.width_cm > EDGE_DEDUCTION_CM,
+                    exact_round(part.width_cm - EDGE_DEDUCTION_CM, 2),
+                    part.width_cm
+                )
+                part.height_cm = np.where(
+                    part.height_cm > EDGE_DEDUCTION_CM,
+                    exact_round(part.height_cm - EDGE_DEDUCTION_CM, 2),
+                    part.height_cm
+                )
+                part.area_m2 = exact_round((part.width_cm * part.height_cm) / 10000, 4)
+
+    for part in parts:
+        perimeter_cm = np.zeros(size, dtype=np.float64)
+        if part.edge_distribution:
+            if part.edge_distribution.top: perimeter_cm = perimeter_cm + part.width_cm
+            if part.edge_distribution.bottom: perimeter_cm = perimeter_cm + part.width_cm
+            if part.edge_distribution.left: perimeter_cm = perimeter_cm + part.height_cm
+            if part.edge_distribution.right: perimeter_cm = perimeter_cm + part.height_cm
+        part.edge_band_m = exact_round(perimeter_cm / 100, 3)
+
+
+def _dimension_grid(widths_cm, heights_cm, depths_cm):
+    width_grid, height_grid, depth_grid = np.meshgrid(
+        np.asarray(widths_cm, dtype=np.float64),
+        np.asarray(heights_cm, dtype=np.float64),
+        np.asarray(depths_cm, dtype=np.float64),
+        indexing="ij"
+    )
+    return width_grid.ravel(), height_grid.ravel(), depth_grid.ravel()
+
+
+def sweep_unit_parts(
+    unit_type: str,
+    widths_cm: List[float],
+    heights_cm: List[float],
+    depths_cm: List[float],
+    settings: SettingsModel,
+    shelf_counts: List[int] = (2,),
+    door_counts: List[int] = (2,),
+    drawer_counts: List[int] = (0,),
+    door_type: str = "hinged",
+    flip_door_height: float = 0.0,
+    bottom_door_height: float = 0.0,
+    oven_height: float = 60.0,
+    microwave_height: float = 35.0,
+    vent_height: float = 10.0,
+    drawer_height_cm: float = 20.0,
+    fixed_part_cm: float = 0.0,
+    width_2_cm: float = 0.0,
+    depth_2_cm: float = 0.0
+) -> List[Dict[str, Any]]:
+    """
+    حساب قطع نوع وحدة واحد لكل نقاط الشبكة (عرض × ارتفاع × عمق)
+
+    يتم الحساب مرة واحدة لكل تركيبة (رفوف، ضلف، أدراج) لأن هذه الأعداد
+    تغير عدد القطع نفسها، أما المقاسات فتُحسب كلها معاً كمصفوفات.
+
+    Returns:
+        قائمة variants، لكل منها الأعداد المستخدمة ومصفوفات المقاسات (مسطحة
+        بترتيب عرض ثم ارتفاع ثم عمق) وقائمة القطع بمصفوفات الأبعاد والمساحة
+        ومتر الشريط، والإجماليات لكل نقطة. التركيبة غير الصالحة (مثل قسمة
+        على صفر) ترجع error بدون قطع.
+    """
+    calculator, parameter_names = _get_array_calculator(unit_type)
+
+    width_cm, height_cm, depth_cm = _dimension_grid(widths_cm, heights_cm, depths_cm)
+    size = width_cm.size
+
+    variants = []
+    for shelf_count, door_count, drawer_count in itertools.product(
+        shelf_counts, door_counts, drawer_counts
+    ):
+        arguments = {
+            "width_cm": width_cm,
+            "height_cm": height_cm,
+            "depth_cm": depth_cm,
+            "shelf_count": shelf_count,
+            "door_count": door_count,
+            "door_type": door_type,
+            "flip_door_height": flip_door_height,
+            "bottom_door_height": bottom_door_height,
+            "oven_height": oven_height,
+            "microwave_height": microwave_height,
+            "vent_height": vent_height,
+            "drawer_count": drawer_count,
+            "drawer_height_cm": drawer_height_cm,
+            "fixed_part_cm": fixed_part_cm,
+            "width_2_cm": width_2_cm,
+            "depth_2_cm": depth_2_cm,
+        }
+        variant = {
+            "shelf_count": shelf_count,
+            "door_count": door_count,
+            "drawer_count": drawer_count,
+            "width_cm": width_cm,
+            "height_cm": height_cm,
+            "depth_cm": depth_cm,
+            "parts": [],
+            "total_area_m2": np.zeros(size, dtype=np.float64),
+            "total_edge_band_m": np.zeros(size, dtype=np.float64),
+            "error": None,
+        }
+        try:
+            # القسمة على صفر (مثلاً door_count = 0) ترفع خطأ مثل الحساب العادي بدل inf
+            with np.errstate(divide="raise", invalid="raise"):
+                parts = calculator(
+                    **{name: arguments[name] for name in parameter_names},
+                    settings=settings
+                )
+                _finish_parts(parts, size, settings)
+        except (ZeroDivisionError, FloatingPointError) as e:
+            variant["error"] = f"Invalid combination for {unit_type}: {e}"
+            variants.append(variant)
+            continue
+
+        # نفس ترتيب الجمع في calculate_total_area / calculate_total_edge_band
+        total_area_m2 = np.zeros(size, dtype=np.float64)
+        total_edge_band_m = np.zeros(size, dtype=np.float64)
+        for part in parts:
+            total_area_m2 = total_area_m2 + part.area_m2
+            total_edge_band_m = total_edge_band_m + part.edge_band_m
+
+        variant["parts"] = parts
+        variant["total_area_m2"] = total_area_m2
+        variant["total_edge_band_m"] = total_edge_band_m
+        variants.append(variant)
+
+    return variants
+
+
+def verify_sweep_against_scalar(
+    unit_type: str,
+    widths_cm: List[float],
+    heights_cm: List[float],
+    depths_cm: List[float],
+    settings: SettingsModel,
+    **kwargs
+) -> List[str]:
+    """
+    مقارنة ناتج sweep_unit_parts مع calculate_unit_parts نقطة بنقطة
+
+    المقارنة بالتساوي التام (بدون tolerance).
+
+    Returns:
+        قائمة بالاختلافات (فارغة إذا تطابقت النتائج)
+    """
+    scalar_defaults = {
+        "door_type": "hinged",
+        "flip_door_height": 0.0,
+        "bottom_door_height": 0.0,
+        "oven_height": 60.0,
+        "microwave_height": 35.0,
+        "vent_height": 10.0,
+        "drawer_height_cm": 20.0,
+        "fixed_part_cm": 0.0,
+        "width_2_cm": 0.0,
+        "depth_2_cm": 0.0,
+    }
+    scalar_options = {
+        name: kwargs.get(name, default) for name, default in scalar_defaults.items()
+    }
+
+    mismatches = []
+    for variant in sweep_unit_parts(unit_type, widths_cm, heights_cm, depths_cm, settings, **kwargs):
+        for index in range(variant["width_cm"].size):
+            point = (
+                f"{unit_type} w={variant['width_cm'][index]} h={variant['height_cm'][index]} "
+                f"d={variant['depth_cm'][index]} shelves={variant['shelf_count']} "
+                f"doors={variant['door_count']} drawers={variant['drawer_count']}"
+            )
+            try:
+                expected = calculate_unit_parts(
+                    unit_type=unit_type,
+                    width_cm=float(variant["width_cm"][index]),
+                    height_cm=float(variant["height_cm"][index]),
+                    depth_cm=float(variant["depth_cm"][index]),
+                    shelf_count=variant["shelf_count"],
+                    door_count=variant["door_count"],
+                    drawer_count=variant["drawer_count"],
+                    settings=settings,
+                    **scalar_options
+                )
+            except ZeroDivisionError:
+                if variant["error"] is None:
+                    mismatches.append(f"{point}: scalar failed but sweep did not")
+                continue
+            if variant["error"] is not None:
+                mismatches.append(f"{point}: sweep failed but scalar did not")
+                continue
+
+            if len(expected) != len(variant["parts"]):
+                mismatches.append(f"{point}: {len(expected)} parts != {len(variant['parts'])}")
+                continue
+
+            for part, swept in zip(expected, variant["parts"]):
+                values = {
+                    "name": (part.name, swept.name),
+                    "qty": (part.qty, swept.qty),
+                    "width_cm": (part.width_cm, float(swept.width_cm[index])),
+                    "height_cm": (part.height_cm, float(swept.height_cm[index])),
+                    "area_m2": (part.area_m2 or 0, float(swept.area_m2[index])),
+                    "edge_band_m": (part.edge_band_m or 0, float(swept.edge_band_m[index])),
+                }
+                for field, (scalar_value, swept_value) in values.items():
+                    if scalar_value != swept_value:
+                        mismatches.append(
+                            f"{point} {part.name}.{field}: {scalar_value!r} != {swept_value!r}"
+                        )
+    return mismatches
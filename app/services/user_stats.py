@@ -0,0 +1,120 @@
+"""
+User Stats - إحصائيات لوحة التحكم لكل مستخدم في مستند واحد
+
+user_stats فيها مستند لكل مستخدم (_id = معرف المستخدم) بعدد المشاريع
+والوحدات وإجمالي المساحة ومتر الشريط والتكلفة، فتحميل لوحة التحكم قراءة
+واحدة بالـ _id بدلاً من المرور على كل وحدات المستخدم.
+
+- حفظ وحدة وإنشاء أو حذف مشروع (مع وحداته) يحدث المستند بـ $inc ذري.
+- rebuild_user_stats تعيد حساب المستندات من الصفر بـ aggregation واحد
+  (الوحدات + المشاريع عبر $unionWith ثم $merge). تعمل كمهمة في الخلفية
+  يطلبها المدير، ولمستخدم واحد عند أول تحميل للوحة التحكم إذا لم يُبنى
+  مستنده من قبل (rebuilt_at).
+- مهمة إعادة حساب الوحدات تطبق الفرق بين القيم القديمة والجديدة لكل وحدة.
+"""
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+# حقول الإحصائيات في مستند المستخدم
+USER_STATS_FIELDS = ["projects", "units", "total_area_m2", "edge_band_m", "total_cost"]
+
+
+def unit_stats_delta(unit_doc: Dict[str, Any], sign: int = 1) -> Dict[str, float]:
+    """التغيير في الإحصائيات عند إضافة (sign=1) أو حذف (sign=-1) وحدة"""
+    return {
+        "units": sign,
+        "total_area_m2": sign * (unit_doc.get("total_area_m2") or 0.0),
+        "edge_band_m": sign * (unit_doc.get("edge_band_m") or 0.0),
+        "total_cost": sign * (unit_doc.get("price_estimate") or 0.0)
+    }
+
+
+def sum_stats_deltas(deltas: Iterable[Dict[str, float]]) -> Dict[str, float]:
+    total: Dict[str, float] = {}
+    for delta in deltas:
+        for field, value in delta.items():
+            total[field] = total.get(field, 0) + value
+    return total
+
+
+async def increment_user_stats(db, user_id: Optional[str], delta: Dict[str, float]) -> None:
+    """
+    $inc ذري على مستند المستخدم (يُنشأ إذا لم يكن موجوداً)
+
+    الفشل لا يوقف العملية الأصلية (الوحدة أو المشروع محفوظ بالفعل)،
+    و rebuild_user_stats تصحح أي فرق.
+    """
+    if not user_id or not delta:
+        return
+    try:
+        await db.user_stats.update_one(
+            {"_id": user_id},
+            {"$inc": delta, "$set": {"updated_at": datetime.utcnow()}},
+            upsert=True
+        )
+    except Exception as e:
+        print(f"WARNING: Could not update stats of user {user_id}: {e}")
+
+
+def user_stats_rebuild_pipeline(rebuilt_at: datetime, user_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    aggregation على units يحسب مستند كل مستخدم ويكتبه في user_stats
+
+    الوحدات تُجمع بـ created_by، والمشاريع تُضاف بـ $unionWith، ثم
+    $merge يستبدل مستند كل مستخدم.
+    """
+    owner_match = {"created_by": user_id} if user_id else {"created_by": {"$ne": None}}
+    return [
+        {"$match": owner_match},
+        {"$group": {
+            "_id": "$created_by",
+            "units": {"$sum": 1},
+            "total_area_m2": {"$sum": "$total_area_m2"},
+            "edge_band_m": {"$sum": "$edge_band_m"},
+            "total_cost": {"$sum": "$price_estimate"}
+        }},
+        {"$unionWith": {"coll": "projects", "pipeline": [
+            {"$match": owner_match},
+            {"$group": {"_id": "$created_by", "projects": {"$sum": 1}}}
+        ]}},
+        {"$group": {"_id": "$_id", **{field: {"$sum": f"${field}"} for field in USER_STATS_FIELDS}}},
+        {"$set": {"updated_at": {"$literal": rebuilt_at}, "rebuilt_at": {"$literal": rebuilt_at}}},
+        {"$merge": {"into": "user_stats", "on": "_id", "whenMatched": "replace", "whenNotMatched": "insert"}}
+    ]
+
+
+async def rebuild_user_stats(db, user_id: Optional[str] = None) -> int:
+    """
+    إعادة حساب مستندات الإحصائيات (كل المستخدمين أو مستخدم واحد)
+
+    مستندات المستخدمين الذين لم يعد لهم مشاريع أو وحدات تُحذف. التحديثات
+    بـ $inc أثناء إعادة الحساب قد تضيع، فالأفضل تشغيلها في وقت هادئ.
+
+    Returns:
+        عدد مستندات الإحصائيات بعد إعادة الحساب
+    """
+    rebuilt_at = datetime.utcnow()
+    await db.units.aggregate(user_stats_rebuild_pipeline(rebuilt_at, user_id)).to_list(None)
+
+    # مستخدمون بدون وحدات أو مشاريع لم يكتب لهم $merge مستنداً جديداً
+    stale_query = {"updated_at": {"$lt": rebuilt_at}}
+    if user_id:
+        stale_query["_id"] = user_id
+    await db.user_stats.delete_many(stale_query)
+
+    return await db.user_stats.count_documents({"_id": user_id} if user_id else {})
+
+
+async def get_user_stats(db, user_id: str) -> Dict[str, Any]:
+    """
+    إحصائيات المستخدم بقراءة واحدة بالـ _id
+
+    إذا لم يُبنى المستند من قبل (مستخدم قديم أو مستند أنشأه $inc فقط)
+    تتم إعادة حسابه لهذا المستخدم أولاً.
+    """
+    stats_doc = await db.user_stats.find_one({"_id": user_id})
+    if stats_doc is None or stats_doc.get("rebuilt_at") is None:
+        await rebuild_user_stats(db, user_id)
+        stats_doc = await db.user_stats.find_one({"_id": user_id})
+    stats_doc = stats_doc or {}
+    return {field: stats_doc.get(field, 0) for field in USER_STATS_FIELDS}
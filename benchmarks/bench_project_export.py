@@ -0,0 +1,72 @@
+"""
+Benchmark - ذروة الذاكرة وزمن تصدير Excel للمشروع حسب عدد الوحدات
+
+Usage:
+    python -m benchmarks.bench_project_export [--units 10 100 1000]
+
+الوحدات تصل من async generator (مثل cursor الـ MongoDB) وكل وحدة لها قطع
+وحدة أرضي محسوبة. ذروة الذاكرة (tracemalloc) يجب أن تظل ثابتة تقريباً مع
+زيادة عدد الوحدات لأن الصفوف تُكتب مباشرة على ملفات مؤقتة.
+"""
+import argparse
+import asyncio
+import gc
+import os
+import time
+import tracemalloc
+from typing import Any, AsyncIterator, Dict, List
+
+from app.models.settings import SettingsModel
+from app.services.project_excel_export import create_export_file, remove_export_file, write_project_workbook
+from app.services.unit_calculators import calculate_unit_parts
+
+from benchmarks.bench_unit_calculators import UNIT_ARGUMENTS
+
+
+def get_unit_doc(index: int) -> Dict[str, Any]:
+    width_cm = 40.0 + index % 80
+    arguments = dict(UNIT_ARGUMENTS, width_cm=width_cm)
+    parts = calculate_unit_parts(unit_type="ground", settings=SettingsModel(), **arguments)
+    return {
+        "_id": str(index),
+        "type": "ground",
+        "width_cm": width_cm,
+        "height_cm": arguments["height_cm"],
+        "depth_cm": arguments["depth_cm"],
+        "parts_calculated": [part.model_dump() for part in parts]
+    }
+
+
+async def stream_units(count: int) -> AsyncIterator[Dict[str, Any]]:
+    for index in range(count):
+        yield get_unit_doc(index)
+
+
+def measure_export(units: int) -> List[float]:
+    path = create_export_file()
+    try:
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        asyncio.run(write_project_workbook(stream_units(units), path))
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return [elapsed * 1000, peak / 1024, os.path.getsize(path) / 1024]
+    finally:
+        remove_export_file(path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--units", type=int, nargs="+", default=[10, 100, 1000])
+    args = parser.parse_args()
+
+    print(f"{'units':>8} {'ms':>10} {'peak KB':>10} {'file KB':>10}")
+    for units in args.units:
+        elapsed_ms, peak_kb, file_kb = measure_export(units)
+        print(f"{units:>8} {elapsed_ms:>10.1f} {peak_kb:>10.1f} {file_kb:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark - زمن بداية التشغيل (استيراد app.main وأول استجابة)
+
+Usage:
+    python -m benchmarks.bench_startup [--repeat N]
+
+كل قياس في عملية بايثون جديدة (مثل بداية container أو إعادة تشغيل worker):
+زمن استيراد app.main، ثم زمن أول استجابة لـ GET /health ولأول طلب يحتاج
+دوال الحساب (POST /units/calculate بدون قاعدة بيانات). يتم القياس مرة بكل
+الـ routers ومرة بـ ENABLED_ROUTERS=auth,marketplace، مع الموديولات الثقيلة
+التي تم استيرادها قبل أول طلب.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+HEAVY_MODULES = ["openpyxl", "numpy", "app.services.unit_calculators"]
+
+MEASURE_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import app.main
+import_s = time.perf_counter() - start
+heavy = [name for name in {heavy!r} if name in sys.modules]
+
+from fastapi.testclient import TestClient
+client = TestClient(app.main.app)
+start = time.perf_counter()
+client.get("/health")
+health_s = time.perf_counter() - start
+
+calculate_s = None
+if any(route.path == "/units/calculate" for route in app.main.app.routes):
+    start = time.perf_counter()
+    client.post("/units/calculate", json={{"type": "ground", "width_cm": 80, "height_cm": 72, "depth_cm": 56}})
+    calculate_s = time.perf_counter() - start
+
+print(json.dumps({{"import_s": import_s, "health_s": health_s, "calculate_s": calculate_s, "heavy": heavy}}))
+"""
+
+
+def measure_once(enabled_routers: str) -> Dict:
+    """قياس واحد في عملية جديدة"""
+    environment = {**os.environ, "ENABLED_ROUTERS": enabled_routers, "PYTHONPATH": os.getcwd()}
+    output = subprocess.run(
+        [sys.executable, "-c", MEASURE_SCRIPT.format(heavy=HEAVY_MODULES)],
+        env=environment, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def median_ms(values: List[Optional[float]]) -> str:
+    values = [value for value in values if value is not None]
+    return f"{statistics.median(values) * 1000:10.1f}" if values else f"{'-':>10}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'routers':25}{'import ms':>10}{'health ms':>10}{'calc ms':>10}  heavy modules at startup")
+    for label, enabled_routers in [("all", ""), ("auth,marketplace", "auth,marketplace")]:
+        runs = [measure_once(enabled_routers) for _ in range(args.repeat)]
+        heavy = ", ".join(runs[-1]["heavy"]) or "none"
+        print(
+            f"{label:25}"
+            f"{median_ms([run['import_s'] for run in runs])}"
+            f"{median_ms([run['health_s'] for run in runs])}"
+            f"{median_ms([run['calculate_s'] for run in runs])}"
+            f"  {heavy}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark - زمن وتخصيص الذاكرة لحساب كل أنواع الوحدات
+
+Usage:
+    python -m benchmarks.bench_unit_calculators [--repeat N]
+
+لكل نوع وحدة له دالة حساب: متوسط الزمن وذروة الذاكرة (tracemalloc) لكل وحدة،
+مرة لـ calculate_unit_parts كاملة حتى قائمة Part العامة، ومرة للمحرك فقط
+(calculate_unit_part_specs بدون التحويل).
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from app.models.settings import SettingsModel
+from app.services.unit_calculators import calculate_unit_part_specs, calculate_unit_parts
+from app.services.unit_registry import implemented_unit_types
+
+UNIT_ARGUMENTS: Dict[str, Any] = {
+    "width_cm": 80.0,
+    "height_cm": 72.0,
+    "depth_cm": 56.0,
+    "shelf_count": 2,
+    "door_count": 2,
+    "door_type": "hinged",
+    "flip_door_height": 35.0,
+    "bottom_door_height": 80.0,
+    "oven_height": 60.0,
+    "microwave_height": 35.0,
+    "vent_height": 10.0,
+    "drawer_count": 3,
+    "drawer_height_cm": 20.0,
+    "fixed_part_cm": 10.0,
+    "width_2_cm": 60.0,
+    "depth_2_cm": 32.0,
+}
+
+
+def measure_time(run: Callable[[], Any], repeat: int) -> float:
+    """متوسط الزمن لكل استدعاء بالميكروثانية"""
+    run()  # warm up
+    gc.collect()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        run()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def measure_peak_bytes(run: Callable[[], Any]) -> int:
+    """ذروة الذاكرة المخصصة أثناء استدعاء واحد"""
+    gc.collect()
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    settings = SettingsModel(edge_banding_type="O")
+    columns = ["us/unit", "engine us", "peak KB", "engine KB"]
+    totals = [0.0] * len(columns)
+    print(f"{'unit type':45}" + "".join(f"{column:>11}" for column in columns))
+    for unit_type in implemented_unit_types():
+        def run_full() -> List[Any]:
+            return calculate_unit_parts(unit_type=unit_type.value, settings=settings, **UNIT_ARGUMENTS)
+
+        def run_engine() -> List[Any]:
+            return calculate_unit_part_specs(unit_type.value, UNIT_ARGUMENTS, settings)
+
+        row = [
+            measure_time(run_full, args.repeat),
+            measure_time(run_engine, args.repeat),
+            measure_peak_bytes(run_full) / 1024,
+            measure_peak_bytes(run_engine) / 1024,
+        ]
+        totals = [total + value for total, value in zip(totals, row)]
+        print(f"{unit_type.value:45}" + "".join(f"{value:11.1f}" for value in row))
+
+    count = len(implemented_unit_types())
+    print(f"{'mean':45}" + "".join(f"{total / count:11.1f}" for total in totals))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+"""
+Benchmark Suite - كل أنواع الوحدات على شبكة مقاسات وإعدادات مع مقارنة بـ baseline
+
+Usage:
+    python -m benchmarks.bench_unit_suite [--rounds 7] [--threshold 0.25]
+    python -m benchmarks.bench_unit_suite --save-baseline
+
+لكل (نوع وحدة، نسخة إعدادات) يتم تشغيل calculate_unit_parts على كل نقاط شبكة
+المقاسات، ويُسجل عدد العمليات في الثانية (أفضل جولة من rounds) وذروة الذاكرة
+المخصصة لكل استدعاء (tracemalloc) ومتوسط عدد الكتل المخصصة لكل استدعاء على
+الشبكة (sys.getallocatedblocks). نسخ الإعدادات: كل AssemblyMethod بدون
+خصم شريط، وكل edge_banding_type يخصم 2 مم مع طريقة التجميع الافتراضية.
+
+النتائج تُقارن بـ benchmarks/baseline_unit_suite.json ويخرج البرنامج بـ 1 إذا
+قلت السرعة أو زادت الذاكرة أو عدد الكتل بأكثر من threshold (الحالات المشتبه بها يُعاد
+قياسها مرة قبل الحكم عليها). السرعة تُقارن كنسبة لزمن حمل
+معايرة ثابت يُقاس بالتبادل مع كل حالة (relative_speed)، حتى لا يظهر اختلاف
+الجهاز أو تغير تردد المعالج كتراجع.
+"""
+import argparse
+import gc
+import itertools
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from app.models.settings import AssemblyMethod, EdgeBandingType, SettingsModel
+from app.services.unit_calculators import calculate_unit_parts
+from app.services.unit_registry import implemented_unit_types
+from benchmarks.bench_unit_calculators import UNIT_ARGUMENTS, measure_peak_bytes
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline_unit_suite.json")
+
+# شبكة المقاسات (سم): عرض × ارتفاع × عمق
+GRID_WIDTHS = [30.0, 45.0, 60.0, 80.0, 100.0, 120.0]
+GRID_HEIGHTS = [72.0, 90.0]
+GRID_DEPTHS = [32.0, 56.0]
+
+# أنواع الشريط التي تخصم 2 مم من مقاسات القطع
+DEDUCTION_EDGE_TYPES = [EdgeBandingType.O, EdgeBandingType.OM, EdgeBandingType.C, EdgeBandingType.CM]
+
+
+def grid_arguments() -> List[Dict[str, Any]]:
+    """مدخلات الوحدة لكل نقطة في شبكة المقاسات"""
+    return [
+        {**UNIT_ARGUMENTS, "width_cm": width, "height_cm": height, "depth_cm": depth}
+        for width, height, depth in itertools.product(GRID_WIDTHS, GRID_HEIGHTS, GRID_DEPTHS)
+    ]
+
+
+def settings_variants() -> Dict[str, SettingsModel]:
+    """اسم النسخة -> الإعدادات"""
+    variants = {
+        f"assembly={method.value}": SettingsModel(assembly_method=method, edge_banding_type=EdgeBandingType.NONE)
+        for method in AssemblyMethod
+    }
+    for edge_type in DEDUCTION_EDGE_TYPES:
+        variants[f"edge={edge_type.value}"] = SettingsModel(edge_banding_type=edge_type)
+    return variants
+
+
+def calibration_workload() -> float:
+    """حمل بايثون ثابت (dict + round + float) يُقاس بالتبادل مع كل حالة"""
+    total = 0.0
+    values: Dict[int, float] = {}
+    for index in range(3000):
+        values[index % 97] = round(index * 0.1, 2)
+        total += values[index % 97]
+    return total
+
+
+def measure_ops(run: Callable[[], Any], calls: int, rounds: int) -> Tuple[float, float]:
+    """
+    عدد الاستدعاءات في الثانية لأسرع جولة، وعددها لكل زمن حمل المعايرة
+
+    كل جولة تُقاس بجوار حمل المعايرة، فتغير سرعة المعالج أثناء التشغيل (أو جهاز
+    مختلف) يؤثر على الاثنين بنفس النسبة ولا يظهر كتراجع. النسبة هي الوسيط بين
+    الجولات حتى لا تؤثر جولة واحدة مشوشة.
+    """
+    run()  # warm up
+    gc.collect()
+    best_run = float("inf")
+    ratios = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        calibration_workload()
+        calibration_s = time.perf_counter() - start
+        start = time.perf_counter()
+        run()
+        run_s = time.perf_counter() - start
+        best_run = min(best_run, run_s)
+        ratios.append(calls * calibration_s / run_s)
+    return calls / best_run, statistics.median(ratios)
+
+
+def measure_allocated_blocks(calls: List[Callable[[], Any]]) -> float:
+    """
+    متوسط عدد الكتل المخصصة لكل استدعاء
+
+    النتائج تبقى محفوظة و gc متوقف أثناء القياس، فالفرق في
+    sys.getallocatedblocks هو كل ما خصصته الاستدعاءات وبقي حياً (القطع
+    والنماذج الناتجة)، والمؤقتات التي حُررت داخل الاستدعاء لا تُحسب.
+    """
+    for call in calls:
+        call()  # warm up (كاش الـ imports والـ validators)
+    gc.collect()
+    gc.disable()
+    try:
+        before = sys.getallocatedblocks()
+        kept = [call() for call in calls]
+        allocated = sys.getallocatedblocks() - before
+    finally:
+        gc.enable()
+    del kept
+    return allocated / len(calls)
+
+
+def measure_case(unit_type: str, settings: SettingsModel, rounds: int) -> Dict[str, float]:
+    """ops_per_sec و relative_speed و allocs_per_call على كل الشبكة، و peak_kb لأكبر مقاس"""
+    grid = grid_arguments()
+
+    def run_grid() -> None:
+        for arguments in grid:
+            calculate_unit_parts(unit_type=unit_type, settings=settings, **arguments)
+
+    def run_largest() -> None:
+        calculate_unit_parts(unit_type=unit_type, settings=settings, **grid[-1])
+
+    grid_calls = [
+        lambda arguments=arguments: calculate_unit_parts(unit_type=unit_type, settings=settings, **arguments)
+        for arguments in grid
+    ]
+
+    ops_per_sec, relative_speed = measure_ops(run_grid, len(grid), rounds)
+    return {
+        "ops_per_sec": round(ops_per_sec, 1),
+        "relative_speed": round(relative_speed, 3),
+        "peak_kb": round(measure_peak_bytes(run_largest) / 1024, 2),
+        "allocs_per_call": round(measure_allocated_blocks(grid_calls), 1),
+    }
+
+
+def run_suite(rounds: int) -> Dict[str, Dict[str, float]]:
+    """"نوع/نسخة" -> مقاييس الحالة"""
+    results: Dict[str, Dict[str, float]] = {}
+    for unit_type in implemented_unit_types():
+        for variant_name, settings in settings_variants().items():
+            results[f"{unit_type.value}/{variant_name}"] = measure_case(unit_type.value, settings, rounds)
+    return results
+
+
+def remeasure(results: Dict[str, Dict[str, float]], cases: Iterable[str], rounds: int) -> None:
+    """إعادة قياس حالات مشتبه بها والاحتفاظ بالأفضل (تجاهل تشويش لحظي)"""
+    variants = settings_variants()
+    for case in cases:
+        unit_type, variant_name = case.split("/", 1)
+        metrics = measure_case(unit_type, variants[variant_name], rounds)
+        results[case] = {
+            "ops_per_sec": max(results[case]["ops_per_sec"], metrics["ops_per_sec"]),
+            "relative_speed": max(results[case]["relative_speed"], metrics["relative_speed"]),
+            "peak_kb": min(results[case]["peak_kb"], metrics["peak_kb"]),
+            "allocs_per_call": min(results[case]["allocs_per_call"], metrics["allocs_per_call"]),
+        }
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float
+) -> List[Tuple[str, str, float, float]]:
+    """
+    الحالات التي تراجعت عن الـ baseline بأكثر من threshold
+
+    السرعة تُقارن بـ relative_speed (مستقلة عن سرعة الجهاز) والذاكرة بـ peak_kb
+    و allocs_per_call (baseline قديم بدون allocs_per_call لا يُقارن عدد الكتل).
+
+    Returns:
+        (الحالة، المقياس، القيمة الحالية، قيمة الـ baseline)
+    """
+    regressions = []
+    for case, baseline_metrics in baseline.items():
+        metrics = results.get(case)
+        if metrics is None:
+            continue
+        if metrics["relative_speed"] < baseline_metrics["relative_speed"] * (1 - threshold):
+            regressions.append((case, "relative_speed", metrics["relative_speed"], baseline_metrics["relative_speed"]))
+        if metrics["peak_kb"] > baseline_metrics["peak_kb"] * (1 + threshold):
+            regressions.append((case, "peak_kb", metrics["peak_kb"], baseline_metrics["peak_kb"]))
+        baseline_allocs = baseline_metrics.get("allocs_per_call")
+        if baseline_allocs is not None and metrics["allocs_per_call"] > baseline_allocs * (1 + threshold):
+            regressions.append((case, "allocs_per_call", metrics["allocs_per_call"], baseline_allocs))
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=7)
+    parser.add_argument("--threshold", type=float, default=0.25, help="أقصى تراجع مسموح (0.25 = 25%%)")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="حفظ النتائج كـ baseline جديد")
+    args = parser.parse_args()
+
+    baseline = None
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)["results"]
+
+    results = run_suite(args.rounds)
+    regressions = []
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            remeasure(results, sorted({case for case, *_ in regressions}), args.rounds * 2)
+            regressions = compare(results, baseline, args.threshold)
+
+    print(f"{'unit type / settings':70}{'ops/sec':>11}{'relative':>11}{'peak KB':>11}{'allocs':>11}")
+    for case, metrics in results.items():
+        print(
+            f"{case:70}{metrics['ops_per_sec']:11.1f}"
+            f"{metrics['relative_speed']:11.2f}{metrics['peak_kb']:11.1f}{metrics['allocs_per_call']:11.1f}"
+        )
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as baseline_file:
+            json.dump({
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "grid_points": len(grid_arguments()),
+                "results": results,
+            }, baseline_file, indent=2, sort_keys=True)
+            baseline_file.write("\n")
+        print(f"\nSaved baseline for {len(results)} cases to {args.baseline}")
+        return
+
+    if baseline is None:
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline first")
+        return
+
+    missing = sorted(set(baseline) - set(results))
+    if missing:
+        print(f"\nWARNING: {len(missing)} baseline cases were not run: {', '.join(missing)}")
+    if regressions:
+        print(f"\n{len(regressions)} regressions above {args.threshold:.0%}:")
+        for case, metric, value, expected in regressions:
+            print(f"  {case}: {metric} {value} (baseline {expected})")
+        sys.exit(1)
+    print(f"\nNo regressions above {args.threshold:.0%} ({len(results)} cases)")
+
+
+if __name__ == "__main__":
+    main()
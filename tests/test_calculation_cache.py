@@ -0,0 +1,89 @@
+import pytest
+from datetime import datetime
+from fastapi.testclient import TestClient
+from app.main import app
+from app.models.settings import SettingsModel
+from app.services.calculation_cache import (
+    CalculationCache,
+    CachedUnitCalculation,
+    calculation_key
+)
+
+client = TestClient(app)
+
+GROUND_ARGUMENTS = {
+    "width_cm": 60.0,
+    "height_cm": 72.0,
+    "depth_cm": 56.0,
+    "shelf_count": 2,
+    "door_count": 2,
+    "oven_height": 60.0
+}
+
+def make_entry(area: float) -> CachedUnitCalculation:
+    return CachedUnitCalculation(parts=(), total_area_m2=area, total_edge_band_m=0.0, material_usage={})
+
+def test_cache_evicts_least_recently_used():
+    """Test that the cache stays bounded and evicts the oldest unused entry"""
+    cache = CalculationCache(max_size=2)
+    cache.put("a", make_entry(1))
+    cache.put("b", make_entry(2))
+    assert cache.get("a").total_area_m2 == 1  # "a" becomes most recently used
+    cache.put("c", make_entry(3))
+    
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    
+    stats = cache.stats()
+    assert stats["size"] == 2
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 3
+    assert stats["misses"] == 1
+
+def test_get_or_compute_computes_once():
+    """Test that a repeated key is served from the cache"""
+    cache = CalculationCache(max_size=4)
+    calls = []
+    
+    def compute():
+        calls.append(1)
+        return make_entry(5)
+    
+    assert cache.get_or_compute("k", compute).total_area_m2 == 5
+    assert cache.get_or_compute("k", compute).total_area_m2 == 5
+    assert len(calls) == 1
+    
+    cache.clear()
+    cache.get_or_compute("k", compute)
+    assert len(calls) == 2
+
+def test_calculation_key_ignores_unused_fields():
+    """Test that fields the unit type does not use do not change the key"""
+    settings = SettingsModel()
+    key = calculation_key("ground", GROUND_ARGUMENTS, settings)
+    
+    assert calculation_key("ground", {**GROUND_ARGUMENTS, "oven_height": 80.0}, settings) == key
+    assert calculation_key("ground", {**GROUND_ARGUMENTS, "width_cm": 80.0}, settings) != key
+    assert calculation_key("sink", GROUND_ARGUMENTS, settings) != key
+
+def test_calculation_key_changes_with_settings_version():
+    """Test that updated settings never reuse old results"""
+    key = calculation_key("ground", GROUND_ARGUMENTS, SettingsModel())
+    
+    assert calculation_key("ground", GROUND_ARGUMENTS, SettingsModel(back_deduction=0.7)) != key
+    assert calculation_key(
+        "ground", GROUND_ARGUMENTS, SettingsModel(last_updated=datetime(2024, 1, 1))
+    ) != calculation_key(
+        "ground", GROUND_ARGUMENTS, SettingsModel(last_updated=datetime(2024, 1, 2))
+    )
+
+@pytest.mark.asyncio
+async def test_get_cache_stats():
+    """Test the cache statistics endpoint"""
+    response = client.get("/units/cache/stats")
+    assert response.status_code == 200
+    
+    data = response.json()
+    for field in ["size", "max_size", "hits", "misses", "evictions", "hit_rate"]:
+        assert field in data
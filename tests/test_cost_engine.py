@@ -0,0 +1,80 @@
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+import app.routers.units as units_router
+from app.models.edge_band import EdgeType
+from app.models.settings import SettingsModel
+from app.services.cost_engine import PriceTable, get_price_table
+from app.services.unit_calculators import estimate_material_costs
+
+client = TestClient(app)
+
+MATERIALS = {
+    "plywood_sheet": {"price_per_sheet": 2500},
+    "mdf_sheet": {"price_per_sheet": 1800},
+    "edge_band_per_meter": {"price_per_meter": 10},
+    "edge_band_wood_per_meter": {"price_per_meter": 25, "roll_length_m": 50, "price_per_roll": 900}
+}
+
+def test_price_table_is_compiled_once_per_settings_version():
+    """Test that the same settings version reuses its price table"""
+    settings = SettingsModel(version=7, materials=MATERIALS)
+
+    assert get_price_table(settings) is get_price_table(settings.model_copy())
+    assert get_price_table(settings) is not get_price_table(settings.model_copy(update={"version": 8}))
+
+def test_price_table_edge_rates_per_edge_type():
+    """Test per edge type rates with the general edge band rate as fallback"""
+    table = PriceTable.from_materials(SettingsModel(materials=MATERIALS).materials)
+
+    assert table.edge_rate() == 10
+    assert table.edge_rate(EdgeType.PVC) == 10
+    assert table.edge_rate(EdgeType.WOOD) == 25
+    assert table.roll_cost(EdgeType.WOOD, 2, 50) == 1800
+    assert table.roll_cost(EdgeType.PVC, 2, 100) == 2000  # no roll price: roll length x meter price
+
+@pytest.mark.parametrize("materials,expected_total", [
+    (MATERIALS, 2 * 2500 + 5.5 * 10),
+    ({"plywood_sheet": {"price_per_sheet": 2500}}, 5000),
+    ({}, 0.0)
+])
+def test_estimate_material_costs_uses_price_table(materials, expected_total):
+    """Test unit cost estimates from material usage"""
+    settings = SettingsModel(materials=materials)
+
+    cost_breakdown, total_cost = estimate_material_costs({"ألواح الخشب": 2.0, "شريط الحافة": 5.5}, 5.5, settings)
+
+    assert set(cost_breakdown) == {"ألواح الخشب", "شريط الحافة"}
+    assert total_cost == expected_total
+
+def test_unit_price_scenarios(monkeypatch):
+    """Test that every scenario prices the same quantities and the current row matches /units/estimate"""
+    async def get_settings_model():
+        return SettingsModel(materials=MATERIALS)
+
+    monkeypatch.setattr(units_router, "get_settings_model", get_settings_model)
+    unit = {"type": "ground", "width_cm": 80, "height_cm": 72, "depth_cm": 56}
+
+    estimate = client.post("/units/estimate", json=unit).json()
+    response = client.post("/units/price-scenarios", json={"unit": unit, "scenarios": [
+        {"name": "supplier_b", "plywood_price_per_sheet": 2000},
+        {"name": "plus_10", "price_factor": 1.1}
+    ]})
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["current"]["total_cost"] == estimate["total_cost"]
+    assert data["current"]["cost_breakdown"] == estimate["cost_breakdown"]
+    supplier_b, plus_10 = data["scenarios"]
+    assert supplier_b["cost_breakdown"]["ألواح الخشب"] == data["sheet_count"] * 2000
+    assert supplier_b["cost_breakdown"]["شريط الحافة"] == data["current"]["cost_breakdown"]["شريط الحافة"]
+    assert plus_10["total_cost"] == pytest.approx(estimate["total_cost"] * 1.1)
+    assert plus_10["difference"] == pytest.approx(estimate["total_cost"] * 0.1)
+
+def test_price_scenarios_rejects_empty_list():
+    """Test that at least one scenario is required"""
+    response = client.post("/units/price-scenarios", json={
+        "unit": {"type": "ground", "width_cm": 80, "height_cm": 72, "depth_cm": 56},
+        "scenarios": []
+    })
+    assert response.status_code == 422
@@ -0,0 +1,58 @@
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.models.settings import SettingsModel
+from app.services.cut_list import build_cut_list, cut_list_key, part_name_class
+from app.services.unit_calculators import calculate_unit_parts
+
+client = TestClient(app)
+
+def get_unit_doc(unit_id, width_cm):
+    parts = calculate_unit_parts(
+        unit_type="ground", width_cm=width_cm, height_cm=72, depth_cm=56,
+        shelf_count=2, door_count=2, door_type="hinged", flip_door_height=0,
+        bottom_door_height=0, oven_height=60, microwave_height=35, vent_height=5,
+        drawer_count=0, drawer_height_cm=0, fixed_part_cm=0, width_2_cm=0,
+        depth_2_cm=0, settings=SettingsModel()
+    )
+    return {"_id": unit_id, "parts_calculated": [part.model_dump() for part in parts]}
+
+def test_part_name_class_strips_numbering():
+    """Test that numbered parts share one name class"""
+    assert part_name_class("side_1") == "side"
+    assert part_name_class("drawer_2_bottom") == "drawer_bottom"
+    assert part_name_class("small_drawer_front") == "small_drawer_front"
+
+def test_float_noise_does_not_split_lines():
+    """Test that sizes equal to the millimeter share a merge key"""
+    noisy = {"name": "shelf", "width_cm": 76.4 + 1e-9, "height_cm": 51.0, "qty": 1}
+    clean = {"name": "shelf", "width_cm": 76.4, "height_cm": 50.99999999, "qty": 1}
+    assert cut_list_key(noisy) == cut_list_key(clean)
+
+def test_identical_units_merge_quantities():
+    """Test that two identical units give the same lines with doubled quantities"""
+    single = build_cut_list([get_unit_doc("a", 80)])
+    double = build_cut_list([get_unit_doc("a", 80), get_unit_doc("b", 80)])
+
+    assert len(double) == len(single)
+    for single_line, double_line in zip(single, double):
+        assert double_line.qty == 2 * single_line.qty
+        assert double_line.units_count == 2
+
+def test_different_units_keep_distinct_sizes():
+    """Test that parts with different sizes or edges are not merged"""
+    lines = build_cut_list([get_unit_doc("a", 80), get_unit_doc("b", 60)])
+    keys = [(line.name, line.width_cm, line.height_cm, line.thickness_cm, line.edge_distribution) for line in lines]
+    assert len(keys) == len(set(map(str, keys)))
+
+    total_qty = sum(
+        part["qty"]
+        for unit_doc in [get_unit_doc("a", 80), get_unit_doc("b", 60)]
+        for part in unit_doc["parts_calculated"]
+    )
+    assert sum(line.qty for line in lines) == total_qty
+
+def test_project_cut_list_requires_authentication():
+    """Test that the cut list is not available without a token"""
+    response = client.get("/projects/some-project/cut-list")
+    assert response.status_code == 401
@@ -207,3 +207,39 @@ async def test_edge_breakdown_different_edge_types(create_test_unit):
     assert all(p["edge_type"] == "pvc" for p in data_pvc["parts"])
     assert all(p["edge_type"] == "wood" for p in data_wood["parts"])
 
+
+def test_pack_strips_best_fit_decreasing():
+    """Test that strips share rolls and over-long strips take whole rolls"""
+    from app.services.edge_roll_optimizer import pack_strips
+    
+    # 700+300 and 600+400 fill two rolls exactly
+    assert pack_strips([300, 600, 700, 400], 1000) == (2, 2000)
+    # 2.5 rolls worth in one strip: two full rolls plus an open one
+    assert pack_strips([2500], 1000) == (3, 2500)
+    assert pack_strips([], 1000) == (0, 0)
+
+def test_plan_edge_rolls_costs_from_rolls():
+    """Test that edge band cost comes from whole rolls, not raw meters"""
+    from app.models.units import Part, EdgeDistribution
+    from app.models.settings import SettingsModel
+    from app.services.edge_band_calculator import calculate_edge_breakdown, calculate_edge_cost
+    from app.services.edge_roll_optimizer import plan_edge_rolls
+    
+    settings = SettingsModel(
+        edge_banding_waste_per_size=0,
+        materials={"edge_band_per_meter": {"price_per_meter": 5, "roll_length_m": 10, "price_per_roll": 40}}
+    )
+    # 4 edges of 1 m x 3 parts = 12 strips of 1 m -> 2 rolls of 10 m
+    parts = [Part(name="panel", width_cm=100, height_cm=100, qty=3, edge_distribution=EdgeDistribution())]
+    edge_breakdown = calculate_edge_breakdown(parts, settings)
+    
+    roll_plan = plan_edge_rolls(edge_breakdown, settings)
+    assert len(roll_plan) == 1
+    plan = roll_plan[0]
+    assert plan.strip_count == 12
+    assert plan.roll_count == 2
+    assert plan.strips_m == 12.0
+    assert plan.waste_m == 8.0
+    assert plan.cost == 80.0
+    
+    assert calculate_edge_cost(edge_breakdown, settings)["total"] == 80.0
@@ -0,0 +1,41 @@
+import pytest
+from datetime import datetime
+from fastapi.testclient import TestClient
+from app.main import app
+from app.models.settings import SettingsModel
+import app.routers.settings as settings_router
+from app.services.etags import content_hash, resource_etag
+
+client = TestClient(app)
+
+def test_resource_etag_follows_inputs():
+    """Test that ETags change with updated_at and the settings version only"""
+    updated_at = datetime(2025, 1, 2, 10, 0)
+    etag = resource_etag("unit", "u1", updated_at, 3)
+    assert etag == resource_etag("unit", "u1", updated_at, 3)
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag != resource_etag("unit", "u1", datetime(2025, 1, 2, 10, 1), 3)
+    assert etag != resource_etag("unit", "u1", updated_at, 4)
+    assert content_hash({"a": 1, "b": 2}) == content_hash({"b": 2, "a": 1})
+
+def test_settings_conditional_get(monkeypatch):
+    """Test that GET /settings returns 304 for the current ETag and 200 after a new version"""
+    current = {"settings": SettingsModel(version=5)}
+
+    async def get_current_settings():
+        return current["settings"]
+
+    monkeypatch.setattr(settings_router, "get_current_settings", get_current_settings)
+
+    response = client.get("/settings")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    not_modified = client.get("/settings", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    current["settings"] = SettingsModel(version=6)
+    changed = client.get("/settings", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
@@ -0,0 +1,91 @@
+import os
+import time
+import pytest
+from app.routers.units import render_unit_workbook
+from app.services.etags import etag_matches, make_etag
+from app.services.export_cache import ExportCache, export_cache_key
+
+UNIT_DOC = {
+    "_id": "u1",
+    "type": "ground",
+    "parts_calculated": [
+        {"name": "side_panel", "width_cm": 56, "height_cm": 72, "qty": 2, "area_m2": 0.4032, "edge_band_m": 1.28},
+        {"name": "door", "width_cm": 39.6, "height_cm": 71, "qty": 2, "area_m2": 0.2812, "edge_band_m": 2.21}
+    ]
+}
+
+def test_export_cache_key_changes_with_unit_and_settings_version():
+    """Test that the key depends on the unit content and the settings version"""
+    key = export_cache_key("unit-xlsx", UNIT_DOC, 3)
+    assert key == export_cache_key("unit-xlsx", dict(UNIT_DOC), 3)
+    assert key != export_cache_key("unit-xlsx", UNIT_DOC, 4)
+    assert key != export_cache_key("unit-xlsx", dict(UNIT_DOC, type="wall"), 3)
+    assert key != export_cache_key("unit-csv", UNIT_DOC, 3)
+
+def test_etag_matches_if_none_match_values():
+    """Test strong, weak, listed and wildcard If-None-Match values"""
+    etag = make_etag("abc")
+    assert etag_matches('"abc"', etag)
+    assert etag_matches('W/"abc"', etag)
+    assert etag_matches('"xyz", "abc"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"xyz"', etag)
+    assert not etag_matches(None, etag)
+
+def test_get_or_create_builds_once(tmp_path):
+    """Test that a cached export is served from disk without rebuilding"""
+    cache = ExportCache(str(tmp_path), max_bytes=10 * 1024 * 1024)
+    builds = []
+
+    def build():
+        builds.append(1)
+        return render_unit_workbook(UNIT_DOC)
+
+    key = export_cache_key("unit-xlsx", UNIT_DOC, 1)
+    first = cache.get_or_create(key, "xlsx", build)
+    second = cache.get_or_create(key, "xlsx", build)
+
+    assert first == second
+    assert first[:2] == b"PK"
+    assert len(builds) == 1
+    assert cache.stats()["hits"] == 1
+
+def test_eviction_respects_size_cap(tmp_path):
+    """Test that least recently used files are removed above the size cap"""
+    cache = ExportCache(str(tmp_path), max_bytes=250)
+    cache.write("a", "csv", b"a" * 100)
+    cache.write("b", "csv", b"b" * 100)
+    old = time.time() - 60
+    os.utime(cache.path_for("a", "csv"), (old, old))
+    os.utime(cache.path_for("b", "csv"), (old + 1, old + 1))
+
+    assert cache.read("a", "csv") is not None  # a is now the most recently used
+    cache.write("c", "csv", b"c" * 100)
+
+    assert cache.read("b", "csv") is None
+    assert cache.read("a", "csv") is not None
+    assert cache.read("c", "csv") is not None
+    assert cache.stats()["evictions"] == 1
+
+def test_files_larger_than_cap_are_not_cached(tmp_path):
+    """Test that one oversized export does not flush the whole cache"""
+    cache = ExportCache(str(tmp_path), max_bytes=50)
+    cache.write("small", "csv", b"s" * 10)
+    cache.write("big", "csv", b"b" * 100)
+    assert cache.read("big", "csv") is None
+    assert cache.read("small", "csv") is not None
+
+def test_writes_keep_a_running_size_total(tmp_path, monkeypatch):
+    """Test that the directory is scanned on the first write only, not on every write"""
+    import app.services.export_cache as export_cache_module
+    scans = []
+    scandir = os.scandir
+    monkeypatch.setattr(export_cache_module.os, "scandir", lambda path: scans.append(path) or scandir(path))
+
+    cache = ExportCache(str(tmp_path), max_bytes=250)
+    for name in "abcde":
+        cache.write(name, "csv", name.encode() * 100)
+
+    assert len(scans) == 1
+    assert cache.stats()["evictions"] == 3
+    assert cache.read("d", "csv") is not None and cache.read("e", "csv") is not None
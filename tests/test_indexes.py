@@ -0,0 +1,87 @@
+import json
+import pytest
+from datetime import datetime
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.database import ensure_database_indexes, settings
+from app.services.index_manager import REQUIRED_INDEXES, ensure_indexes, format_index_report
+from app.services.pagination import encode_cursor, page_filter, page_sort
+
+TEST_DATABASE = f"{settings.database_name}_index_test"
+mongo_available = None
+CURSOR = encode_cursor(datetime(2025, 6, 1), "id-500")
+
+@pytest.fixture
+async def index_db():
+    """Test database with the required indexes (skipped when MongoDB is not available)"""
+    global mongo_available
+    if mongo_available is False:
+        pytest.skip("MongoDB is not available")
+    mongo_client = AsyncIOMotorClient(settings.mongodb_url, serverSelectionTimeoutMS=1000)
+    try:
+        await mongo_client.admin.command("ping")
+        mongo_available = True
+    except Exception:
+        mongo_available = False
+        mongo_client.close()
+        pytest.skip("MongoDB is not available")
+    await mongo_client.drop_database(TEST_DATABASE)
+    db = mongo_client[TEST_DATABASE]
+    await ensure_indexes(db)
+    yield db
+    await mongo_client.drop_database(TEST_DATABASE)
+    mongo_client.close()
+
+async def test_unreachable_mongo_only_warns(monkeypatch, capsys):
+    """Test that the startup index task gives up after index_check_timeout_ms with a warning"""
+    monkeypatch.setattr(settings, "mongodb_url", "mongodb://127.0.0.1:1/")
+    monkeypatch.setattr(settings, "index_check_timeout_ms", 100)
+
+    await ensure_database_indexes()
+
+    assert "WARNING: Could not ensure MongoDB indexes" in capsys.readouterr().out
+
+def winning_plan_stages(explain: dict) -> str:
+    return json.dumps(explain["queryPlanner"]["winningPlan"])
+
+async def test_ensure_indexes_is_idempotent(index_db):
+    """Test that a second run creates nothing and reports no errors"""
+    report = await ensure_indexes(index_db)
+
+    assert all(collection["error"] is None for collection in report.values())
+    assert all(collection["created"] == [] for collection in report.values())
+    assert format_index_report(report) == []
+    for collection_name, indexes in REQUIRED_INDEXES.items():
+        existing = await index_db[collection_name].index_information()
+        assert {index.document["name"] for index in indexes} <= set(existing)
+
+@pytest.mark.parametrize("collection_name,query,sort", [
+    ("units", {"created_by": "user1", "created_at": {"$gte": datetime(2025, 1, 1)}}, None),
+    ("units", {"created_by": "user1"}, None),
+    ("projects", {"created_by": "user1"}, [("created_at", -1)]),
+    ("projects", {"_id": {"$ne": "p1"}, "unit_ids": "u1"}, None),
+    ("marketplace_items", {"status": "available"}, [("created_at", -1)]),
+    ("marketplace_items", {"seller_id": "user1"}, [("created_at", -1)]),
+    ("marketplace_items", {"seller_id": "user1", "status": {"$in": ["sold", "pending"]}}, [("updated_at", -1)]),
+    ("marketplace_items", {"buyer_id": "user1", "status": "sold"}, [("updated_at", -1)]),
+    ("carts", {"user_id": "user1"}, None),
+    ("users", {"phone": "01000000000"}, None),
+    ("unit_summaries", {"unit_id": "u1"}, None),
+    ("jobs", {"status": "pending"}, None),
+    # صفحات بمؤشر (keyset)
+    ("units", page_filter({"created_by": "user1"}, "created_at", CURSOR), page_sort("created_at")),
+    ("projects", page_filter({"created_by": "user1"}, "created_at", CURSOR), page_sort("created_at")),
+    ("marketplace_items", page_filter({"status": "available"}, "created_at", CURSOR), page_sort("created_at")),
+    ("marketplace_items", page_filter({"buyer_id": "user1", "status": "sold"}, "updated_at", CURSOR), page_sort("updated_at")),
+])
+async def test_hot_queries_use_an_index(index_db, collection_name, query, sort):
+    """Test that each hot query path is planned as an index scan, not COLLSCAN"""
+    cursor = index_db[collection_name].find(query)
+    if sort:
+        cursor = cursor.sort(sort)
+    plan = winning_plan_stages(await cursor.explain())
+
+    assert "IXSCAN" in plan
+    assert "COLLSCAN" not in plan
+    if sort:
+        # الترتيب من الفهرس وليس في الذاكرة
+        assert '"SORT"' not in plan
@@ -0,0 +1,101 @@
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.models.settings import SettingsModel
+from app.services.project_optimizer import (
+    nest_project_parts,
+    plan_project_edge_rolls,
+    summarize_project_cost
+)
+
+client = TestClient(app)
+
+def get_parts_data():
+    return [
+        {
+            "name": "جانب",
+            "width_cm": 56.0,
+            "height_cm": 72.0,
+            "qty": 2,
+            "edge_distribution": {"top": True, "bottom": False, "left": True, "right": False}
+        },
+        {
+            "name": "رف",
+            "width_cm": 55.0,
+            "height_cm": 76.0,
+            "qty": 3,
+            "edge_distribution": {"top": True, "bottom": False, "left": False, "right": False}
+        }
+    ]
+
+def test_project_optimizer_functions_round_trip_plain_data():
+    """Test that the process pool functions take and return plain data"""
+    settings_data = SettingsModel().model_dump(mode="json")
+    parts_data = get_parts_data()
+
+    nesting = nest_project_parts(parts_data, settings_data)
+    assert nesting["parts_count"] == 5
+    assert nesting["sheet_count"] >= 1
+    assert not nesting["oversized_parts"]
+
+    edge_rolls = plan_project_edge_rolls(parts_data, settings_data, "pvc")
+    assert edge_rolls["total_edge_m"] > 0
+    assert edge_rolls["roll_plan"][0]["roll_count"] >= 1
+
+    cost = summarize_project_cost(nesting, edge_rolls, settings_data)
+    assert cost["total"] == pytest.approx(cost["ألواح الخشب"] + cost["شريط الحافة"])
+
+def test_get_job_requires_authentication():
+    """Test that job status is not visible without a token"""
+    response = client.get("/jobs/some-job-id")
+    assert response.status_code == 401
+
+@pytest.fixture
+async def jobs_db(monkeypatch):
+    """Test database for the jobs collection (skipped when MongoDB is not available)"""
+    from motor.motor_asyncio import AsyncIOMotorClient
+    from app.database import settings
+    import app.services.job_service as job_service
+
+    mongo_client = AsyncIOMotorClient(settings.mongodb_url, serverSelectionTimeoutMS=1000)
+    try:
+        await mongo_client.admin.command("ping")
+    except Exception:
+        mongo_client.close()
+        pytest.skip("MongoDB is not available")
+    database_name = f"{settings.database_name}_jobs_test"
+    await mongo_client.drop_database(database_name)
+    db = mongo_client[database_name]
+    monkeypatch.setattr(job_service, "get_database", lambda: db)
+    yield db
+    await mongo_client.drop_database(database_name)
+    mongo_client.close()
+
+async def test_resume_only_reclaims_expired_leases(jobs_db, monkeypatch):
+    """Test that a job leased by a live worker is not reset or scheduled again"""
+    from datetime import datetime, timedelta
+    import app.services.job_service as job_service
+
+    scheduled = []
+    monkeypatch.setattr(job_service, "schedule_job", scheduled.append)
+    now = datetime.utcnow()
+    await jobs_db.jobs.insert_many([
+        {"_id": "live", "status": "running", "worker_id": "other", "lease_until": now + timedelta(minutes=1)},
+        {"_id": "expired", "status": "running", "worker_id": "dead", "lease_until": now - timedelta(minutes=1)},
+        {"_id": "queued", "status": "pending", "worker_id": None, "lease_until": None},
+    ])
+
+    await job_service.resume_unfinished_jobs()
+
+    assert sorted(scheduled) == ["expired", "queued"]
+    live = await jobs_db.jobs.find_one({"_id": "live"})
+    assert live["status"] == "running" and live["worker_id"] == "other"
+
+async def test_job_updates_require_the_lease(jobs_db):
+    """Test that a worker that lost the lease cannot write the job"""
+    import app.services.job_service as job_service
+
+    await jobs_db.jobs.insert_one({"_id": "job", "status": "running", "worker_id": "other"})
+
+    assert not await job_service.update_job("job", status="completed")
+    assert (await jobs_db.jobs.find_one({"_id": "job"}))["status"] == "running"
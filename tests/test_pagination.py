@@ -0,0 +1,49 @@
+import pytest
+from datetime import datetime
+from app.services.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    page_filter,
+    split_page
+)
+
+def test_cursor_round_trip():
+    """Test that a cursor decodes to the same sort value and id"""
+    created_at = datetime(2025, 3, 4, 5, 6, 7, 123000)
+    cursor = encode_cursor(created_at, "proj_ABC")
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (created_at, "proj_ABC")
+    assert decode_cursor(encode_cursor(None, "u1")) == (None, "u1")
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "e30", encode_cursor(None, "u1")[:-3] + "!!!"])
+def test_invalid_cursor_is_rejected(cursor):
+    """Test that tampered cursors raise InvalidCursorError"""
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+def test_page_filter_starts_after_the_cursor():
+    """Test the keyset condition: same index range ($lte) and _id as tie breaker"""
+    created_at = datetime(2025, 1, 1)
+    query = page_filter({"created_by": "user1"}, "created_at", encode_cursor(created_at, "u9"))
+
+    assert query == {"$and": [
+        {"created_by": "user1"},
+        {
+            "created_at": {"$lte": created_at},
+            "$or": [{"created_at": {"$lt": created_at}}, {"_id": {"$lt": "u9"}}]
+        }
+    ]}
+    assert page_filter({"created_by": "user1"}, "created_at", None) == {"created_by": "user1"}
+
+def test_split_page_returns_cursor_of_last_item_only_when_more_exist():
+    """Test that next_cursor points at the last returned item and is None on the last page"""
+    docs = [{"_id": f"u{index}", "created_at": datetime(2025, 1, 10 - index)} for index in range(3)]
+
+    page, next_cursor = split_page(docs, "created_at", 2)
+    assert page == docs[:2]
+    assert decode_cursor(next_cursor) == (docs[1]["created_at"], "u1")
+
+    page, next_cursor = split_page(docs, "created_at", 3)
+    assert page == docs and next_cursor is None
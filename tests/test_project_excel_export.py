@@ -0,0 +1,76 @@
+import pytest
+from fastapi.testclient import TestClient
+from openpyxl import load_workbook
+from app.main import app
+from app.services.project_excel_export import (
+    PART_SHEETS,
+    column_widths,
+    create_export_file,
+    iter_file_chunks,
+    part_sheet_key,
+    remove_export_file,
+    write_project_workbook
+)
+
+client = TestClient(app)
+
+UNIT_DOCS = [
+    {
+        "_id": "u1", "type": "ground", "width_cm": 80, "height_cm": 72, "depth_cm": 56,
+        "parts_calculated": [
+            {"name": "side_panel", "width_cm": 56, "height_cm": 72, "qty": 2, "area_m2": 0.4032, "edge_band_m": 1.28},
+            {"name": "back_panel", "width_cm": 78, "height_cm": 70, "qty": 1, "area_m2": 0.546, "edge_band_m": 0},
+            {"name": "door", "width_cm": 39.6, "height_cm": 71, "qty": 2, "area_m2": 0.2812, "edge_band_m": 2.21}
+        ]
+    },
+    {
+        "_id": "u2", "type": "wall", "width_cm": 60, "height_cm": 70, "depth_cm": 32,
+        "parts_calculated": [
+            {"name": "shelf", "width_cm": 56.4, "height_cm": 27, "qty": 3, "area_m2": 0.1523, "edge_band_m": 0.56}
+        ]
+    }
+]
+
+async def stream_units():
+    for unit_doc in UNIT_DOCS:
+        yield unit_doc
+
+def test_part_sheet_key_matches_unit_export():
+    """Test that parts go to the same sheets as the single unit export"""
+    assert part_sheet_key("door") == "doors"
+    assert part_sheet_key("drawer_front") == "doors"
+    assert part_sheet_key("back_panel") == "backs"
+    assert part_sheet_key("side_panel") == "main"
+
+@pytest.mark.asyncio
+async def test_write_project_workbook_streams_all_units():
+    """Test that every unit's parts land in the right sheet with totals and fixed widths"""
+    path = create_export_file()
+    try:
+        units_count = await write_project_workbook(stream_units(), path)
+        assert units_count == 2
+        assert sum(len(chunk) for chunk in iter_file_chunks(path, chunk_size=1024)) > 0
+
+        workbook = load_workbook(path)
+        assert workbook.sheetnames == [title for _, title in PART_SHEETS]
+
+        main_rows = list(workbook["القطع الأساسية"].values)
+        assert [row[1] for row in main_rows[1:-1]] == ["side_panel", "shelf"]
+        assert main_rows[1][0].startswith("1. ground")
+        assert main_rows[2][0].startswith("2. wall")
+        assert main_rows[-1][0] == "المجموع"
+        assert main_rows[-1][4] == 5
+
+        assert [row[1] for row in list(workbook["الضهر"].values)[1:-1]] == ["back_panel"]
+        assert [row[1] for row in list(workbook["الضلف"].values)[1:-1]] == ["door"]
+
+        main_sheet = workbook["القطع الأساسية"]
+        assert main_sheet.sheet_view.rightToLeft
+        assert main_sheet.column_dimensions["A"].width == column_widths()[0]
+    finally:
+        remove_export_file(path)
+
+def test_project_export_requires_authentication():
+    """Test that the project export is not available without a token"""
+    response = client.get("/projects/some-project/export-excel")
+    assert response.status_code == 401
@@ -0,0 +1,24 @@
+from app.routers.projects import project_list_pipeline
+
+def test_project_list_pipeline_joins_units_in_one_aggregation():
+    """Test that projects and their units come from one $lookup with a projection"""
+    pipeline = project_list_pipeline({"created_by": "user1"})
+
+    assert pipeline[0] == {"$match": {"created_by": "user1"}}
+    assert pipeline[1]["$lookup"]["localField"] == "unit_ids"
+    # الحقول تُحدد داخل $lookup فلا تخرج باقي حقول الوحدة من units
+    unit_projection = pipeline[1]["$lookup"]["pipeline"][-1]["$project"]
+    assert unit_projection["parts_calculated"] == 1
+    assert "request_inputs" not in unit_projection
+    assert pipeline[-1]["$project"]["units"] == 1
+
+def test_project_list_summary_pipeline_ships_no_unit_fields():
+    """Test that summary mode computes the totals in MongoDB and returns no unit fields"""
+    pipeline = project_list_pipeline({}, summary=True)
+    projection = pipeline[-1]["$project"]
+
+    assert projection["unit_count"] == {"$size": "$units"}
+    assert projection["total_area_m2"] == {"$sum": "$units.total_area_m2"}
+    assert projection["total_cost"] == {"$sum": "$units.price_estimate"}
+    assert not any(key == "units" or key.startswith("units.") for key in projection)
+    assert pipeline[1]["$lookup"]["pipeline"] == [{"$project": {"_id": 0, "total_area_m2": 1, "price_estimate": 1}}]
@@ -0,0 +1,96 @@
+import asyncio
+import pytest
+from pydantic import ValidationError
+from app.models.settings import SettingsModel
+from app.services.calculation_cache import settings_stamp
+from app.services.settings_snapshot import SettingsSnapshotStore, settings_from_document
+
+class FakeSettingsCollection:
+    """Settings document with a version counter and read counters"""
+
+    def __init__(self):
+        self.document = {"_id": "global", "back_deduction": 2.0, "version": 1}
+        self.document_reads = 0
+        self.version_reads = 0
+
+    async def load_document(self):
+        self.document_reads += 1
+        await asyncio.sleep(0.01)
+        return dict(self.document)
+
+    async def load_version(self):
+        self.version_reads += 1
+        return self.document["version"]
+
+    def update(self, **fields):
+        self.document.update(fields)
+        self.document["version"] += 1
+
+@pytest.mark.asyncio
+async def test_concurrent_cold_fetches_are_coalesced():
+    """Test that concurrent requests on a cold store share one DB read"""
+    collection = FakeSettingsCollection()
+    store = SettingsSnapshotStore(collection.load_document, collection.load_version)
+
+    results = await asyncio.gather(*[store.get() for _ in range(20)])
+
+    assert collection.document_reads == 1
+    assert all(settings is results[0] for settings in results)
+    assert results[0].version == 1
+
+@pytest.mark.asyncio
+async def test_snapshot_is_reused_within_poll_interval():
+    """Test that a fresh snapshot is served without any DB read"""
+    collection = FakeSettingsCollection()
+    store = SettingsSnapshotStore(collection.load_document, collection.load_version, poll_interval_s=60)
+
+    first = await store.get()
+    collection.update(back_deduction=0.7)
+    second = await store.get()
+
+    assert second is first
+    assert collection.document_reads == 1
+    assert collection.version_reads == 0
+
+@pytest.mark.asyncio
+async def test_version_poll_reloads_only_on_change():
+    """Test that expired snapshots check the version and reload only when it changed"""
+    collection = FakeSettingsCollection()
+    store = SettingsSnapshotStore(collection.load_document, collection.load_version, poll_interval_s=0)
+
+    first = await store.get()
+    assert await store.get() is first
+    assert collection.document_reads == 1
+    assert collection.version_reads == 1
+
+    collection.update(back_deduction=0.7)
+    updated = await store.get()
+    assert updated.back_deduction == 0.7
+    assert updated.version == 2
+    assert collection.document_reads == 2
+
+@pytest.mark.asyncio
+async def test_failed_version_check_keeps_snapshot():
+    """Test that cached settings are still served when the version check fails"""
+    collection = FakeSettingsCollection()
+
+    async def broken_version():
+        raise RuntimeError("database unavailable")
+
+    store = SettingsSnapshotStore(collection.load_document, broken_version, poll_interval_s=0)
+    first = await store.get()
+    assert await store.get() is first
+
+def test_invalid_document_falls_back_to_defaults():
+    """Test that outdated settings documents keep their version with default values"""
+    settings = settings_from_document({"_id": "global", "assembly_method": "unknown", "version": 5})
+    assert settings.version == 5
+    assert settings.assembly_method == SettingsModel().assembly_method
+
+def test_settings_model_is_frozen_and_stamped_by_version():
+    """Test that the shared settings cannot be modified and version drives the cache stamp"""
+    settings = SettingsModel(version=3)
+    with pytest.raises(ValidationError):
+        settings.back_deduction = 1.0
+    assert settings_stamp(settings) == "v3"
+    assert settings_stamp(settings.model_copy(update={"version": 4})) != settings_stamp(settings)
@@ -0,0 +1,130 @@
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.models.units import Part
+from app.models.settings import SettingsModel
+from app.services.sheet_nesting import nest_parts, nest_parts_with_settings
+from app.services.unit_calculators import calculate_material_usage
+
+client = TestClient(app)
+
+def assert_valid_layout(result, kerf_cm):
+    """No placement leaves the sheet and pieces are at least one kerf apart"""
+    for sheet in result.sheets:
+        placements = sheet.placements
+        for placement in placements:
+            assert placement.x_cm >= 0 and placement.y_cm >= 0
+            assert placement.x_cm + placement.length_cm <= result.sheet_length_cm + 1e-6
+            assert placement.y_cm + placement.width_cm <= result.sheet_width_cm + 1e-6
+        for i, a in enumerate(placements):
+            for b in placements[i + 1:]:
+                separated = (
+                    a.x_cm + a.length_cm + kerf_cm <= b.x_cm + 1e-6
+                    or b.x_cm + b.length_cm + kerf_cm <= a.x_cm + 1e-6
+                    or a.y_cm + a.width_cm + kerf_cm <= b.y_cm + 1e-6
+                    or b.y_cm + b.width_cm + kerf_cm <= a.y_cm + 1e-6
+                )
+                assert separated, (a, b)
+
+def test_nesting_packs_exact_fit_on_one_sheet():
+    """Test that four quarter sheets fill exactly one sheet without kerf"""
+    parts = [Part(name="quarter", width_cm=61, height_cm=122, qty=4)]
+    result = nest_parts(parts, sheet_length_cm=244, sheet_width_cm=122, kerf_cm=0)
+    
+    assert result.sheet_count == 1
+    assert result.parts_count == 4
+    assert result.utilization_percent == 100.0
+    assert_valid_layout(result, 0)
+
+def test_nesting_kerf_opens_new_sheet():
+    """Test that the saw kerf is taken into account between pieces"""
+    parts = [Part(name="quarter", width_cm=61, height_cm=122, qty=4)]
+    result = nest_parts(parts, sheet_length_cm=244, sheet_width_cm=122, kerf_cm=0.4)
+    
+    assert result.sheet_count == 2
+    assert_valid_layout(result, 0.4)
+
+def test_nesting_rotation_rule():
+    """Test that pieces are only rotated when rotation is allowed"""
+    parts = [Part(name="side", width_cm=200, height_cm=50, qty=2)]
+    
+    rotated = nest_parts(parts, sheet_length_cm=244, sheet_width_cm=122, kerf_cm=0)
+    assert rotated.sheet_count == 1
+    assert all(placement.rotated for placement in rotated.sheets[0].placements)
+    
+    fixed = nest_parts(parts, sheet_length_cm=244, sheet_width_cm=122, kerf_cm=0, allow_rotation=False)
+    assert fixed.oversized_parts == ["side", "side"]
+    assert fixed.sheet_count == 0
+    assert fixed.priced_sheet_count == 2
+
+def test_oversized_parts_are_priced_by_area():
+    """Test that a part larger than the sheet still counts at least ceil(area / sheet area) sheets"""
+    parts = [
+        Part(name="panel", width_cm=130, height_cm=300, qty=1),
+        Part(name="shelf", width_cm=50, height_cm=100, qty=1)
+    ]
+    result = nest_parts(parts, sheet_length_cm=244, sheet_width_cm=122, kerf_cm=0)
+    
+    assert result.oversized_parts == ["panel"]
+    assert result.oversized_sheet_count == 2
+    assert result.priced_sheet_count == result.sheet_count + 2 == 3
+
+def test_nesting_beats_area_estimate_lower_bound():
+    """Test a mixed project-sized list: valid layout, never fewer sheets than the area bound"""
+    parts = [
+        Part(name=f"part_{i}", width_cm=20 + (i * 7) % 50, height_cm=30 + (i * 13) % 150, qty=1 + i % 3)
+        for i in range(150)
+    ]
+    result = nest_parts(parts, sheet_length_cm=244, sheet_width_cm=122, kerf_cm=0.4)
+    
+    sheet_area_m2 = 2.44 * 1.22
+    assert result.sheet_count >= result.parts_area_m2 / sheet_area_m2
+    assert result.parts_count == sum(part.qty for part in parts)
+    assert sum(len(sheet.placements) for sheet in result.sheets) == result.parts_count
+    assert_valid_layout(result, 0.4)
+
+def test_material_usage_reports_nested_sheets():
+    """Test that unit material usage carries the real sheet count"""
+    settings = SettingsModel()
+    parts = [Part(name="side", width_cm=56, height_cm=72, qty=2), Part(name="base", width_cm=56, height_cm=56.4, qty=1)]
+    usage = calculate_material_usage(1.1, 5.0, settings, parts)
+    
+    assert usage["ألواح الخشب"] == nest_parts_with_settings(parts, settings).sheet_count == 1
+    assert 0 < usage["نسبة استغلال الألواح"] <= 100
+
+def test_material_usage_without_parts_estimates_sheets_from_area():
+    """Test that the area-only path still reports sheets so they get priced"""
+    settings = SettingsModel()
+    sheet_area_m2 = settings.sheet_length_cm * settings.sheet_width_cm / 10000
+    
+    assert calculate_material_usage(sheet_area_m2 * 1.5, 5.0, settings)["ألواح الخشب"] == 2
+    assert calculate_material_usage(0.0, 0.0, settings)["ألواح الخشب"] == 0
+
+@pytest.mark.asyncio
+async def test_nesting_endpoint_validation():
+    """Test that an empty parts list is rejected"""
+    response = client.post("/units/nesting", json={"parts": []})
+    assert response.status_code == 422
+
+def test_nesting_endpoint_rejects_too_many_pieces(monkeypatch):
+    """Test that quantities are capped before any nesting work starts"""
+    import app.routers.units as units_router
+    from app.models.nesting import MAX_NESTING_PIECES
+    from app.services.auth_service import create_access_token
+    
+    async def get_settings_model():
+        return SettingsModel()
+    
+    monkeypatch.setattr(units_router, "get_settings_model", get_settings_model)
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': 'user1', 'role': 'user'})}"}
+    part = {"name": "رف", "width_cm": 50, "height_cm": 40, "qty": MAX_NESTING_PIECES + 1}
+    
+    assert client.post("/units/nesting", json={"parts": [part]}, headers=headers).status_code == 422
+    negative = [{**part, "qty": 100000}, {**part, "qty": -100000}]
+    assert client.post("/units/nesting", json={"parts": negative}, headers=headers).status_code == 422
+    
+    part["qty"] = 2
+    assert client.post("/units/nesting", json={"parts": [part]}).status_code == 401
+    response = client.post("/units/nesting", json={"parts": [part]}, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["parts_count"] == 2
@@ -0,0 +1,117 @@
+import pytest
+from datetime import datetime, timedelta
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.database import settings
+from app.services.unit_quota import (
+    QUOTA_BUCKET_DAYS,
+    count_recent_units,
+    increment_unit_quota,
+    quota_day,
+    reconcile_unit_quotas,
+    sum_quota_days,
+    window_start_day
+)
+
+TEST_DATABASE = f"{settings.database_name}_unit_quota_test"
+NOW = datetime(2025, 3, 31, 15, 30)
+
+def test_window_covers_today_and_previous_days():
+    """Test that a 30-day window starts at midnight 29 days before today"""
+    assert window_start_day(30, NOW) == datetime(2025, 3, 2)
+    assert window_start_day(1, NOW) == datetime(2025, 3, 31)
+
+@pytest.mark.parametrize("now,expected", [
+    (datetime(2025, 3, 31, 0, 0), datetime(2025, 3, 2)),
+    (datetime(2025, 3, 31, 23, 59, 59, 999999), datetime(2025, 3, 2)),
+    (datetime(2025, 1, 10, 12, 0), datetime(2024, 12, 12)),
+    (datetime(2024, 3, 1, 8, 0), datetime(2024, 2, 1)),
+])
+def test_window_start_is_the_same_for_the_whole_day(now, expected):
+    """Test that the window start only moves at midnight, across month, year and leap-day boundaries"""
+    assert window_start_day(QUOTA_BUCKET_DAYS, now) == expected
+
+def test_sum_quota_days_ignores_buckets_outside_the_window():
+    """Test that only the buckets of the last period_days days are summed"""
+    days = {"2025-02-28": 7, "2025-03-01": 5, "2025-03-02": 2, "2025-03-31": 1}
+
+    assert sum_quota_days(days, 30, NOW) == 3
+    assert sum_quota_days(days, 1, NOW) == 1
+    assert sum_quota_days({}, 30, NOW) == 0
+
+def test_sum_quota_days_window_edges():
+    """Test that the first day of the window counts and the day before it does not"""
+    first_day = window_start_day(QUOTA_BUCKET_DAYS, NOW)
+    days = {
+        quota_day(first_day - timedelta(days=1)): 100,
+        quota_day(first_day): 1,
+        quota_day(first_day + timedelta(days=QUOTA_BUCKET_DAYS - 1)): 10,
+    }
+
+    assert sum_quota_days(days, QUOTA_BUCKET_DAYS, NOW) == 11
+    # نفس الخانات بعد منتصف الليل: أول يوم يخرج من النافذة
+    assert sum_quota_days(days, QUOTA_BUCKET_DAYS, NOW + timedelta(days=1)) == 10
+
+def test_quota_day_names_sort_like_dates():
+    """Test that bucket names compare in date order, which sum_quota_days relies on"""
+    dates = [datetime(2024, 12, 31, 23, 59), datetime(2025, 1, 1), datetime(2025, 1, 9), datetime(2025, 1, 10)]
+
+    assert quota_day(NOW) == "2025-03-31"
+    assert [quota_day(date) for date in dates] == sorted(quota_day(date) for date in dates)
+
+def test_save_and_delete_deltas_cancel_out():
+    """Test that the +1 of saving and the -1 of deleting the same units leave the count unchanged"""
+    days = {"2025-03-30": 2, "2025-03-31": 1}
+    created = [NOW, NOW - timedelta(days=1)]
+
+    for created_at in created:
+        days[quota_day(created_at)] = days.get(quota_day(created_at), 0) + 1
+    assert sum_quota_days(days, QUOTA_BUCKET_DAYS, NOW) == 5
+    for created_at in created:
+        days[quota_day(created_at)] -= 1
+    assert sum_quota_days(days, QUOTA_BUCKET_DAYS, NOW) == 3
+
+@pytest.fixture
+async def quota_db():
+    """Test database (skipped when MongoDB is not available)"""
+    mongo_client = AsyncIOMotorClient(settings.mongodb_url, serverSelectionTimeoutMS=1000)
+    try:
+        await mongo_client.admin.command("ping")
+    except Exception:
+        mongo_client.close()
+        pytest.skip("MongoDB is not available")
+    await mongo_client.drop_database(TEST_DATABASE)
+    yield mongo_client[TEST_DATABASE]
+    await mongo_client.drop_database(TEST_DATABASE)
+    mongo_client.close()
+
+async def test_bucket_counters_match_reconciliation(quota_db):
+    """Test that $inc-maintained buckets equal a reconciliation from the units"""
+    now = datetime.utcnow()
+    await quota_db.units.insert_many([
+        {"_id": "u1", "created_by": "user1", "created_at": now},
+        {"_id": "u2", "created_by": "user1", "created_at": now - timedelta(days=3)},
+        {"_id": "u3", "created_by": "user1", "created_at": now - timedelta(days=45)},
+    ])
+
+    # أول قراءة تبني الخانات من الوحدات الموجودة
+    assert await count_recent_units(quota_db, "user1") == 2
+    assert await count_recent_units(quota_db, "user1", 60) == 3
+
+    await quota_db.units.insert_one({"_id": "u4", "created_by": "user1", "created_at": now})
+    await increment_unit_quota(quota_db, "user1", {quota_day(now): 1})
+    assert await count_recent_units(quota_db, "user1") == 3
+
+    await quota_db.unit_quotas.update_one({"_id": "user1"}, {"$inc": {f"days.{quota_day(now)}": 5}})
+    assert await reconcile_unit_quotas(quota_db) == 1
+    assert await count_recent_units(quota_db, "user1") == 3
+
+async def test_increment_drops_days_outside_the_bucket_window(quota_db):
+    """Test that every counter update also removes old and empty day buckets"""
+    now = datetime.utcnow()
+    old_day = quota_day(now - timedelta(days=QUOTA_BUCKET_DAYS + 5))
+    await quota_db.unit_quotas.insert_one({"_id": "user1", "days": {old_day: 4, quota_day(now): 1}, "reconciled_at": now})
+
+    await increment_unit_quota(quota_db, "user1", {quota_day(now): -1, quota_day(now - timedelta(days=1)): 2})
+
+    quota_doc = await quota_db.unit_quotas.find_one({"_id": "user1"})
+    assert quota_doc["days"] == {quota_day(now - timedelta(days=1)): 2}
@@ -0,0 +1,101 @@
+import pytest
+from app.models.units import UnitCalculateRequest
+from app.models.settings import SettingsModel, AssemblyMethod, HandleType
+from app.routers.units import calculate_request_result
+from app.services.calculation_cache import clear_unit_calculation_cache
+from app.services.settings_dependencies import (
+    affected_unit_types,
+    shared_settings_fields,
+    unit_settings_dependencies
+)
+from app.services.unit_calculators import calculate_unit_part_specs, estimate_material_costs
+from app.services.unit_recalculation import recalculate_unit_fields, recalculate_units_chunk
+from app.services.unit_registry import implemented_unit_types
+
+IMPLEMENTED_UNIT_TYPES = [unit_type.value for unit_type in implemented_unit_types()]
+
+def get_request_inputs(unit_type):
+    return UnitCalculateRequest(
+        type=unit_type,
+        width_cm=80,
+        width_2_cm=60,
+        height_cm=72,
+        depth_cm=56,
+        depth_2_cm=56,
+        drawer_count=3,
+        fixed_part_cm=10
+    ).model_dump(mode="json")
+
+def perturbed_value(settings, field):
+    value = getattr(settings, field)
+    if isinstance(value, AssemblyMethod):
+        return next(method for method in AssemblyMethod if method != value)
+    if isinstance(value, HandleType):
+        return next(handle for handle in HandleType if handle != value)
+    if isinstance(value, bool):
+        return not value
+    if isinstance(value, (int, float)):
+        return value + 1.3
+    return None
+
+def parts_snapshot(unit_type, settings):
+    return [
+        (part.name, part.width_cm, part.height_cm, part.qty, part.edge_band_m)
+        for part in calculate_unit_part_specs(unit_type, get_request_inputs(unit_type), settings)
+    ]
+
+@pytest.mark.parametrize("unit_type", IMPLEMENTED_UNIT_TYPES)
+def test_unlisted_settings_fields_do_not_change_parts(unit_type):
+    """Test that the dependency map lists every settings field a unit type reads"""
+    base_settings = SettingsModel()
+    expected = parts_snapshot(unit_type, base_settings)
+    dependencies = unit_settings_dependencies()[unit_type]
+
+    for field in SettingsModel.model_fields:
+        if field in dependencies:
+            continue
+        value = perturbed_value(base_settings, field)
+        if value is None:
+            continue
+        settings = base_settings.model_copy(update={field: value})
+        assert parts_snapshot(unit_type, settings) == expected, field
+
+def test_affected_unit_types():
+    """Test that only unit types reading a changed field are recalculated"""
+    assert affected_unit_types([]) == []
+    assert affected_unit_types(["last_updated"]) == []
+    assert sorted(affected_unit_types(["materials"])) == sorted(IMPLEMENTED_UNIT_TYPES)
+    assert "materials" in shared_settings_fields()
+
+    mirror_types = affected_unit_types(["mirror_width"])
+    assert "ground" in mirror_types
+    assert "wall" not in mirror_types
+
+def test_recalculate_unit_fields_matches_saved_unit():
+    """Test that recalculated fields match what save_unit stores"""
+    clear_unit_calculation_cache()
+    settings = SettingsModel(back_deduction=0.7)
+    request_inputs = get_request_inputs("ground")
+
+    fields = recalculate_unit_fields(request_inputs, settings)
+    result = calculate_request_result(UnitCalculateRequest(**request_inputs), settings)
+    cost_breakdown, total_cost = estimate_material_costs(
+        dict(result.material_usage), result.total_edge_band_m, settings
+    )
+
+    assert fields["parts_calculated"] == [part.model_dump() for part in result.parts]
+    assert fields["edge_band_m"] == result.total_edge_band_m
+    assert fields["total_area_m2"] == result.total_area_m2
+    assert fields["material_usage"] == dict(result.material_usage)
+    assert fields["price_estimate"] == total_cost
+    assert fields["cost_breakdown"] == cost_breakdown
+
+def test_recalculate_units_chunk_reports_errors_per_unit():
+    """Test that one invalid saved unit does not fail the whole chunk"""
+    settings_data = SettingsModel().model_dump(mode="json")
+    result = recalculate_units_chunk(
+        [("good", get_request_inputs("wall")), ("bad", {"type": "wall"})],
+        settings_data
+    )
+    assert [unit_id for unit_id, _ in result["updates"]] == ["good"]
+    assert [error["unit_id"] for error in result["errors"]] == ["bad"]
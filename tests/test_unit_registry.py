@@ -0,0 +1,55 @@
+import inspect
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.models.units import UnitType
+from app.services import unit_calculators
+from app.services.unit_registry import (
+    UNIT_CALCULATORS,
+    get_unit_calculator,
+    implemented_unit_types,
+    unimplemented_unit_types
+)
+
+client = TestClient(app)
+
+@pytest.mark.parametrize("unit_type", list(UNIT_CALCULATORS))
+def test_registry_parameters_match_calculator_signature(unit_type):
+    """Test that every registered calculator exists and declares exactly its parameters"""
+    spec = get_unit_calculator(unit_type)
+    calculator = spec.load()
+    assert calculator is getattr(unit_calculators, spec.function_name)
+    
+    signature_parameters = [
+        name for name in inspect.signature(calculator).parameters if name != "settings"
+    ]
+    assert list(spec.parameters) == signature_parameters
+
+def test_registry_covers_every_calculator():
+    """Test that no calculate_<type>_unit function is missing from the registry"""
+    unregistered = [
+        unit_type.value for unit_type in unimplemented_unit_types()
+        if hasattr(unit_calculators, f"calculate_{unit_type.value}_unit")
+    ]
+    assert unregistered == []
+    assert len(implemented_unit_types()) + len(unimplemented_unit_types()) == len(UnitType)
+
+def test_unimplemented_unit_type_raises():
+    """Test that looking up a type without a calculator raises ValueError"""
+    unimplemented = unimplemented_unit_types()
+    if not unimplemented:
+        pytest.skip("All unit types are implemented")
+    
+    with pytest.raises(ValueError, match="not implemented yet"):
+        get_unit_calculator(unimplemented[0].value)
+
+@pytest.mark.asyncio
+async def test_get_unit_types_reports_implemented():
+    """Test that /units/types flags which types can be calculated"""
+    response = client.get("/units/types")
+    assert response.status_code == 200
+    
+    implemented = {item["value"]: item["implemented"] for item in response.json()}
+    assert set(implemented) == {unit_type.value for unit_type in UnitType}
+    for unit_type in UnitType:
+        assert implemented[unit_type.value] == (unit_type.value in UNIT_CALCULATORS)
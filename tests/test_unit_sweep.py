@@ -0,0 +1,66 @@
+import pytest
+from app.models.units import UnitType
+from app.models.settings import SettingsModel, AssemblyMethod
+from app.services.unit_registry import implemented_unit_types
+from app.services.unit_sweep import sweep_unit_parts, verify_sweep_against_scalar
+
+IMPLEMENTED_UNIT_TYPES = [unit_type.value for unit_type in implemented_unit_types()]
+
+@pytest.mark.parametrize("unit_type", IMPLEMENTED_UNIT_TYPES)
+@pytest.mark.parametrize("settings", [
+    SettingsModel(),
+    SettingsModel(assembly_method=AssemblyMethod.BASE_FULL_TOP_SIDES_BACK_ROUTED, edge_banding_type="O"),
+], ids=["default", "base_full_edge_O"])
+def test_sweep_matches_scalar_calculators(unit_type, settings):
+    """Test that every sweep point is identical to calculate_unit_parts"""
+    mismatches = verify_sweep_against_scalar(
+        unit_type,
+        widths_cm=[30, 45.5, 60, 120],
+        heights_cm=[72, 90.3],
+        depths_cm=[32, 56],
+        settings=settings,
+        shelf_counts=[0, 4],
+        door_counts=[1, 2],
+        drawer_counts=[0, 3],
+        width_2_cm=60
+    )
+    assert mismatches == []
+
+def test_sweep_grid_shape():
+    """Test that the sweep returns one value per grid point for every part"""
+    variants = sweep_unit_parts(
+        "ground",
+        widths_cm=list(range(30, 121)),
+        heights_cm=[72, 80],
+        depths_cm=[56, 60],
+        settings=SettingsModel(),
+        shelf_counts=[1, 2]
+    )
+    
+    assert len(variants) == 2
+    for variant in variants:
+        assert variant["error"] is None
+        assert variant["width_cm"].size == 91 * 2 * 2
+        for part in variant["parts"]:
+            assert part.width_cm.shape == part.area_m2.shape == part.edge_band_m.shape == (364,)
+        assert (variant["total_area_m2"] > 0).all()
+
+def test_sweep_reports_invalid_combination():
+    """Test that a zero door count on a unit that divides by it is reported, not returned as inf"""
+    variants = sweep_unit_parts(
+        "wall_microwave",
+        widths_cm=[60],
+        heights_cm=[72],
+        depths_cm=[32],
+        settings=SettingsModel(),
+        door_counts=[0, 2]
+    )
+    
+    assert variants[0]["error"] is not None
+    assert variants[0]["parts"] == []
+    assert variants[1]["error"] is None
+
+def test_sweep_unknown_unit_type():
+    """Test that an unimplemented unit type is rejected"""
+    with pytest.raises(ValueError):
+        sweep_unit_parts("corner_45_ground", [60], [72], [56], SettingsModel())
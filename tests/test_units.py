@@ -396,4 +396,202 @@ async def test_calculate_sink_ground_unit_with_shelf():
             assert part["area_m2"] >= 0
         if "area_m2" in part and part["name"] == "top_panel_sink":
             # Top panel should have a smaller area due to sink cutout
-            assert part["area_m2"] > 0
\ No newline at end of file
+            assert part["area_m2"] > 0
+@pytest.mark.asyncio
+async def test_calculate_units_batch():
+    """Test calculating several units in one request"""
+    request_data = {
+        "items": [
+            {"type": "ground", "width_cm": 80, "height_cm": 72, "depth_cm": 56, "shelf_count": 1},
+            {"type": "wall", "width_cm": 60, "height_cm": 70, "depth_cm": 32, "shelf_count": 2},
+            {"type": "corner_45_ground", "width_cm": 90, "height_cm": 72, "depth_cm": 56}
+        ]
+    }
+    
+    response = client.post("/units/calculate/batch", json=request_data)
+    assert response.status_code == 200
+    data = response.json()
+    
+    # Results keep the request order
+    assert [item["index"] for item in data["results"]] == [0, 1, 2]
+    assert data["results"][0]["result"]["type"] == "ground"
+    assert data["results"][1]["result"]["type"] == "wall"
+    
+    # Unimplemented unit type fails alone without failing the batch
+    assert data["results"][2]["result"] is None
+    assert data["results"][2]["error"]
+    assert data["succeeded"] == 2
+    assert data["failed"] == 1
+
+@pytest.mark.asyncio
+async def test_estimate_units_batch():
+    """Test estimating several units in one request"""
+    request_data = {
+        "items": [
+            {"type": "ground", "width_cm": 80, "height_cm": 72, "depth_cm": 56},
+            {"type": "sink", "width_cm": 100, "height_cm": 72, "depth_cm": 56}
+        ]
+    }
+    
+    response = client.post("/units/estimate/batch", json=request_data)
+    assert response.status_code == 200
+    data = response.json()
+    
+    assert data["succeeded"] == 2
+    assert data["failed"] == 0
+    assert data["total_cost"] == sum(item["result"]["total_cost"] for item in data["results"])
+
+@pytest.mark.asyncio
+async def test_calculate_units_batch_empty():
+    """Test that an empty batch is rejected"""
+    response = client.post("/units/calculate/batch", json={"items": []})
+    assert response.status_code == 422
+
+def test_calculate_unit_parts_returns_public_parts():
+    """Test that engine parts are converted to validated Part models once at the end"""
+    from app.models.units import Part
+    from app.models.settings import SettingsModel
+    from app.services.unit_calculators import calculate_unit_parts
+    
+    parts = calculate_unit_parts(
+        unit_type="ground",
+        width_cm=60,
+        height_cm=72,
+        depth_cm=56,
+        shelf_count=2,
+        door_count=2,
+        door_type="hinged",
+        flip_door_height=0,
+        bottom_door_height=0,
+        oven_height=60,
+        microwave_height=35,
+        vent_height=10,
+        drawer_count=0,
+        drawer_height_cm=20,
+        fixed_part_cm=0,
+        width_2_cm=0,
+        depth_2_cm=0,
+        settings=SettingsModel(edge_banding_type="O")
+    )
+    
+    assert parts and all(isinstance(part, Part) for part in parts)
+    base = next(part for part in parts if part.name == "base")
+    assert isinstance(base.width_cm, float)
+    assert base.width_cm == 55.8  # 56 - 0.2 edge banding deduction
+    assert base.edge_distribution.top is True
+    assert base.edge_band_m is not None
+
+def test_calculate_unit_result_accumulates_totals():
+    """Test that engine totals are accumulated in the same pass as the deduction"""
+    from app.models.settings import SettingsModel
+    from app.services.unit_calculators import (
+        calculate_total_area,
+        calculate_total_edge_band,
+        calculate_unit_result
+    )
+    
+    arguments = {"width_cm": 80, "height_cm": 72, "depth_cm": 56, "shelf_count": 2, "door_count": 2}
+    result = calculate_unit_result("ground", arguments, SettingsModel(edge_banding_type="O"))
+    parts = result.parts()
+    
+    assert result.total_area_m2 == calculate_total_area(parts)
+    assert result.total_edge_band_m == calculate_total_edge_band(parts)
+    assert result.part_count == len(parts)
+    assert result.total_qty == sum(part.qty for part in parts)
+
+def test_estimate_unit_cost_totals_only(monkeypatch):
+    """Test that totals_only returns the same totals and cost without the parts list"""
+    import app.routers.units as units_router
+    from app.models.settings import SettingsModel
+    
+    async def get_settings_model():
+        return SettingsModel(materials={
+            "plywood_sheet": {"price_per_sheet": 2500},
+            "edge_band_per_meter": {"price_per_meter": 10}
+        })
+    
+    monkeypatch.setattr(units_router, "get_settings_model", get_settings_model)
+    request_data = {"type": "wall", "width_cm": 60, "height_cm": 70, "depth_cm": 32}
+    
+    full = client.post("/units/estimate", json=request_data).json()
+    totals = client.post("/units/estimate?totals_only=true", json=request_data).json()
+    
+    assert totals["parts"] == []
+    assert full["parts"] and totals["part_count"] == len(full["parts"])
+    assert totals["total_qty"] == sum(part["qty"] for part in full["parts"])
+    for field in ["total_area_m2", "total_edge_band_m", "material_usage", "cost_breakdown", "total_cost"]:
+        assert totals[field] == full[field]
+
+def test_compare_variant_round_trips_plain_data():
+    """Test that a variant computed from plain data matches the estimate with the same settings"""
+    from app.models.settings import SettingsModel
+    from app.routers.units import build_estimate_response
+    from app.models.units import UnitEstimateRequest
+    from app.services.assembly_comparison import compare_variant
+    
+    settings = SettingsModel(
+        assembly_method="base_full_top_sides_back_routed",
+        materials={"plywood_sheet": {"price_per_sheet": 2500}, "edge_band_per_meter": {"price_per_meter": 10}}
+    )
+    inputs = {"type": "ground", "width_cm": 80, "height_cm": 72, "depth_cm": 56}
+    estimate = build_estimate_response(UnitEstimateRequest(**inputs), settings)
+    
+    variant = compare_variant([inputs], settings.model_dump(mode="json"), "base_full_top_sides_back_routed", "built_in")
+    
+    assert "error" not in variant
+    assert variant["total_area_m2"] == pytest.approx(estimate.total_area_m2)
+    assert variant["part_count"] == estimate.part_count
+    assert variant["total_cost"] == estimate.total_cost
+
+def test_compare_unit_assembly_returns_every_combination(monkeypatch):
+    """Test that every AssemblyMethod x HandleType combination is returned side by side"""
+    import app.routers.units as units_router
+    from app.models.settings import AssemblyMethod, HandleType, SettingsModel
+    
+    async def get_settings_model():
+        return SettingsModel(materials={"plywood_sheet": {"price_per_sheet": 2500}})
+    
+    monkeypatch.setattr(units_router, "get_settings_model", get_settings_model)
+    request_data = {"type": "ground", "width_cm": 80, "height_cm": 72, "depth_cm": 56}
+    
+    response = client.post("/units/assembly-comparison", json=request_data)
+    assert response.status_code == 200
+    data = response.json()
+    
+    assert len(data["variants"]) == len(AssemblyMethod) * len(HandleType)
+    assert {(v["assembly_method"], v["handle_type"]) for v in data["variants"]} == {
+        (method.value, handle.value) for method in AssemblyMethod for handle in HandleType
+    }
+    current = next(
+        v for v in data["variants"]
+        if v["assembly_method"] == data["current_assembly_method"] and v["handle_type"] == data["current_handle_type"]
+    )
+    estimate = client.post("/units/estimate", json=request_data).json()
+    assert current["total_cost"] == estimate["total_cost"]
+    assert data["cheapest"]["total_cost"] == min(v["total_cost"] for v in data["variants"])
+
+async def test_assembly_comparison_computes_each_method_once(monkeypatch):
+    """Test that handle types share one computed result per assembly method while no calculator reads handle_type"""
+    import app.services.assembly_comparison as assembly_comparison
+    from app.models.settings import AssemblyMethod, HandleType, SettingsModel
+    
+    calls = []
+    
+    async def run_in_job_pool(function, *args):
+        calls.append(args[2:4])
+        return function(*args)
+    
+    monkeypatch.setattr(assembly_comparison, "run_in_job_pool", run_in_job_pool)
+    assembly_comparison.clear_variant_results()
+    settings = SettingsModel(materials={"plywood_sheet": {"price_per_sheet": 2500}})
+    inputs = {"type": "ground", "width_cm": 81, "height_cm": 72, "depth_cm": 56}
+    
+    assert not assembly_comparison.handle_type_affects_results()
+    variants = await assembly_comparison.compare_assembly_variants([inputs], settings)
+    
+    assert len(calls) == len(AssemblyMethod)
+    assert {handle for _, handle in calls} == {settings.handle_type.value}
+    assert len(variants) == len(AssemblyMethod) * len(HandleType)
+    for method in AssemblyMethod:
+        costs = {variant.total_cost for variant in variants if variant.assembly_method == method.value}
+        assert len(costs) == 1
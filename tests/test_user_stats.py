@@ -0,0 +1,118 @@
+import pytest
+from datetime import datetime, timedelta
+from motor.motor_asyncio import AsyncIOMotorClient
+import app.routers.projects as projects_router
+from app.database import settings
+from app.services.auth_service import create_access_token
+from app.services.unit_quota import count_recent_units
+from app.services.user_stats import (
+    get_user_stats,
+    increment_user_stats,
+    rebuild_user_stats,
+    sum_stats_deltas,
+    unit_stats_delta
+)
+
+TEST_DATABASE = f"{settings.database_name}_user_stats_test"
+
+def test_unit_stats_delta_adds_and_removes_a_unit():
+    """Test that a deleted unit subtracts exactly what saving it added"""
+    unit_doc = {"total_area_m2": 2.5, "edge_band_m": 10.0, "price_estimate": 300.0}
+
+    added = unit_stats_delta(unit_doc)
+    removed = unit_stats_delta(unit_doc, -1)
+
+    assert added == {"units": 1, "total_area_m2": 2.5, "edge_band_m": 10.0, "total_cost": 300.0}
+    assert sum_stats_deltas([added, removed]) == {"units": 0, "total_area_m2": 0.0, "edge_band_m": 0.0, "total_cost": 0.0}
+
+def test_unit_stats_delta_treats_missing_totals_as_zero():
+    """Test that old units without totals only change the unit count"""
+    assert unit_stats_delta({"price_estimate": None}) == {
+        "units": 1, "total_area_m2": 0.0, "edge_band_m": 0.0, "total_cost": 0.0
+    }
+
+def test_recalculation_delta_moves_totals_from_old_to_new():
+    """Test that removing the old unit and adding the recalculated one changes totals but not the count"""
+    old_unit = {"total_area_m2": 2.0, "edge_band_m": 8.0, "price_estimate": 200.0}
+    new_unit = {"total_area_m2": 2.5, "edge_band_m": 7.0, "price_estimate": 260.0}
+
+    delta = sum_stats_deltas([unit_stats_delta(old_unit, -1), unit_stats_delta(new_unit)])
+
+    assert delta == pytest.approx({"units": 0, "total_area_m2": 0.5, "edge_band_m": -1.0, "total_cost": 60.0})
+
+def test_saving_then_deleting_units_sums_to_zero():
+    """Test that the deltas of saving several units and deleting them all cancel out"""
+    units = [
+        {"total_area_m2": 1.25, "edge_band_m": 3.5, "price_estimate": 99.99},
+        {"total_area_m2": 0.75, "edge_band_m": None, "price_estimate": 10.01},
+        {},
+    ]
+    added = sum_stats_deltas(unit_stats_delta(unit_doc) for unit_doc in units)
+    removed = sum_stats_deltas(unit_stats_delta(unit_doc, -1) for unit_doc in units)
+
+    assert added == pytest.approx({"units": 3, "total_area_m2": 2.0, "edge_band_m": 3.5, "total_cost": 110.0})
+    assert sum_stats_deltas([added, removed]) == pytest.approx(
+        {"units": 0, "total_area_m2": 0.0, "edge_band_m": 0.0, "total_cost": 0.0}
+    )
+    assert sum_stats_deltas([]) == {}
+
+@pytest.fixture
+async def stats_db():
+    """Test database (skipped when MongoDB is not available)"""
+    mongo_client = AsyncIOMotorClient(settings.mongodb_url, serverSelectionTimeoutMS=1000)
+    try:
+        await mongo_client.admin.command("ping")
+    except Exception:
+        mongo_client.close()
+        pytest.skip("MongoDB is not available")
+    await mongo_client.drop_database(TEST_DATABASE)
+    yield mongo_client[TEST_DATABASE]
+    await mongo_client.drop_database(TEST_DATABASE)
+    mongo_client.close()
+
+async def test_incremental_stats_match_rebuild(stats_db):
+    """Test that $inc-maintained stats equal a rebuild from scratch"""
+    units = [
+        {"_id": "u1", "created_by": "user1", "total_area_m2": 1.5, "edge_band_m": 4.0, "price_estimate": 100.0},
+        {"_id": "u2", "created_by": "user1", "total_area_m2": 2.0, "edge_band_m": 6.0, "price_estimate": 150.0},
+    ]
+    await stats_db.units.insert_many(units)
+    await stats_db.projects.insert_one({"_id": "p1", "created_by": "user1", "unit_ids": ["u1", "u2"]})
+
+    # أول قراءة تبني المستند من الوحدات الموجودة
+    assert await get_user_stats(stats_db, "user1") == {
+        "projects": 1, "units": 2, "total_area_m2": 3.5, "edge_band_m": 10.0, "total_cost": 250.0
+    }
+
+    unit_doc = {"_id": "u3", "created_by": "user1", "total_area_m2": 0.5, "edge_band_m": 2.0, "price_estimate": 50.0}
+    await stats_db.units.insert_one(unit_doc)
+    await increment_user_stats(stats_db, "user1", unit_stats_delta(unit_doc))
+    incremental = await get_user_stats(stats_db, "user1")
+
+    assert await rebuild_user_stats(stats_db) == 1
+    assert await get_user_stats(stats_db, "user1") == incremental
+
+async def test_delete_project_decrements_stats_and_quota(stats_db, monkeypatch):
+    """Test that deleting a project subtracts its units from both the dashboard stats and the unit quota"""
+    now = datetime.utcnow()
+    await stats_db.units.insert_many([
+        {"_id": "u1", "created_by": "user1", "created_at": now, "total_area_m2": 1.5, "edge_band_m": 4.0, "price_estimate": 100.0},
+        {"_id": "u2", "created_by": "user1", "created_at": now - timedelta(days=3), "total_area_m2": 2.0, "edge_band_m": 6.0, "price_estimate": 150.0},
+        {"_id": "u3", "created_by": "user1", "created_at": now, "total_area_m2": 0.5, "edge_band_m": 2.0, "price_estimate": 50.0},
+    ])
+    await stats_db.projects.insert_many([
+        {"_id": "p1", "created_by": "user1", "unit_ids": ["u1", "u2"]},
+        {"_id": "p2", "created_by": "user1", "unit_ids": ["u3"]},
+    ])
+    # بناء المستندات قبل الحذف حتى يعتمد الحذف على $inc فقط
+    assert (await get_user_stats(stats_db, "user1"))["units"] == 3
+    assert await count_recent_units(stats_db, "user1") == 3
+
+    monkeypatch.setattr(projects_router, "get_database", lambda: stats_db)
+    token = create_access_token({"sub": "user1", "role": "user"})
+    await projects_router.delete_project("p1", authorization=f"Bearer {token}")
+
+    assert await get_user_stats(stats_db, "user1") == {
+        "projects": 1, "units": 1, "total_area_m2": 0.5, "edge_band_m": 2.0, "total_cost": 50.0
+    }
+    assert await count_recent_units(stats_db, "user1") == 1